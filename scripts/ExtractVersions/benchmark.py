@@ -0,0 +1,100 @@
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from extract_custom_versions import extract_custom_versions
+from extract_versions import extract_versions, set_output_dir, ExtractionState
+from synthetic_repository import SyntheticConfig, build_synthetic_repository
+from utils import (
+    git_backends,
+    register_repository,
+    set_cache_dir,
+    set_git_backend,
+    set_profile_path,
+    spawn_process,
+)
+
+
+def main():
+    defaults = SyntheticConfig()
+    parser = argparse.ArgumentParser(
+        description="Measure the extraction on a synthetic Unreal Engine repository"
+    )
+    parser.add_argument("--tags", type=int, default=defaults.tags)
+    parser.add_argument("--custom-versions", type=int, default=defaults.custom_versions)
+    parser.add_argument("--filler-files", type=int, default=defaults.filler_files)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument(
+        "--backend",
+        choices=["memory"] + git_backends,
+        default="memory",
+        help="memory: serve the repository from memory, otherwise it is saved to disk and read with --git-backend",
+    )
+    parser.add_argument(
+        "--pack",
+        action="store_true",
+        help="Run `git gc` on the saved repository, so objects are read from packfiles",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes used to parse the tags (the memory backend needs the fork start method)",
+    )
+    parser.add_argument(
+        "--profile-out",
+        type=Path,
+        help="Save the timings and the counters of the run to this JSON file",
+    )
+    args = parser.parse_args()
+    set_profile_path(args.profile_out)
+
+    config = SyntheticConfig(
+        tags=args.tags,
+        custom_versions=args.custom_versions,
+        filler_files=args.filler_files,
+        seed=args.seed,
+    )
+
+    timings = {}
+    start = time.perf_counter()
+    repository = build_synthetic_repository(config)
+    timings["Build repository"] = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir) / "repository"
+        if args.backend == "memory":
+            register_repository(root, repository)
+        else:
+            start = time.perf_counter()
+            repository.write_loose(root)
+            if args.pack:
+                spawn_process(["git", "-C", root, "gc", "-q"])
+            timings["Save repository"] = time.perf_counter() - start
+            set_git_backend(args.backend)
+
+        # Measure the whole work, and don't touch the generated files of the repository
+        set_cache_dir(None)
+        set_output_dir(Path(temp_dir) / "output")
+
+        state = ExtractionState()
+        start = time.perf_counter()
+        extract_versions(root, state, args.jobs)
+        timings["ObjectVersion.h"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        extract_custom_versions(root, state, lambda name: True)
+        timings["Custom versions"] = time.perf_counter() - start
+
+    print()
+    print(
+        f"{config.tags} tags, {config.custom_versions} custom versions, "
+        f"{config.filler_files} other files, {len(repository.objects)} objects"
+    )
+    for name, elapsed in timings.items():
+        print(f"{name:<20} {elapsed:8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,50 @@
+import io
 import re
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Generator, List, Callable
+from functools import lru_cache
+from typing import Generator, List, Callable, TextIO
 
 from extract_versions import (
-    output_dir,
+    get_output_dir,
+    set_output_dir,
     SerializationVersion,
+    ExtractionState,
     print_table,
-    parse_enum_with_name,
-    aggregate_versions,
+    get_enum_summary,
+    parse_enum_blob,
+    find_inline_file,
+    VersionTable,
+    extend_appearance,
     format_details,
 )
 from utils import (
-    follow_paren,
     error,
     extract_tags,
     get_git_file,
+    get_git_blob_id,
+    get_parse_store,
+    read_git_blob,
     write_file,
+    open_output,
+    print_file_statistics,
+    run_pipeline,
     parse_global_args,
     make_header,
     warning,
     grep_files,
-    get_full_name_from_filename,
+    grep_matches,
     read_file,
     convert_pattern_to_regex,
     fail_if_warnings,
     TokenIterator,
+    interesting_versions_path,
     TokenType,
+    has_non_ascii_numbers,
+    find_block,
+    opaque_token_pattern,
+    g_profiler,
 )
 
 # language=pythonregexp
@@ -38,19 +55,6 @@ regex_custom_version = (
 # language=pythonregexp
 usual_pattern_declaration = r"^\s*([\w:]+),\s*(?:static_cast<int32>\()?\s*([\w:]+)::(?:LatestVersion|FirstVersion)\)?,\s*TEXT\(\s*\"([^\"]+)\"\s*\)"
 
-field_to_filename = {
-    "EVisualLoggerVersion::GUID": "Engine/Source/Runtime/Engine/Private/VisualLogger/VisualLogger.cpp",
-    "FLandscapeCustomVersion::GUID": "Engine/Source/Runtime/Landscape/Private/LandscapeVersion.h",
-    "FMovieSceneEvaluationCustomVersion::GUID": "Engine/Source/Runtime/MovieScene/Public/Evaluation/MovieSceneEvaluationCustomVersion.h",
-}
-
-filename_hint = {
-    "FAssetRegistryVersion": "AssetData.h",
-    "FSkeletalMeshCustomVersion": "SkeletalMeshLegacyCustomVersions.h",
-    "FRecomputeTangentCustomVersion": "SkeletalMeshLegacyCustomVersions.h",
-    "FOverlappingVerticesCustomVersion": "SkeletalMeshLegacyCustomVersions.h",
-}
-
 hardcoded_names = {}
 
 disallowed_files = [
@@ -61,6 +65,14 @@ g_skipped_enums = []
 
 custom_version_registration = ["FCustomVersionRegistration", "FDevVersionRegistration"]
 
+# Tokens which can change the state of iterate_enum_registrations.
+# Comments, literals and numbers with digit separators are matched too, to not find the tokens inside them.
+registration_token_pattern = re.compile(
+    opaque_token_pattern
+    + r"|(\b(?:namespace|using|FCustomVersionRegistration|FDevVersionRegistration)\b|[{}])",
+    re.DOTALL,
+)
+
 # This is a list of known duplicates that should be renamed
 known_duplicates = []
 
@@ -75,19 +87,104 @@ guid_pattern = (
     r")\s*[})]"
 )
 
-interesting_versions_path = Path(__file__).parent / "InterestingVersions.txt"
+# Declarations of enums, structs and namespaces, followed by "{", ":" or the end of the line
+# This is written in the subset of syntax shared by git (POSIX ERE) and python
+# language=pythonregexp
+symbol_declaration_pattern = (
+    r"^[ \t]*(enum([ \t]+class)?|struct|namespace)[ \t]+([A-Za-z0-9_]+_API[ \t]+)?"
+    r"[A-Za-z0-9_:]+[ \t]*([:{]|$)"
+)
+
+# Definitions of FGuid constants (eg: "FGuid FFooVersion::GUID(" or "FGuid GUID =")
+# language=pythonregexp
+guid_definition_pattern = r"FGuid[ \t]+[A-Za-z0-9_:]+[ \t]*[=({]"
+
+symbol_index_pathspecs = ["*.h", "*.inl", "*.cpp"]
+
 NameFilter = Callable[[str], bool]
 
 g_engine_root: Path
 
+g_state: ExtractionState
+""" State updated with the custom versions found in this run """
+
+g_previous_state: ExtractionState
+""" Custom versions found in the previous run """
+
+g_new_tags: list[str]
+""" Tags which are not included in g_previous_state """
+
 
 @dataclass
 class CustomVersion:
     enum_name: str
-    guid: str
+    # Components of the GUID (A, B, C, D), None if it was not found
+    guid: list[int] | None
     enum_values: list[SerializationVersion]
 
 
+@dataclass
+class SymbolIndex:
+    """
+    Index of the symbols declared in a tag, built with a single git grep over the whole tree.
+    Used to resolve where enums and GUIDs are defined without scanning the repository for each of them.
+    """
+
+    # Name of the enum/struct/namespace -> files where it is declared
+    declarations: dict[str, list[str]]
+    # Name of the FGuid constant, as written in the definition (eg: "FFooVersion::GUID" or "GUID") -> files
+    guid_definitions: dict[str, list[str]]
+
+    def find_declaration(self, name: str) -> list[str]:
+        return self.declarations.get(name) or self.declarations.get(
+            name.rsplit("::", 1)[-1], []
+        )
+
+    def find_guid_definition(self, guid_prop: str) -> list[str]:
+        files = list(self.guid_definitions.get(guid_prop, []))
+
+        # The GUID may be defined inside the struct/namespace (eg: "namespace FFooVersion { const FGuid GUID(...); }")
+        if "::" in guid_prop:
+            scope, guid_name = guid_prop.rsplit("::", 1)
+            defined_in = set(self.guid_definitions.get(guid_name, []))
+            files += [f for f in self.find_declaration(scope) if f in defined_in]
+
+        return files
+
+
+@lru_cache(maxsize=None)
+def get_symbol_index(tag: str) -> SymbolIndex:
+    print(f"Indexing symbols of {tag}...")
+    with g_profiler.phase("custom_versions.symbol_index") as timer:
+        index = SymbolIndex({}, {})
+        matches = grep_matches(
+            g_engine_root,
+            [symbol_declaration_pattern, guid_definition_pattern],
+            tag,
+            symbol_index_pathspecs,
+        )
+
+        for file, text in matches:
+            # The indentation is part of the match, unless git omits it
+            text = text.strip()
+            if match := re.match(r"FGuid\s+([\w:]+)", text):
+                table = index.guid_definitions
+            else:
+                match = re.match(
+                    r"(?:enum(?:\s+class)?|struct|namespace)\s+(?:\w+_API\s+)?([\w:]+)",
+                    text,
+                )
+                table = index.declarations
+
+            name = match.group(1).rstrip(":")
+            files = table.setdefault(name, [])
+            if file not in files:
+                files.append(file)
+
+    print(f"Indexed {len(matches)} symbols in {timer.wall:.2f}s")
+    return index
+
+
 def read_interesting_versions() -> NameFilter:
     all_rules = []
     for line in read_file(interesting_versions_path).splitlines():
@@ -101,63 +198,118 @@ def read_interesting_versions() -> NameFilter:
     return lambda name: any(re.search(rule, name) for rule in all_rules)
 
 
-def extract_custom_versions(unreal_path: Path):
-    global g_engine_root
+def extract_custom_versions(
+    unreal_path: Path,
+    state: ExtractionState | None = None,
+    enum_name_filter: NameFilter | None = None,
+):
+    """
+    Extracts all custom versions.
+    If a state is provided, the history of already known enums is only scanned for the new tags.
+    Enums are filtered with InterestingVersions.txt, unless another filter is given.
+    """
+    global g_engine_root, g_state, g_previous_state, g_new_tags
     g_engine_root = unreal_path
 
+    output_dir = get_output_dir()
     if not output_dir.exists():
         output_dir.mkdir(parents=True)
 
-    enum_name_filter = read_interesting_versions()
+    enum_name_filter = enum_name_filter or read_interesting_versions()
 
     # List of Unreal Engine tags (eg: ["5.3.0-release", "5.3.1-release", ...])
     unreal_tags = extract_tags(unreal_path)
     latest_version = unreal_tags[-1]
 
+    g_state = state or ExtractionState()
+    g_new_tags = g_state.find_new_tags(unreal_tags)
+
+    # Registrations are always collected again, the previous tables are only used to skip the old tags
+    g_previous_state = ExtractionState(
+        files=g_state.files,
+        tables={name: g_state.tables.pop(name) for name in g_state.files},
+    )
+    g_state.files = {}
+
     # Starts by reading the list of files where a registration might be present
     files = grab_source_files(unreal_tags[-1])
     processed_names = set()
     custom_versions = []
 
-    for i, relative_path in enumerate(files):
-        print(f"[{i + 1}/{len(files)}] Processing {relative_path}")
+    # Built upfront, since both the registration scan and the history walk use it
+    get_symbol_index(latest_version)
 
-        # Skip files that don't contain custom version registration
-        for custom_version in scan_for_custom_versions(
-            relative_path, enum_name_filter, unreal_tags
-        ):
-            enum_name = custom_version.enum_name
+    # Each file goes through a pipeline of stages running in parallel, so reading blobs from git overlaps with
+    # parsing. Every stage runs in a single thread, so the enums reach the last stages in the same order of the
+    # sequential scan (the renaming of duplicates and the written files don't depend on the timing).
+    def fetch_source(item: tuple[int, Path]):
+        i, relative_path = item
+        print(f"[{i + 1}/{len(files)}] Processing {relative_path}")
+        yield relative_path, get_git_file(g_engine_root, relative_path, latest_version)
 
-            if enum_name in known_duplicates:
-                # Rename the enum to avoid duplicates
-                enum_name = f"{enum_name}_v{len(custom_versions)}"
-                warning(
-                    f"Renaming duplicate custom version {custom_version.enum_name} to {enum_name}"
-                )
-                custom_version.enum_name = enum_name
+    def scan_registrations(item: tuple[Path, str]):
+        relative_path, source = item
+        yield from scan_for_custom_versions(
+            relative_path, source, enum_name_filter, latest_version
+        )
 
-            # Check for duplicates
-            if enum_name in processed_names:
-                error(f"Duplicate custom version {enum_name}")
-            processed_names.add(enum_name)
+    def walk_history(custom_version: CustomVersion):
+        start = time.perf_counter()
+        custom_version.enum_values = find_enum_definition(
+            custom_version.enum_name, unreal_tags
+        )
+        g_profiler.add_timing(
+            "custom_version_enums",
+            custom_version.enum_name,
+            time.perf_counter() - start,
+        )
+        yield custom_version
 
-            custom_versions.append(custom_version)
+    def format_version(custom_version: CustomVersion):
+        enum_name = custom_version.enum_name
 
-            # Write the version file
-            output_file = (
-                output_dir / f"custom-versions-enums/{custom_version.enum_name}.ts"
-            )
-            write_file(
-                output_file, format_custom_version(custom_version, latest_version)
+        if enum_name in known_duplicates:
+            # Rename the enum to avoid duplicates
+            enum_name = f"{enum_name}_v{len(custom_versions)}"
+            warning(
+                f"Renaming duplicate custom version {custom_version.enum_name} to {enum_name}"
             )
+            custom_version.enum_name = enum_name
+
+        # Check for duplicates
+        if enum_name in processed_names:
+            error(f"Duplicate custom version {enum_name}")
+        processed_names.add(enum_name)
+
+        custom_versions.append(custom_version)
+
+        output_file = output_dir / f"custom-versions-enums/{enum_name}.ts"
+        out = io.StringIO()
+        format_custom_version(out, custom_version, latest_version)
+        yield output_file, out.getvalue()
+
+    def write_version(item: tuple[Path, str]):
+        write_file(*item)
+
+    with g_profiler.phase("custom_versions.pipeline"):
+        run_pipeline(
+            enumerate(files),
+            [
+                fetch_source,
+                scan_registrations,
+                walk_history,
+                format_version,
+                write_version,
+            ],
+            name="custom_versions.pipeline",
+        )
 
     # Sort custom_versions by enum_name
     custom_versions.sort(key=lambda cv: cv.enum_name)
 
-    write_file(
-        output_dir / "ue-custom-versions.ts",
-        format_custom_versions_index(custom_versions),
-    )
+    with g_profiler.phase("custom_versions.write_index"):
+        with open_output(output_dir / "ue-custom-versions.ts") as out:
+            format_custom_versions_index(out, custom_versions)
 
     # Write skipped.txt
     if g_skipped_enums:
@@ -168,81 +320,86 @@ def extract_custom_versions(unreal_path: Path):
 
 def grab_source_files(latest_tag: str) -> List[Path]:
     print("Looking for source files...")
-    start = time.time()
 
     # Get all files which contains at least one custom version registration
     unique_files = set()
-    for pattern in custom_version_registration:
-        files = grep_files(g_engine_root, pattern, latest_tag)
-        for file in files:
-            if file.suffix.lower() == ".cpp":
-                unique_files.add(file)
-
-    print(f"Found {len(unique_files)} files in {time.time() - start:.2f}s")
+    with g_profiler.phase("custom_versions.grab_source_files") as timer:
+        for pattern in custom_version_registration:
+            files = grep_files(g_engine_root, pattern, latest_tag)
+            for file in files:
+                if file.suffix.lower() == ".cpp":
+                    unique_files.add(file)
+
+    print(f"Found {len(unique_files)} files in {timer.wall:.2f}s")
     return sorted(list(unique_files))
 
 
-def format_guid(guid: str) -> str:
+def parse_guid(guid: str) -> list[int]:
+    """Components of a GUID matched by guid_pattern, the same of FGuid.fromComponents (and FGuid.fromString)."""
     match = re.match(guid_pattern, guid, re.IGNORECASE)
     assert match
 
     if pattern1 := match.group(1):
-        return f"FGuid.fromComponents({pattern1.lower()})"
+        return [int(component, 16) for component in pattern1.split(",")]
 
     if pattern2 := match.group(2):
-        return f'FGuid.fromString("{{{pattern2}}}")'
+        digits = pattern2.replace("-", "")
+        return [int(digits[i : i + 8], 16) for i in range(0, 32, 8)]
 
     assert False
 
 
-def find_guid(source: str, guid_prop: str) -> str or None:
+def format_guid_components(guid: list[int] | None) -> str:
+    if guid is None:
+        return "__INVALID_GUID__"
+    return ", ".join(f"0x{component:08x}" for component in guid)
+
+
+def format_guid(guid: list[int] | None) -> str:
+    if guid is None:
+        return "__INVALID_GUID__"
+    return f"FGuid.fromComponents({format_guid_components(guid)})"
+
+
+def find_guid(source: str, guid_prop: str) -> list[int] | None:
     standard = r"const FGuid __name__(?:\s*=\s*FGuid)?(" + guid_pattern + r");"
 
     # Match GUID
     if matched := re.search(
         standard.replace("__name__", guid_prop), source, re.IGNORECASE
     ):
-        return format_guid(matched.group(1))
+        return parse_guid(matched.group(1))
 
     if guid_prop.lower().endswith("::guid"):
         without_suffix = guid_prop.rsplit("::", 1)[0]
-        with_namespace = rf"(?:namespace|struct)\s+{without_suffix}\s*{{"
-        if matched := re.search(with_namespace, source, re.IGNORECASE):
+        with_namespace = rf"(?:namespace|struct)\s+{without_suffix}"
+        if block := find_block(source, with_namespace):
             in_namespace = r"\bFGuid GUID(?: = FGuid)?(" + guid_pattern + r");"
-            remaining = follow_paren(source[matched.end() - 1 :])
-
-            if matched := re.search(in_namespace, remaining, re.IGNORECASE):
-                return format_guid(matched.group(1))
+            if matched := re.compile(in_namespace, re.IGNORECASE).search(
+                source, *block
+            ):
+                return parse_guid(matched.group(1))
 
     return None
 
 
-def scan_possible_files(enum_name: str, latest_tag: str):
+def scan_possible_files(enum_name: str, latest_tag: str) -> List[Path]:
     """
-    Returns a generator of possible files that may contain the enum definition.
+    Returns the list of possible files that may contain the enum definition.
+    Files named after the enum (eg: "FooVersion.h" for "FFooVersion") and headers are returned first.
     :param enum_name:
     :param latest_tag:
     :return:
     """
+    short_name = enum_name.rsplit("::", 1)[-1]
+    preferred_names = {f"{short_name}.h".lower(), f"{short_name[1:]}.h".lower()}
 
-    # 1. Try from the list of hardcoded filenames
-    if enum_name in filename_hint:
-        yield from get_full_name_from_filename(
-            g_engine_root, filename_hint[enum_name], latest_tag
-        )
-
-    # 2. Try with the enum name
-    yield from get_full_name_from_filename(g_engine_root, enum_name + ".h", latest_tag)
+    def sort_key(file: str):
+        path = Path(file)
+        return path.name.lower() not in preferred_names, path.suffix != ".h", file
 
-    # 3. Try with the enum name without F prefix
-    if enum_name.startswith("F"):
-        file_name = enum_name[1:] + ".h"
-        yield from get_full_name_from_filename(g_engine_root, file_name, latest_tag)
-
-    # Last resort: find all files with the enum name in the content
-    print(f"Continue to search for {enum_name} using git grep")
-    for filename in grep_files(g_engine_root, enum_name, latest_tag):
-        yield filename
+    files = get_symbol_index(latest_tag).find_declaration(enum_name)
+    return [Path(file) for file in sorted(files, key=sort_key)]
 
 
 def find_enum_definition(
@@ -252,48 +409,128 @@ def find_enum_definition(
     latest_tag = unreal_tags[-1]
 
     for relative_path in scan_possible_files(enum_name, latest_tag):
-        source = get_git_file(g_engine_root, relative_path, latest_tag)
+        blob_id = get_git_blob_id(g_engine_root, relative_path, latest_tag)
 
         # Find nested struct syntax
-        if parse_enum_with_name(g_engine_root, latest_tag, enum_name, source):
-            # Aggregate the same filename on other versions
-            list_versions = []
+        # A block without versions is not the definition, unless they are defined in an inline file
+        summary = blob_id and get_enum_summary(g_engine_root, blob_id, enum_name)
+        if summary and (summary["rows"] or summary["include"]):
+            file = relative_path.as_posix()
 
-            for tag in reversed(unreal_tags):
-                revision = get_git_file(g_engine_root, relative_path, tag)
-                if not revision:
-                    break
+            # If the enum was already in the same file, only the new tags need to be scanned
+            previous_versions = None
+            if g_previous_state.files.get(enum_name) == file:
+                previous_versions = g_previous_state.tables[enum_name]
 
-                versions_at_revision = parse_enum_with_name(
-                    g_engine_root, tag, enum_name, revision
-                )
-                if not versions_at_revision:
-                    # The enum exists in a newer version, but not in this one
-                    # This is probably legit
-                    break
+            # Aggregate the same filename on other versions
+            table, complete = aggregate_enum_history(
+                enum_name,
+                relative_path,
+                unreal_tags if previous_versions is None else g_new_tags,
+            )
+
+            # If the history stops within the new tags, the older ones are not part of it
+            if previous_versions is not None and complete:
+                table.aggregate(previous_versions)
 
-                aggregate_versions(versions_at_revision, list_versions)
+            if not table.versions:
+                continue
 
-            return list_versions
+            g_state.tables[enum_name] = table.versions
+            g_state.files[enum_name] = file
+            return table.versions
 
     error(f"Enum definition of {enum_name} not found")
 
 
-def find_guid_in_files(source: str, guid_prop: str, latest_tag: str) -> str:
+def aggregate_enum_history(
+    enum_name: str,
+    relative_path: Path,
+    unreal_tags: list[str],
+) -> tuple[VersionTable, bool]:
+    """
+    Aggregates the enum from the given tags, starting from the latest one.
+    The blob id of the file is resolved first, so files which didn't change between tags are not parsed again.
+    Returns the aggregated table, and whether the history covers all the tags.
+    """
+    table = VersionTable()
+
+    # Blob id of the file which defines the values -> versions aggregated from it
+    aggregated_by_blob: dict[str, list[SerializationVersion]] = {}
+
+    for tag in reversed(unreal_tags):
+        start = time.perf_counter()
+        blob_id = get_git_blob_id(g_engine_root, relative_path, tag)
+        if not blob_id:
+            break
+
+        # The header is scanned once for all its enums, and only in the first run
+        summary = get_enum_summary(g_engine_root, blob_id, enum_name)
+        if not summary:
+            # The enum exists in a newer version, but not in this one
+            # This is probably legit
+            break
+
+        # The values may be defined in an inline file, which can change without touching the header
+        content_id = blob_id
+        if inline_file := summary["include"]:
+            inline_path = find_inline_file(g_engine_root, inline_file, tag)
+            content_id = get_git_blob_id(g_engine_root, inline_path, tag)
+
+        if content_id in aggregated_by_blob:
+            extend_appearance(aggregated_by_blob[content_id], tag)
+        else:
+            versions_at_revision = parse_enum_blob(
+                g_engine_root, blob_id, enum_name, tag, inline_files=True
+            )
+            if not versions_at_revision:
+                break
+
+            aggregated_by_blob[content_id] = table.aggregate(versions_at_revision)
+
+        g_profiler.add_timing("custom_version_tags", tag, time.perf_counter() - start)
+    else:
+        return table, True
+
+    return table, False
+
+
+def find_guid_in_file(
+    relative_path: Path, guid_prop: str, latest_tag: str, source: str | None = None
+) -> list[int] | None:
+    """find_guid on a file of the latest tag, the result is saved in the parse store by blob id."""
+    blob_id = get_git_blob_id(g_engine_root, relative_path, latest_tag)
+    if not blob_id:
+        return None
+
+    store = get_parse_store()
+    if store:
+        found, guid = store.get("guids", blob_id, guid_prop)
+        if found:
+            return guid
+
+    if source is None:
+        source = read_git_blob(g_engine_root, blob_id)
+    guid = find_guid(source, guid_prop)
+    if store:
+        store.put("guids", blob_id, guid_prop, guid)
+    return guid
+
+
+def find_guid_in_files(
+    relative_path: Path, source: str, guid_prop: str, latest_tag: str
+) -> list[int] | None:
     # Match GUID
-    if matched := find_guid(source, guid_prop):
+    if matched := find_guid_in_file(relative_path, guid_prop, latest_tag, source):
         return matched
 
-    # Exceptional cases
-    if guid_prop in field_to_filename:
-        source_file = get_git_file(
-            g_engine_root, field_to_filename[guid_prop], latest_tag
-        )
-        if matched := find_guid(source_file, guid_prop):
+    # Look for the files where the GUID is defined
+    for relative_path in get_symbol_index(latest_tag).find_guid_definition(guid_prop):
+        if matched := find_guid_in_file(relative_path, guid_prop, latest_tag):
             return matched
 
     warning(f"Cannot find GUID for {guid_prop}")
-    return "__INVALID_GUID__"
+    return None
 
 
 def iterate_enum_registrations(source: str) -> List[str]:
@@ -308,7 +545,14 @@ def iterate_enum_registrations(source: str) -> List[str]:
     returns "FAvaExtrudeModifierVersion::GUID"]
     """
 
-    iterator = TokenIterator(source)
+    if not has_custom_version_registration(source):
+        return []
+
+    # Tokens are consumed in order, there is no need to store them
+    iterator = TokenIterator(source, stream=True)
+    search_token = registration_token_pattern.search
+    # The pattern doesn't know about non-ASCII digits, these rare sources are parsed token by token
+    can_skip_tokens = not has_non_ascii_numbers(source)
 
     # State variables
     current_namespace = None
@@ -324,6 +568,20 @@ def iterate_enum_registrations(source: str) -> List[str]:
 
         return None
 
+    def skip_tokens():
+        """Jumps to the next token which is handled by parse_single_item, tokenizing only that region."""
+        if not can_skip_tokens:
+            iterator.advance()
+            return
+
+        pos = iterator.token_end
+        while match := search_token(source, pos):
+            if match.lastindex:
+                iterator.seek(match.start())
+                return
+            pos = match.end()
+        iterator.seek(len(source))
+
     def combine_name(name: str) -> str:
         if current_namespace:
             return f"{current_namespace}::{name}"
@@ -374,8 +632,7 @@ def iterate_enum_registrations(source: str) -> List[str]:
             return
 
         else:
-            # Advance unknown tokens
-            iterator.advance()
+            skip_tokens()
 
     def parse_block():
         assert iterator.token_text == "{"
@@ -390,17 +647,20 @@ def iterate_enum_registrations(source: str) -> List[str]:
     while not iterator.is_eof():
         parse_single_item()
 
+    g_profiler.count("tokens", iterator.index)
     return result
 
 
 def scan_for_custom_versions(
     relative_path: Path,
+    source: str,
     enum_name_filter: NameFilter,
-    unreal_tags: list[str],
+    latest_tag: str,
 ) -> Generator[CustomVersion, None, None]:
-    latest_tag = unreal_tags[-1]
-    source = get_git_file(g_engine_root, relative_path, latest_tag)
-
+    """
+    Yields the custom versions registered in the source file, with their GUID.
+    The values of the enums are filled later by find_enum_definition.
+    """
     if relative_path.name in disallowed_files:
         print(f"Skipping {relative_path} as it is in the disallowed files list")
         return
@@ -428,14 +688,9 @@ def scan_for_custom_versions(
             enum_name = hardcoded_names[enum_name]
 
         print(f"Scanning enum {enum_name}")
-        guid = find_guid_in_files(source, guid_prop, latest_tag)
-        enum_values = find_enum_definition(enum_name, unreal_tags)
+        guid = find_guid_in_files(relative_path, source, guid_prop, latest_tag)
 
-        yield CustomVersion(
-            enum_name,
-            guid,
-            enum_values,
-        )
+        yield CustomVersion(enum_name, guid, [])
 
 
 def has_custom_version_registration(source: str) -> bool:
@@ -446,52 +701,64 @@ def has_custom_version_registration(source: str) -> bool:
     return False
 
 
-def format_custom_version(custom_version: CustomVersion, latest_version: str) -> str:
-    result = make_header("extract_custom_versions.py") + "\n"
+def format_custom_version(
+    out: TextIO, custom_version: CustomVersion, latest_version: str
+):
+    write = out.write
+    write(make_header("extract_custom_versions.py") + "\n")
 
-    result += (
-        'import { VersionDetails, CustomVersionGuid } from "../CustomVersionGuid";\n'
+    write(
+        'import { LazyVersionDetails, CustomVersionGuid } from "../CustomVersionGuid";\n'
     )
-    result += 'import { FGuid } from "../../modules/CoreUObject/structs/Guid";\n\n'
+    write('import { FGuid } from "../../modules/CoreUObject/structs/Guid";\n\n')
 
-    result += print_table(custom_version.enum_name, custom_version.enum_values)
+    print_table(out, custom_version.enum_name, custom_version.enum_values)
+    write("\n")
 
     # Add details
-    result = format_details(
-        result,
+    format_details(
+        out,
         custom_version.enum_name + "Details",
         custom_version.enum_values,
         latest_version,
     )
-    result += "\n"
+    write("\n")
 
     # Add the guid
-    result += f"export const {custom_version.enum_name}Guid = new CustomVersionGuid<{custom_version.enum_name}>({{\n"
-    result += f'  name: "{custom_version.enum_name}",\n'
-    result += f"  guid: {custom_version.guid},\n"
-    result += f"  details: {custom_version.enum_name}Details,\n"
-    result += "});\n"
+    write(
+        f"export const {custom_version.enum_name}Guid = new CustomVersionGuid<{custom_version.enum_name}>({{\n"
+    )
+    write(f'  name: "{custom_version.enum_name}",\n')
+    write(f"  guid: {format_guid(custom_version.guid)},\n")
+    write(f"  details: {custom_version.enum_name}Details,\n")
+    write("});\n")
+    write("\n")
+    # Loaded on demand by the index of the custom versions
+    write(f"export default {custom_version.enum_name}Guid;\n")
 
-    return result
 
+def format_custom_versions_index(out: TextIO, custom_versions: list[CustomVersion]):
+    """
+    The index only has what is needed to recognize a custom version, the module of each version is imported
+    dynamically, so the viewer loads only the versions it needs.
+    """
+    write = out.write
+    write(make_header("extract_custom_versions.py") + "\n")
 
-def format_custom_versions_index(custom_versions: list[CustomVersion]) -> str:
-    result = make_header("extract_custom_versions.py") + "\n"
+    write('import { CustomVersionIndex } from "./CustomVersionGuid";\n')
+    write("\n")
 
+    write("export const customVersionIndex = new CustomVersionIndex([\n")
     for version in custom_versions:
-        result += (
-            f"import {{ {version.enum_name}Guid }} "
-            f'from "./custom-versions-enums/{version.enum_name}";\n'
+        write("  {\n")
+        write(f"    guid: [{format_guid_components(version.guid)}],\n")
+        write(f'    name: "{version.enum_name}",\n')
+        write(f"    latestVersion: {version.enum_values[-1].value},\n")
+        write(
+            f'    load: () => import("./custom-versions-enums/{version.enum_name}"),\n'
         )
-    result += 'import type { CustomVersionGuid } from "./CustomVersionGuid";\n'
-    result += "\n"
-
-    result += "export const allCustomVersions: ReadonlyArray<CustomVersionGuid> = [\n"
-    for version in custom_versions:
-        result += f"    {version.enum_name}Guid,\n"
-    result += "];\n"
-
-    return result
+        write("  },\n")
+    write("]);\n")
 
 
 if __name__ == "__main__":
@@ -499,5 +766,9 @@ if __name__ == "__main__":
         "Extract all custom eversion from Unreal Engine source code"
     )
 
+    if args.output_dir:
+        set_output_dir(args.output_dir)
+
     extract_custom_versions(Path(args.unreal_engine_path))
+    print_file_statistics()
     fail_if_warnings()
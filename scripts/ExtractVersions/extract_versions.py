@@ -1,20 +1,39 @@
+import bisect
+import hashlib
+import json
 import re
-from dataclasses import dataclass
+import sys
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from typing import TextIO
 
 from utils import (
-    parse_block,
+    compute_parser_version,
+    interesting_versions_path,
+    get_parse_store,
+    get_source_index,
+    memory_cache,
     error,
     extract_tags,
     clean_tag_name,
-    get_git_file,
-    compare_versions,
-    write_file,
+    get_git_blob_id,
+    read_git_blob,
+    tag_name,
+    tag_ordinal,
+    is_known_tag,
+    create_process_pool,
+    open_output,
+    print_file_statistics,
+    read_file,
     parse_global_args,
     make_header,
     warning,
     get_full_name_from_filename,
     fail_if_warnings,
+    g_profiler,
+    run_profiled,
 )
 
 output_dir = Path(__file__).parent.parent.parent / "src/unreal-engine/versioning"
@@ -22,11 +41,29 @@ output_dir = Path(__file__).parent.parent.parent / "src/unreal-engine/versioning
 
 path_versions = output_dir / "ue-versions.ts"
 path_version_details = output_dir / "ue-version-details.ts"
+path_state = output_dir / "extract-versions-state.json"
+
+
+def set_output_dir(directory: Path):
+    """Changes where the generated files and the state are written."""
+    global output_dir, path_versions, path_version_details, path_state
+    output_dir = directory
+    path_versions = output_dir / "ue-versions.ts"
+    path_version_details = output_dir / "ue-version-details.ts"
+    path_state = output_dir / "extract-versions-state.json"
+
+
+def get_output_dir() -> Path:
+    return output_dir
+
 
 regex_enum_row = r"(?://\s*(.*))?\n\s+([\d\w]+)(?: *= *(\d+))?,"
 
 path_version_file = "Engine/Source/Runtime/Core/Public/UObject/ObjectVersion.h"
 
+ue4_enum_name = "EUnrealEngineObjectUE4Version"
+ue5_enum_name = "EUnrealEngineObjectUE5Version"
+
 # versions to ignore
 ignored_versions = {
     "VER_UE4_OLDEST_LOADABLE_PACKAGE",
@@ -34,59 +71,278 @@ ignored_versions = {
 }
 
 
-@dataclass
+@lru_cache(maxsize=8192)
+def normalize_comment(comment: str) -> str:
+    # The same comments are found in every tag, so each one is normalized once
+    # (the engine has a few thousand distinct comments, the bound only protects against unexpected inputs)
+    # Remove unwanted characters from the comment
+    comment = re.sub(r"[\u00A0\u2000-\u200B]+", " ", comment).strip()
+    # Replace double spaces with single space
+    return re.sub(r"\s+", " ", comment)
+
+
+def range_mask(first: int, last: int) -> int:
+    """Bitset of the ordinals from first to last (inclusive)."""
+    return (1 << (last + 1)) - (1 << first)
+
+
+@dataclass(slots=True)
 class SerializationVersion:
     name: str
     value: int
     comment: str = None
-    first_appearance: str = None
-    last_appearance: str = None
+    # Ordinals of the tags (see TagRegistry), set when the versions of a tag are read (see parse_enum_blob)
+    first_appearance: int = None
+    last_appearance: int = None
+    # Bitset of the ordinals of the tags where the version is present, all the tags of the range by default
+    presence: int = 0
 
     def __post_init__(self):
-        # Remove unwanted characters from the comment
-        self.comment = re.sub(r"[\u00A0\u2000-\u200B]+", " ", self.comment).strip()
-        # Replace double spaces with single space
-        self.comment = re.sub(r"\s+", " ", self.comment)
-
-    def update_version(self, version):
-        if compare_versions(version, self.first_appearance) < 0:
-            self.first_appearance = version
-        if compare_versions(version, self.last_appearance) > 0:
-            self.last_appearance = version
-
-
-def parse_enum_with_name(
-    engine_root: Path | None,
-    tag: str,
-    enum_name: str,
-    source: str,
-) -> list[SerializationVersion] or None:
-    maybe_api = r"(?:\w+_API\s*)?"
-    maybe_class = r"(?:\s*class\b\s*)?"
-    maybe_numeric_type = r"(?::\s*\w+)?"
-
-    if struct_block := parse_block(
-        source, rf"(struct|namespace)\s+{maybe_api}{enum_name}"
-    ):
-        if enum_block := parse_block(
-            struct_block, rf"enum\s+{maybe_class}[\w\d]+\s*{maybe_numeric_type}"
+        self.comment = normalize_comment(self.comment)
+        if not self.presence and self.first_appearance is not None:
+            self.presence = range_mask(self.first_appearance, self.last_appearance)
+
+    def update_version(self, ordinal: int):
+        self.presence |= 1 << ordinal
+        if ordinal < self.first_appearance:
+            self.first_appearance = ordinal
+        if ordinal > self.last_appearance:
+            self.last_appearance = ordinal
+
+    def merge_appearances(self, other: "SerializationVersion"):
+        self.presence |= other.presence
+        self.first_appearance = min(self.first_appearance, other.first_appearance)
+        self.last_appearance = max(self.last_appearance, other.last_appearance)
+
+    def has_gaps(self) -> bool:
+        """Whether the version was removed and restored between its first and last appearance."""
+        return self.presence != range_mask(self.first_appearance, self.last_appearance)
+
+    def missing_ordinals(self) -> list[int]:
+        """Tags between the first and the last appearance where the version is not present."""
+        missing = ~self.presence & range_mask(
+            self.first_appearance, self.last_appearance
+        )
+        return [
+            ordinal
+            for ordinal in range(self.first_appearance, self.last_appearance + 1)
+            if missing >> ordinal & 1
+        ]
+
+
+@dataclass
+class ExtractionState:
+    """
+    Result of the last extraction, saved next to the generated files.
+    Later runs only process the tags added since then, and merge them with these tables.
+    """
+
+    processed_tags: list[str] = field(default_factory=list)
+    # Enum name -> aggregated versions
+    tables: dict[str, list[SerializationVersion]] = field(default_factory=dict)
+    # Custom version enum name -> file where the enum is defined
+    files: dict[str, str] = field(default_factory=dict)
+
+    def find_new_tags(self, tags: list[str]) -> list[str]:
+        """
+        Returns the tags which need to be processed.
+        If the saved tables cannot be updated incrementally, they are discarded and all tags are returned.
+        """
+        if not self.processed_tags:
+            return tags
+
+        processed = set(self.processed_tags)
+        new_tags = [tag for tag in tags if tag not in processed]
+
+        if not processed.issubset(tags):
+            print("Some processed tags are missing, processing all tags")
+        elif new_tags and tag_ordinal(new_tags[0]) < tag_ordinal(
+            self.processed_tags[-1]
         ):
-            return parse_enum_content(engine_root, tag, enum_block)
+            # Aggregation goes from the latest to the oldest tag, so older tags cannot be appended
+            print(
+                f"Tag {new_tags[0]} is older than processed tags, processing all tags"
+            )
+        else:
+            return new_tags
 
-    if enum_block := parse_block(
-        source, rf"enum\s+{maybe_class}{maybe_api}{enum_name}(?:\s*:\s*[\w\d]+)?"
-    ):
-        return parse_enum_content(engine_root, tag, enum_block)
+        self.processed_tags = []
+        self.tables = {}
+        self.files = {}
+        return tags
 
-    return None
 
+def compute_state_inputs() -> dict[str, str]:
+    """
+    What the saved tables depend on, besides the tags: the code of the extractor and the custom versions to extract.
+    The state is discarded when one of them changes.
+    """
+    return {
+        "parser_version": compute_parser_version(),
+        "interesting_versions": hashlib.sha1(
+            interesting_versions_path.read_bytes()
+        ).hexdigest(),
+    }
+
+
+def load_state() -> ExtractionState:
+    """
+    The tags are saved by name, so the tags of the repository must be registered first (see extract_tags).
+    """
+    if not path_state.exists():
+        return ExtractionState()
+
+    data = json.loads(read_file(path_state))
+    if any(data.get(key) != value for key, value in compute_state_inputs().items()):
+        print(
+            f"Ignoring {path_state}, the extractor or InterestingVersions.txt changed since it was saved"
+        )
+        return ExtractionState()
+
+    if not all(is_known_tag(tag) for tag in data["tags"]):
+        print(f"Ignoring {path_state}, some processed tags are missing")
+        return ExtractionState()
+
+    def load_version(name, value, comment, first, last, missing=()):
+        version = SerializationVersion(
+            name, value, comment, tag_ordinal(first), tag_ordinal(last)
+        )
+        for tag in missing:
+            version.presence &= ~(1 << tag_ordinal(tag))
+        return version
+
+    tables = {
+        name: [load_version(*row) for row in rows]
+        for name, rows in data["tables"].items()
+    }
+    return ExtractionState(data["tags"], tables, data["files"])
+
+
+def save_state(state: ExtractionState):
+    def format_row(v: SerializationVersion):
+        row = [
+            v.name,
+            v.value,
+            v.comment,
+            tag_name(v.first_appearance),
+            tag_name(v.last_appearance),
+        ]
+        # The tags where the version is missing are only saved when there are some
+        if v.has_gaps():
+            row.append([tag_name(ordinal) for ordinal in v.missing_ordinals()])
+        return row
+
+    def format_rows(rows: list[SerializationVersion]):
+        return ",\n".join("      " + json.dumps(format_row(v)) for v in rows)
+
+    tables = ",\n".join(
+        f"    {json.dumps(name)}: [\n{format_rows(rows)}\n    ]"
+        for name, rows in sorted(state.tables.items())
+    )
+
+    # One version per line, so that the diff stays readable
+    with open_output(path_state) as out:
+        out.write("{\n")
+        for key, value in compute_state_inputs().items():
+            out.write(f"  {json.dumps(key)}: {json.dumps(value)},\n")
+        out.write(f'  "tags": {json.dumps(state.processed_tags)},\n')
+        out.write(f'  "files": {json.dumps(state.files, sort_keys=True)},\n')
+        out.write(f'  "tables": {{\n{tables}\n  }}\n')
+        out.write("}\n")
+
+
+# Declarations which can contain a versioning enum, as matched by HeaderEnums:
+# a struct/namespace with the name of the version, or an enum with the name of the version
+# language=pythonregexp
+regex_enum_scope = (
+    r"(?:struct|namespace)\s+(?:\w+_API\s*)?(?P<scope_name>\w+(?:::\w+)*)\s*{"
+    r"|enum\s+(?:\s*class\b\s*)?(?:(?P<api>\w+_API)\s*)?(?P<enum_name>\w+(?:::\w+)*)(?:\s*:\s*\w+)?\s*{"
+)
+enum_scope_pattern = re.compile(regex_enum_scope, re.IGNORECASE)
 
-def parse_enum_content(
-    engine_root: Path | None, tag: str, enum_content: str
-) -> list[SerializationVersion]:
-    if engine_root and "#include" in enum_content:
-        return parse_enums_from_inline_file(engine_root, tag, enum_content)
 
+class HeaderEnums:
+    """
+    Versioning enums of a source, found in a single pass.
+    The enum of a version can be nested in a struct/namespace with the name of the version
+    (eg: "struct FFooVersion { enum Type {...} }"), or declared at the top level with that name.
+    Names are case-insensitive, like the patterns used to find them.
+    Only the bodies of the enums are kept, not the whole source.
+    """
+
+    def __init__(self, source: str):
+        # Lowercase name -> text of the enum body
+        self.blocks: dict[str, str] = {}
+        # Lowercase name -> versions parsed from the enum body
+        self.parsed: dict[str, list[SerializationVersion]] = {}
+
+        index = get_source_index(source)
+        scopes: dict[str, tuple[int, int]] = {}
+        named_enums: dict[str, tuple[int, int]] = {}
+        # Enums which can be nested in a scope (without an API macro)
+        nested_starts: list[int] = []
+        nested_blocks: list[tuple[int, int]] = []
+
+        for match in enum_scope_pattern.finditer(source):
+            brace = match.end() - 1
+            block_end = index.block_end(brace)
+            if block_end is None or index.is_ignored(match.start()):
+                continue
+
+            if scope_name := match.group("scope_name"):
+                scopes.setdefault(scope_name.lower(), (brace, block_end))
+                continue
+
+            enum_name = match.group("enum_name")
+            named_enums.setdefault(enum_name.lower(), (brace, block_end))
+            if not match.group("api") and "::" not in enum_name:
+                nested_starts.append(match.start())
+                nested_blocks.append((brace, block_end))
+
+        blocks = dict(named_enums)
+        for name, (start, end) in scopes.items():
+            # The first enum in the scope
+            i = bisect.bisect_left(nested_starts, start)
+            if i < len(nested_starts) and nested_blocks[i][0] < end:
+                blocks[name] = nested_blocks[i]
+
+        for name, (start, end) in blocks.items():
+            self.blocks[name] = source[start:end]
+
+    def find_block(self, enum_name: str) -> str | None:
+        return self.blocks.get(enum_name.lower())
+
+    def parse_enum(self, enum_name: str) -> list[SerializationVersion] | None:
+        """
+        Same as parse_enum_content on the body of the enum.
+        Values defined in an inline file are not included, see get_inline_rows.
+        """
+        key = enum_name.lower()
+        if key in self.parsed:
+            return self.parsed[key]
+
+        enum_block = self.find_block(enum_name)
+        if not enum_block:
+            return None
+
+        versions = self.parsed[key] = parse_enum_content(enum_block)
+        return versions
+
+    def size_of(self) -> int:
+        return (
+            sys.getsizeof(self.blocks)
+            + sum(map(sys.getsizeof, self.blocks.values()))
+            + len(self.blocks) * 100
+            + sum(len(versions) * 200 for versions in self.parsed.values())
+        )
+
+
+@memory_cache("Header enums", size_of=HeaderEnums.size_of)
+def get_header_enums(root: Path, blob_id: str) -> HeaderEnums:
+    return HeaderEnums(read_git_blob(root, blob_id))
+
+
+def parse_enum_content(enum_content: str) -> list[SerializationVersion]:
     rows = re.findall(regex_enum_row, enum_content)
     value = None
 
@@ -121,42 +377,29 @@ def parse_enum_content(
             error(f"Field {field_name} already found")
         already_found.add(field_name)
 
-        result.append(SerializationVersion(field_name, value, comment, tag, tag))
-        result.append(
-            SerializationVersion(
-                name=field_name,
-                value=value,
-                comment=comment,
-                first_appearance=tag,
-                last_appearance=tag,
-            )
-        )
+        result.append(SerializationVersion(field_name, value, comment))
 
     return result
 
 
-def parse_enums_from_inline_file(
-    engine_root: Path, tag: str, enum_content: str
-) -> list[SerializationVersion]:
-    """
-    UE I hate you so much.
-    FFortniteMainBranchObjectVersion contains the enum definition inline in the file "FortniteMainBranchObjectVersions.inl"
-    So we need to parse that file instead of the main header file.
-    """
-
+def find_inline_include(enum_content: str) -> str | None:
+    """Returns the name of the file included in the enum body, if any."""
     match = re.search(r"^\s*#\s*include\b\s*\"([^$\"]+)\"", enum_content, re.MULTILINE)
-    if not match:
-        error(f"Could not find include for tag {tag}")
+    return match.group(1).strip() if match else None
 
-    inline_file = match.group(1).strip()
+
+def find_inline_file(engine_root: Path, inline_file: str, tag: str) -> Path:
     found_files = get_full_name_from_filename(engine_root, Path(inline_file).name, tag)
     if len(found_files) != 1:
         error(
             f"Expected exactly one file for {inline_file} in tag {tag}, found {len(found_files)}"
         )
+    return found_files[0]
 
-    source_file = get_git_file(engine_root, found_files[0], tag)
 
+def parse_inline_versions(
+    source_file: str, inline_file: str, tag: str
+) -> list[SerializationVersion]:
     # Find macro name
     # #define UE5_MAIN_VERSION(Version, ID) Version,
     match = re.search(
@@ -179,8 +422,6 @@ def parse_enums_from_inline_file(
                 name=name.strip(),
                 value=int(value),
                 comment=comment,
-                first_appearance=tag,
-                last_appearance=tag,
             )
         )
 
@@ -190,92 +431,266 @@ def parse_enums_from_inline_file(
     return result
 
 
-def parse_version_enums(
-    tag: str, enum_name: str, file: str
-) -> list[SerializationVersion]:
-    # find regex
-    enum_content = parse_enum_with_name(None, tag, enum_name, file)
-    if not enum_content:
-        error(f"Enum {enum_name} not found")
+def to_rows(versions: list[SerializationVersion]) -> list[list]:
+    return [[v.name, v.value, v.comment] for v in versions]
 
-    return enum_content
+
+def get_enum_summary(root: Path, blob_id: str, enum_name: str) -> dict | None:
+    """
+    What a header blob defines about an enum, None if the enum is not in the header.
+    - inline: whether the body includes the file where the values are defined (see get_inline_rows)
+    - include: the name of the included file, if found
+    - rows: (name, value, comment) of the versions in the body
+    The summary is saved in the parse store, so the header is not scanned again in later runs.
+    """
+    store = get_parse_store()
+    if store:
+        found, summary = store.get("enums", blob_id, enum_name)
+        if found:
+            return summary
+
+    summary = None
+    header_enums = get_header_enums(root, blob_id)
+    if enum_block := header_enums.find_block(enum_name):
+        inline = "#include" in enum_block
+        summary = {
+            "inline": inline,
+            "include": find_inline_include(enum_block) if inline else None,
+            "rows": to_rows(header_enums.parse_enum(enum_name)),
+        }
+
+    if store:
+        store.put("enums", blob_id, enum_name, summary)
+    return summary
+
+
+def get_inline_rows(
+    root: Path, tag: str, enum_name: str, inline_file: str | None
+) -> list[list]:
+    """
+    Rows of an enum whose values are defined in an inline file.
+    UE I hate you so much.
+    FFortniteMainBranchObjectVersion contains the enum definition inline in the file "FortniteMainBranchObjectVersions.inl"
+    So we need to parse that file instead of the main header file.
+    The rows are saved in the parse store by the blob id of the inline file.
+    """
+    if not inline_file:
+        error(f"Could not find include for tag {tag}")
+
+    blob_id = get_git_blob_id(root, find_inline_file(root, inline_file, tag), tag)
+    store = get_parse_store()
+    if store and blob_id:
+        found, rows = store.get("enums", blob_id, enum_name)
+        if found:
+            return rows
+
+    source_file = read_git_blob(root, blob_id) if blob_id else ""
+    rows = to_rows(parse_inline_versions(source_file, inline_file, tag))
+    if store and blob_id:
+        store.put("enums", blob_id, enum_name, rows)
+    return rows
+
+
+def parse_enum_blob(
+    root: Path, blob_id: str, enum_name: str, tag: str, inline_files: bool = False
+) -> list[SerializationVersion] | None:
+    """
+    Versions of the enum defined in the blob, through the parse store.
+    With inline_files, the values defined in an inline file are read from there (see get_inline_rows).
+    """
+    summary = get_enum_summary(root, blob_id, enum_name)
+    if summary is None:
+        return None
+
+    rows = summary["rows"]
+    if inline_files and summary["inline"]:
+        rows = get_inline_rows(root, tag, enum_name, summary["include"])
+
+    ordinal = tag_ordinal(tag)
+    return [
+        SerializationVersion(
+            name=name,
+            value=value,
+            comment=comment,
+            first_appearance=ordinal,
+            last_appearance=ordinal,
+        )
+        for name, value, comment in rows
+    ]
 
 
 def format_versions(
+    out: TextIO,
     ue4_versions: list[SerializationVersion],
     ue5_versions: list[SerializationVersion],
 ):
-    result = make_header("extract_versions.py")
-    result += "// This file contains all the versions used by Unreal Engine to serialize objects\n"
-    result += "// The global version number is placed in the summary of all assets\n"
-    result += "// See ObjectVersion.h for more information\n\n"
+    out.write(make_header("extract_versions.py"))
+    out.write(
+        "// This file contains all the versions used by Unreal Engine to serialize objects\n"
+        "// The global version number is placed in the summary of all assets\n"
+        "// See ObjectVersion.h for more information\n\n"
+    )
 
-    result += print_table("EUnrealEngineObjectUE4Version", ue4_versions)
-    result += print_table("EUnrealEngineObjectUE5Version", ue5_versions)
+    print_table(out, ue4_enum_name, ue4_versions)
+    out.write("\n")
+    print_table(out, ue5_enum_name, ue5_versions)
 
-    return result.strip() + "\n"
+
+# Width used by prettier for the TypeScript files (see .prettierrc)
+print_width = 120
 
 
 def escape_string(s):
-    return '"' + str(s).replace('"', '\\"') + '"'
+    """String literal with the quotes preferred by prettier (double quotes, unless the string has more of them)."""
+    s = str(s)
+    literal = json.dumps(s, ensure_ascii=False)
+    if s.count('"') > s.count("'"):
+        literal = "'" + literal[1:-1].replace('\\"', '"').replace("'", "\\'") + "'"
+    return literal
+
+
+def format_array_property(out: TextIO, name: str, items: list, fill: bool = False):
+    """
+    Writes `name: [...]` (in an object, indented by 2), with the layout of prettier, so the generated files don't
+    change when the pre-commit hooks run.
+    When it doesn't fit a line, numbers (fill) are packed on as few lines as possible, other items are one per line.
+    """
+    items = [str(item) for item in items]
+    line = f"  {name}: [{', '.join(items)}],"
+    if len(line) <= print_width:
+        out.write(line + "\n")
+        return
+
+    out.write(f"  {name}: [\n")
+    if fill:
+        line = ""
+        for item in items:
+            if line and len(line) + 2 + len(item) <= print_width:
+                line += ", " + item
+            else:
+                if line:
+                    out.write(line + ",\n")
+                line = "    " + item
+        out.write(line + ",\n")
+    else:
+        for item in items:
+            out.write(f"    {item},\n")
+    out.write("  ],\n")
 
 
-def format_details(result, field_name, versions, latest_version):
-    result += f"export const {field_name}: VersionDetails[] = [\n"
+def format_details(out: TextIO, field_name, versions, latest_version):
+    """
+    Writes the details of the versions by column (see PackedVersionDetails in CustomVersionGuid.ts).
+    The viewer creates the VersionDetails objects only when they are needed.
+    """
+    latest_ordinal = tag_ordinal(latest_version)
+
+    # Tags referenced by the versions -> index in the table of releases
+    ordinals = set()
+    for version in versions:
+        ordinals.add(version.first_appearance)
+        if version.last_appearance != latest_ordinal:
+            ordinals.add(version.last_appearance)
+        if version.has_gaps():
+            ordinals.update(version.missing_ordinals())
+    release_index = {ordinal: i for i, ordinal in enumerate(sorted(ordinals))}
+
+    comments: dict[str, int] = {}
+    comment_indexes = []
     for version in versions:
-        result += "  new VersionDetails({\n"
-        result += f"    name: {escape_string(version.name)},\n"
         if version.comment:
-            result += f"    comment: {escape_string(version.comment)},\n"
-        result += f"    value: {version.value},\n"
-        result += f"    firstAppearance: {escape_string(clean_tag_name(version.first_appearance))},\n"
-        if version.last_appearance != latest_version:
-            result += f"    lastAppearance: {escape_string(clean_tag_name(version.last_appearance))},\n"
-        result += "  }),\n"
-    result += "];\n"
-
-    return result
+            comment_indexes.append(comments.setdefault(version.comment, len(comments)))
+        else:
+            comment_indexes.append(-1)
+
+    missing_in = {
+        i: [release_index[ordinal] for ordinal in version.missing_ordinals()]
+        for i, version in enumerate(versions)
+        if version.has_gaps()
+    }
+
+    out.write(f"export const {field_name} = new LazyVersionDetails({{\n")
+    format_array_property(
+        out,
+        "releases",
+        [escape_string(clean_tag_name(tag_name(o))) for o in release_index],
+    )
+    format_array_property(out, "names", [escape_string(v.name) for v in versions])
+    format_array_property(out, "values", [v.value for v in versions], fill=True)
+    format_array_property(out, "comments", [escape_string(c) for c in comments])
+    format_array_property(out, "commentIndexes", comment_indexes, fill=True)
+    format_array_property(
+        out,
+        "firstAppearances",
+        [release_index[v.first_appearance] for v in versions],
+        fill=True,
+    )
+    format_array_property(
+        out,
+        "lastAppearances",
+        [
+            (
+                -1
+                if v.last_appearance == latest_ordinal
+                else release_index[v.last_appearance]
+            )
+            for v in versions
+        ],
+        fill=True,
+    )
+    if missing_in:
+        entries = ", ".join(
+            f"{i}: [{', '.join(map(str, releases))}]"
+            for i, releases in missing_in.items()
+        )
+        line = f"  missingIn: {{ {entries} }},"
+        if len(line) <= print_width:
+            out.write(line + "\n")
+        else:
+            out.write("  missingIn: {\n")
+            for i, releases in missing_in.items():
+                out.write(f"    {i}: [{', '.join(map(str, releases))}],\n")
+            out.write("  },\n")
+    out.write("});\n")
 
 
 def format_version_details(
+    out: TextIO,
     ue4_versions: list[SerializationVersion],
     ue5_versions: list[SerializationVersion],
     latest_version,
 ):
-    result = f"{make_header('extract_versions.py')}\n"
-    result += 'import { VersionDetails } from "./CustomVersionGuid";\n\n'
+    out.write(f"{make_header('extract_versions.py')}\n")
+    out.write('import { LazyVersionDetails } from "./CustomVersionGuid";\n\n')
 
     # Print merged version details
-    result = format_details(
-        result, "versionsDetails", ue4_versions + ue5_versions, latest_version
-    )
-
-    return result
+    format_details(out, "versionsDetails", ue4_versions + ue5_versions, latest_version)
 
 
-def print_table(name, versions: list[SerializationVersion]):
-    result = f"export enum {name} {{\n"
+def print_table(out: TextIO, name, versions: list[SerializationVersion]):
+    write = out.write
+    write(f"export enum {name} {{\n")
 
     last_ue_version = None
 
     for version in versions:
         if last_ue_version != version.first_appearance:
-            if last_ue_version:
-                result += "  // endregion\n\n"
-            result += f"  // region Introduced with UE {clean_tag_name(version.first_appearance)}\n"
+            if last_ue_version is not None:
+                write("  // endregion\n\n")
+            write(
+                f"  // region Introduced with UE {clean_tag_name(tag_name(version.first_appearance))}\n"
+            )
             last_ue_version = version.first_appearance
 
         if version.comment:
-            result += f"  /// {version.comment.strip()}\n"
-        result += f"  {version.name} = {version.value},\n"
-    if last_ue_version:
-        result += "  // endregion\n"
-    result += "\n"
-    result += "  /// Always the latest known version\n"
-    result += f"  LatestVersion = {versions[-1].name},\n"
-    result += "}\n\n"
-
-    return result
+            write(f"  /// {version.comment.strip()}\n")
+        write(f"  {version.name} = {version.value},\n")
+    if last_ue_version is not None:
+        write("  // endregion\n")
+    write("\n")
+    write("  /// Always the latest known version\n")
+    write(f"  LatestVersion = {versions[-1].name},\n")
+    write("}\n")
 
 
 def validate_table(version_by_name_ue4: list[SerializationVersion]):
@@ -287,83 +702,192 @@ def validate_table(version_by_name_ue4: list[SerializationVersion]):
         seen_versions.add(version.value)
 
 
-def aggregate_versions(
-    versions: list[SerializationVersion], result_list: list[SerializationVersion]
-):
-    for v in versions:
-        # Find a constant with the same value but different name
-        if any(it.value == v.value and it.name != v.name for it in result_list):
-            print(f"Version {v.name} with value {v.value} already exists, skipping")
-            continue
+class VersionTable:
+    """
+    Versions of an enum aggregated from several tags, from the latest to the oldest one.
+    Versions are indexed by name and by value, so that merging a tag doesn't scan the whole table.
+    """
 
-        # Get the index of the version already stored in the list, if any
-        found_index = next(
-            (i for i, it in enumerate(result_list) if it.name == v.name),
-            None,
-        )
+    def __init__(self):
+        # In order of insertion
+        self.versions: list[SerializationVersion] = []
+        self.by_name: dict[str, SerializationVersion] = {}
+        # Values are unique, a version with the value of another one is never added
+        self.by_value: dict[int, SerializationVersion] = {}
+
+    def aggregate(
+        self, versions: list[SerializationVersion]
+    ) -> list[SerializationVersion]:
+        """
+        Merges the versions found in a tag into the table.
+        New versions are added to the table as they are, so the given versions must not be used afterward.
+        Returns the versions of the table which have been updated or added.
+        """
+        aggregated = []
+
+        for v in versions:
+            # Find a constant with the same value but different name
+            same_value = self.by_value.get(v.value)
+            if same_value is not None and same_value.name != v.name:
+                print(f"Version {v.name} with value {v.value} already exists, skipping")
+                continue
+
+            found_element = self.by_name.get(v.name)
+
+            if found_element is not None:
+                # Apparently, there is a case in FCustomizableObjectCustomVersion where the value of a version changes between tags.
+                # Since we scan tags from the latest to the oldest, we can just ignore the value change and only use the latest version.
+                if found_element.value != v.value:
+                    warning(
+                        f"Field {v.name} has different version number {v.value} != {found_element.value}"
+                    )
+
+                # Latest version should have a better comment
+                if v.comment and v.comment != found_element.comment:
+                    if v.first_appearance >= found_element.last_appearance:
+                        found_element.comment = v.comment
+
+                found_element.merge_appearances(v)
+                aggregated.append(found_element)
 
-        if found_index is not None:
-            found_element = result_list[found_index]
+            else:
+                self.versions.append(v)
+                self.by_name[v.name] = v
+                self.by_value[v.value] = v
+                aggregated.append(v)
 
-            # Apparently, there is a case in FCustomizableObjectCustomVersion where the value of a version changes between tags.
-            # Since we scan tags from the latest to the oldest, we can just ignore the value change and only use the latest version.
-            if found_element.value != v.value:
-                warning(
-                    f"Field {v.name} has different version number {v.value} != {found_element.value}"
-                )
+        return aggregated
 
-            # Latest version should have a better comment
-            if v.comment and v.comment != found_element.comment:
-                if (
-                    compare_versions(v.first_appearance, found_element.last_appearance)
-                    >= 0
-                ):
-                    found_element.comment = v.comment
 
-            found_element.update_version(v.first_appearance)
-            found_element.update_version(v.last_appearance)
+def extend_appearance(aggregated: list[SerializationVersion], tag: str):
+    """
+    Cheap alternative to VersionTable.aggregate, used when a tag contains a file identical to one already aggregated.
+    Only the appearance range of the versions returned by VersionTable.aggregate needs to be updated.
+    """
+    ordinal = tag_ordinal(tag)
+    for version in aggregated:
+        version.update_version(ordinal)
 
-        else:
-            result_list.append(
-                SerializationVersion(
-                    name=v.name,
-                    value=v.value,
-                    comment=v.comment,
-                    first_appearance=v.first_appearance,
-                    last_appearance=v.last_appearance,
-                )
-            )
 
+def get_version_enum_names(tag: str) -> list[str]:
+    # ue5 is optional
+    if tag.startswith("5."):
+        return [ue4_enum_name, ue5_enum_name]
+    return [ue4_enum_name]
+
+
+def parse_version_blob(
+    unreal_path: Path, blob_id: str, enum_name: str, tag: str
+) -> list[SerializationVersion]:
+    # Both enums of ObjectVersion.h are found with a single scan of the blob
+    start = time.perf_counter()
+    versions = parse_enum_blob(unreal_path, blob_id, enum_name, tag)
+    if not versions:
+        error(f"Enum {enum_name} not found")
+
+    g_profiler.add_timing("parse_version_tags", tag, time.perf_counter() - start)
+    return versions
 
-def extract_versions(unreal_path: Path):
+
+def parse_version_blobs(
+    unreal_path: Path, blobs: dict[tuple[str, str], str], jobs: int
+) -> dict[tuple[str, str], list[SerializationVersion]]:
+    """
+    Parses the enums from each (blob id, enum name), using the tag associated with it.
+    With jobs > 1 the blobs are read and parsed in a pool of processes.
+    """
+    keys = list(blobs)
+    arguments = (
+        [unreal_path] * len(keys),
+        [blob_id for blob_id, _ in keys],
+        [enum_name for _, enum_name in keys],
+        list(blobs.values()),
+    )
+
+    if jobs > 1 and len(keys) > 1:
+        print(f"Parsing {len(keys)} files with {jobs} processes")
+        with create_process_pool(jobs) as pool:
+            results = []
+            for result, profile in pool.map(
+                run_profiled, [parse_version_blob] * len(keys), *arguments
+            ):
+                g_profiler.merge(profile)
+                results.append(result)
+    else:
+        results = list(map(parse_version_blob, *arguments))
+
+    return dict(zip(keys, results))
+
+
+def extract_versions(
+    unreal_path: Path, state: ExtractionState | None = None, jobs: int = 1
+):
+    """
+    Extracts the object versions from all tags.
+    If a state is provided, only the tags which are not in the state are processed, and the state is updated.
+    """
     if not output_dir.exists():
         output_dir.mkdir(parents=True)
 
     if not unreal_path.exists():
         print(f"Path {unreal_path} does not exist")
 
-    version_by_name_ue4: list[SerializationVersion] = []
-    version_by_name_ue5: list[SerializationVersion] = []
+    state = state or ExtractionState()
 
     tags = extract_tags(unreal_path) or error(f"Could not find tags in {unreal_path}")
     latest_version = tags[-1]
 
-    for tag in reversed(tags):
-        # for tag in tags:
-        print(f"Processing tag {tag}")
+    tables = {
+        ue4_enum_name: VersionTable(),
+        ue5_enum_name: VersionTable(),
+    }
+
+    # Resolve the blob of each tag first, most tags share the same ObjectVersion.h, so each blob is parsed only once
+    blob_by_tag: dict[str, str] = {}
+    # (blob id, enum name) -> latest tag containing that blob
+    blobs_to_parse: dict[tuple[str, str], str] = {}
+
+    with g_profiler.phase("object_versions.resolve_blobs"):
+        for tag in reversed(state.find_new_tags(tags)):
+            blob_id = get_git_blob_id(unreal_path, path_version_file, tag)
+            if not blob_id:
+                error(f"Could not find {path_version_file} in tag {tag}")
+
+            blob_by_tag[tag] = blob_id
+            for enum_name in get_version_enum_names(tag):
+                blobs_to_parse.setdefault((blob_id, enum_name), tag)
+
+    with g_profiler.phase("object_versions.parse"):
+        parsed_blobs = parse_version_blobs(unreal_path, blobs_to_parse, jobs)
+
+    # Aggregate from the latest to the oldest tag, like the serial path
+    aggregated_by_blob: dict[tuple[str, str], list[SerializationVersion]] = {}
+
+    with g_profiler.phase("object_versions.aggregate"):
+        for tag, blob_id in blob_by_tag.items():
+            # for tag in tags:
+            print(f"Processing tag {tag}")
+            start = time.perf_counter()
+
+            for enum_name in get_version_enum_names(tag):
+                if (blob_id, enum_name) in aggregated_by_blob:
+                    extend_appearance(aggregated_by_blob[blob_id, enum_name], tag)
+                    continue
+
+                aggregated_by_blob[blob_id, enum_name] = tables[enum_name].aggregate(
+                    parsed_blobs[blob_id, enum_name]
+                )
 
-        file = get_git_file(unreal_path, path_version_file, tag)
+            g_profiler.add_timing(
+                "aggregate_version_tags", tag, time.perf_counter() - start
+            )
 
-        # Extract UE4 versions
-        ue4_versions = parse_version_enums(tag, "EUnrealEngineObjectUE4Version", file)
-        aggregate_versions(ue4_versions, version_by_name_ue4)
+        # Merge the versions of the tags processed in previous runs, which are older than the new ones
+        for enum_name, table in tables.items():
+            table.aggregate(state.tables.get(enum_name, []))
 
-        # ue5 is optional
-        if tag.startswith("5."):
-            ue5_versions = parse_version_enums(
-                tag, "EUnrealEngineObjectUE5Version", file
-            )
-            aggregate_versions(ue5_versions, version_by_name_ue5)
+    version_by_name_ue4 = tables[ue4_enum_name].versions
+    version_by_name_ue5 = tables[ue5_enum_name].versions
 
     print("Validating tables")
     validate_table(version_by_name_ue4)
@@ -374,13 +898,16 @@ def extract_versions(unreal_path: Path):
     version_by_name_ue4.sort(key=lambda v: v.value)
     version_by_name_ue5.sort(key=lambda v: v.value)
 
-    versions = format_versions(version_by_name_ue4, version_by_name_ue5)
-    version_details = format_version_details(
-        version_by_name_ue4, version_by_name_ue5, latest_version
-    )
+    state.tables[ue4_enum_name] = version_by_name_ue4
+    state.tables[ue5_enum_name] = version_by_name_ue5
 
-    write_file(path_versions, versions)
-    write_file(path_version_details, version_details)
+    with g_profiler.phase("object_versions.write"):
+        with open_output(path_versions) as out:
+            format_versions(out, version_by_name_ue4, version_by_name_ue5)
+        with open_output(path_version_details) as out:
+            format_version_details(
+                out, version_by_name_ue4, version_by_name_ue5, latest_version
+            )
 
 
 if __name__ == "__main__":
@@ -388,5 +915,9 @@ if __name__ == "__main__":
         "Check all tags of UnrealEngine repository, and populate the tables of this directory"
     )
 
-    extract_versions(Path(args.unreal_engine_path))
+    if args.output_dir:
+        set_output_dir(args.output_dir)
+
+    extract_versions(Path(args.unreal_engine_path), jobs=args.jobs)
+    print_file_statistics()
     fail_if_warnings()
@@ -0,0 +1,598 @@
+"""
+Backends used to read a git repository without spawning git.
+
+GitObjectDatabase reads the loose objects and the packfiles (memory-mapped, with their v2 `.idx` files) of a `.git`
+directory, MemoryObjectDatabase keeps a synthetic repository in memory.
+Names are resolved like `git cat-file` does for the subset used by the scripts:
+- object ids (eg: "0123...")
+- refs (eg: "HEAD", "5.3.0-release", "refs/tags/5.3.0-release")
+- peeling (eg: "5.3.0-release^{tree}", "5.3.0-release^{}")
+- paths (eg: "5.3.0-release:Engine/Source/Foo.h")
+"""
+
+import hashlib
+import mmap
+import re
+import struct
+import zlib
+from abc import ABC, abstractmethod
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Generator, Tuple, Any
+
+object_id_pattern = re.compile(r"[0-9a-f]{40}")
+
+# Types of the objects stored in a packfile
+object_types = {1: "commit", 2: "tree", 3: "blob", 4: "tag"}
+ofs_delta = 6
+ref_delta = 7
+
+# Size of the slices of the packfile given to zlib while inflating an object
+inflate_chunk_size = 64 * 1024
+
+# Revisions are searched in this order, like `git rev-parse` does
+ref_search_order = ["{}", "refs/{}", "refs/tags/{}", "refs/heads/{}", "refs/remotes/{}"]
+
+
+def parse_tree(content: bytes) -> Generator[Tuple[str, str, str], None, None]:
+    """
+    Parses the content of a git tree object.
+    Returns a generator of (mode, name, object id).
+    """
+    i = 0
+    while i < len(content):
+        space = content.index(b" ", i)
+        nul = content.index(b"\0", space)
+        mode = content[i:space].decode("ascii")
+        name = content[space + 1 : nul].decode("utf-8")
+        object_id = content[nul + 1 : nul + 21].hex()
+        i = nul + 21
+        yield mode, name, object_id
+
+
+def apply_delta(base: bytes, delta: bytes) -> bytes:
+    """Rebuilds an object from its base and the delta stored in the packfile."""
+
+    def read_size(pos: int) -> Tuple[int, int]:
+        size = shift = 0
+        while True:
+            c = delta[pos]
+            pos += 1
+            size |= (c & 0x7F) << shift
+            shift += 7
+            if not c & 0x80:
+                return size, pos
+
+    base_size, pos = read_size(0)
+    result_size, pos = read_size(pos)
+    if base_size != len(base):
+        raise ValueError(f"Delta expects a base of {base_size} bytes, got {len(base)}")
+
+    base_view = memoryview(base)
+    result = bytearray()
+    while pos < len(delta):
+        op = delta[pos]
+        pos += 1
+        if op & 0x80:
+            # Copy from the base, the flags tell which bytes of offset and size are present
+            offset = size = 0
+            for i in range(4):
+                if op & (1 << i):
+                    offset |= delta[pos] << (8 * i)
+                    pos += 1
+            for i in range(3):
+                if op & (0x10 << i):
+                    size |= delta[pos] << (8 * i)
+                    pos += 1
+            result += base_view[offset : offset + (size or 0x10000)]
+        elif op:
+            # Insert the next bytes of the delta
+            result += delta[pos : pos + op]
+            pos += op
+        else:
+            raise ValueError("Invalid delta opcode 0")
+
+    if len(result) != result_size:
+        raise ValueError(f"Delta produced {len(result)} bytes instead of {result_size}")
+    return bytes(result)
+
+
+class PackFile:
+    """
+    A packfile and its index, both memory-mapped.
+    Objects are located with a binary search in the index, and inflated straight from the mapped pack.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.index = self._map(path.with_suffix(".idx"))
+        if (
+            self.index[:4] != b"\377tOc"
+            or struct.unpack_from(">I", self.index, 4)[0] != 2
+        ):
+            raise ValueError(f"Unsupported pack index {path.with_suffix('.idx')}")
+
+        self.fanout = struct.unpack_from(">256I", self.index, 8)
+        count = self.fanout[255]
+        self.names_offset = 8 + 256 * 4
+        # Names are followed by the CRC32 of each object, then by the offsets
+        self.offsets_offset = self.names_offset + count * (20 + 4)
+        self.large_offsets_offset = self.offsets_offset + count * 4
+
+        self.data = self._map(path)
+        self.view = memoryview(self.data)
+
+    @staticmethod
+    def _map(path: Path) -> mmap.mmap:
+        with open(path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def find_offset(self, object_id: bytes) -> int | None:
+        """Returns the offset of the object in the pack, or None if the object is not in this pack."""
+        first = object_id[0]
+        lo = self.fanout[first - 1] if first else 0
+        hi = self.fanout[first]
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = self.names_offset + mid * 20
+            name = self.index[start : start + 20]
+            if name < object_id:
+                lo = mid + 1
+            elif name > object_id:
+                hi = mid
+            else:
+                return self._offset_at(mid)
+        return None
+
+    def _offset_at(self, i: int) -> int:
+        offset = struct.unpack_from(">I", self.index, self.offsets_offset + i * 4)[0]
+        # Packs bigger than 2GB store the offset in a second table
+        if offset & 0x80000000:
+            large_offset = self.large_offsets_offset + (offset & 0x7FFFFFFF) * 8
+            offset = struct.unpack_from(">Q", self.index, large_offset)[0]
+        return offset
+
+    def read_header(self, offset: int) -> Tuple[int, int, int]:
+        """Returns (type, inflated size, offset of the data)."""
+        c = self.data[offset]
+        object_type = (c >> 4) & 7
+        size = c & 0x0F
+        shift = 4
+        offset += 1
+        while c & 0x80:
+            c = self.data[offset]
+            offset += 1
+            size |= (c & 0x7F) << shift
+            shift += 7
+        return object_type, size, offset
+
+    def read_base_distance(self, offset: int) -> Tuple[int, int]:
+        """Returns (distance of the base of an OFS_DELTA object, offset of the data)."""
+        c = self.data[offset]
+        offset += 1
+        distance = c & 0x7F
+        while c & 0x80:
+            c = self.data[offset]
+            offset += 1
+            distance = ((distance + 1) << 7) | (c & 0x7F)
+        return distance, offset
+
+    def inflate(self, offset: int, size: int) -> bytes:
+        # zlib reads slices of the mapped pack, so the compressed data is never copied
+        decompressor = zlib.decompressobj()
+        chunks = []
+        chunk_size = size + 1024
+        while not decompressor.eof:
+            if offset >= len(self.view):
+                raise ValueError(f"Truncated object in {self.path}")
+            chunks.append(
+                decompressor.decompress(self.view[offset : offset + chunk_size])
+            )
+            offset += chunk_size
+            chunk_size = inflate_chunk_size
+
+        content = b"".join(chunks)
+        if len(content) != size:
+            raise ValueError(f"Corrupted object in {self.path}")
+        return content
+
+    def close(self):
+        self.view.release()
+        self.data.close()
+        self.index.close()
+
+
+class Repository(ABC):
+    """
+    Interface of the backends used to read a repository.
+    Objects are requested by name, like `git cat-file` does (eg: "5.3.0-release:Engine/Source/Foo.h").
+    """
+
+    @abstractmethod
+    def read_object(self, name: str) -> Tuple[str, str, bytes] | None:
+        """Returns the tuple (object id, type, content), or None if the object doesn't exist."""
+
+    @abstractmethod
+    def read_object_id(self, name: str) -> str | None:
+        """Returns the id of the object, or None if the object doesn't exist."""
+
+    @abstractmethod
+    def list_tags(self) -> list[str]:
+        """Returns the names of the tags (eg: "5.3.0-release")."""
+
+    @abstractmethod
+    def grep(
+        self, patterns: list[str], revision: str, pathspecs: list[str]
+    ) -> list[Tuple[str, str]]:
+        """
+        Searches the extended regular expressions in the text files of the revision (like `git grep -I -o -E`).
+        Patterns must use the syntax shared by POSIX ERE and python.
+        Pathspecs are wildcards (eg: "*.h"), no pathspec means all files.
+        Returns a list of (file, matched text).
+        """
+
+    def close(self):
+        pass
+
+
+class ObjectDatabase(Repository):
+    """
+    Base of the backends which read the objects in-process.
+    Resolves names (refs, peeling, paths) on top of the storage of objects and refs provided by the subclass.
+    """
+
+    def read_object(self, name: str) -> Tuple[str, str, bytes] | None:
+        """Returns the tuple (object id, type, content), or None if the object doesn't exist."""
+        object_id = self.read_object_id(name)
+        if not object_id:
+            return None
+
+        git_object = self._read(object_id)
+        if not git_object:
+            return None
+        return object_id, git_object[0], git_object[1]
+
+    def read_object_id(self, name: str) -> str | None:
+        """Returns the id of the object, or None if the object doesn't exist."""
+        # eg: "5.3.0-release:Engine/Source/Foo.h"
+        if ":" in name:
+            revision, path = name.split(":", 1)
+            tree_id = self.read_object_id(f"{revision}^{{tree}}")
+            return self._find_path(tree_id, path) if tree_id else None
+
+        # eg: "5.3.0-release^{tree}"
+        if name.endswith("}") and "^{" in name:
+            revision, target_type = name[:-1].rsplit("^{", 1)
+            object_id = self.read_object_id(revision)
+            return self._peel(object_id, target_type) if object_id else None
+
+        if object_id_pattern.fullmatch(name):
+            return name if self._has_object(name) else None
+
+        for pattern in ref_search_order:
+            if object_id := self._read_ref(pattern.format(name)):
+                return object_id
+        return None
+
+    def list_tags(self) -> list[str]:
+        prefix = "refs/tags/"
+        return sorted(ref.removeprefix(prefix) for ref in self._list_refs(prefix))
+
+    def grep(
+        self, patterns: list[str], revision: str, pathspecs: list[str]
+    ) -> list[Tuple[str, str]]:
+        regex = re.compile("|".join(f"(?:{p})" for p in patterns), re.MULTILINE)
+        tree_id = self.read_object_id(f"{revision}^{{tree}}")
+        if not tree_id:
+            return []
+
+        result = []
+        for path, blob_id in self._walk_files(tree_id, ""):
+            if pathspecs and not any(fnmatchcase(path, spec) for spec in pathspecs):
+                continue
+            content = self._read(blob_id)[1]
+            # Skip binary files, with the same heuristic of git
+            if b"\0" in content[:8000]:
+                continue
+            text = content.decode("utf-8", errors="replace")
+            result += [(path, m.group(0)) for m in regex.finditer(text) if m.group(0)]
+        return result
+
+    @abstractmethod
+    def _read(self, object_id: str) -> Tuple[str, bytes] | None:
+        """Returns (type, content), or None if the object doesn't exist."""
+
+    @abstractmethod
+    def _has_object(self, object_id: str) -> bool:
+        """Whether the object is stored, without reading it."""
+
+    @abstractmethod
+    def _read_ref(self, ref: str) -> str | None:
+        """Returns the object id of the ref (eg: "refs/tags/5.3.0-release"), or None if it doesn't exist."""
+
+    @abstractmethod
+    def _list_refs(self, prefix: str) -> list[str]:
+        """Returns the full names of the refs starting with the prefix."""
+
+    def _peel(self, object_id: str, target_type: str) -> str | None:
+        """Follows tags and commits until an object of the target type is found ("" peels only the tags)."""
+        while True:
+            git_object = self._read(object_id)
+            if not git_object:
+                return None
+
+            object_type, content = git_object
+            if object_type == target_type or (not target_type and object_type != "tag"):
+                return object_id
+
+            # The first line of a tag is "object <id>", the first line of a commit is "tree <id>"
+            if object_type == "tag" or (
+                object_type == "commit" and target_type == "tree"
+            ):
+                object_id = (
+                    content[: content.index(b"\n")].split(b" ")[1].decode("ascii")
+                )
+            else:
+                return None
+
+    def _find_path(self, tree_id: str, path: str) -> str | None:
+        object_id = tree_id
+        for name in path.split("/"):
+            if not name:
+                continue
+            git_object = self._read(object_id)
+            if not git_object or git_object[0] != "tree":
+                return None
+            object_id = next(
+                (oid for _, entry, oid in parse_tree(git_object[1]) if entry == name),
+                None,
+            )
+            if not object_id:
+                return None
+        return object_id
+
+    def _walk_files(
+        self, tree_id: str, prefix: str
+    ) -> Generator[Tuple[str, str], None, None]:
+        """Yields (path, blob id) of all files in the tree, recursively."""
+        for mode, name, object_id in parse_tree(self._read(tree_id)[1]):
+            if mode == "40000":
+                yield from self._walk_files(object_id, f"{prefix}{name}/")
+            elif mode != "160000":
+                # Submodules are commits of another repository
+                yield prefix + name, object_id
+
+
+class GitObjectDatabase(ObjectDatabase):
+    """
+    Reads objects and refs straight from the `.git` directory.
+
+    Delta bases are kept in delta_base_cache (any object with `get(key)` and `put(key, value, size)`, like a
+    MemoryCache), since the revisions of the same file are usually stored as deltas of each other.
+    """
+
+    def __init__(self, root: Path, delta_base_cache: Any = None):
+        self.root = root
+        self.git_dir = self._find_git_dir(root)
+
+        # Linked worktrees keep their HEAD, but share objects and refs with the main repository
+        self.common_dir = self.git_dir
+        if (self.git_dir / "commondir").is_file():
+            common_dir = (self.git_dir / "commondir").read_text().strip()
+            self.common_dir = (self.git_dir / common_dir).resolve()
+
+        self.object_dirs = [self.common_dir / "objects"]
+        alternates = self.common_dir / "objects/info/alternates"
+        if alternates.is_file():
+            for line in alternates.read_text().splitlines():
+                if line and not line.startswith("#"):
+                    self.object_dirs.append(self.object_dirs[0] / line)
+
+        self.packs = [
+            PackFile(pack)
+            for object_dir in self.object_dirs
+            for pack in sorted((object_dir / "pack").glob("*.pack"))
+            if pack.with_suffix(".idx").is_file()
+        ]
+        self.delta_base_cache = delta_base_cache
+        self.packed_refs: dict[str, str] | None = None
+
+    @staticmethod
+    def _find_git_dir(root: Path) -> Path:
+        dot_git = root / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        # Worktrees and submodules use a file pointing to the actual directory
+        if dot_git.is_file():
+            git_dir = dot_git.read_text().strip().removeprefix("gitdir: ")
+            return (root / git_dir).resolve()
+        # Bare repository
+        if (root / "objects").is_dir() and (root / "HEAD").is_file():
+            return root
+        raise ValueError(f"{root} is not a git repository")
+
+    def close(self):
+        for pack in self.packs:
+            pack.close()
+        self.packs = []
+
+    def _has_object(self, object_id: str) -> bool:
+        binary_id = bytes.fromhex(object_id)
+        if any(pack.find_offset(binary_id) is not None for pack in self.packs):
+            return True
+        return any(self._loose_path(d, object_id).is_file() for d in self.object_dirs)
+
+    @staticmethod
+    def _loose_path(object_dir: Path, object_id: str) -> Path:
+        return object_dir / object_id[:2] / object_id[2:]
+
+    def _read(self, object_id: str) -> Tuple[str, bytes] | None:
+        """Returns (type, content), or None if the object doesn't exist."""
+        binary_id = bytes.fromhex(object_id)
+        for pack in self.packs:
+            offset = pack.find_offset(binary_id)
+            if offset is not None:
+                return self._read_packed(pack, offset)
+
+        for object_dir in self.object_dirs:
+            path = self._loose_path(object_dir, object_id)
+            if path.is_file():
+                raw = zlib.decompress(path.read_bytes())
+                # eg: "blob 1234\0<content>"
+                header_end = raw.index(b"\0")
+                object_type = raw[:header_end].split(b" ")[0].decode("ascii")
+                return object_type, raw[header_end + 1 :]
+
+        return None
+
+    def _read_packed(self, pack: PackFile, offset: int) -> Tuple[str, bytes]:
+        # Walk the chain of deltas down to a non-delta object (or to a cached base)
+        chain: list[Tuple[Tuple[str, int], bytes]] = []
+        while True:
+            key = (str(pack.path), offset)
+            if chain and self.delta_base_cache:
+                found, cached = self.delta_base_cache.get(key)
+                if found:
+                    object_type, content = cached
+                    break
+
+            packed_type, size, data_offset = pack.read_header(offset)
+            if packed_type == ofs_delta:
+                distance, data_offset = pack.read_base_distance(data_offset)
+                chain.append((key, pack.inflate(data_offset, size)))
+                offset -= distance
+            elif packed_type == ref_delta:
+                base_id = pack.data[data_offset : data_offset + 20].hex()
+                chain.append((key, pack.inflate(data_offset + 20, size)))
+                base = self._read(base_id)
+                if not base:
+                    raise ValueError(f"Missing delta base {base_id} in {pack.path}")
+                object_type, content = base
+                break
+            elif packed_type in object_types:
+                object_type = object_types[packed_type]
+                content = pack.inflate(data_offset, size)
+                if chain:
+                    self._cache_base(key, object_type, content)
+                break
+            else:
+                raise ValueError(f"Unknown object type {packed_type} in {pack.path}")
+
+        # Apply the deltas starting from the base, each intermediate object is the base of the next one
+        for i in range(len(chain) - 1, -1, -1):
+            key, delta = chain[i]
+            content = apply_delta(content, delta)
+            if i > 0:
+                self._cache_base(key, object_type, content)
+
+        return object_type, content
+
+    def _cache_base(self, key: Tuple[str, int], object_type: str, content: bytes):
+        if self.delta_base_cache:
+            self.delta_base_cache.put(key, (object_type, content), len(content))
+
+    def _read_ref(self, ref: str, depth: int = 0) -> str | None:
+        # HEAD is specific of each worktree, the other refs are shared
+        directory = self.git_dir if ref == "HEAD" else self.common_dir
+        path = directory / ref
+        if path.is_file():
+            value = path.read_text().strip()
+            # Symbolic ref, eg: "ref: refs/heads/main"
+            if value.startswith("ref: "):
+                return self._read_ref(value[5:], depth + 1) if depth < 5 else None
+            return value
+        return self._get_packed_refs().get(ref)
+
+    def _list_refs(self, prefix: str) -> list[str]:
+        refs = {ref for ref in self._get_packed_refs() if ref.startswith(prefix)}
+        for path in (self.common_dir / prefix).rglob("*"):
+            if path.is_file():
+                refs.add(path.relative_to(self.common_dir).as_posix())
+        return sorted(refs)
+
+    def _get_packed_refs(self) -> dict[str, str]:
+        if self.packed_refs is None:
+            self.packed_refs = {}
+            path = self.common_dir / "packed-refs"
+            if path.is_file():
+                for line in path.read_text().splitlines():
+                    # Skip the header and the peeled ids of annotated tags ("^<id>")
+                    if not line or line[0] in "#^":
+                        continue
+                    object_id, ref = line.split(" ", 1)
+                    self.packed_refs[ref] = object_id
+        return self.packed_refs
+
+
+class MemoryObjectDatabase(ObjectDatabase):
+    """
+    Repository stored in memory, used to build synthetic repositories for tests and benchmarks.
+    Objects get the same ids they would have in git, so the repository can be saved to disk with write_loose.
+    """
+
+    def __init__(self):
+        self.objects: dict[str, Tuple[str, bytes]] = {}
+        self.refs: dict[str, str] = {}
+
+    def add_object(self, object_type: str, content: bytes) -> str:
+        header = f"{object_type} {len(content)}\0".encode("ascii")
+        object_id = hashlib.sha1(header + content).hexdigest()
+        self.objects[object_id] = object_type, content
+        return object_id
+
+    def add_tree(self, files: dict[str, bytes]) -> str:
+        """Adds the blobs and the trees of the files (path -> content), returns the id of the root tree."""
+        entries: dict[str, Tuple[str, str]] = {}
+        subtrees: dict[str, dict[str, bytes]] = {}
+        for path, content in files.items():
+            if "/" in path:
+                directory, rest = path.split("/", 1)
+                subtrees.setdefault(directory, {})[rest] = content
+            else:
+                entries[path] = "100644", self.add_object("blob", content)
+        for directory, subtree_files in subtrees.items():
+            entries[directory] = "40000", self.add_tree(subtree_files)
+
+        # Git sorts the entries as if the trees had a trailing slash
+        def sort_key(name: str) -> bytes:
+            suffix = "/" if entries[name][0] == "40000" else ""
+            return (name + suffix).encode("utf-8")
+
+        content = b"".join(
+            f"{entries[name][0]} {name}\0".encode("utf-8")
+            + bytes.fromhex(entries[name][1])
+            for name in sorted(entries, key=sort_key)
+        )
+        return self.add_object("tree", content)
+
+    def set_ref(self, ref: str, object_id: str):
+        self.refs[ref] = object_id
+
+    def write_loose(self, root: Path):
+        """Saves the repository as a bare git repository with loose objects (`git gc` can pack it)."""
+        root.mkdir(parents=True, exist_ok=True)
+        (root / "HEAD").write_text("ref: refs/heads/main\n")
+        (root / "config").write_text(
+            "[core]\n\trepositoryformatversion = 0\n\tbare = true\n"
+        )
+        for object_id, (object_type, content) in self.objects.items():
+            path = root / "objects" / object_id[:2] / object_id[2:]
+            path.parent.mkdir(parents=True, exist_ok=True)
+            header = f"{object_type} {len(content)}\0".encode("ascii")
+            path.write_bytes(zlib.compress(header + content))
+        for ref, object_id in self.refs.items():
+            path = root / ref
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(object_id + "\n")
+
+    def _read(self, object_id: str) -> Tuple[str, bytes] | None:
+        return self.objects.get(object_id)
+
+    def _has_object(self, object_id: str) -> bool:
+        return object_id in self.objects
+
+    def _read_ref(self, ref: str) -> str | None:
+        return self.refs.get(ref)
+
+    def _list_refs(self, prefix: str) -> list[str]:
+        return sorted(ref for ref in self.refs if ref.startswith(prefix))
@@ -1,18 +1,56 @@
 from pathlib import Path
 
 from extract_custom_versions import extract_custom_versions
-from extract_versions import extract_versions
-from utils import parse_global_args, fail_if_warnings
+from extract_versions import (
+    extract_versions,
+    load_state,
+    save_state,
+    set_output_dir,
+    ExtractionState,
+)
+from utils import (
+    parse_global_args,
+    fail_if_warnings,
+    extract_tags,
+    print_cache_statistics,
+    print_file_statistics,
+    g_profiler,
+)
 
 
 def main():
     args = parse_global_args(
         "Check all tags of UnrealEngine repository, and populate the tables of this directory"
     )
+    unreal_path = Path(args.unreal_engine_path)
+    if args.output_dir:
+        set_output_dir(args.output_dir)
 
-    extract_versions(Path(args.unreal_engine_path))
-    extract_custom_versions(Path(args.unreal_engine_path))
+    # The state refers to the tags of the repository
+    with g_profiler.phase("tags"):
+        tags = extract_tags(unreal_path)
+    with g_profiler.phase("load_state"):
+        state = ExtractionState() if args.full else load_state()
+
+    # Nothing to do if no tags were added since the last run
+    # (the state is discarded by load_state when the extractor or InterestingVersions.txt changed)
+    if tags and tags == state.processed_tags:
+        print("No new tags since the last run, the generated files are up to date")
+        return
+
+    with g_profiler.phase("object_versions"):
+        extract_versions(unreal_path, state, args.jobs)
+    with g_profiler.phase("custom_versions"):
+        extract_custom_versions(unreal_path, state)
+
+    print_cache_statistics()
+    print_file_statistics()
+
+    # The tags are only recorded as processed if there were no warnings, so the next run repeats the work
     fail_if_warnings()
+    state.processed_tags = tags
+    with g_profiler.phase("save_state"):
+        save_state(state)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,217 @@
+"""
+Generates a synthetic repository with the same layout of Unreal Engine, used to benchmark the extraction without a
+checkout of the engine.
+
+The history contains release tags where:
+- ObjectVersion.h grows over time (EUnrealEngineObjectUE4Version, then EUnrealEngineObjectUE5Version from 5.0)
+- custom versions are registered in .cpp files, and their enums grow in headers
+- some enums store their values in an .inl file, and some headers are moved to another directory
+- unrelated files are changed in every tag
+"""
+
+import random
+from dataclasses import dataclass
+
+from git_odb import MemoryObjectDatabase
+
+object_version_path = "Engine/Source/Runtime/Core/Public/UObject/ObjectVersion.h"
+
+
+@dataclass
+class SyntheticConfig:
+    tags: int = 40
+    # Fraction of the tags released as UE4, the remaining ones are UE5
+    ue4_fraction: float = 0.6
+    # Versions added to ObjectVersion.h in each tag
+    versions_per_tag: int = 8
+    custom_versions: int = 30
+    # Probability that an enum of a custom version changes in a tag
+    custom_version_change_rate: float = 0.3
+    # Every N-th custom version defines its values in an .inl file
+    inline_every: int = 5
+    # Every N-th custom version moves its header to another directory in the middle of the history
+    moved_every: int = 7
+    # Registrations are grouped in .cpp files of this size
+    registrations_per_file: int = 5
+    filler_files: int = 1000
+    changed_filler_files: int = 50
+    seed: int = 0
+
+
+def make_tag_names(config: SyntheticConfig) -> list[str]:
+    ue4_tags = max(1, round(config.tags * config.ue4_fraction))
+    return [
+        f"4.{i}.0-release" if i < ue4_tags else f"5.{i - ue4_tags}.0-release"
+        for i in range(config.tags)
+    ]
+
+
+def format_object_version(ue4_rows: int, ue5_rows: int | None) -> str:
+    rows = "\n".join(
+        f"\t// Synthetic change {i}\n\tVER_UE4_SYNTHETIC_{i}," for i in range(ue4_rows)
+    )
+    text = (
+        "#pragma once\n\n"
+        "enum EUnrealEngineObjectUE4Version\n{\n"
+        "\tVER_UE4_OLDEST_LOADABLE_PACKAGE = 214,\n"
+        f"{rows}\n"
+        "\t// -----<new versions can be added before this line>-----\n"
+        "\tVER_UE4_AUTOMATIC_VERSION_PLUS_ONE,\n"
+        "\tVER_UE4_AUTOMATIC_VERSION = VER_UE4_AUTOMATIC_VERSION_PLUS_ONE - 1\n};\n"
+    )
+    if ue5_rows is not None:
+        rows = "\n".join(
+            f"\t// Synthetic UE5 change {i}\n\tSYNTHETIC_{i}," for i in range(ue5_rows)
+        )
+        text += (
+            "\nenum class EUnrealEngineObjectUE5Version : uint32\n{\n"
+            "\t// The original UE5 version\n\tINITIAL_VERSION = 1000,\n"
+            f"{rows}\n"
+            "\tAUTOMATIC_VERSION_PLUS_ONE,\n"
+            "\tAUTOMATIC_VERSION = AUTOMATIC_VERSION_PLUS_ONE - 1\n};\n"
+        )
+    return text
+
+
+@dataclass
+class SyntheticCustomVersion:
+    index: int
+    first_tag: int
+    guid: str
+    rows: int = 1
+
+    @property
+    def name(self) -> str:
+        return f"FSynthetic{self.index:03}ObjectVersion"
+
+    @property
+    def module(self) -> str:
+        return f"Engine/Source/Runtime/Synthetic{self.index // 10}"
+
+    def header_path(self, moved: bool) -> str:
+        directory = "Public/Moved" if moved else "Public"
+        return f"{self.module}/{directory}/{self.name[1:]}.h"
+
+    def format_header(self, inline_file: str | None) -> str:
+        if inline_file:
+            # Like FFortniteMainBranchObjectVersion
+            values = (
+                "#define SYNTHETIC_VERSION(Version, ID) Version,\n"
+                f'#include "{inline_file}"\n'
+                "#undef SYNTHETIC_VERSION\n"
+            )
+        else:
+            values = (
+                "\t\t// Before any version changes were made\n"
+                "\t\tBeforeCustomVersionWasAdded = 0,\n"
+            ) + "".join(
+                f"\t\t// Change {i}\n\t\tChange{i},\n" for i in range(self.rows)
+            )
+        return (
+            "#pragma once\n\n"
+            f"struct CORE_API {self.name}\n{{\n\tenum Type\n\t{{\n"
+            f"{values}"
+            "\t\tVersionPlusOne,\n\t\tLatestVersion = VersionPlusOne - 1\n\t};\n\n"
+            f"\tconst static FGuid GUID;\n\n\t{self.name}() = delete;\n}};\n"
+        )
+
+    def format_inline(self) -> str:
+        return (
+            "#define SYNTHETIC_VERSION(Version, ID) Version,\n"
+            "// Before any version changes were made\n"
+            "SYNTHETIC_VERSION(BeforeCustomVersionWasAdded, 0)\n"
+        ) + "".join(
+            f"// Change {i}\nSYNTHETIC_VERSION(Change{i}, {i + 1})\n"
+            for i in range(self.rows)
+        )
+
+    def format_registration(self) -> str:
+        return (
+            f"const FGuid {self.name}::GUID({self.guid});\n"
+            f"FCustomVersionRegistration GRegister{self.name}({self.name}::GUID, "
+            f'{self.name}::LatestVersion, TEXT("{self.name[1:]}"));\n'
+        )
+
+
+def build_synthetic_repository(config: SyntheticConfig) -> MemoryObjectDatabase:
+    rng = random.Random(config.seed)
+    repository = MemoryObjectDatabase()
+    tags = make_tag_names(config)
+
+    custom_versions = [
+        SyntheticCustomVersion(
+            index=i,
+            # Custom versions are added over the first half of the history
+            first_tag=i * config.tags // max(1, 2 * config.custom_versions),
+            guid=", ".join(f"0x{rng.getrandbits(32):08X}" for _ in range(4)),
+        )
+        for i in range(config.custom_versions)
+    ]
+    filler_revisions = [0] * config.filler_files
+
+    ue4_rows = ue5_rows = 0
+    parent = None
+    for tag_index, tag in enumerate(tags):
+        files: dict[str, str] = {}
+
+        # The UE4 enum is frozen once UE5 is released
+        is_ue5 = tag.startswith("5.")
+        if is_ue5:
+            ue5_rows += config.versions_per_tag
+        else:
+            ue4_rows += config.versions_per_tag
+        files[object_version_path] = format_object_version(
+            ue4_rows, ue5_rows if is_ue5 else None
+        )
+
+        registrations: dict[str, str] = {}
+        for custom_version in custom_versions:
+            if custom_version.first_tag > tag_index:
+                continue
+            if custom_version.first_tag < tag_index:
+                if rng.random() < config.custom_version_change_rate:
+                    custom_version.rows += 1
+
+            i = custom_version.index
+            moved = i % config.moved_every == 0 and tag_index >= config.tags // 2
+            header_path = custom_version.header_path(moved)
+            inline_file = None
+            if i % config.inline_every == 0:
+                inline_file = f"{custom_version.name[1:]}s.inl"
+                inline_path = header_path.rsplit("/", 1)[0] + "/" + inline_file
+                files[inline_path] = custom_version.format_inline()
+            files[header_path] = custom_version.format_header(inline_file)
+
+            group = i // config.registrations_per_file
+            cpp_path = (
+                f"Engine/Source/Runtime/Core/Private/SyntheticVersions{group}.cpp"
+            )
+            registrations.setdefault(cpp_path, '#include "CoreMinimal.h"\n')
+            registrations[cpp_path] += custom_version.format_registration()
+        files.update(registrations)
+
+        for i in rng.sample(
+            range(config.filler_files),
+            min(config.changed_filler_files, config.filler_files),
+        ):
+            filler_revisions[i] += 1
+        for i, revision in enumerate(filler_revisions):
+            files[f"Engine/Source/Runtime/Filler{i % 50}/Private/Filler{i}.cpp"] = (
+                f"// Revision {revision}\nstruct FFiller{i}\n{{\n\tint32 Value = {revision};\n}};\n"
+            )
+
+        tree_id = repository.add_tree(
+            {path: content.encode("utf-8") for path, content in files.items()}
+        )
+        commit = f"tree {tree_id}\n"
+        if parent:
+            commit += f"parent {parent}\n"
+        signature = (
+            f"Synthetic <synthetic@example.com> {1400000000 + tag_index * 86400} +0000"
+        )
+        commit += f"author {signature}\ncommitter {signature}\n\n{tag}\n"
+        parent = repository.add_object("commit", commit.encode("utf-8"))
+        repository.set_ref(f"refs/tags/{tag}", parent)
+
+    repository.set_ref("refs/heads/main", parent)
+    return repository
@@ -1,14 +1,52 @@
 import argparse
+import atexit
+import bisect
+import hashlib
 import io
+import json
+import os
+import queue
 import re
+import sqlite3
 import subprocess
 import sys
+import threading
+import time
+import zlib
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from enum import Enum
-from functools import lru_cache
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import NoReturn, List, Generator, Tuple
+from typing import (
+    NoReturn,
+    List,
+    Generator,
+    Tuple,
+    Callable,
+    Any,
+    Iterable,
+    TextIO,
+)
+
+from git_odb import Repository, GitObjectDatabase, parse_tree
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows, the peak memory is not reported
+    resource = None
 
 g_warning_counter = 0
+g_warning_lock = threading.Lock()
+
+default_cache_dir = Path(__file__).parent / ".cache"
+""" Default location of the persistent cache, shared across runs """
+
+default_memory_budget = 512 * 1024 * 1024
+""" Default size of each in-memory cache, in bytes """
 
 
 def error(message: str) -> NoReturn:
@@ -19,7 +57,8 @@ def error(message: str) -> NoReturn:
 def warning(message: str):
     global g_warning_counter
     print(f"WARNING: {message}", file=sys.stderr)
-    g_warning_counter += 1
+    with g_warning_lock:
+        g_warning_counter += 1
 
 
 def fail_if_warnings():
@@ -27,15 +66,108 @@ def fail_if_warnings():
         error(f"{g_warning_counter} warnings were encountered during processing.")
 
 
+class PhaseTimer:
+    __slots__ = ("wall", "cpu")
+
+    def __init__(self):
+        self.wall = 0.0
+        self.cpu = 0.0
+
+
+class Profiler:
+    """
+    Timings and counters of a run, saved as JSON with --profile-out, so that runs can be compared.
+    - phases: wall and CPU time of each step, the CPU time of the process includes all its threads
+    - timings: seconds spent on each key of a category (eg: on each tag)
+    - counters: git requests, bytes read, cache hits, tokens, ...
+    Can be used from several threads. Worker processes send their own values back with take(), see run_profiled.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.lock = threading.Lock()
+        self.phases: dict[str, dict[str, float]] = {}
+        self.timings: dict[str, dict[str, float]] = {}
+        self.counters: dict[str, int] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Generator[PhaseTimer, None, None]:
+        """Measures the block, the timer is filled when the block ends."""
+        timer = PhaseTimer()
+        start, start_cpu = time.perf_counter(), time.process_time()
+        try:
+            yield timer
+        finally:
+            timer.wall = time.perf_counter() - start
+            timer.cpu = time.process_time() - start_cpu
+            self.add_phase(name, timer.wall, timer.cpu)
+
+    def add_phase(self, name: str, wall: float, cpu: float, calls: int = 1):
+        with self.lock:
+            phase = self.phases.setdefault(name, {"calls": 0, "wall": 0.0, "cpu": 0.0})
+            phase["calls"] += calls
+            phase["wall"] += wall
+            phase["cpu"] += cpu
+
+    def add_timing(self, category: str, key: str, seconds: float):
+        with self.lock:
+            timings = self.timings.setdefault(category, {})
+            timings[key] = timings.get(key, 0.0) + seconds
+
+    def count(self, name: str, amount: int = 1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def take(self) -> dict:
+        """Returns the collected values and starts again from zero."""
+        with self.lock:
+            values = {
+                "phases": self.phases,
+                "timings": self.timings,
+                "counters": self.counters,
+            }
+            self.phases, self.timings, self.counters = {}, {}, {}
+        return values
+
+    def merge(self, values: dict):
+        """Adds the values returned by take() (eg: in a worker process)."""
+        for name, phase in values["phases"].items():
+            self.add_phase(name, phase["wall"], phase["cpu"], phase["calls"])
+        for category, timings in values["timings"].items():
+            for key, seconds in timings.items():
+                self.add_timing(category, key, seconds)
+        for name, amount in values["counters"].items():
+            self.count(name, amount)
+
+
+g_profiler = Profiler()
+g_profile_path: Path | None = None
+
+
+def find_block(
+    source: str, prefix: str, start: int = 0, end: int | None = None
+) -> Tuple[int, int] | None:
+    """
+    Finds a block using the provided regex between start and end, and returns the offsets from its '{' to the
+    matching '}' (included). Braces in comments and literals are ignored.
+    """
+    index = get_source_index(source)
+    pattern = re.compile(prefix + r"\s*{", re.IGNORECASE)
+    for match in pattern.finditer(source, start, len(source) if end is None else end):
+        block_end = index.block_end(match.end() - 1)
+        if block_end is not None and not index.is_ignored(match.start()):
+            return match.end() - 1, block_end
+    return None
+
+
 def parse_block(source: str, prefix: str):
     """
     Given a block of text, finds a block using the provided regex, and scans until the matching '}' is found.
 
     es: parse_block("struct FStruct { int32 Value; }", "struct FStruct") -> "{ int32 Value; }"
     """
-    if match := re.search(prefix + r"\s*{", source, re.IGNORECASE):
-        start = match.end()
-        return follow_paren(source[start - 1 :])
+    if block := find_block(source, prefix):
+        return source[block[0] : block[1]]
     return None
 
 
@@ -80,32 +212,15 @@ def split_arguments(source: str) -> List[str]:
     return arguments
 
 
-def follow_paren(source: str) -> str:
-    """Given a source string with a starting '{', return the string until the matching '}'"""
-
-    assert source.startswith("{")
-
-    level = 0
-    for i, c in enumerate(source):
-        if c == "{":
-            level += 1
-        elif c == "}":
-            level -= 1
-            if level == 0:
-                return source[: i + 1]
-
-    return source
-
-
 def spawn_process(command: list[str], allow_error=False, print_errors=True):
     command = [str(x) for x in command]
 
     print(f"-- Running {' '.join(command)}")
+    g_profiler.count("git_processes")
     process = subprocess.run(
         command,
         stdout=subprocess.PIPE,
         stderr=None if print_errors else subprocess.PIPE,
-        shell=True,
     )
 
     if process.returncode != 0 and not allow_error:
@@ -114,14 +229,9 @@ def spawn_process(command: list[str], allow_error=False, print_errors=True):
     return process.stdout.decode("utf-8")
 
 
-def compare_versions(a: str, b: str) -> int:
-    left = [int(i) for i in a.split("-")[0].split(".")]
-    right = [int(i) for i in b.split("-")[0].split(".")]
-    if left < right:
-        return -1
-    if left > right:
-        return 1
-    return 0
+def tag_sort_key(tag: str) -> list[int]:
+    # The default sort puts 4.10 before 4.2
+    return [int(i) for i in tag.split("-")[0].split(".")]
 
 
 class TokenType(Enum):
@@ -137,193 +247,190 @@ class TokenType(Enum):
         return self.value
 
 
+# Comments, single-line comments don't include the trailing whitespaces
+# Unterminated multi-line comments run until the end of the file
+comment_pattern = r"//(?:[^\n]*\S)?|/\*[^*]*\*+(?:[^/*][^*]*\*+)*/|/\*.*"
+
+# String and character literals, unterminated literals run until the end of the file
+literal_pattern = r"\"(?:[^\"\\]+|\\.?)*\"?|'(?:[^'\\]+|\\.?)*'?"
+
+# Operators, the longest ones first
+operator_pattern = (
+    r"\.\.\.|\.\*|::|\^[\^=]|<<=|<=>|<<|<=|>>=|>>|>=|[-+*/%&|=!]=|&&|\|\||\+\+|--|->\*|->"
+    r"|[.:^<>+\-*/%&|=!{}\[\]();?~,]"
+)
+
+# Kind of token by group of the pattern returned by get_token_pattern
+token_types_by_group = [
+    None,
+    TokenType.COMMENT,
+    TokenType.STRING_LITERAL,
+    TokenType.NUMERIC_LITERAL,
+    TokenType.IDENTIFIER,
+    TokenType.OPERATOR,
+    TokenType.UNKNOWN,
+]
+
+non_ascii_pattern = re.compile(r"[^\x00-\x7f]")
+
+
+def find_non_ascii_numbers(source: str) -> str:
+    """Sorted non-ASCII characters of the source which are numeric for str methods (eg: "²", "½", "٣")."""
+    if source.isascii():
+        return ""
+    return "".join(
+        sorted(c for c in set(non_ascii_pattern.findall(source)) if c.isnumeric())
+    )
+
+
+def has_non_ascii_numbers(source: str) -> bool:
+    return bool(find_non_ascii_numbers(source))
+
+
+@lru_cache(maxsize=64)
+def get_token_pattern(non_ascii_numbers: str = "") -> re.Pattern:
+    """
+    Master pattern of the tokenizer, with a group for each kind of token (see token_types_by_group).
+    C++ numbers and identifiers are split with str.isdigit() and str.isalpha(), while re only knows the Unicode
+    decimals as digits. So the non-ASCII numbers of the source (see find_non_ascii_numbers) are added to the digits
+    (eg: "²"), or can't start an identifier if they are not letters either (eg: "½").
+    """
+    digits = r"\d" + "".join(c for c in non_ascii_numbers if c.isdigit())
+    not_letters = "".join(c for c in non_ascii_numbers if not c.isalpha())
+    alternatives = [
+        comment_pattern,
+        literal_pattern,
+        # pp-numbers (eg: "1.0", "1'000", "1e+5", but "0x1F" is split into "0" and "x1F")
+        rf"(?:[{digits}]|\.[{digits}])(?:[{digits}.]+|'[^\W_]|[EePp][-+])*",
+        # Identifiers and keywords
+        rf"[^\W\d{not_letters}]\w*",
+        operator_pattern,
+        r"\S",
+    ]
+    return re.compile(
+        r"\s*(?:" + "|".join(f"({alternative})" for alternative in alternatives) + ")",
+        re.DOTALL,
+    )
+
+
 def tokenize_cpp(source: str) -> Generator[Tuple[TokenType, str], None, None]:
     """
     Tokenizes a C++ source code string into a generator of tokens.
     Returns identifiers, keywords, operators (but not digraphs), literals and comments.
     Whitespaces are removed.
     """
-
-    i = 0
     length = len(source)
+    for match in get_token_pattern(find_non_ascii_numbers(source)).finditer(source):
+        group = match.lastindex
+        token = match.group(group)
+        if match.end() == length:
+            # Unterminated literal or comment
+            token = token.rstrip()
+        yield token_types_by_group[group], token
+
+
+def tokenize_cpp_spans(
+    source: str, pos: int = 0, pattern: re.Pattern | None = None
+) -> Generator[Tuple[TokenType, int, int], None, None]:
+    """
+    Same tokens of tokenize_cpp, as (type, start, end) offsets into the source.
+    The tokenization can start from any offset which is the boundary of a token.
+    The pattern of the source can be passed, to not look for its non-ASCII numbers again.
+    """
+    pattern = pattern or get_token_pattern(find_non_ascii_numbers(source))
+    length = len(source)
+    for match in pattern.finditer(source, pos):
+        group = match.lastindex
+        start, end = match.span(group)
+        if end == length:
+            # Unterminated literal or comment
+            end = start + len(source[start:end].rstrip())
+        yield token_types_by_group[group], start, end
 
-    while i < length:
-        token_start = i
-        c = source[i]
-
-        # Handle spaces
-        if c.isspace():
-            i += 1
-            while i < length and source[i].isspace():
-                i += 1
-            # Skip whitespaces
-            continue
-
-        # Handle single line comments
-        elif c == "/" and i + 1 < length and source[i + 1] == "/":
-            i += 2
-            while i < length and source[i] != "\n":
-                i += 1
-            yield TokenType.COMMENT, source[token_start:i].strip()
-
-        elif c == "/" and i + 1 < length and source[i + 1] == "*":
-            # Multi-line comment
-            i += 2
-            while i < length - 1 and not (source[i] == "*" and source[i + 1] == "/"):
-                i += 1
-            i += 2
-            yield TokenType.COMMENT, source[token_start:i].strip()
-
-        # Handle string and character literals
-        elif c == '"' or c == "'":
-            quote = c
-            i += 1
-            while i < length:
-                if source[i] == quote:
-                    i += 1
-                    break
-                elif source[i] == "\\" and i + 1 < length:
-                    # Skip escaped characters
-                    i += 2
-                else:
-                    i += 1
-            yield TokenType.STRING_LITERAL, source[token_start:i].strip()
-
-        # Handle numeric literals
-        elif c.isdigit() or (c == "." and i + 1 < length and source[i + 1].isdigit()):
-            # Handle all pp-number
-            i += 1
-            while i < length:
-                if source[i].isdigit() or source[i] == ".":
-                    i += 1
-                elif source[i] == "'" and i + 1 < length and (source[i + 1].isalnum()):
-                    i += 2
-                elif source[i] in "EePp" and i + 1 < length and (source[i + 1] in "-+"):
-                    i += 2
-                else:
-                    break
-            yield TokenType.NUMERIC_LITERAL, source[token_start:i].strip()
-
-        # Handle identifiers
-        elif c.isalpha() or c == "_":
-            i += 1
-            while i < length and (source[i].isalnum() or source[i] == "_"):
-                i += 1
-            identifier = source[token_start:i].strip()
-            yield TokenType.IDENTIFIER, identifier
-
-        # Handle operators
-        elif c == ".":
-            if i + 2 < length and source[i + 1] == "." and source[i + 2] == ".":
-                i += 3
-                yield TokenType.OPERATOR, "..."
-            elif i + 1 < length and source[i + 1] == "*":
-                i += 2
-                yield TokenType.OPERATOR, ".*"
-            else:
-                i += 1
-                yield TokenType.OPERATOR, c
-
-        elif c == ":":
-            if i + 1 < length and source[i + 1] == ":":
-                i += 2
-                yield TokenType.OPERATOR, "::"
-            else:
-                i += 1
-                yield TokenType.OPERATOR, c
-
-        elif c == "^":
-            if i + 1 < length and source[i + 1] in "^=":
-                i += 2
-                yield TokenType.OPERATOR, c + source[i - 1]
-            elif i + 1 < length and source[i + 1] == "^":
-                i += 2
-                yield TokenType.OPERATOR, "^^"
-            else:
-                i += 1
-                yield TokenType.OPERATOR, c
-
-        elif c == "<":
-            if i + 2 < length and source[i + 1] == "<" and source[i + 2] == "=":
-                i += 3
-                yield TokenType.OPERATOR, "<<="
-            elif i + 2 < length and source[i + 1] == "=" and source[i + 2] == ">":
-                i += 3
-                yield TokenType.OPERATOR, "<=>"
-            elif i + 1 < length and source[i + 1] == "<":
-                i += 2
-                yield TokenType.OPERATOR, "<<"
-            elif i + 1 < length and source[i + 1] == "=":
-                i += 2
-                yield TokenType.OPERATOR, "<="
-            else:
-                i += 1
-                yield TokenType.OPERATOR, c
-
-        elif c == ">":
-            if i + 2 > length and source[i + 1] == ">" and source[i + 2] == "=":
-                i += 3
-                yield TokenType.OPERATOR, ">="
-            elif i + 1 > length and source[i + 1] == ">":
-                i += 2
-                yield TokenType.OPERATOR, ">"
-            elif i + 1 > length and source[i + 1] == "=":
-                i += 2
-                yield TokenType.OPERATOR, ">="
-            else:
-                i += 1
-                yield TokenType.OPERATOR, c
-
-        elif c in "+-*/%&|=!":
-            if i + 1 < length and source[i + 1] == "=":
-                i += 2
-                yield TokenType.OPERATOR, c + "="
-            elif c in "&|+->" and i + 1 < length and source[i + 1] == c:
-                i += 2
-                yield TokenType.OPERATOR, c + c
-            elif c == "-":
-                if i + 2 < length and source[i + 1] == ">" and source[i + 2] == "*":
-                    i += 3
-                    yield TokenType.OPERATOR, "->*"
-                elif i + 1 < length and source[i + 1] == ">":
-                    i += 2
-                    yield TokenType.OPERATOR, "->"
-                else:
-                    i += 1
-                    yield TokenType.OPERATOR, c
-            else:
-                i += 1
-                yield TokenType.OPERATOR, c
-
-        elif c in "{}[]();:?~!,":
-            i += 1
-            yield TokenType.OPERATOR, c
 
-        else:
-            i += 1
-            yield TokenType.UNKNOWN, c
+token_types = list(TokenType)
+token_type_codes = {token_type: code for code, token_type in enumerate(token_types)}
 
 
 class TokenIterator:
-    def __init__(self, source: str):
-        self.tokens = list(tokenize_cpp(source))
-        self.tokens.append((TokenType.EOF, ""))
+    """
+    Cursor over the tokens of a C++ source.
+    The tokens are stored as kind codes and offsets into the source, the text is sliced only when requested.
+    With stream=True, the tokens are read from the tokenizer while advancing, without storing the whole file.
+    """
+
+    def __init__(self, source: str, stream: bool = False):
+        self.source = source
         self.index = 0
+        self.kinds: array | None = None
+        self.starts: array | None = None
+        self.ends: array | None = None
+        self._spans = None
+        self._pattern = get_token_pattern(find_non_ascii_numbers(source))
+
+        if stream:
+            self._spans = tokenize_cpp_spans(source, 0, self._pattern)
+        else:
+            self.kinds = array("B")
+            self.starts = array("I")
+            self.ends = array("I")
+            append_kind = self.kinds.append
+            append_start = self.starts.append
+            append_end = self.ends.append
+            for token_type, start, end in tokenize_cpp_spans(source, 0, self._pattern):
+                append_kind(token_type_codes[token_type])
+                append_start(start)
+                append_end(end)
+            g_profiler.count("tokens", len(self.kinds))
+            append_kind(token_type_codes[TokenType.EOF])
+            append_start(len(source))
+            append_end(len(source))
+
+        self._load_token()
+
+    def _load_token(self):
+        if self._spans is not None:
+            self._token_type, self._start, self._end = next(
+                self._spans, (TokenType.EOF, len(self.source), len(self.source))
+            )
+        else:
+            self._token_type = token_types[self.kinds[self.index]]
+            self._start = self.starts[self.index]
+            self._end = self.ends[self.index]
+        self._text = None
 
     @property
     def token_type(self) -> TokenType:
-        return self.tokens[self.index][0]
+        return self._token_type
 
     @property
     def token_text(self):
-        return self.tokens[self.index][1]
+        if self._text is None:
+            self._text = self.source[self._start : self._end]
+        return self._text
+
+    @property
+    def token_end(self) -> int:
+        return self._end
 
     def is_eof(self):
-        return self.token_type is TokenType.EOF
+        return self._token_type is TokenType.EOF
+
+    def seek(self, offset: int):
+        """
+        Moves to the first token which starts at or after offset.
+        In stream mode, offset must be the boundary of a token (eg: the end of the current one).
+        """
+        if self._spans is not None:
+            self._spans = tokenize_cpp_spans(self.source, offset, self._pattern)
+        else:
+            self.index = bisect.bisect_left(self.starts, offset)
+        self._load_token()
 
     def advance(self):
-        assert self.token_type is not TokenType.EOF, "Cannot call next() on EOF token"
+        assert self._token_type is not TokenType.EOF, "Cannot call next() on EOF token"
         self.index += 1
+        self._load_token()
 
     def read_token(self, token_type: TokenType) -> str | None:
         if self.token_type != token_type:
@@ -357,17 +464,75 @@ class TokenIterator:
         self.advance()
 
 
-def extract_tags(unreal_path: Path) -> list[str]:
-    command = ["git", "-C", unreal_path, "tag"]
+# Comments, literals and pp-numbers with digit separators (eg: 1'000), which must be skipped as a whole when
+# looking for some punctuation in a source
+opaque_token_pattern = (
+    comment_pattern
+    + "|"
+    + literal_pattern
+    + r"|(?:\b\d|\.\d)(?:[\d.]|[EePp][-+])*'[^\W_](?:[\d.]+|'[^\W_]|[EePp][-+])*"
+)
+
+structure_pattern = re.compile(opaque_token_pattern + r"|[{}]", re.DOTALL)
+
 
-    tags = spawn_process(command).split("\n")
+class SourceIndex:
+    """
+    Structure of a C++ source, built in a single pass:
+    - the end of the block of every '{', after the matching '}' (or the end of the source if there is none)
+    - the spans of comments and literals, where braces don't count
+    """
+
+    def __init__(self, source: str):
+        # The indexes are cached by source, so the source is part of the memory used by an index
+        self.source_size = sys.getsizeof(source)
+        self.block_ends: dict[int, int] = {}
+        self.ignored_starts = array("I")
+        self.ignored_ends = array("I")
+
+        open_braces = []
+        for match in structure_pattern.finditer(source):
+            start, end = match.span()
+            c = source[start]
+            if c == "{":
+                open_braces.append(start)
+            elif c == "}":
+                if open_braces:
+                    self.block_ends[open_braces.pop()] = end
+            elif c in "/\"'":
+                self.ignored_starts.append(start)
+                self.ignored_ends.append(end)
+
+        for start in open_braces:
+            self.block_ends[start] = len(source)
+
+    def block_end(self, open_brace: int) -> int | None:
+        """Returns None if there is no '{' at the given offset, or it is in a comment/literal."""
+        return self.block_ends.get(open_brace)
+
+    def is_ignored(self, offset: int) -> bool:
+        i = bisect.bisect_right(self.ignored_starts, offset) - 1
+        return i >= 0 and offset < self.ignored_ends[i]
+
+    def size_of(self) -> int:
+        return (
+            self.source_size
+            + sys.getsizeof(self.block_ends)
+            + len(self.block_ends) * 2 * 32
+            + sys.getsizeof(self.ignored_starts)
+            + sys.getsizeof(self.ignored_ends)
+        )
+
+
+def extract_tags(unreal_path: Path) -> list[str]:
+    tags = get_object_reader(unreal_path).list_tags()
 
     # Use only release tags
     tags = [tag for tag in tags if tag.endswith("-release")]
 
-    # Sort tags, because the default sort puts 4.10 before 4.2
-    tags.sort(key=lambda x: [int(i) for i in x.split("-")[0].split(".")])
+    tags.sort(key=tag_sort_key)
 
+    register_tags(tags)
     return tags
 
 
@@ -375,23 +540,741 @@ def clean_tag_name(tag):
     return tag.replace("-release", "")
 
 
+class TagRegistry:
+    """
+    Release tags in release order, a tag is identified by its position (ordinal).
+    Appearances of the versions are stored as ordinals, which compare like the tags without parsing them again,
+    and the names are only resolved when the output is written.
+    """
+
+    def __init__(self, tags: list[str]):
+        self.names = list(tags)
+        self.ordinals = {tag: i for i, tag in enumerate(tags)}
+
+    def ordinal(self, tag: str) -> int:
+        ordinal = self.ordinals.get(tag)
+        if ordinal is None:
+            error(f"Unknown tag {tag}")
+        return ordinal
+
+    def name(self, ordinal: int) -> str:
+        return self.names[ordinal]
+
+
+g_tags = TagRegistry([])
+
+
+def register_tags(tags: list[str]):
+    """
+    Sets the tags of the repository, sorted by tag_sort_key (see extract_tags).
+    Ordinals are only valid for the registered tags, so they are assigned once, before any version is parsed.
+    """
+    global g_tags
+    if tags != g_tags.names:
+        g_tags = TagRegistry(tags)
+
+
+def is_known_tag(tag: str) -> bool:
+    return tag in g_tags.ordinals
+
+
+def tag_ordinal(tag: str) -> int:
+    return g_tags.ordinal(tag)
+
+
+def tag_name(ordinal: int) -> str:
+    return g_tags.name(ordinal)
+
+
+class GitObjectReader(Repository):
+    """
+    Long-lived `git cat-file --batch` session.
+    Objects are requested by name (eg: "5.3.0-release:Engine/Source/Foo.h" or an object id) and streamed back over
+    the same pipe, so reading thousands of files doesn't fork a new git process for each one of them.
+    Object ids are resolved through a second `git cat-file --batch-check` session, which doesn't transfer the content.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.process = self._spawn("--batch")
+        self.check_process: subprocess.Popen | None = None
+
+    def _spawn(self, mode: str) -> subprocess.Popen:
+        print(f"-- Running git -C {self.root} cat-file {mode}")
+        g_profiler.count("git_processes")
+        return subprocess.Popen(
+            ["git", "-C", str(self.root), "cat-file", mode],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+
+    @staticmethod
+    def _request(process: subprocess.Popen, name: str) -> List[str] | None:
+        process.stdin.write(name.encode("utf-8") + b"\n")
+        process.stdin.flush()
+
+        header = process.stdout.readline().decode("utf-8").rstrip("\n")
+        if not header:
+            error(f"git cat-file terminated unexpectedly while reading {name}")
+
+        # eg: "5.3.0-release:Foo.h missing"
+        if header.endswith(" missing") or header.endswith(" ambiguous"):
+            return None
+
+        # object id, type, size
+        return header.split(" ")
+
+    def read_object(self, name: str) -> Tuple[str, str, bytes] | None:
+        """Returns the tuple (object id, type, content), or None if the object doesn't exist."""
+        header = self._request(self.process, name)
+        if not header:
+            return None
+
+        object_id, object_type, size = header
+        content = self.process.stdout.read(int(size))
+        # Skip the LF after the content
+        self.process.stdout.read(1)
+        return object_id, object_type, content
+
+    def read_object_id(self, name: str) -> str | None:
+        """Returns the id of the object, or None if the object doesn't exist."""
+        if not self.check_process:
+            self.check_process = self._spawn("--batch-check")
+
+        header = self._request(self.check_process, name)
+        return header[0] if header else None
+
+    def list_tags(self) -> list[str]:
+        return spawn_process(["git", "-C", self.root, "tag"]).splitlines()
+
+    def grep(
+        self, patterns: list[str], revision: str, pathspecs: list[str]
+    ) -> list[Tuple[str, str]]:
+        command = ["git", "-C", self.root, "grep", "--full-name", "-I", "-o", "-E"]
+        for pattern in patterns:
+            command += ["-e", pattern]
+
+        # git grep returns 1 if nothing is found
+        output = spawn_process(command + [revision, "--"] + pathspecs, allow_error=True)
+
+        result = []
+        for line in output.splitlines():
+            # eg: "5.6.0-release:Engine/Source/Foo.h:struct FFoo"
+            _, file, text = line.split(":", 2)
+            result.append((file, text))
+        return result
+
+    def close(self):
+        for process in [self.process, self.check_process]:
+            if process and process.poll() is None:
+                process.stdin.close()
+                process.wait()
+
+
+class BlobCache:
+    """
+    Persistent cache of git blobs, shared across runs.
+
+    Blobs are stored by object id (like the loose objects of git), so a file which is identical across several tags is
+    stored only once.
+    In front of it there is a small "<tree id>:<path>" -> blob id map, so that a second run doesn't need to ask git
+    where a file is.
+    The tree id is used instead of the tag name, since it identifies the content of the tag.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.blob_ids_path = directory / "blob-ids.json"
+        self.blob_ids: dict[str, dict[str, str | None]] | None = None
+        self.dirty = False
+
+    def _blob_path(self, blob_id: str) -> Path:
+        return self.directory / "objects" / blob_id[:2] / blob_id[2:]
+
+    def _load_blob_ids(self) -> dict[str, dict[str, str | None]]:
+        if self.blob_ids is None:
+            self.blob_ids = {}
+            if self.blob_ids_path.exists():
+                self.blob_ids = json.loads(read_file(self.blob_ids_path))
+        return self.blob_ids
+
+    def get_blob(self, blob_id: str) -> bytes | None:
+        path = self._blob_path(blob_id)
+        if not path.exists():
+            return None
+        with io.open(path, "rb") as f:
+            return zlib.decompress(f.read())
+
+    def put_blob(self, blob_id: str, content: bytes):
+        path = self._blob_path(blob_id)
+        if path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(path, zlib.compress(content, 1))
+
+    def get_blob_id(self, tree_id: str, path: str) -> Tuple[bool, str | None]:
+        """Returns (found, blob id), the blob id is None if the file is known to be missing."""
+        paths = self._load_blob_ids().get(tree_id)
+        if paths is None or path not in paths:
+            return False, None
+        return True, paths[path]
+
+    def set_blob_id(self, tree_id: str, path: str, blob_id: str | None):
+        self._load_blob_ids().setdefault(tree_id, {})[path] = blob_id
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.blob_ids_path, json.dumps(self.blob_ids).encode("utf-8"))
+        self.dirty = False
+
+
+# Sources of the extractor, the parse results are discarded when they change
+parser_sources = ["utils.py", "extract_versions.py", "extract_custom_versions.py"]
+
+interesting_versions_path = Path(__file__).parent / "InterestingVersions.txt"
+""" Patterns of the custom versions to extract """
+
+
+def compute_parser_version() -> str:
+    digest = hashlib.sha1()
+    for name in parser_sources:
+        digest.update((Path(__file__).parent / name).read_bytes())
+    return digest.hexdigest()
+
+
+class ParseStore:
+    """
+    Persistent store of parse results, shared across runs (sqlite).
+
+    Results are keyed by the blob id of the parsed file, so a file which is identical across several tags is parsed
+    only once, and by the version of the parser, so they are discarded when the parsing code changes.
+    Values are stored as JSON, None is a valid value (eg: the enum is not defined in that file).
+    """
+
+    # Table -> name of the second part of the key
+    tables = {"enums": "enum_name", "guids": "guid_prop"}
+
+    def __init__(self, path: Path, parser_version: str):
+        self.path = path
+        self.parser_version = parser_version
+        self.connections = threading.local()
+
+        connection = self._connection()
+        for table, key in self.tables.items():
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                f"blob_id TEXT, {key} TEXT, parser_version TEXT, value TEXT, "
+                f"PRIMARY KEY (blob_id, {key}, parser_version))"
+            )
+            connection.execute(
+                f"DELETE FROM {table} WHERE parser_version != ?", (parser_version,)
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        # Connections can't be shared by threads or forked processes
+        connection = getattr(self.connections, "connection", None)
+        if connection is None or self.connections.pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Autocommit, each result is saved as soon as it is available
+            connection = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=OFF")
+            self.connections.connection = connection
+            self.connections.pid = os.getpid()
+        return connection
+
+    def get(self, table: str, blob_id: str, name: str) -> Tuple[bool, Any]:
+        """Returns (found, value)."""
+        row = (
+            self._connection()
+            .execute(
+                f"SELECT value FROM {table} WHERE blob_id = ? AND {self.tables[table]} = ? AND parser_version = ?",
+                (blob_id, name, self.parser_version),
+            )
+            .fetchone()
+        )
+        if row is None:
+            g_profiler.count("parse_store_misses")
+            return False, None
+        g_profiler.count("parse_store_hits")
+        return True, json.loads(row[0])
+
+    def put(self, table: str, blob_id: str, name: str, value: Any):
+        self._connection().execute(
+            f"INSERT OR REPLACE INTO {table} VALUES (?, ?, ?, ?)",
+            (blob_id, name, self.parser_version, json.dumps(value)),
+        )
+
+
+class MemoryCache:
+    """
+    In-memory cache limited by the total size of the stored values.
+    When the budget is exceeded, the least recently used values are evicted.
+    The cache can be used from several threads.
+    """
+
+    def __init__(self, name: str, budget: int):
+        self.name = name
+        self.lock = threading.Lock()
+        self.budget = budget
+        self.values: OrderedDict[Any, Tuple[Any, int]] = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key) -> Tuple[bool, Any]:
+        """Returns (found, value)."""
+        with self.lock:
+            if key not in self.values:
+                self.misses += 1
+                return False, None
+
+            self.hits += 1
+            self.values.move_to_end(key)
+            return True, self.values[key][0]
+
+    def put(self, key, value, size: int):
+        with self.lock:
+            if key in self.values:
+                self.size -= self.values.pop(key)[1]
+
+            # Values bigger than the whole budget are not stored at all
+            if size > self.budget:
+                return
+
+            self.values[key] = value, size
+            self.size += size
+            self._evict()
+
+    def set_budget(self, budget: int):
+        with self.lock:
+            self.budget = budget
+            self._evict()
+
+    def _evict(self):
+        while self.size > self.budget:
+            _, (_, evicted_size) = self.values.popitem(last=False)
+            self.size -= evicted_size
+            self.evictions += 1
+
+    def format_statistics(self) -> str:
+        return (
+            f"{self.name}: {self.hits} hits, {self.misses} misses, {self.evictions} evictions, "
+            f"{self.size / 1024 / 1024:.1f}/{self.budget / 1024 / 1024:.0f} MB"
+        )
+
+
+g_memory_caches: list[MemoryCache] = []
+
+
+def memory_cache(name: str, size_of: Callable[[Any], int] = sys.getsizeof):
+    """
+    Like lru_cache, but the cache is limited by the total size of the results (measured with size_of).
+    The budget can be changed with set_memory_budget.
+    """
+
+    def decorator(function):
+        cache = MemoryCache(name, default_memory_budget)
+        g_memory_caches.append(cache)
+
+        @wraps(function)
+        def wrapper(*args):
+            found, value = cache.get(args)
+            if not found:
+                value = function(*args)
+                cache.put(args, value, size_of(value))
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+g_memory_budget = default_memory_budget
+
+
+def set_memory_budget(budget: int):
+    """Changes the size of all in-memory caches, in bytes."""
+    global g_memory_budget
+    g_memory_budget = budget
+    for cache in g_memory_caches:
+        cache.set_budget(budget)
+
+
+def print_cache_statistics():
+    for cache in g_memory_caches:
+        if cache.hits or cache.misses:
+            print(cache.format_statistics())
+
+
+g_blob_cache: BlobCache | None = BlobCache(default_cache_dir)
+
+g_parse_store: ParseStore | None = None
+g_parse_store_dir: Path | None = default_cache_dir
+
+
+def set_cache_dir(directory: Path | None):
+    """Changes the location of the persistent cache, None disables it."""
+    global g_blob_cache, g_parse_store, g_parse_store_dir
+    if g_blob_cache:
+        g_blob_cache.save()
+    g_blob_cache = BlobCache(directory) if directory else None
+    g_parse_store = None
+    g_parse_store_dir = directory
+
+
+def get_parse_store() -> ParseStore | None:
+    """The store is opened on first use, so that importing the scripts doesn't touch the disk."""
+    global g_parse_store
+    if g_parse_store is None and g_parse_store_dir:
+        g_parse_store = ParseStore(
+            g_parse_store_dir / "parsed.sqlite", compute_parser_version()
+        )
+    return g_parse_store
+
+
+@atexit.register
+def _save_blob_cache():
+    if g_blob_cache:
+        g_blob_cache.save()
+
+
+git_backends = ["cli", "python"]
+""" cli: `git cat-file` processes, python: GitObjectDatabase reading the `.git` directory in-process """
+
+g_git_backend = "cli"
+
+g_delta_base_cache = MemoryCache("Delta bases", default_memory_budget)
+g_memory_caches.append(g_delta_base_cache)
+
+g_object_readers = threading.local()
+
+g_repositories: dict[Path, Repository] = {}
+
+
+def register_repository(root: Path, repository: Repository):
+    """Serves the repository at root from the given backend (eg: a synthetic MemoryObjectDatabase)."""
+    g_repositories[root] = repository
+
+
+def set_git_backend(backend: str):
+    global g_git_backend
+    g_git_backend = backend
+
+
+def get_object_reader(root: Path) -> Repository:
+    """
+    Returns the object reader of the repository.
+    A session serves one request at a time, so each thread (and each worker process) opens its own one.
+    """
+    if root in g_repositories:
+        return g_repositories[root]
+
+    readers = g_object_readers.__dict__.setdefault("readers", {})
+    # Forked processes inherit the readers of the parent, don't share their pipes
+    key = root, os.getpid()
+    reader = readers.get(key)
+    if not reader:
+        if g_git_backend == "python":
+            reader = GitObjectDatabase(root, g_delta_base_cache)
+        else:
+            reader = GitObjectReader(root)
+        atexit.register(reader.close)
+        readers[key] = reader
+    return reader
+
+
 @lru_cache(maxsize=None)
-def get_git_file(root: Path, filename: str | Path, revision: str = "HEAD"):
+def get_tree_id(root: Path, revision: str) -> str:
+    g_profiler.count("git_id_lookups")
+    tree_id = get_object_reader(root).read_object_id(f"{revision}^{{tree}}")
+    if not tree_id:
+        error(f"Could not find revision {revision}")
+    return tree_id
+
+
+def get_git_blob_id(
+    root: Path, filename: str | Path, revision: str = "HEAD"
+) -> str | None:
+    """Returns the id of the blob at the specified revision, or None if the file doesn't exist."""
     path_unix = str(filename).replace("\\", "/")
-    return spawn_process(
-        ["git", "-C", root, "show", f"{revision}:{path_unix}"],
-        allow_error=True,
-        print_errors=False,
-    )
+    tree_id = get_tree_id(root, revision)
+
+    if g_blob_cache:
+        found, blob_id = g_blob_cache.get_blob_id(tree_id, path_unix)
+        if found:
+            g_profiler.count("blob_id_cache_hits")
+            return blob_id
+        g_profiler.count("blob_id_cache_misses")
+
+    g_profiler.count("git_id_lookups")
+    blob_id = get_object_reader(root).read_object_id(f"{tree_id}:{path_unix}")
+
+    if g_blob_cache:
+        g_blob_cache.set_blob_id(tree_id, path_unix, blob_id)
+
+    return blob_id
+
+
+@memory_cache("Blobs")
+def read_git_blob(root: Path, blob_id: str) -> str:
+    if g_blob_cache and (content := g_blob_cache.get_blob(blob_id)) is not None:
+        g_profiler.count("blob_cache_hits")
+        g_profiler.count("blob_cache_bytes_read", len(content))
+        return content.decode("utf-8")
+    if g_blob_cache:
+        g_profiler.count("blob_cache_misses")
+
+    g_profiler.count("git_reads")
+    git_object = get_object_reader(root).read_object(blob_id)
+    if not git_object or git_object[1] != "blob":
+        return ""
+    g_profiler.count("git_bytes_read", len(git_object[2]))
+
+    if g_blob_cache:
+        g_blob_cache.put_blob(blob_id, git_object[2])
+
+    return git_object[2].decode("utf-8")
+
+
+@memory_cache("Source indexes", size_of=SourceIndex.size_of)
+def get_source_index(source: str) -> SourceIndex:
+    # The entry keeps the source alive even if the blob is evicted, so the source counts in its size
+    return SourceIndex(source)
+
+
+def get_git_file(root: Path, filename: str | Path, revision: str = "HEAD"):
+    blob_id = get_git_blob_id(root, filename, revision)
+    if not blob_id:
+        return ""
+    return read_git_blob(root, blob_id)
 
 
-def write_file(path: Path, content):
+g_file_statistics_lock = threading.Lock()
+g_written_files = 0
+g_unchanged_files = 0
+
+
+def write_file(path: Path, content: str):
+    """
+    Writes the file only if the content is different, so the files which didn't change keep their timestamp
+    (and the viewer is not rebuilt).
+    The file is replaced atomically, a reader never sees it half written.
+    """
+    global g_written_files, g_unchanged_files
+
+    # Always \n, even on windows
+    data = content.encode("utf-8")
+    try:
+        # The size is compared first, so most of the changed files are not even read
+        unchanged = path.stat().st_size == len(data) and path.read_bytes() == data
+    except FileNotFoundError:
+        unchanged = False
+
+    if unchanged:
+        with g_file_statistics_lock:
+            g_unchanged_files += 1
+        return
+
     print(f"Writing {path}")
     if not path.parent.exists():
-        path.parent.mkdir(parents=True)
-    # on windows, use \r\n
-    with io.open(path, "w", encoding="utf-8", newline="\n") as f:
-        f.write(content)
+        path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(path, data)
+
+    with g_file_statistics_lock:
+        g_written_files += 1
+
+
+@contextmanager
+def open_output(path: Path) -> Generator[TextIO, None, None]:
+    """
+    Stream for the generated files, the content is buffered in memory and saved with write_file when the block ends.
+    """
+    stream = io.StringIO()
+    yield stream
+    write_file(path, stream.getvalue())
+
+
+def print_file_statistics():
+    print(
+        f"Updated {g_written_files} files, {g_unchanged_files} files were already up to date"
+    )
+
+
+def get_peak_memory() -> dict[str, float] | None:
+    """Peak resident memory in MB, of this process and of the largest child (eg: git, or a worker)."""
+    if not resource:
+        return None
+    # ru_maxrss is in kilobytes, except on macOS where it is in bytes
+    unit = 1 / 1024 / 1024 if sys.platform == "darwin" else 1 / 1024
+    return {
+        "self": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * unit,
+        "children": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * unit,
+    }
+
+
+def make_profile() -> dict:
+    """The values collected by g_profiler, with the totals of the process."""
+    times = os.times()
+    with g_profiler.lock:
+        profile = {
+            "command": sys.argv,
+            "wall": time.perf_counter() - g_profiler.start,
+            "cpu": time.process_time(),
+            # Only the children which terminated, the git sessions are closed before the profile is saved
+            "children_cpu": times.children_user + times.children_system,
+            "peak_memory_mb": get_peak_memory(),
+            "phases": {name: dict(phase) for name, phase in g_profiler.phases.items()},
+            "timings": {
+                category: dict(timings)
+                for category, timings in g_profiler.timings.items()
+            },
+            "counters": dict(sorted(g_profiler.counters.items())),
+        }
+    profile["caches"] = {
+        cache.name: {
+            "hits": cache.hits,
+            "misses": cache.misses,
+            "evictions": cache.evictions,
+            "size": cache.size,
+            "budget": cache.budget,
+        }
+        for cache in g_memory_caches
+    }
+    profile["files"] = {"written": g_written_files, "unchanged": g_unchanged_files}
+    profile["warnings"] = g_warning_counter
+    return profile
+
+
+def set_profile_path(path: Path | None):
+    """The profile of the run is saved to path when the process exits, None disables it."""
+    global g_profile_path
+    g_profile_path = path
+
+
+@atexit.register
+def _save_profile():
+    if g_profile_path:
+        write_atomic(
+            g_profile_path, json.dumps(make_profile(), indent=2).encode("utf-8")
+        )
+        print(f"Profile saved to {g_profile_path}")
+
+
+def create_process_pool(jobs: int) -> ProcessPoolExecutor:
+    """Creates a pool of processes, which use the same cache configuration of this process."""
+    cache_dir = g_blob_cache.directory if g_blob_cache else None
+    return ProcessPoolExecutor(
+        jobs,
+        initializer=_configure_worker,
+        initargs=(cache_dir, g_memory_budget, g_git_backend, g_tags.names),
+    )
+
+
+def _configure_worker(
+    cache_dir: Path | None, memory_budget: int, git_backend: str, tags: list[str]
+):
+    set_cache_dir(cache_dir)
+    set_memory_budget(memory_budget)
+    set_git_backend(git_backend)
+    register_tags(tags)
+    # Forked workers inherit the values of the parent, only their own ones are sent back
+    set_profile_path(None)
+    g_profiler.take()
+
+
+def run_profiled(function: Callable, *args) -> Tuple[Any, dict]:
+    """
+    Runs the function in a worker process, the result is returned with the values collected by the profiler of the
+    worker, which are merged by the caller with g_profiler.merge.
+    """
+    result = function(*args)
+    return result, g_profiler.take()
+
+
+_end_of_stream = object()
+
+
+def run_pipeline(
+    items: Iterable,
+    stages: List[Callable[[Any], Iterable]],
+    queue_size: int = 8,
+    name: str = "pipeline",
+):
+    """
+    Runs the items through a chain of stages, each one in its own thread.
+    A stage receives one item and returns (or yields) the items for the next stage.
+    Stages are connected by bounded queues, so a slow stage applies back-pressure on the previous ones instead of
+    buffering the whole input in memory.
+    Since every stage is served by a single thread, the items reach the last stage in the same order as the input.
+    The time spent in each stage, without waiting for the other ones, is saved in the phase "{name}.{stage name}".
+    """
+    queues = [queue.Queue(queue_size) for _ in stages]
+    failures: list[BaseException] = []
+
+    def run_stage(index: int):
+        stage = stages[index]
+        output = queues[index + 1] if index + 1 < len(queues) else None
+        calls = 0
+        wall = cpu = 0.0
+        while (item := queues[index].get()) is not _end_of_stream:
+            # After a failure, keep draining the queue, so the previous stages are not blocked forever
+            if failures:
+                continue
+            calls += 1
+            start, start_cpu = time.perf_counter(), time.thread_time()
+            try:
+                for result in stage(item) or ():
+                    if output:
+                        wait = time.perf_counter()
+                        output.put(result)
+                        start += time.perf_counter() - wait
+            except BaseException as e:
+                failures.append(e)
+            wall += time.perf_counter() - start
+            cpu += time.thread_time() - start_cpu
+        if output:
+            output.put(_end_of_stream)
+        g_profiler.add_phase(f"{name}.{stage.__name__}", wall, cpu, calls)
+
+    threads = [
+        threading.Thread(target=run_stage, args=(i,), name=stage.__name__, daemon=True)
+        for i, stage in enumerate(stages)
+    ]
+    for thread in threads:
+        thread.start()
+
+    for item in items:
+        if failures:
+            break
+        queues[0].put(item)
+    queues[0].put(_end_of_stream)
+
+    for thread in threads:
+        thread.join()
+
+    # Errors inside the stages (including the SystemExit raised by error()) are reported by the calling thread
+    if failures:
+        raise failures[0]
+
+
+def write_atomic(path: Path, content: bytes):
+    """
+    Writes the file through a temporary file, so readers never see a partially written file.
+    The temporary file is removed if the write fails.
+    """
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with io.open(temp_path, "wb") as f:
+            f.write(content)
+        os.replace(temp_path, path)
+    finally:
+        temp_path.unlink(missing_ok=True)
 
 
 def read_file(path):
@@ -402,8 +1285,55 @@ def read_file(path):
 def parse_global_args(description):
     parser = argparse.ArgumentParser(description=description)
     parser.add_argument("unreal_engine_path", help="Path to Unreal Engine repository")
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=default_cache_dir,
+        help="Directory of the persistent git blob cache",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Disable the persistent cache"
+    )
+    parser.add_argument(
+        "--memory-budget",
+        type=int,
+        default=default_memory_budget // 1024 // 1024,
+        help="Maximum size of the in-memory caches, in MB",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes used to parse the tags",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        help="Directory of the generated files (src/unreal-engine/versioning by default)",
+    )
+    parser.add_argument(
+        "--git-backend",
+        choices=git_backends,
+        default="cli",
+        help="How the repository is read: through git processes, or directly from the .git directory",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore the state of the previous run, and process all tags again",
+    )
+    parser.add_argument(
+        "--profile-out",
+        type=Path,
+        help="Save the timings and the counters of the run to this JSON file",
+    )
     args = parser.parse_args()
 
+    set_cache_dir(None if args.no_cache else args.cache_dir)
+    set_memory_budget(args.memory_budget * 1024 * 1024)
+    set_git_backend(args.git_backend)
+    set_profile_path(args.profile_out)
+
     return args
 
 
@@ -417,55 +1347,131 @@ def make_header(filename: str):
     return header
 
 
-def ls_files(root: Path, tag: str) -> list[Path]:
-    """Run git grep to find files matching the pattern in the specified tag."""
-    # git ls-tree --name-only -r 5.6.0-release
-    files = spawn_process(["git", "-C", root, "ls-tree", "--name-only", "-r", tag])
-    return [Path(file.strip()) for file in files.strip().split("\n") if file]
+class PathIndex:
+    """
+    Index of the files of all tags of a repository.
 
+    Each path is stored once for all tags, and each tag only keeps a bitmap of the ids of its files.
+    Tags are listed by walking the tree objects, and the subtrees which didn't change since the previously indexed tag
+    are reused without reading them again.
+    """
 
-def grep_files(root: Path, pattern: str, tag: str) -> list[Path]:
-    """Run git grep to find files matching the pattern in the specified tag."""
-    files = spawn_process(
-        [
-            "git",
-            "-C",
-            root,
-            "grep",
-            "--full-name",
-            "--files-with-matches",
-            pattern,
-            tag,
+    def __init__(self, root: Path):
+        self.root = root
+        self.paths: list[str] = []
+        self.path_ids: dict[str, int] = {}
+        # Lower case file name -> ids of the paths with that name
+        self.ids_by_name: dict[str, array] = {}
+        # Tag -> bitmap of the ids of the files present in the tag
+        self.members_by_tag: dict[str, bytearray] = {}
+        # Subtrees of the last indexed tag: (tree id, prefix) -> (ids of all files, child subtrees)
+        self.subtrees: dict[Tuple[str, str], Tuple[array, list]] = {}
+
+    def _intern(self, path: str) -> int:
+        path_id = self.path_ids.get(path)
+        if path_id is None:
+            path_id = len(self.paths)
+            self.paths.append(path)
+            self.path_ids[path] = path_id
+            name = path.rsplit("/", 1)[-1].lower()
+            self.ids_by_name.setdefault(name, array("I")).append(path_id)
+        return path_id
+
+    def _get_members(self, tag: str) -> bytearray:
+        if tag not in self.members_by_tag:
+            self.members_by_tag[tag] = self._index_tag(tag)
+        return self.members_by_tag[tag]
+
+    def _index_tag(self, tag: str) -> bytearray:
+        reader = get_object_reader(self.root)
+        previous_subtrees = self.subtrees
+        self.subtrees = {}
+
+        def keep_subtree(key: Tuple[str, str]) -> array:
+            # Keep the children too, the next tag may reuse them
+            ids, children = self.subtrees[key] = previous_subtrees[key]
+            for child in children:
+                keep_subtree(child)
+            return ids
+
+        def walk_tree(tree_id: str, prefix: str) -> array:
+            if (tree_id, prefix) in previous_subtrees:
+                return keep_subtree((tree_id, prefix))
+
+            g_profiler.count("git_reads")
+            git_object = reader.read_object(tree_id)
+            if not git_object:
+                error(f"Could not read tree {tree_id}")
+            g_profiler.count("git_bytes_read", len(git_object[2]))
+
+            ids = array("I")
+            children = []
+            for mode, name, object_id in parse_tree(git_object[2]):
+                if mode == "40000":
+                    children.append((object_id, f"{prefix}{name}/"))
+                    ids.extend(walk_tree(*children[-1]))
+                else:
+                    ids.append(self._intern(prefix + name))
+
+            self.subtrees[tree_id, prefix] = ids, children
+            return ids
+
+        ids = walk_tree(get_tree_id(self.root, tag), "")
+
+        members = bytearray((len(self.paths) + 7) // 8)
+        for path_id in ids:
+            members[path_id >> 3] |= 1 << (path_id & 7)
+        return members
+
+    @staticmethod
+    def _is_member(members: bytearray, path_id: int) -> bool:
+        # Paths found after the tag was indexed are beyond the end of the bitmap
+        return path_id >> 3 < len(members) and bool(
+            members[path_id >> 3] >> (path_id & 7) & 1
+        )
+
+    def list_files(self, tag: str) -> list[str]:
+        members = self._get_members(tag)
+        return [
+            path
+            for path_id, path in enumerate(self.paths)
+            if self._is_member(members, path_id)
+        ]
+
+    def find_files(self, file_name: str, tag: str) -> list[str]:
+        """Returns the files with the given name (case-insensitive) in the tag."""
+        members = self._get_members(tag)
+        return [
+            self.paths[path_id]
+            for path_id in self.ids_by_name.get(file_name.lower(), [])
+            if self._is_member(members, path_id)
         ]
-    )
-    return [
-        Path(file.strip().split(":")[1]) for file in files.strip().split("\n") if file
-    ]
 
 
 @lru_cache(maxsize=None)
-def get_files_by_name(root: Path, tag: str) -> dict[str, list[Path]]:
-    file_by_name: dict[str, list[Path]] = {}
+def get_path_index(root: Path) -> PathIndex:
+    return PathIndex(root)
 
-    # scan all files
-    for file in ls_files(root, tag):
-        # Index all files by name
-        name = file.name.lower()
-        if name not in file_by_name:
-            file_by_name[name] = []
-        file_by_name[name].append(file)
 
-    return file_by_name
+def grep_files(root: Path, pattern: str, tag: str) -> list[Path]:
+    """Find the files matching the pattern in the specified tag."""
+    files = dict.fromkeys(file for file, _ in grep_matches(root, [pattern], tag, []))
+    return [Path(file) for file in files]
 
 
-def get_full_name_from_filename(root: Path, file_name: str, tag: str) -> List[Path]:
-    file_name = file_name.lower()
+def grep_matches(
+    root: Path, patterns: list[str], tag: str, pathspecs: list[str]
+) -> list[Tuple[str, str]]:
+    """
+    Search the extended regular expressions in the specified tag, with a single pass over the files.
+    Returns a list of (file, matched text), only the part of the line matching the pattern is returned.
+    """
+    g_profiler.count("git_greps")
+    return get_object_reader(root).grep(patterns, tag, pathspecs)
 
-    file_by_name = get_files_by_name(root, tag)
-    if file_name in file_by_name:
-        return file_by_name[file_name]
 
-    return []
+def get_full_name_from_filename(root: Path, file_name: str, tag: str) -> List[Path]:
+    return [Path(file) for file in get_path_index(root).find_files(file_name, tag)]
 
 
 def convert_pattern_to_regex(value: str):
@@ -1,6 +1,205 @@
+import json
+import random
+import tempfile
 import unittest
+from pathlib import Path
+from typing import Generator, Tuple
 
-from utils import split_arguments
+from extract_custom_versions import parse_guid
+from extract_versions import (
+    ExtractionState,
+    get_output_dir,
+    HeaderEnums,
+    load_state,
+    parse_enum_content,
+    save_state,
+    SerializationVersion,
+    set_output_dir,
+    VersionTable,
+)
+from git_odb import apply_delta, MemoryObjectDatabase, ObjectDatabase
+from utils import (
+    split_arguments,
+    find_block,
+    parse_block,
+    BlobCache,
+    g_profiler,
+    MemoryCache,
+    Profiler,
+    ParseStore,
+    register_tags,
+    SourceIndex,
+    run_pipeline,
+    tokenize_cpp,
+    TokenIterator,
+    TokenType,
+)
+
+
+def legacy_tokenize_cpp(source: str) -> Generator[Tuple[TokenType, str], None, None]:
+    """
+    Character-at-a-time tokenizer replaced by tokenize_cpp, kept as the reference of its behavior.
+    The only difference is the ">" branch, which couldn't return ">>", ">=" and ">>=".
+    """
+
+    i = 0
+    length = len(source)
+
+    while i < length:
+        token_start = i
+        c = source[i]
+
+        # Handle spaces
+        if c.isspace():
+            i += 1
+            while i < length and source[i].isspace():
+                i += 1
+            # Skip whitespaces
+            continue
+
+        # Handle single line comments
+        elif c == "/" and i + 1 < length and source[i + 1] == "/":
+            i += 2
+            while i < length and source[i] != "\n":
+                i += 1
+            yield TokenType.COMMENT, source[token_start:i].strip()
+
+        elif c == "/" and i + 1 < length and source[i + 1] == "*":
+            # Multi-line comment
+            i += 2
+            while i < length - 1 and not (source[i] == "*" and source[i + 1] == "/"):
+                i += 1
+            i += 2
+            yield TokenType.COMMENT, source[token_start:i].strip()
+
+        # Handle string and character literals
+        elif c == '"' or c == "'":
+            quote = c
+            i += 1
+            while i < length:
+                if source[i] == quote:
+                    i += 1
+                    break
+                elif source[i] == "\\" and i + 1 < length:
+                    # Skip escaped characters
+                    i += 2
+                else:
+                    i += 1
+            yield TokenType.STRING_LITERAL, source[token_start:i].strip()
+
+        # Handle numeric literals
+        elif c.isdigit() or (c == "." and i + 1 < length and source[i + 1].isdigit()):
+            # Handle all pp-number
+            i += 1
+            while i < length:
+                if source[i].isdigit() or source[i] == ".":
+                    i += 1
+                elif source[i] == "'" and i + 1 < length and (source[i + 1].isalnum()):
+                    i += 2
+                elif source[i] in "EePp" and i + 1 < length and (source[i + 1] in "-+"):
+                    i += 2
+                else:
+                    break
+            yield TokenType.NUMERIC_LITERAL, source[token_start:i].strip()
+
+        # Handle identifiers
+        elif c.isalpha() or c == "_":
+            i += 1
+            while i < length and (source[i].isalnum() or source[i] == "_"):
+                i += 1
+            identifier = source[token_start:i].strip()
+            yield TokenType.IDENTIFIER, identifier
+
+        # Handle operators
+        elif c == ".":
+            if i + 2 < length and source[i + 1] == "." and source[i + 2] == ".":
+                i += 3
+                yield TokenType.OPERATOR, "..."
+            elif i + 1 < length and source[i + 1] == "*":
+                i += 2
+                yield TokenType.OPERATOR, ".*"
+            else:
+                i += 1
+                yield TokenType.OPERATOR, c
+
+        elif c == ":":
+            if i + 1 < length and source[i + 1] == ":":
+                i += 2
+                yield TokenType.OPERATOR, "::"
+            else:
+                i += 1
+                yield TokenType.OPERATOR, c
+
+        elif c == "^":
+            if i + 1 < length and source[i + 1] in "^=":
+                i += 2
+                yield TokenType.OPERATOR, c + source[i - 1]
+            elif i + 1 < length and source[i + 1] == "^":
+                i += 2
+                yield TokenType.OPERATOR, "^^"
+            else:
+                i += 1
+                yield TokenType.OPERATOR, c
+
+        elif c == "<":
+            if i + 2 < length and source[i + 1] == "<" and source[i + 2] == "=":
+                i += 3
+                yield TokenType.OPERATOR, "<<="
+            elif i + 2 < length and source[i + 1] == "=" and source[i + 2] == ">":
+                i += 3
+                yield TokenType.OPERATOR, "<=>"
+            elif i + 1 < length and source[i + 1] == "<":
+                i += 2
+                yield TokenType.OPERATOR, "<<"
+            elif i + 1 < length and source[i + 1] == "=":
+                i += 2
+                yield TokenType.OPERATOR, "<="
+            else:
+                i += 1
+                yield TokenType.OPERATOR, c
+
+        elif c == ">":
+            if i + 2 < length and source[i + 1] == ">" and source[i + 2] == "=":
+                i += 3
+                yield TokenType.OPERATOR, ">>="
+            elif i + 1 < length and source[i + 1] == ">":
+                i += 2
+                yield TokenType.OPERATOR, ">>"
+            elif i + 1 < length and source[i + 1] == "=":
+                i += 2
+                yield TokenType.OPERATOR, ">="
+            else:
+                i += 1
+                yield TokenType.OPERATOR, c
+
+        elif c in "+-*/%&|=!":
+            if i + 1 < length and source[i + 1] == "=":
+                i += 2
+                yield TokenType.OPERATOR, c + "="
+            elif c in "&|+->" and i + 1 < length and source[i + 1] == c:
+                i += 2
+                yield TokenType.OPERATOR, c + c
+            elif c == "-":
+                if i + 2 < length and source[i + 1] == ">" and source[i + 2] == "*":
+                    i += 3
+                    yield TokenType.OPERATOR, "->*"
+                elif i + 1 < length and source[i + 1] == ">":
+                    i += 2
+                    yield TokenType.OPERATOR, "->"
+                else:
+                    i += 1
+                    yield TokenType.OPERATOR, c
+            else:
+                i += 1
+                yield TokenType.OPERATOR, c
+
+        elif c in "{}[]();:?~!,":
+            i += 1
+            yield TokenType.OPERATOR, c
+
+        else:
+            i += 1
+            yield TokenType.UNKNOWN, c
 
 
 class TestMathUtils(unittest.TestCase):
@@ -13,5 +212,381 @@ class TestMathUtils(unittest.TestCase):
         self.assertEqual(split_arguments('"a\\"b"'), ['"a\\"b"'])
 
 
+class TestBlocks(unittest.TestCase):
+    def test_parse_block(self):
+        self.assertEqual(
+            parse_block("struct FStruct { int32 Value; }", "struct FStruct"),
+            "{ int32 Value; }",
+        )
+        self.assertIsNone(parse_block("struct FStruct;", "struct FStruct"))
+
+    def test_ignores_comments_and_literals(self):
+        source = (
+            "// struct FOld {\n"
+            "struct FStruct {\n"
+            "\t/* } */ const char* A = \"}\"; char B = '{'; int C = 1'000;\n"
+            "\tenum Type { D };\n"
+            "};\n"
+        )
+        struct_block = find_block(source, "struct F\\w+")
+        self.assertEqual(struct_block, (source.index("{\n\t/*"), len(source) - 2))
+        enum_block = find_block(source, r"enum \w+", *struct_block)
+        self.assertEqual(source[enum_block[0] : enum_block[1]], "{ D }")
+
+    def test_unterminated_block(self):
+        self.assertEqual(parse_block("enum E { A, { B", "enum E"), "{ A, { B")
+
+    def test_source_index_size(self):
+        # The cached index keeps its source alive
+        source = "struct F { int A; };\n" * 1000
+        self.assertGreater(SourceIndex(source).size_of(), len(source))
+
+
+class TestHeaderEnums(unittest.TestCase):
+    source = (
+        "// struct FOldVersion { enum Type { Old }; };\n"
+        "struct CORE_API FSkeletalMeshCustomVersion\n{\n"
+        "\tenum Type\n\t{\n"
+        "\t\t// Before any version changes were made\n"
+        "\t\tBeforeCustomVersionWasAdded = 0,\n"
+        "\t\t// Added a flag\n"
+        "\t\tAddedFlag,\n"
+        "\t\tVersionPlusOne,\n"
+        "\t};\n};\n"
+        "namespace FRecomputeTangentCustomVersion\n{\n"
+        "\tenum Type { BeforeCustomVersionWasAdded = 0, };\n}\n"
+        "enum class ENGINE_API EFooVersion : uint8 { A, };\n"
+    )
+
+    def test_find_block(self):
+        enums = HeaderEnums(self.source)
+        self.assertEqual(
+            enums.find_block("FRecomputeTangentCustomVersion"),
+            "{ BeforeCustomVersionWasAdded = 0, }",
+        )
+        self.assertEqual(enums.find_block("efooversion"), "{ A, }")
+        self.assertIsNone(enums.find_block("FOldVersion"))
+
+    def test_parse_enum(self):
+        enums = HeaderEnums(self.source)
+        versions = enums.parse_enum("FSkeletalMeshCustomVersion")
+        self.assertEqual(
+            versions,
+            parse_enum_content(enums.find_block("FSkeletalMeshCustomVersion")),
+        )
+        self.assertEqual(
+            (versions[-1].name, versions[-1].value, versions[-1].comment),
+            ("AddedFlag", 1, "Added a flag"),
+        )
+        # Parsed only once
+        self.assertIs(enums.parse_enum("FSkeletalMeshCustomVersion"), versions)
+
+    def test_size_of(self):
+        # Only the bodies of the enums are kept
+        padded = HeaderEnums("// Filler\n" * 10000 + self.source)
+        self.assertEqual(padded.size_of(), HeaderEnums(self.source).size_of())
+
+
+class TestVersionTable(unittest.TestCase):
+    def test_aggregate(self):
+        def version(name, value, comment, ordinal):
+            return SerializationVersion(name, value, comment, ordinal, ordinal)
+
+        table = VersionTable()
+        table.aggregate(
+            [
+                version("A", 0, "New A", 1),
+                version("B", 1, "B", 1),
+            ]
+        )
+        aggregated = table.aggregate(
+            [
+                version("A", 0, "Old A", 0),
+                # The value is taken by B
+                version("C", 1, "C", 0),
+                version("D", 2, "D", 0),
+            ]
+        )
+        self.assertEqual([v.name for v in aggregated], ["A", "D"])
+        self.assertEqual(
+            [
+                (v.name, v.comment, v.first_appearance, v.last_appearance)
+                for v in table.versions
+            ],
+            [
+                ("A", "New A", 0, 1),
+                ("B", "B", 1, 1),
+                ("D", "D", 0, 0),
+            ],
+        )
+        self.assertIs(table.by_value[2], table.by_name["D"])
+
+    def test_gaps(self):
+        table = VersionTable()
+        for ordinal, names in [(3, "AB"), (2, "A"), (1, "AB"), (0, "B")]:
+            table.aggregate(
+                [
+                    SerializationVersion(name, "AB".index(name), "", ordinal, ordinal)
+                    for name in names
+                ]
+            )
+
+        a, b = table.by_name["A"], table.by_name["B"]
+        self.assertEqual((a.first_appearance, a.last_appearance), (1, 3))
+        self.assertFalse(a.has_gaps())
+        self.assertEqual((b.first_appearance, b.last_appearance), (0, 3))
+        self.assertTrue(b.has_gaps())
+        self.assertEqual(b.missing_ordinals(), [2])
+
+
+class TestExtractionState(unittest.TestCase):
+    def test_discarded_when_inputs_change(self):
+        register_tags(["4.0.0-release", "4.1.0-release"])
+        previous_output_dir = get_output_dir()
+        with tempfile.TemporaryDirectory() as directory:
+            set_output_dir(Path(directory))
+            try:
+                version = SerializationVersion("A", 0, "", 0, 1)
+                save_state(ExtractionState(["4.0.0-release"], {"E": [version]}))
+                state = load_state()
+                self.assertEqual(state.processed_tags, ["4.0.0-release"])
+                self.assertEqual(state.tables["E"][0], version)
+
+                # eg: the extractor changed since the state was saved
+                path = Path(directory) / "extract-versions-state.json"
+                content = path.read_text()
+                parser_version = json.loads(content)["parser_version"]
+                path.write_text(content.replace(parser_version, "0" * 40))
+                self.assertEqual(load_state(), ExtractionState())
+            finally:
+                set_output_dir(previous_output_dir)
+
+
+class TestGuid(unittest.TestCase):
+    def test_parse_guid(self):
+        components = [0x2EB5FDBD, 0x01AC4D10, 0x8136F38F, 0x3393A5DA]
+        self.assertEqual(
+            parse_guid("(0x2EB5FDBD, 0x01AC4D10, 0x8136F38F, 0x3393A5DA)"), components
+        )
+        self.assertEqual(
+            parse_guid('("2EB5FDBD-01AC-4D10-8136-F38F3393A5DA")'), components
+        )
+
+
+class TestTokenizer(unittest.TestCase):
+    sample = (
+        '// Copyright\r\n#include "Foo.h"\n'
+        "namespace UE::Private {\n"
+        '/* block { */ static FCustomVersionRegistration GReg(FFoo::GUID, 1, TEXT("a\\"b"));\n'
+        "x = a->*b ->c .5 1'000 1e+5 0x1F 1.0f '\\'' a<<=b<=>c>>=d>>e>=f<=g ...::^^ ^= && || ++ --;\n"
+        "int ²x = ½ + 1² + .²; é = \ufeff; @ $ `\\\n"
+        "} /* unterminated"
+    )
+
+    def test_operators(self):
+        tokens = [text for _, text in tokenize_cpp("a >>= b >> c >= d > e")]
+        self.assertEqual(tokens, ["a", ">>=", "b", ">>", "c", ">=", "d", ">", "e"])
+
+    def test_same_as_legacy(self):
+        self.assertEqual(
+            list(tokenize_cpp(self.sample)), list(legacy_tokenize_cpp(self.sample))
+        )
+
+    def test_same_as_legacy_on_random_sources(self):
+        alphabet = list("aZ_09.eEpP+-*/%&|=!<>^:;,?~{}[]()'\"\\#@ \t\n\r") + [
+            "é",
+            "\u00a0",
+            "\ufeff",
+            "//",
+            "/*",
+            "*/",
+        ]
+        rng = random.Random(0)
+        # Non-ASCII numbers change the pattern of the tokenizer
+        for non_ascii_numbers in [[], ["²", "½", "٣", "一", "Ⅻ"]]:
+            for _ in range(300):
+                source = "".join(
+                    rng.choice(alphabet + non_ascii_numbers)
+                    for _ in range(rng.randrange(200))
+                )
+                self.assertEqual(
+                    list(tokenize_cpp(source)),
+                    list(legacy_tokenize_cpp(source)),
+                    source,
+                )
+
+    def test_token_iterator(self):
+        # With and without non-ASCII digits
+        for source in [self.sample, self.sample.replace("²", "2").replace("½", "5")]:
+            for stream in [False, True]:
+                iterator = TokenIterator(source, stream)
+                tokens = []
+                while not iterator.is_eof():
+                    tokens.append((iterator.token_type, iterator.token_text))
+                    iterator.advance()
+                self.assertEqual(tokens, list(tokenize_cpp(source)))
+
+    def test_token_iterator_seek(self):
+        source = 'a /* { */ b "c" { d }'
+        for stream in [False, True]:
+            iterator = TokenIterator(source, stream)
+            iterator.seek(source.index("{ d"))
+            self.assertEqual(iterator.token_text, "{")
+            iterator.seek(iterator.token_end)
+            self.assertEqual(iterator.token_text, "d")
+            iterator.seek(len(source))
+            self.assertTrue(iterator.is_eof())
+
+
+class TestBlobCache(unittest.TestCase):
+    def test_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = BlobCache(Path(directory))
+            cache.put_blob("0123abcd", b"enum Foo {};")
+            cache.set_blob_id("tree1", "Foo.h", "0123abcd")
+            cache.set_blob_id("tree1", "Missing.h", None)
+            cache.save()
+
+            cache = BlobCache(Path(directory))
+            self.assertEqual(cache.get_blob("0123abcd"), b"enum Foo {};")
+            self.assertIsNone(cache.get_blob("ffff"))
+            self.assertEqual(cache.get_blob_id("tree1", "Foo.h"), (True, "0123abcd"))
+            self.assertEqual(cache.get_blob_id("tree1", "Missing.h"), (True, None))
+            self.assertEqual(cache.get_blob_id("tree2", "Foo.h"), (False, None))
+
+
+class TestParseStore(unittest.TestCase):
+    def test_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "parsed.sqlite"
+            store = ParseStore(path, "v1")
+            self.assertEqual(store.get("enums", "blob", "EType"), (False, None))
+            store.put("enums", "blob", "EType", None)
+            store.put("guids", "blob", "GUID", [1, 2, 3, 4])
+            self.assertEqual(store.get("enums", "blob", "EType"), (True, None))
+            self.assertEqual(
+                ParseStore(path, "v1").get("guids", "blob", "GUID"),
+                (True, [1, 2, 3, 4]),
+            )
+
+            # Results of another version of the parser are discarded
+            self.assertEqual(
+                ParseStore(path, "v2").get("guids", "blob", "GUID"), (False, None)
+            )
+            self.assertEqual(
+                ParseStore(path, "v1").get("guids", "blob", "GUID"), (False, None)
+            )
+
+
+class TestMemoryCache(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = MemoryCache("Test", budget=10)
+        cache.put("a", "aaaa", 4)
+        cache.put("b", "bbbb", 4)
+        self.assertEqual(cache.get("a"), (True, "aaaa"))
+
+        # "b" is the least recently used
+        cache.put("c", "cccc", 4)
+        self.assertEqual(cache.get("b"), (False, None))
+        self.assertEqual(cache.get("c"), (True, "cccc"))
+        self.assertEqual(cache.size, 8)
+
+        # Too big to be stored
+        cache.put("d", "d" * 20, 20)
+        self.assertEqual(cache.get("d"), (False, None))
+
+        self.assertEqual((cache.hits, cache.misses, cache.evictions), (2, 2, 1))
+
+
+class TestGitObjectDatabase(unittest.TestCase):
+    def test_apply_delta(self):
+        base = b"enum Foo { A, B };"
+        # Sizes, copy 13 bytes from offset 0, insert " X,", copy 5 bytes from offset 13
+        delta = b"\x12\x15\x90\x0d\x03 X,\x91\x0d\x05"
+        self.assertEqual(apply_delta(base, delta), b"enum Foo { A, X, B };")
+
+    def test_memory_repository(self):
+        repository = MemoryObjectDatabase()
+        tree_id = repository.add_tree(
+            {"Source/Foo.h": b"struct FFoo {};\n", "Source/Foo.cpp": b"FFoo Foo;\n"}
+        )
+        repository.set_ref("refs/tags/5.0.0-release", tree_id)
+
+        self.assertEqual(repository.list_tags(), ["5.0.0-release"])
+        self.assertEqual(repository.read_object_id("5.0.0-release^{tree}"), tree_id)
+        self.assertEqual(
+            repository.read_object("5.0.0-release:Source/Foo.h")[1:],
+            ("blob", b"struct FFoo {};\n"),
+        )
+        self.assertIsNone(repository.read_object_id("5.0.0-release:Source/Bar.h"))
+        self.assertEqual(
+            repository.grep([r"struct [A-Za-z]+"], "5.0.0-release", ["*.h"]),
+            [("Source/Foo.h", "struct FFoo")],
+        )
+
+    def test_incomplete_backend(self):
+        class NoRefs(ObjectDatabase):
+            def _read(self, object_id):
+                return None
+
+            def _has_object(self, object_id):
+                return False
+
+        # Fails when the backend is created, not when the refs are first needed
+        with self.assertRaises(TypeError):
+            NoRefs()
+
+
+class TestPipeline(unittest.TestCase):
+    def test_keeps_order(self):
+        results = []
+        run_pipeline(
+            range(100),
+            [lambda x: [x, -x], lambda x: [x * 2], results.append],
+            queue_size=2,
+        )
+        self.assertEqual(results, [v for x in range(100) for v in (x * 2, -x * 2)])
+
+    def test_propagates_errors(self):
+        def fail(x):
+            if x == 3:
+                raise ValueError("boom")
+            return [x]
+
+        with self.assertRaises(ValueError):
+            run_pipeline(range(1000), [fail, lambda x: None], queue_size=2)
+
+    def test_profiles_stages(self):
+        def produce(x):
+            return [x]
+
+        g_profiler.take()
+        run_pipeline(range(10), [produce, lambda x: None], name="test")
+        phases = g_profiler.take()["phases"]
+        self.assertEqual(phases["test.produce"]["calls"], 10)
+        self.assertEqual(phases["test.<lambda>"]["calls"], 10)
+
+
+class TestProfiler(unittest.TestCase):
+    def test_merge(self):
+        worker = Profiler()
+        with worker.phase("parse") as timer:
+            worker.count("tokens", 5)
+        worker.add_timing("tags", "5.0.0-release", 0.5)
+        self.assertGreaterEqual(timer.wall, 0)
+
+        profiler = Profiler()
+        profiler.count("tokens", 2)
+        profiler.add_timing("tags", "5.0.0-release", 0.25)
+        profiler.merge(worker.take())
+        profiler.merge(worker.take())
+
+        values = profiler.take()
+        self.assertEqual(values["counters"], {"tokens": 7})
+        self.assertEqual(values["timings"], {"tags": {"5.0.0-release": 0.75}})
+        self.assertEqual(values["phases"]["parse"]["calls"], 1)
+        self.assertEqual(profiler.take()["counters"], {})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,14 +1,19 @@
 import type { AssetApi } from "../../unreal-engine/serialization/Asset";
 import { CollapsableSection, IndentedRow, SimpleDetailsView } from "../components/SimpleDetailsView";
 import React from "react";
-import { allCustomVersions } from "../../unreal-engine/versioning/ue-custom-versions";
+import { customVersionIndex } from "../../unreal-engine/versioning/ue-custom-versions";
 import type { FCustomVersion } from "../../unreal-engine/serialization/CustomVersion";
 import { MakeHelpTooltip } from "./AssetPreview";
 import { ListItem, UnorderedList } from "@chakra-ui/react";
-import type { CustomVersionGuid } from "../../unreal-engine/versioning/CustomVersionGuid";
+import type {
+  CustomVersionEntry,
+  LazyVersionDetails,
+  VersionDetails,
+} from "../../unreal-engine/versioning/CustomVersionGuid";
+import { useAsyncCompute } from "../../utils/async-compute";
 
 type ResolvedVersion = {
-  versionGuid: CustomVersionGuid | undefined;
+  versionGuid: CustomVersionEntry | undefined;
   name: string;
   value: number;
 };
@@ -51,11 +56,7 @@ export function SummaryDetails(props: { asset: AssetApi }) {
           name={`Custom Versions (${summary.CustomVersionContainer.Versions.length})`}
           initialExpanded={false}
         >
-          {customVersions.map((version, index) => (
-            <IndentedRow key={index}>
-              {version.name} {"=>"} {version.value}
-            </IndentedRow>
-          ))}
+          {customVersions.map((version, index) => <CustomVersionRow key={index} version={version} />)}
         </CollapsableSection>
         <IndentedRow title={"TotalHeaderSize"}>{summary.TotalHeaderSize}</IndentedRow>
         <IndentedRow title={"Package Name"}>{summary.PackageName}</IndentedRow>
@@ -75,10 +76,66 @@ export function SummaryDetails(props: { asset: AssetApi }) {
 }
 
 function findCustomVersion(version: FCustomVersion): ResolvedVersion {
-  const versionGuid = allCustomVersions.find((v) => v.guid.equals(version.Key));
+  const versionGuid = customVersionIndex.find(version.Key);
   return {
     versionGuid: versionGuid,
     name: versionGuid ? versionGuid.name.toString() : version.Key.toString(),
     value: version.Version,
   };
 }
+
+/**
+ * A custom version of the package.
+ * The module with the details of a known version is only loaded when the row is shown.
+ */
+function CustomVersionRow(props: { version: ResolvedVersion }) {
+  const version = props.version;
+  const entry = version.versionGuid;
+
+  const details = useAsyncCompute(async () => {
+    if (!entry) {
+      return null;
+    }
+    const module = await entry.load();
+    return findVersionDetails(module.default.details, version.value);
+  }, [entry, version.value]);
+
+  return (
+    <IndentedRow>
+      {version.name} {"=>"} {version.value}
+      {details.data && <MakeHelpTooltip label={<VersionDetailsTooltip details={details.data} />} />}
+    </IndentedRow>
+  );
+}
+
+function VersionDetailsTooltip(props: { details: VersionDetails }) {
+  const details = props.details;
+  return (
+    <UnorderedList>
+      <ListItem>
+        <b>{details.name}</b>
+      </ListItem>
+      {details.comment && <ListItem>{details.comment}</ListItem>}
+      <ListItem>
+        <b>First appearance</b>: {details.firstAppearance}
+      </ListItem>
+      {details.lastAppearance && (
+        <ListItem>
+          <b>Last appearance</b>: {details.lastAppearance}
+        </ListItem>
+      )}
+    </UnorderedList>
+  );
+}
+
+/**
+ * The latest version with the given value, without creating the details of the other versions.
+ */
+function findVersionDetails(details: LazyVersionDetails, value: number): VersionDetails | null {
+  for (let i = details.length - 1; i >= 0; i--) {
+    if (details.valueAt(i) === value) {
+      return details.get(i);
+    }
+  }
+  return null;
+}
@@ -6,7 +6,7 @@ import { FIoHash, HashNone } from "../types/hash/IoHash";
 import { EUnrealEngineObjectUE4Version, EUnrealEngineObjectUE5Version } from "../versioning/ue-versions";
 
 import { ECustomVersionSerializationFormat, FCustomVersionContainer } from "./CustomVersion";
-import { allCustomVersions } from "../versioning/ue-custom-versions";
+import { customVersionIndex } from "../versioning/ue-custom-versions";
 
 /**
  * struct FGenerationInfo {
@@ -357,7 +357,7 @@ export class FPackageFileSummary {
       problems.push(`FileVersionUE5 ${result.FileVersionUE5} > ${EUnrealEngineObjectUE5Version.LatestVersion}`);
     }
     for (const version of result.CustomVersionContainer.Versions) {
-      const knownVersion = allCustomVersions.find((v) => v.guid.equals(version.Key));
+      const knownVersion = customVersionIndex.find(version.Key);
       if (!knownVersion) {
         // This might be an issue, but since there are many untracked custom versions, we don't warn about it for now.
         // problems.push(`Unknown custom version GUID ${version.Key.toString()}`);
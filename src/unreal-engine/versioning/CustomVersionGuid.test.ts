@@ -0,0 +1,67 @@
+import { describe, expect, test } from "vitest";
+import { CustomVersionIndex, LazyVersionDetails } from "./CustomVersionGuid";
+import { FGuid } from "../modules/CoreUObject/structs/Guid";
+import { customVersionIndex } from "./ue-custom-versions";
+
+describe("LazyVersionDetails", () => {
+  const details = new LazyVersionDetails({
+    releases: ["4.20.0", "4.21.0", "4.22.0"],
+    names: ["BeforeCustomVersionWasAdded", "AddedFlag"],
+    values: [0, 1],
+    comments: ["Before any version changes were made"],
+    commentIndexes: [0, -1],
+    firstAppearances: [0, 0],
+    lastAppearances: [-1, 2],
+    missingIn: { 1: [1] },
+  });
+
+  test("unpacks the columns", () => {
+    expect(details.length).toBe(2);
+    expect(details.valueAt(1)).toBe(1);
+    expect(details.get(0)).toEqual({
+      name: "BeforeCustomVersionWasAdded",
+      comment: "Before any version changes were made",
+      value: 0,
+      firstAppearance: "4.20.0",
+      lastAppearance: undefined,
+      missingIn: undefined,
+    });
+    expect(details.get(1)).toEqual({
+      name: "AddedFlag",
+      comment: undefined,
+      value: 1,
+      firstAppearance: "4.20.0",
+      lastAppearance: "4.22.0",
+      missingIn: ["4.21.0"],
+    });
+  });
+
+  test("creates the details once", () => {
+    expect(details.get(1)).toBe(details.get(1));
+    expect([...details].map((version) => version.name)).toEqual(["BeforeCustomVersionWasAdded", "AddedFlag"]);
+  });
+});
+
+describe("CustomVersionIndex", () => {
+  test("finds a custom version by guid", () => {
+    const index = new CustomVersionIndex([
+      {
+        guid: [0xaf43a65d, 0x7fd34947, 0x98733e8e, 0xd9c1bb05],
+        name: "FAnimObjectVersion",
+        latestVersion: 15,
+        load: () => import("./custom-versions-enums/FAnimObjectVersion"),
+      },
+    ]);
+    expect(index.find(FGuid.fromString("{af43a65d-7fd3-4947-9873-3e8ed9c1bb05}"))?.name).toBe("FAnimObjectVersion");
+    expect(index.find(FGuid.fromComponents(1, 2, 3, 4))).toBeUndefined();
+  });
+
+  test("matches the loaded modules", async () => {
+    for (const entry of customVersionIndex.entries) {
+      const { default: version } = await entry.load();
+      expect(version.name).toBe(entry.name);
+      expect(version.latestVersion).toBe(entry.latestVersion);
+      expect(customVersionIndex.find(version.guid)).toBe(entry);
+    }
+  });
+});
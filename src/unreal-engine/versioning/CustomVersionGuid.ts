@@ -10,15 +10,15 @@ import invariant from "tiny-invariant";
 export class CustomVersionGuid<E = unknown> {
   readonly name: string;
   readonly guid: FGuid;
-  readonly details: VersionDetails[];
+  readonly details: LazyVersionDetails;
   readonly latestVersion: number;
 
-  constructor(args: { name: string; guid: FGuid; details: VersionDetails[] }) {
+  constructor(args: { name: string; guid: FGuid; details: LazyVersionDetails }) {
     invariant(args.details.length > 0, "Custom version details must not be empty.");
     this.name = args.name;
     this.guid = args.guid;
     this.details = args.details;
-    this.latestVersion = this.details[this.details.length - 1].value;
+    this.latestVersion = this.details.valueAt(this.details.length - 1);
   }
 
   get defaultValue(): E {
@@ -60,16 +60,132 @@ export class VersionDetails {
    */
   lastAppearance?: string;
 
+  /**
+   * Releases between the first and the last appearance where this version was not present
+   * (e.g. removed in a hotfix and restored later).
+   * If undefined, the version is present in all of them.
+   */
+  missingIn?: string[];
+
   constructor(args: {
     name: string;
     comment?: string;
     value: number;
     firstAppearance: string;
     lastAppearance?: string;
+    missingIn?: string[];
   }) {
     this.name = args.name;
+    this.comment = args.comment;
     this.value = args.value;
     this.firstAppearance = args.firstAppearance;
     this.lastAppearance = args.lastAppearance;
+    this.missingIn = args.missingIn;
+  }
+}
+
+/**
+ * Version details stored by column, as generated by the extractor.
+ * Releases are referenced by their index in `releases`, and each comment is stored once.
+ */
+export interface PackedVersionDetails {
+  releases: string[];
+  names: string[];
+  values: number[];
+  comments: string[];
+  /** Index in `comments`, -1 if the version has no comment. */
+  commentIndexes: number[];
+  firstAppearances: number[];
+  /** -1 if the version is still present. */
+  lastAppearances: number[];
+  /** Index of a version -> releases where it was not present, only for the versions with gaps. */
+  missingIn?: Record<number, number[]>;
+}
+
+/**
+ * List of VersionDetails backed by PackedVersionDetails.
+ * The objects are only created when they are requested (e.g. when a package summary is inspected),
+ * loading the generated modules only creates a few arrays.
+ */
+export class LazyVersionDetails implements Iterable<VersionDetails> {
+  private readonly packed: PackedVersionDetails;
+  private readonly created: (VersionDetails | undefined)[];
+
+  constructor(packed: PackedVersionDetails) {
+    this.packed = packed;
+    this.created = new Array<VersionDetails | undefined>(packed.names.length);
+  }
+
+  get length(): number {
+    return this.packed.names.length;
+  }
+
+  /**
+   * Value of a version, without creating its details.
+   */
+  valueAt(index: number): number {
+    return this.packed.values[index];
   }
+
+  get(index: number): VersionDetails {
+    invariant(index >= 0 && index < this.length, `Version index ${index} out of range`);
+    let details = this.created[index];
+    if (!details) {
+      const packed = this.packed;
+      const commentIndex = packed.commentIndexes[index];
+      const lastAppearance = packed.lastAppearances[index];
+      details = new VersionDetails({
+        name: packed.names[index],
+        comment: commentIndex >= 0 ? packed.comments[commentIndex] : undefined,
+        value: packed.values[index],
+        firstAppearance: packed.releases[packed.firstAppearances[index]],
+        lastAppearance: lastAppearance >= 0 ? packed.releases[lastAppearance] : undefined,
+        missingIn: packed.missingIn?.[index]?.map((release) => packed.releases[release]),
+      });
+      this.created[index] = details;
+    }
+    return details;
+  }
+
+  *[Symbol.iterator](): Iterator<VersionDetails> {
+    for (let i = 0; i < this.length; i++) {
+      yield this.get(i);
+    }
+  }
+}
+
+/**
+ * A custom version known by the viewer, the module with its enum and details is loaded on demand.
+ */
+export interface CustomVersionEntry {
+  /** Components of the guid (A, B, C, D). */
+  guid: readonly [number, number, number, number];
+  name: string;
+  latestVersion: number;
+  load: () => Promise<{ default: CustomVersionGuid }>;
+}
+
+/**
+ * Index of the custom versions by guid, as generated by the extractor.
+ * Recognizing a custom version doesn't load its module.
+ */
+export class CustomVersionIndex {
+  readonly entries: readonly CustomVersionEntry[];
+  private readonly byGuid = new Map<string, CustomVersionEntry>();
+
+  constructor(entries: CustomVersionEntry[]) {
+    this.entries = entries;
+    for (const entry of entries) {
+      const [A, B, C, D] = entry.guid;
+      this.byGuid.set(guidKey(A, B, C, D), entry);
+    }
+  }
+
+  find(guid: FGuid): CustomVersionEntry | undefined {
+    return this.byGuid.get(guidKey(guid.A, guid.B, guid.C, guid.D));
+  }
+}
+
+function guidKey(A: number, B: number, C: number, D: number) {
+  return `${A}-${B}-${C}-${D}`;
 }
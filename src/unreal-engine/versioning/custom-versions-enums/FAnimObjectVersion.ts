@@ -3,7 +3,7 @@
 // noinspection JSUnusedGlobalSymbols
 //
 
-import { VersionDetails, CustomVersionGuid } from "../CustomVersionGuid";
+import { LazyVersionDetails, CustomVersionGuid } from "../CustomVersionGuid";
 import { FGuid } from "../../modules/CoreUObject/structs/Guid";
 
 export enum FAnimObjectVersion {
@@ -51,106 +51,50 @@ export enum FAnimObjectVersion {
   LatestVersion = GroomBindingSerialization,
 }
 
-export const FAnimObjectVersionDetails: VersionDetails[] = [
-  new VersionDetails({
-    name: "BeforeCustomVersionWasAdded",
-    comment: "Before any version changes were made",
-    value: 0,
-    firstAppearance: "4.21.0",
-  }),
-  new VersionDetails({
-    name: "LinkTimeAnimBlueprintRootDiscovery",
-    comment: "Reworked how anim blueprint root nodes are recovered",
-    value: 1,
-    firstAppearance: "4.21.0",
-  }),
-  new VersionDetails({
-    name: "StoreMarkerNamesOnSkeleton",
-    comment: "Cached marker sync names on skeleton for editor",
-    value: 2,
-    firstAppearance: "4.21.0",
-  }),
-  new VersionDetails({
-    name: "SerializeRigVMRegisterArrayState",
-    comment: "Serialized register array state for RigVM",
-    value: 3,
-    firstAppearance: "4.25.0",
-  }),
-  new VersionDetails({
-    name: "IncreaseBoneIndexLimitPerChunk",
-    comment: "Increase number of bones per chunk from uint8 to uint16",
-    value: 4,
-    firstAppearance: "4.25.0",
-  }),
-  new VersionDetails({
-    name: "UnlimitedBoneInfluences",
-    value: 5,
-    firstAppearance: "4.25.0",
-  }),
-  new VersionDetails({
-    name: "AnimSequenceCurveColors",
-    comment: "Anim sequences have colors for their curves",
-    value: 6,
-    firstAppearance: "4.25.0",
-  }),
-  new VersionDetails({
-    name: "NotifyAndSyncMarkerGuids",
-    comment: "Notifies and sync markers now have Guids",
-    value: 7,
-    firstAppearance: "4.25.0",
-  }),
-  new VersionDetails({
-    name: "SerializeRigVMRegisterDynamicState",
-    comment: "Serialized register dynamic state for RigVM",
-    value: 8,
-    firstAppearance: "4.26.0",
-  }),
-  new VersionDetails({
-    name: "SerializeGroomCards",
-    comment: "Groom cards serialization",
-    value: 9,
-    firstAppearance: "4.26.0",
-  }),
-  new VersionDetails({
-    name: "SerializeRigVMEntries",
-    comment: "Serialized rigvm entry names",
-    value: 10,
-    firstAppearance: "4.26.0",
-  }),
-  new VersionDetails({
-    name: "SerializeHairBindingAsset",
-    comment: "Serialized rigvm entry names",
-    value: 11,
-    firstAppearance: "4.26.0",
-  }),
-  new VersionDetails({
-    name: "SerializeHairClusterCullingData",
-    comment: "Serialized rigvm entry names",
-    value: 12,
-    firstAppearance: "4.26.0",
-  }),
-  new VersionDetails({
-    name: "SerializeGroomCardsAndMeshes",
-    comment: "Groom cards and meshes serialization",
-    value: 13,
-    firstAppearance: "4.26.0",
-  }),
-  new VersionDetails({
-    name: "GroomLODStripping",
-    comment: "Stripping LOD data from groom",
-    value: 14,
-    firstAppearance: "4.26.0",
-  }),
-  new VersionDetails({
-    name: "GroomBindingSerialization",
-    comment: "Stripping LOD data from groom",
-    value: 15,
-    firstAppearance: "4.26.0",
-  }),
-];
+export const FAnimObjectVersionDetails = new LazyVersionDetails({
+  releases: ["4.21.0", "4.25.0", "4.26.0"],
+  names: [
+    "BeforeCustomVersionWasAdded",
+    "LinkTimeAnimBlueprintRootDiscovery",
+    "StoreMarkerNamesOnSkeleton",
+    "SerializeRigVMRegisterArrayState",
+    "IncreaseBoneIndexLimitPerChunk",
+    "UnlimitedBoneInfluences",
+    "AnimSequenceCurveColors",
+    "NotifyAndSyncMarkerGuids",
+    "SerializeRigVMRegisterDynamicState",
+    "SerializeGroomCards",
+    "SerializeRigVMEntries",
+    "SerializeHairBindingAsset",
+    "SerializeHairClusterCullingData",
+    "SerializeGroomCardsAndMeshes",
+    "GroomLODStripping",
+    "GroomBindingSerialization",
+  ],
+  values: [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15],
+  comments: [
+    "Before any version changes were made",
+    "Reworked how anim blueprint root nodes are recovered",
+    "Cached marker sync names on skeleton for editor",
+    "Serialized register array state for RigVM",
+    "Increase number of bones per chunk from uint8 to uint16",
+    "Anim sequences have colors for their curves",
+    "Notifies and sync markers now have Guids",
+    "Serialized register dynamic state for RigVM",
+    "Groom cards serialization",
+    "Serialized rigvm entry names",
+    "Groom cards and meshes serialization",
+    "Stripping LOD data from groom",
+  ],
+  commentIndexes: [0, 1, 2, 3, 4, -1, 5, 6, 7, 8, 9, 9, 9, 10, 11, 11],
+  firstAppearances: [0, 0, 0, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2],
+  lastAppearances: [-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+});
 
 export const FAnimObjectVersionGuid = new CustomVersionGuid<FAnimObjectVersion>({
   name: "FAnimObjectVersion",
   guid: FGuid.fromComponents(0xaf43a65d, 0x7fd34947, 0x98733e8e, 0xd9c1bb05),
   details: FAnimObjectVersionDetails,
 });
+
+export default FAnimObjectVersionGuid;
@@ -3,7 +3,7 @@
 // noinspection JSUnusedGlobalSymbols
 //
 
-import { VersionDetails, CustomVersionGuid } from "../CustomVersionGuid";
+import { LazyVersionDetails, CustomVersionGuid } from "../CustomVersionGuid";
 import { FGuid } from "../../modules/CoreUObject/structs/Guid";
 
 export enum FAnimPhysObjectVersion {
@@ -62,119 +62,58 @@ export enum FAnimPhysObjectVersion {
   LatestVersion = GeometryCacheAssetDeprecation,
 }
 
-export const FAnimPhysObjectVersionDetails: VersionDetails[] = [
-  new VersionDetails({
-    name: "BeforeCustomVersionWasAdded",
-    comment: "Before any version changes were made",
-    value: 0,
-    firstAppearance: "4.16.0",
-  }),
-  new VersionDetails({
-    name: "ConvertAnimNodeLookAtAxis",
-    comment: "convert animnode look at to use just default axis instead of enum, which doesn't do much",
-    value: 1,
-    firstAppearance: "4.16.0",
-  }),
-  new VersionDetails({
-    name: "BoxSphylElemsUseRotators",
-    comment: "Change FKSphylElem and FKBoxElem to use Rotators not Quats for easier editing",
-    value: 2,
-    firstAppearance: "4.16.0",
-  }),
-  new VersionDetails({
-    name: "ThumbnailSceneInfoAndAssetImportDataAreTransactional",
-    comment: "Change thumbnail scene info and asset import data to be transactional",
-    value: 3,
-    firstAppearance: "4.16.0",
-  }),
-  new VersionDetails({
-    name: "AddedClothingMaskWorkflow",
-    comment: "Enabled clothing masks rather than painting parameters directly",
-    value: 4,
-    firstAppearance: "4.17.0",
-  }),
-  new VersionDetails({
-    name: "RemoveUIDFromSmartNameSerialize",
-    comment: "Remove UID from smart name serialize, it just breaks determinism",
-    value: 5,
-    firstAppearance: "4.17.0",
-  }),
-  new VersionDetails({
-    name: "CreateTargetReference",
-    comment: "Convert FName Socket to FSocketReference and added TargetReference that support bone and socket",
-    value: 6,
-    firstAppearance: "4.17.0",
-  }),
-  new VersionDetails({
-    name: "TuneSoftLimitStiffnessAndDamping",
-    comment: "Tune soft limit stiffness and damping coefficients",
-    value: 7,
-    firstAppearance: "4.17.0",
-  }),
-  new VersionDetails({
-    name: "FixInvalidClothParticleMasses",
-    comment: "Fix possible inf/nans in clothing particle masses",
-    value: 8,
-    firstAppearance: "4.18.0",
-  }),
-  new VersionDetails({
-    name: "CacheClothMeshInfluences",
-    comment: "Moved influence count to cached data",
-    value: 9,
-    firstAppearance: "4.18.0",
-  }),
-  new VersionDetails({
-    name: "SmartNameRefactorForDeterministicCooking",
-    comment: "Remove GUID from Smart Names entirely + remove automatic name fixup",
-    value: 10,
-    firstAppearance: "4.18.0",
-  }),
-  new VersionDetails({
-    name: "RenameDisableAnimCurvesToAllowAnimCurveEvaluation",
-    comment: "rename the variable and allow individual curves to be set",
-    value: 11,
-    firstAppearance: "4.18.0",
-  }),
-  new VersionDetails({
-    name: "AddLODToCurveMetaData",
-    comment: "link curve to LOD, so curve metadata has to include LODIndex",
-    value: 12,
-    firstAppearance: "4.18.0",
-  }),
-  new VersionDetails({
-    name: "FixupBadBlendProfileReferences",
-    comment: "Fixed blend profile references persisting after paste when they aren't compatible",
-    value: 13,
-    firstAppearance: "4.19.0",
-  }),
-  new VersionDetails({
-    name: "AllowMultipleAudioPluginSettings",
-    comment: "Allowing multiple audio plugin settings",
-    value: 14,
-    firstAppearance: "4.19.0",
-  }),
-  new VersionDetails({
-    name: "ChangeRetargetSourceReferenceToSoftObjectPtr",
-    comment: "Change RetargetSource reference to SoftObjectPtr",
-    value: 15,
-    firstAppearance: "4.19.0",
-  }),
-  new VersionDetails({
-    name: "SaveEditorOnlyFullPoseForPoseAsset",
-    comment: "Save editor only full pose for pose asset",
-    value: 16,
-    firstAppearance: "4.19.0",
-  }),
-  new VersionDetails({
-    name: "GeometryCacheAssetDeprecation",
-    comment: "Asset change and cleanup to facilitate new streaming system",
-    value: 17,
-    firstAppearance: "4.20.0",
-  }),
-];
+export const FAnimPhysObjectVersionDetails = new LazyVersionDetails({
+  releases: ["4.16.0", "4.17.0", "4.18.0", "4.19.0", "4.20.0"],
+  names: [
+    "BeforeCustomVersionWasAdded",
+    "ConvertAnimNodeLookAtAxis",
+    "BoxSphylElemsUseRotators",
+    "ThumbnailSceneInfoAndAssetImportDataAreTransactional",
+    "AddedClothingMaskWorkflow",
+    "RemoveUIDFromSmartNameSerialize",
+    "CreateTargetReference",
+    "TuneSoftLimitStiffnessAndDamping",
+    "FixInvalidClothParticleMasses",
+    "CacheClothMeshInfluences",
+    "SmartNameRefactorForDeterministicCooking",
+    "RenameDisableAnimCurvesToAllowAnimCurveEvaluation",
+    "AddLODToCurveMetaData",
+    "FixupBadBlendProfileReferences",
+    "AllowMultipleAudioPluginSettings",
+    "ChangeRetargetSourceReferenceToSoftObjectPtr",
+    "SaveEditorOnlyFullPoseForPoseAsset",
+    "GeometryCacheAssetDeprecation",
+  ],
+  values: [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17],
+  comments: [
+    "Before any version changes were made",
+    "convert animnode look at to use just default axis instead of enum, which doesn't do much",
+    "Change FKSphylElem and FKBoxElem to use Rotators not Quats for easier editing",
+    "Change thumbnail scene info and asset import data to be transactional",
+    "Enabled clothing masks rather than painting parameters directly",
+    "Remove UID from smart name serialize, it just breaks determinism",
+    "Convert FName Socket to FSocketReference and added TargetReference that support bone and socket",
+    "Tune soft limit stiffness and damping coefficients",
+    "Fix possible inf/nans in clothing particle masses",
+    "Moved influence count to cached data",
+    "Remove GUID from Smart Names entirely + remove automatic name fixup",
+    "rename the variable and allow individual curves to be set",
+    "link curve to LOD, so curve metadata has to include LODIndex",
+    "Fixed blend profile references persisting after paste when they aren't compatible",
+    "Allowing multiple audio plugin settings",
+    "Change RetargetSource reference to SoftObjectPtr",
+    "Save editor only full pose for pose asset",
+    "Asset change and cleanup to facilitate new streaming system",
+  ],
+  commentIndexes: [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17],
+  firstAppearances: [0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 3, 4],
+  lastAppearances: [-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+});
 
 export const FAnimPhysObjectVersionGuid = new CustomVersionGuid<FAnimPhysObjectVersion>({
   name: "FAnimPhysObjectVersion",
   guid: FGuid.fromComponents(0x29e575dd, 0xe0a34627, 0x9d10d276, 0x232cdcea),
   details: FAnimPhysObjectVersionDetails,
 });
+
+export default FAnimPhysObjectVersionGuid;
@@ -3,7 +3,7 @@
 // noinspection JSUnusedGlobalSymbols
 //
 
-import { VersionDetails, CustomVersionGuid } from "../CustomVersionGuid";
+import { LazyVersionDetails, CustomVersionGuid } from "../CustomVersionGuid";
 import { FGuid } from "../../modules/CoreUObject/structs/Guid";
 
 export enum FEnterpriseObjectVersion {
@@ -56,83 +56,46 @@ export enum FEnterpriseObjectVersion {
   LatestVersion = AddedParametricSurfaceData,
 }
 
-export const FEnterpriseObjectVersionDetails: VersionDetails[] = [
-  new VersionDetails({
-    name: "BeforeCustomVersionWasAdded",
-    comment: "Before any version changes were made",
-    value: 0,
-    firstAppearance: "4.20.0",
-  }),
-  new VersionDetails({
-    name: "FixSerializationOfBulkAndExtraData",
-    comment: "Conditional serialization of bulk (UDatasmithScene) and extra (UDatasmithStaticMeshCADImportData) data",
-    value: 1,
-    firstAppearance: "4.20.0",
-  }),
-  new VersionDetails({
-    name: "BookmarkExtensibilityUpgrade",
-    comment: "Extensibility updates for bookmarks",
-    value: 2,
-    firstAppearance: "4.21.0",
-  }),
-  new VersionDetails({
-    name: "MediaFrameworkUserDataLazyObject",
-    comment: "Update FMediaFrameworkCaptureCameraViewportCameraOutputInfo with LazyObjectPtr",
-    value: 3,
-    firstAppearance: "4.21.0",
-  }),
-  new VersionDetails({
-    name: "LiveLinkTimeSynchronization",
-    comment: "Live Live timecode synchronization updates",
-    value: 4,
-    firstAppearance: "4.21.0",
-  }),
-  new VersionDetails({
-    name: "AjaMediaConfiguration",
-    comment: "Deprecate MediaMode and MediaPort for from MediaConfiguration",
-    value: 5,
-    firstAppearance: "4.22.0",
-  }),
-  new VersionDetails({
-    name: "HasUDataprepRecipe",
-    comment: "Addition of pointer to UDatasmithDataPrepRecipe",
-    value: 6,
-    firstAppearance: "4.23.0",
-  }),
-  new VersionDetails({
-    name: "HasUDatatprepAssetInterface",
-    comment: "Addition of UDatatprepAssetInterface and UDatatprepAssetInstance",
-    value: 7,
-    firstAppearance: "4.24.0",
-  }),
-  new VersionDetails({
-    name: "MeshDescriptionBulkDataGuidIsHash",
-    comment: "MeshDescriptionBulkData contains a bGuidIsHash so we can benefit from DDC caching.",
-    value: 8,
-    firstAppearance: "4.24.0",
-  }),
-  new VersionDetails({
-    name: "LiveLinkControllerSplitPerRole",
-    comment: "Splitting controller associated with a livelink component for each LiveLinkRole class hierarchy",
-    value: 9,
-    firstAppearance: "4.25.0",
-  }),
-  new VersionDetails({
-    name: "CoreTechParametricSurfaceOptim",
-    comment: "Change CoreTechParametricSurface serialization to be more efficient",
-    value: 10,
-    firstAppearance: "4.25.0",
-  }),
-  new VersionDetails({
-    name: "AddedParametricSurfaceData",
-    comment: "Replacement of UDatasmithParametricSurfaceData by UParametricSurfaceData",
-    value: 11,
-    firstAppearance: "5.6.0",
-  }),
-];
+export const FEnterpriseObjectVersionDetails = new LazyVersionDetails({
+  releases: ["4.20.0", "4.21.0", "4.22.0", "4.23.0", "4.24.0", "4.25.0", "5.6.0"],
+  names: [
+    "BeforeCustomVersionWasAdded",
+    "FixSerializationOfBulkAndExtraData",
+    "BookmarkExtensibilityUpgrade",
+    "MediaFrameworkUserDataLazyObject",
+    "LiveLinkTimeSynchronization",
+    "AjaMediaConfiguration",
+    "HasUDataprepRecipe",
+    "HasUDatatprepAssetInterface",
+    "MeshDescriptionBulkDataGuidIsHash",
+    "LiveLinkControllerSplitPerRole",
+    "CoreTechParametricSurfaceOptim",
+    "AddedParametricSurfaceData",
+  ],
+  values: [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11],
+  comments: [
+    "Before any version changes were made",
+    "Conditional serialization of bulk (UDatasmithScene) and extra (UDatasmithStaticMeshCADImportData) data",
+    "Extensibility updates for bookmarks",
+    "Update FMediaFrameworkCaptureCameraViewportCameraOutputInfo with LazyObjectPtr",
+    "Live Live timecode synchronization updates",
+    "Deprecate MediaMode and MediaPort for from MediaConfiguration",
+    "Addition of pointer to UDatasmithDataPrepRecipe",
+    "Addition of UDatatprepAssetInterface and UDatatprepAssetInstance",
+    "MeshDescriptionBulkData contains a bGuidIsHash so we can benefit from DDC caching.",
+    "Splitting controller associated with a livelink component for each LiveLinkRole class hierarchy",
+    "Change CoreTechParametricSurface serialization to be more efficient",
+    "Replacement of UDatasmithParametricSurfaceData by UParametricSurfaceData",
+  ],
+  commentIndexes: [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11],
+  firstAppearances: [0, 0, 1, 1, 1, 2, 3, 4, 4, 5, 5, 6],
+  lastAppearances: [-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+});
 
 export const FEnterpriseObjectVersionGuid = new CustomVersionGuid<FEnterpriseObjectVersion>({
   name: "FEnterpriseObjectVersion",
   guid: FGuid.fromComponents(0x9dffbcd6, 0x494f0158, 0xe2211282, 0x3c92a888),
   details: FEnterpriseObjectVersionDetails,
 });
+
+export default FEnterpriseObjectVersionGuid;
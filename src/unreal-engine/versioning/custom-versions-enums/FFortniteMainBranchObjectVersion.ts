@@ -3,7 +3,7 @@
 // noinspection JSUnusedGlobalSymbols
 //
 
-import { VersionDetails, CustomVersionGuid } from "../CustomVersionGuid";
+import { LazyVersionDetails, CustomVersionGuid } from "../CustomVersionGuid";
 import { FGuid } from "../../modules/CoreUObject/structs/Guid";
 
 export enum FFortniteMainBranchObjectVersion {
@@ -505,1401 +505,525 @@ export enum FFortniteMainBranchObjectVersion {
   LatestVersion = LandscapeAdvancedWeightBlending,
 }
 
-export const FFortniteMainBranchObjectVersionDetails: VersionDetails[] = [
-  new VersionDetails({
-    name: "BeforeCustomVersionWasAdded",
-    comment: "Before any version changes were made",
-    value: 0,
-    firstAppearance: "4.20.0",
-  }),
-  new VersionDetails({
-    name: "WorldCompositionTile3DOffset",
-    comment: "World composition tile offset changed from 2d to 3d",
-    value: 1,
-    firstAppearance: "4.20.0",
-  }),
-  new VersionDetails({
-    name: "MaterialInstanceSerializeOptimization_ShaderFName",
-    comment: "Minor material serialization optimization",
-    value: 2,
-    firstAppearance: "4.20.0",
-  }),
-  new VersionDetails({
-    name: "CullDistanceRefactor_RemovedDefaultDistance",
-    comment: "Refactored cull distances to account for HLOD, explicit override and globals in priority",
-    value: 3,
-    firstAppearance: "4.20.0",
-  }),
-  new VersionDetails({
-    name: "CullDistanceRefactor_NeverCullHLODsByDefault",
-    value: 4,
-    firstAppearance: "4.20.0",
-  }),
-  new VersionDetails({
-    name: "CullDistanceRefactor_NeverCullALODActorsByDefault",
-    value: 5,
-    firstAppearance: "4.20.0",
-  }),
-  new VersionDetails({
-    name: "SaveGeneratedMorphTargetByEngine",
-    comment: "Support to remove morphtarget generated by bRemapMorphtarget",
-    value: 6,
-    firstAppearance: "4.20.0",
-  }),
-  new VersionDetails({
-    name: "ConvertReductionSettingOptions",
-    comment: "Convert reduction setting options",
-    value: 7,
-    firstAppearance: "4.20.0",
-  }),
-  new VersionDetails({
-    name: "StaticParameterTerrainLayerWeightBlendType",
-    comment: "Serialize the type of blending used for landscape layer weight static params",
-    value: 8,
-    firstAppearance: "4.20.0",
-  }),
-  new VersionDetails({
-    name: "FixUpNoneNameAnimationCurves",
-    comment: "Fix up None Named animation curve names,",
-    value: 9,
-    firstAppearance: "4.20.0",
-  }),
-  new VersionDetails({
-    name: "EnsureActiveBoneIndicesToContainParents",
-    comment: "Ensure ActiveBoneIndices to have parents even not skinned for old assets",
-    value: 10,
-    firstAppearance: "4.20.0",
-  }),
-  new VersionDetails({
-    name: "SerializeInstancedStaticMeshRenderData",
-    comment: "Serialize the instanced static mesh render data, to avoid building it at runtime",
-    value: 11,
-    firstAppearance: "4.20.0",
-  }),
-  new VersionDetails({
-    name: "CachedMaterialQualityNodeUsage",
-    comment: "Cache material quality node usage",
-    value: 12,
-    firstAppearance: "4.20.0",
-  }),
-  new VersionDetails({
-    name: "FontOutlineDropShadowFixup",
-    comment:
-      "Font outlines no longer apply to drop shadows for new objects but we maintain the opposite way for backwards compat",
-    value: 13,
-    firstAppearance: "4.21.0",
-  }),
-  new VersionDetails({
-    name: "NewSkeletalMeshImporterWorkflow",
-    comment: "New skeletal mesh import workflow (Geometry only or animation only re-import )",
-    value: 14,
-    firstAppearance: "4.21.0",
-  }),
-  new VersionDetails({
-    name: "NewLandscapeMaterialPerLOD",
-    comment: "Migrate data from previous data structure to new one to support materials per LOD on the Landscape",
-    value: 15,
-    firstAppearance: "4.21.0",
-  }),
-  new VersionDetails({
-    name: "RemoveUnnecessaryTracksFromPose",
-    comment: "New Pose Asset data type",
-    value: 16,
-    firstAppearance: "4.21.0",
-  }),
-  new VersionDetails({
-    name: "FoliageLazyObjPtrToSoftObjPtr",
-    comment: "Migrate Foliage TLazyObjectPtr to TSoftObjectPtr",
-    value: 17,
-    firstAppearance: "4.21.0",
-  }),
-  new VersionDetails({
-    name: "REVERTED_StoreTimelineNamesInTemplate",
-    comment: "This code tied to this version was reverted and redone at a later date",
-    value: 18,
-    firstAppearance: "4.22.0",
-  }),
-  new VersionDetails({
-    name: "AddBakePoseOverrideForSkeletalMeshReductionSetting",
-    comment: "Added BakePoseOverride for LOD setting",
-    value: 19,
-    firstAppearance: "4.22.0",
-  }),
-  new VersionDetails({
-    name: "StoreTimelineNamesInTemplate",
-    comment: "TimelineTemplates store their derived names instead of dynamically generating",
-    value: 20,
-    firstAppearance: "4.22.0",
-  }),
-  new VersionDetails({
-    name: "WidgetStopDuplicatingAnimations",
-    comment: "Avoid duplicating widget animations to save space.",
-    value: 21,
-    firstAppearance: "4.22.0",
-  }),
-  new VersionDetails({
-    name: "AllowSkeletalMeshToReduceTheBaseLOD",
-    comment:
-      "Allow reducing of the base LOD, we need to store some imported model data so we can reduce again from the same data.",
-    value: 22,
-    firstAppearance: "4.22.0",
-  }),
-  new VersionDetails({
-    name: "ShrinkCurveTableSize",
-    comment: "Curve Table size reduction",
-    value: 23,
-    firstAppearance: "4.22.0",
-  }),
-  new VersionDetails({
-    name: "WidgetAnimationDefaultToSelfFail",
-    comment:
-      "Widgets upgraded with WidgetStopDuplicatingAnimations, may not correctly default-to-self for the widget parameter.",
-    value: 24,
-    firstAppearance: "4.22.0",
-  }),
-  new VersionDetails({
-    name: "FortHUDElementNowRequiresTag",
-    comment: "HUDWidgets now require an element tag",
-    value: 25,
-    firstAppearance: "4.22.0",
-  }),
-  new VersionDetails({
-    name: "FortMappedCookedAnimation",
-    comment: "Animation saved as bulk data when cooked",
-    value: 26,
-    firstAppearance: "4.23.0",
-  }),
-  new VersionDetails({
-    name: "SupportVirtualBoneInRetargeting",
-    comment: "Support Virtual Bone in Retarget Manager",
-    value: 27,
-    firstAppearance: "4.23.0",
-  }),
-  new VersionDetails({
-    name: "FixUpWaterMetadata",
-    comment: "Fixup bad defaults in water metadata",
-    value: 28,
-    firstAppearance: "4.24.0",
-  }),
-  new VersionDetails({
-    name: "MoveWaterMetadataToActor",
-    comment: "Move the location of water metadata",
-    value: 29,
-    firstAppearance: "4.24.0",
-  }),
-  new VersionDetails({
-    name: "ReplaceLakeCollision",
-    comment: "Replaced lake collision component",
-    value: 30,
-    firstAppearance: "4.24.0",
-  }),
-  new VersionDetails({
-    name: "AnimLayerGuidConformation",
-    comment: "Anim layer node names are now conformed by Guid",
-    value: 31,
-    firstAppearance: "4.24.0",
-  }),
-  new VersionDetails({
-    name: "MakeOceanCollisionTransient",
-    comment: "Ocean collision component has become dynamic",
-    value: 32,
-    firstAppearance: "4.26.0",
-  }),
-  new VersionDetails({
-    name: "FFieldPathOwnerSerialization",
-    comment: "FFieldPath will serialize the owner struct reference and only a short path to its property",
-    value: 33,
-    firstAppearance: "4.26.0",
-  }),
-  new VersionDetails({
-    name: "FixUpUnderwaterPostProcessMaterial",
-    comment: "Simplified WaterBody post process material handling",
-    value: 34,
-    firstAppearance: "4.26.0",
-  }),
-  new VersionDetails({
-    name: "SupportMultipleWaterBodiesPerExclusionVolume",
-    comment: "A single water exclusion volume can now exclude N water bodies",
-    value: 35,
-    firstAppearance: "4.26.0",
-  }),
-  new VersionDetails({
-    name: "RigVMByteCodeDeterminism",
-    comment: "Serialize rigvm operators one by one instead of the full byte code array to ensure determinism",
-    value: 36,
-    firstAppearance: "4.26.0",
-  }),
-  new VersionDetails({
-    name: "LandscapePhysicalMaterialRenderData",
-    comment: "Serialize the physical materials generated by the render material",
-    value: 37,
-    firstAppearance: "4.26.0",
-  }),
-  new VersionDetails({
-    name: "FixupRuntimeVirtualTextureVolume",
-    comment: "RuntimeVirtualTextureVolume fix transforms",
-    value: 38,
-    firstAppearance: "4.26.0",
-  }),
-  new VersionDetails({
-    name: "FixUpRiverCollisionComponents",
-    comment: "Retrieve water body collision components that were lost in cooked builds",
-    value: 39,
-    firstAppearance: "4.26.0",
-  }),
-  new VersionDetails({
-    name: "FixDuplicateRiverSplineMeshCollisionComponents",
-    comment: "Fix duplicate spline mesh components on rivers",
-    value: 40,
-    firstAppearance: "4.26.0",
-  }),
-  new VersionDetails({
-    name: "ContainsStableActorGUIDs",
-    comment: "Indicates level has stable actor guids",
-    value: 41,
-    firstAppearance: "4.26.0",
-  }),
-  new VersionDetails({
-    name: "LevelsetSerializationSupportForBodySetup",
-    comment: "Levelset Serialization support for BodySetup.",
-    value: 42,
-    firstAppearance: "4.26.0",
-  }),
-  new VersionDetails({
-    name: "ChaosSolverPropertiesMoved",
-    comment: "Moving Chaos solver properties to allow them to exist in the project physics settings",
-    value: 43,
-    firstAppearance: "4.26.0",
-  }),
-  new VersionDetails({
-    name: "GameFeatureData_MovedComponentListAndCheats",
-    comment: "Moving some UFortGameFeatureData properties and behaviors into the UGameFeatureAction pattern",
-    value: 44,
-    firstAppearance: "4.27.0",
-  }),
-  new VersionDetails({
-    name: "ChaosClothAddfictitiousforces",
-    comment: "Add centrifugal forces for cloth",
-    value: 45,
-    firstAppearance: "4.27.0",
-  }),
-  new VersionDetails({
-    name: "ChaosConvexVariableStructureDataAndVerticesArray",
-    comment: "(Merged from //UE4/Main)",
-    value: 46,
-    firstAppearance: "4.27.0",
-  }),
-  new VersionDetails({
-    name: "RemoveLandscapeWaterInfo",
-    comment: "Remove the WaterVelocityHeightTexture dependency on MPC_Landscape and LandscapeWaterIndo",
-    value: 47,
-    firstAppearance: "4.27.0",
-  }),
-  new VersionDetails({
-    name: "ChaosClothAddWeightedValue",
-    comment: "Added the weighted value property type to store the cloths weight maps' low/high ranges",
-    value: 48,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "ChaosClothAddTetherStiffnessWeightMap",
-    comment: "Added the Long Range Attachment stiffness weight map",
-    value: 49,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "ChaosClothFixLODTransitionMaps",
-    comment: "Fix corrupted LOD transition maps",
-    value: 50,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "ChaosClothAddTetherScaleAndDragLiftWeightMaps",
-    comment: "Enable a few more weight maps to better art direct the cloth simulation",
-    value: 51,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "ChaosClothAddMaterialWeightMaps",
-    comment: "Enable material (edge, bending, and area stiffness) weight maps",
-    value: 52,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "SerializeFloatChannelShowCurve",
-    comment: "Added bShowCurve for movie scene float channel serialization",
-    value: 53,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "LandscapeGrassSingleArray",
-    comment: "Minimize slack waste by using a single array for grass data",
-    value: 54,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "AddedSubSequenceEntryWarpCounter",
-    comment: "Add loop counters to sequencer's compiled sub-sequence data",
-    value: 55,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "WaterBodyComponentRefactor",
-    comment: "Water plugin is now component-based rather than actor based",
-    value: 56,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "BPGCCookedEditorTags",
-    comment: "Cooked BPGC storing editor-only asset tags",
-    value: 57,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "TerrainLayerWeightsAreNotParameters",
-    comment: "Terrain layer weights are no longer considered material parameters",
-    value: 58,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "GravityOverrideDefinedInWorldSpace",
-    comment: "true for nodes predating this change.",
-    value: 59,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "AnimDynamicsEditableChainParameters",
-    comment:
-      "Anim Dynamics Node Physics parameters for each body in a chain are now stored in an array and can be edited.",
-    value: 60,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "WaterZonesRefactor",
-    comment: "Decoupled the generation of the water texture from the Water Brush and the landscape",
-    value: 61,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "ChaosClothFasterDamping",
-    comment:
-      "Add faster damping calculations to the cloth simulation and rename previous Damping parameter to LocalDamping.",
-    value: 62,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "MigratedFunctionHandlersToDefaults",
-    comment: "Migrated function handlers to the CDO/archetype data",
-    value: 63,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "ChaosInertiaConvertedToVec3",
-    comment: "Storing inertia tensor as vec3 instead of matrix.",
-    value: 64,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "MigratedEventDefinitionToDefaults",
-    comment: "Migrated event definitions to the CDO/archetype data",
-    value: 65,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "LevelInstanceActorGuidSerialize",
-    comment: "Serialize LevelInstanceActorGuid on new ILevelInstanceInterface implementation",
-    value: 66,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "SingleFrameAndKeyAnimModel",
-    comment: "Single-frame/key AnimDataModel patch-up",
-    value: 67,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "RemappedEvaluateWorldPositionOffsetInRayTracing",
-    comment: "Remapped bEvaluateWorldPositionOffset to bEvaluateWorldPositionOffsetInRayTracing",
-    value: 68,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "WaterBodyComponentCollisionSettingsRefactor",
-    comment:
-      "Water body collision settings are now those of the base UPrimitiveComponent, rather than duplicated in UWaterBodyComponent",
-    value: 69,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "WidgetInheritedNamedSlots",
-    comment:
-      "if a widget exposes its named slot to everyone (even if it has content) which by default they wont any longer.",
-    value: 70,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "WaterHLODSupportAdded",
-    comment: "Added water HLOD material",
-    value: 71,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "PoseWatchMigrateSkeletonDrawParametersToPoseElement",
-    comment:
-      "Moved parameters affecting Skeleton pose rendering from the PoseWatch class to the PoseWatchPoseElement class.",
-    value: 72,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "WaterExclusionVolumeExcludeAllDefault",
-    comment:
-      'Reset default value for Water exclusion volumes to make them more intuitive and support the "it just works" philosophy.',
-    value: 73,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "WaterNontessellatedLODSupportAdded",
-    comment: "Added water non-tessellated LOD",
-    value: 74,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "HierarchicalSimplificationMethodEnumAdded",
-    comment: "Added FHierarchicalSimplification::SimplificationMethod",
-    value: 75,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionStreamingCellsNamingShortened",
-    comment: "Changed how world partition streaming cells are named",
-    value: 76,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionActorDescSerializeContentBundleGuid",
-    comment: "Serialize ContentBundleGuid in WorldPartitionActorDesc",
-    value: 77,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionActorDescSerializeActorIsRuntimeOnly",
-    comment: "Serialize IsActorRuntimeOnly in WorldPartitionActorDesc",
-    value: 78,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "NaniteMaterialOverride",
-    comment: "Add Nanite Material Override option to materials and material instances.",
-    value: 79,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionHLODActorDescSerializeStats",
-    comment: "Serialize HLOD stats in HLODActorDesc",
-    value: 80,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionStreamingSourceComponentTargetDeprecation",
-    comment: "WorldPartitionStreamingSourceComponent property deprecation",
-    value: 81,
-    firstAppearance: "5.2.0",
-  }),
-  new VersionDetails({
-    name: "FixedLocalizationGatherForExternalActorPackage",
-    comment: "Fixed localization gathering for external actor packages",
-    value: 82,
-    firstAppearance: "5.2.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionHLODActorUseSourceCellGuid",
-    comment: "Change HLODActors to RuntimeCells mapping to use a GUID instead of the cell name",
-    value: 83,
-    firstAppearance: "5.2.0",
-  }),
-  new VersionDetails({
-    name: "ChaosGeometryCollectionInternalFacesAttribute",
-    comment:
-      "Add an attribute to geometry collection to track internal faces, rather than relying on material ID numbering",
-    value: 84,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "DynamicCastNodesUsePureStateEnum",
-    comment: "Dynamic cast nodes use an enumerated pure node state to include a value for the default setting",
-    value: 85,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionActorFilter",
-    comment: "Add FWorldPartitionActorFilter to FLevelInstanceActorDesc/FDataLayerInstanceDesc",
-    value: 86,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "AudioAttenuationNonSpatializedRadiusBlend",
-    comment: "Change the non-spatialized radius to blend to a pure 2D spatialized sound vs omnidirectional",
-    value: 87,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionActorClassDescSerialize",
-    comment: "Serialize actor class descriptors",
-    value: 88,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionFActorContainerIDu64ToGuid",
-    comment: "FActorContainerID is now an FGuid instead of a uint64",
-    value: 89,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionPrivateDataLayers",
-    comment: "FDataLayerInstanceDesc support for private data layers",
-    value: 90,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "ChaosImplicitObjectUnionBVHRefactor",
-    comment: "Reduce size and improve behaviour of Chaos::FImplicitObjectUnion",
-    value: 91,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "LevelInstanceActorDescDeltaSerializeFilter",
-    comment: "FLevelInstanceActorDesc DeltaSerialize Filter",
-    value: 92,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "FixNaniteLandscapeMeshDDCKey",
-    comment: "Fix the Nanite landscape mesh non-deterministic DDC keys",
-    value: 93,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "ChaosGeometryCollectionConnectionEdgeGroup",
-    comment: "Change how connection graphs are stored on Geometry Collections to an edge-array representation",
-    value: 94,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "WaterBodyStaticMeshComponents",
-    comment:
-      "Moved the water info mesh data and static water body meshes into new static mesh components for water bodies.",
-    value: 95,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionActorDescSerializeInvalidBounds",
-    comment: "Serialize invalid bounds in world partition actor descriptors",
-    value: 96,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "NavigationLinkID32To64",
-    comment: "Upgrade Navigation Links to use 64 bits for the ID",
-    value: 97,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionActorDescSerializeEditorOnlyReferences",
-    comment: "Serialize editor only references in world partition actor descriptors",
-    value: 98,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionActorDescSerializeSoftObjectPathSupport",
-    comment: "Add support for soft object paths in actor descriptors",
-    value: 99,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionClasDescGuidTransient",
-    comment: "Don't serialize class descriptor GUIDs",
-    value: 100,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionActorDescIsMainWorldOnly",
-    comment: "Serialize ActorDesc bIsMainWorldOnly",
-    value: 101,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionActorFilterStringAssetPath",
-    comment:
-      "FWorldPartitionActorFilter go back to FString serialize of AssetPaths to avoid FArchiveReplaceOrClearExternalReferences clearing CDO references on BP Compile",
-    value: 102,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "PackedLevelActorDesc",
-    comment: "Add FPackedLevelActorDesc for APackedLevelActor and support for APackedLevelActor Filters",
-    value: 103,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionRuntimeSpatialHashCVarOverrides",
-    comment: "Add customizable values for several UWorldPartitionRuntimeSpatialHash cvars",
-    value: 104,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionHLODSourceActorsRefactor",
-    comment: "WorldPartition HLOD now contains a source actors object",
-    value: 105,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "WaterBodyStaticMeshRename",
-    value: 106,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "GeometryCollectionConvertVertexColorToSRGB",
-    comment: "Geometry Collection now by-default converts vertex colors to sRGB when creating render data",
-    value: 107,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "WaterOwningZonePointerFixup",
-    comment:
-      "Water bodies before this version need to update their water zone on load since they won't have been serialized yet.",
-    value: 108,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "WaterBodyStaticMeshDuplicateTransient",
-    comment:
-      "Set flags on water static meshes to duplicate transient to avoid underlying static mesh duplication issue",
-    value: 109,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "MVVMConvertPropertyPathToSkeletalClass",
-    comment: "Update paths to use the SkeletalClass",
-    value: 110,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "WaterBodyStaticMeshFixup",
-    comment: "Fixup all flags/outering on static meshes on water bodies by rebuilding them completely",
-    value: 111,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "AnimGraphNodeBindingExtensions",
-    comment: "Binding extensions for anim graph nodes",
-    value: 112,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "RigVMSaveDebugMapInGraphFunctionData",
-    comment: "Function data stores a map from work to debug operands",
-    value: 113,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "FixMissingAnimGraphNodeBindingExtensions",
-    comment: "Fix missing binding extensions for some anim graph nodes",
-    value: 114,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "ISMComponentEditableWhenInheritedSkipSerialization",
-    comment: "EditableWhenInherited: Skip custom serialization on non Archetypes",
-    value: 115,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "LandscapeSupportPerComponentGrassTypes",
-    comment: "GrassTypes are now per-component, rather than per-landscape proxy :",
-    value: 116,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionDataLayersLogicOperatorAdded",
-    comment: "World partition actor data layers activation logic operator support defaults for old maps",
-    value: 117,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "MovieSceneSortedBindings",
-    comment: "Started sorting Possessables, Spawnables, and MovieSceneBindings for better search performance.",
-    value: 118,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "RemoveAnimCurveCompressionCodecInstanceGuid",
-    comment: "Remove the UAnimCurveCompressionCodec::InstanceGuid which causes cook determinism issues",
-    value: 119,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionHLODActorDescSerializeSourceHLODLayer",
-    comment: "Serialize the source HLOD Layer for HLOD actor descriptors.",
-    value: 120,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionHLODActorDescSerializeEditorBounds",
-    comment: "Serialize custom editor bounds for HLOD actor descriptors.",
-    value: 121,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "LocalExposureDefaultChangeFrom1_Reverted",
-    comment: "Changed default Local Exposure Contrast from 1.0 to 0.8 (reverted)",
-    value: 122,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "AddDataLayerInstanceExternalPackage",
-    comment: "Added support of external packaging of Data Layer Instances",
-    value: 123,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "MVVMPropertyPathSelf",
-    comment: "Update paths to keep a flag if they are the widget BP",
-    value: 124,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "AddDataflowObjectSerialization",
-    comment: "Enabled ObjectPtr property serialization for Dataflow nodes",
-    value: 125,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "AnimNotifyAddRateScale",
-    comment: "Add anim notify rate scaling, defaults to on for new content, off for old content",
-    value: 126,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "FixedTangentTransformForNonuniformBuildScale",
-    comment:
-      "Fix tangents for non-uniform build scales, and add a flag to optionally match the previous (incorrect) tangents",
-    value: 127,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "AnimNodeRootDefaultGroupChange",
-    comment:
-      "AnimNode Layers will now start in a Shared Group, instead of being each one on a different group at runtime",
-    value: 128,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "AnimNextMoveGraphsToEntries",
-    comment: "Move AnimNext graphs to sub-entries of assets",
-    value: 129,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "AnimationSequenceCompressedDataRemoveDebugData",
-    comment:
-      "Removed debug information containing compressed data author, time etc. from animation DDC data as it introduces indeterminism",
-    value: 130,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "OrthographicCameraDefaultSettings",
-    comment: "Changes to Orthographic Camera default settings",
-    value: 131,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "LandscapeAddedHLODSettings",
-    comment: "Added settings to Landscape HLODs",
-    value: 132,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "MeshDescriptionForSkeletalMesh",
-    comment: "Skeletal Mesh uses Mesh Description to store mesh bulk data.",
-    value: 133,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "SkeletalHalfEdgeData",
-    comment: "Skeletal Mesh optionally cooks half edge data per lod",
-    value: 134,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "AnimNextCombineGraphContexts",
-    comment: "Combine graph contexts for AnimNext graphs",
-    value: 135,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "AnimNextCombineParameterBlocksAndGraphs",
-    comment: "Combine parameter blocks and graphs",
-    value: 136,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "AnimNextMoveWorkspaces",
-    comment: "Move workspaces to a separate plugin",
-    value: 137,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "LevelInstancePropertyOverrides",
-    comment: "Level Instance Property overrides",
-    value: 138,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "VolumetricLightMapGridDescSupport",
-    comment: "Added FVolumetricLightMapGridDesc in MapBuildData",
-    value: 139,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "IntroduceLandscapeEditLayerClass",
-    comment: "Introduce new structure for customizing the landscape edit layer behavior",
-    value: 140,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "AnimNextWorkspaceEntryConversion",
-    comment: "Change workspaces to store asset references as external objects",
-    value: 141,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "DataflowAnyTypeSupport",
-    comment: "Add support for anytype in dataflow",
-    value: 142,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "PhysicsAssetUseManifoldFlags",
-    comment: "Adding a new flag in RBAN Solver Setting to be able to use manifolds",
-    value: 143,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "SimAndQueryDataSupportInChaosVisualDebugger",
-    comment: "Added support for to record sim and query data of Shape Instance data in CVD",
-    value: 144,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "ChaosClothAssetUSDImportNodeAddAssetDependencies",
-    comment: "Add the imported asset dependencies to the Cloth Asset USD Import node",
-    value: 145,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "LumenRayLightingModeOverrideEnum",
-    comment:
-      "Changed HitLighting to HitLightingForReflections, and HitLighting now means hit lighting for entire Lumen",
-    value: 146,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "PCGPartitionActorDesc",
-    comment: "PCGPartitionActorDesc",
-    value: 147,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "LandscapeTargetLayersInLandscapeActor",
-    comment:
-      "Target layers are now defined in the Landscape actor and not continuously synced from the assigned material.",
-    value: 148,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "DataflowTemplatedTypeFix",
-    comment: "Fix to get full name of templated type ( Tarray > TArray<Float> for example )",
-    value: 149,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "LevelInstanceStaticLightingSupport",
-    comment: "Changes for LevelInstance support in StaticLighting",
-    value: 150,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "PCGGridDescriptor",
-    comment: "PCGGridDescriptor",
-    value: 151,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "AnimNextGraphAccessSpecifiers",
-    comment: "AnimNext graphs now have public/private state",
-    value: 152,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "MaterialPixelDepthOffsetMode",
-    comment: "Added a more stable pixel depth offset mode.",
-    value: 153,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "DataflowHideablePins",
-    comment: "Added hideable pins to dataflow",
-    value: 154,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "ClothAssetSkeletalMeshMultiSectionImport",
-    comment: "Added multiple section import to the cloth asset skeletal mesh import node",
-    value: 155,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionActorDescSerializeEditorBounds",
-    comment: "Serialize EditorBounds in WorldPartitionActorDesc",
-    value: 156,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "FixupLandscapeTargetLayersInLandscapeActor",
-    comment:
-      "Fixup for the data that has been damaged by LandscapeTargetLayersInLandscapeActor (loss of landscape layer info object assignments)",
-    value: 157,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "MorphTargetCustomImport",
-    comment: "Allow custom import of morph target",
-    value: 158,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "ChaosClothAllowZeroBucklingStiffness",
-    comment: "Fix chaos cloth buckling stiffness parameter bug",
-    value: 159,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "LevelSequenceUpgradeDynamicBindings_NoOp",
-    comment:
-      "LevelSequenceUpgradeDynamicBindings was removed but was intended for this position. Putting this here to make sure versioning of subsequent assets remains the same",
-    value: 160,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "GameFeatureDataActionAddToFrontendDefaultToUnload",
-    comment: "AddToFrontend GFA now defaults to unload plugin on exit frontend",
-    value: 161,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "LevelSequenceUpgradeDynamicBindings",
-    comment: "Upgraded movie scene 'dynamic bindings' to use the new Custom Bindings system",
-    value: 162,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "ChaosStoreKinematicTargetRotationAsSinglePrecision",
-    comment:
-      "Changed the precision for the stored rotation on kinematic targets to match the precision used in particles",
-    value: 163,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "PCGApplyOnActorNodeMoveTargetActorEdgeToInput",
-    comment: "PCG changes around the ApplyOnActor node, where we collapsed the TargetActor to the input pin.",
-    value: 164,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "TimelinePlayingStateTrackerDeprecation",
-    comment: "PlayingStateTracker type to improve replication reliability",
-    value: 165,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "MeshPaintTextureUsesEditorOnly",
-    comment: "Enable SkipOnlyEditorOnly style cooking of UStaticMeshComponent::MeshPaintTexture",
-    value: 166,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "LandscapeBodyInstanceAsSharedProperty",
-    comment:
-      "Fixup and synchronize some landscape properties that have moved to the property sharing/overriding system :",
-    value: 167,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "AnimNextModuleRefactor",
-    comment: "Multiple changes to AnimNext modules, variables etc.",
-    value: 168,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "SubsurfaceProfileGuid",
-    comment: "Subsurface profile now has a guid to be able to select one of many in a Substrate material.",
-    value: 169,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "SolverIterationsDataSupportInChaosVisualDebugger",
-    comment: "Added support for to record the new solver iteration settings in CVD",
-    value: 170,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "MaterialInputUsesLinearColor",
-    comment: "Updated FColorMaterialInput to use FLinearColor instead of FColor",
-    value: 171,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "FunctionalTestCanRunInEditorWorld",
-    comment:
-      "Updated editor only AFunctionalTest running logic to run tests editor world if the actors don't support PIE",
-    value: 172,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "VisualLoggerSupportDisplayName",
-    comment: "Added support for display name in the Visual Logger",
-    value: 173,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "GyroscopicTorquesSupportInChaosVisualDebugger",
-    comment: "Added support for the GyroscopicTorque flag in CVD",
-    value: 174,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "AddManagedArrayCollectionPropertySerialization",
-    comment: "Added managed array property serialization",
-    value: 175,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "LandscapeTexturePatchUsesTextureAssetResolution",
-    comment:
-      "Landscape texture patches in Texture Asset source mode now use proper resolution when calculating transform",
-    value: 176,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionActorDescSerializeRelativeTransform",
-    comment: "Added support for relative transform in WorldPartitionActorDesc",
-    value: 177,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "SceneGraphEntitiesPrivateByDefault",
-    comment: "Make sure scene graph entities are not public by default",
-    value: 178,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "DebugColorForPhysicalMaterials",
-    comment: "Added debug color for physical materials",
-    value: 179,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "AddedPreprocessedFontGeometry",
-    comment: "Added PreprocessedFontGeometry to FFontFaceData",
-    value: 180,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "DynamicMeshSerializeSculptLayers",
-    comment: "Added Dynamic Mesh Sculpt Layer serialization",
-    value: 181,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "SpatialHashRuntimeGridInfoSpriteFixup",
-    comment: "Fix reachable garbage object warnings from some legacy ASpatialHashRuntimeGridInfo actors",
-    value: 182,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "AnimSequenceRawDataOnlyFlagRemoval",
-    comment: "Removed UAnimSequence::bUseRawDataOnly flag alongside compression refactor",
-    value: 183,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "ResetLevelInstanceHLODRelevancy",
-    comment:
-      "HLOD relevancy of Level Instances was previously ignored, now taken into account. Reset to the default behavior.",
-    value: 184,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "SceneCaptureDefaultSettings",
-    comment:
-      "Updated default scene capture post-processing settings to reflect the underlying implementation overrides",
-    value: 185,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "AddClothAssetBase",
-    comment: "Add Cloth Asset Base class serialization",
-    value: 186,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "PCGInlineConstantDefaultValues",
-    comment: "Add inline constant default values to the PCG graph nodes.",
-    value: 187,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "AddMaterialSubstrateSubsurfaceType",
-    comment:
-      "Add MaterialSubstrateSubsurfaceType type to UMaterialExpressionSubstrateSlabBSDF for replacing bUseSSSDifffusion",
-    value: 188,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "AddedRuntimeVirtualTextureUseStreamingMipsInEditorMode",
-    comment: "Added option to visualize runtime virtual textures' streamed mips only in PIE",
-    value: 189,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "MediaPlateHoldoutComponentRemoval",
-    comment: "Media plate holdout composite components have been replaced by a checkbox",
-    value: 190,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "PCGLandscapeCacheDefaultSerializationChanged",
-    comment: 'Changed PCG landscape cache default from "serialize at cook" to "never serialize"',
-    value: 191,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "SoftObjectPathUtf8SubPaths",
-    comment: "FSoftObjectPath::SubPathString changed to FUtf8String",
-    value: 192,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "SoftObjectPathTrailingNULsMaintained",
-    comment: "FSoftObjectPath::SubPathString could be saved with trailing NULs and need truncating",
-    value: 193,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "WaterBodyPhysicalMaterialPropertyRemoval",
-    comment:
-      "Water body components no longer need to maintain their own PhysicalMaterial property since they are primitive components. After this version, leverage that one instead.",
-    value: 194,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "PCGAttributeSetToPointAlwaysConverts",
-    comment:
-      "PCG fixed attribute set -> point conversion passing through empty point data as-is and violating output pin type.",
-    value: 195,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "MeshMaterialSlotOverlayMaterialAdded",
-    comment: "Add per material slot overlay material data",
-    value: 196,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "ConvertGlintDensity",
-    comment: "Convert Sustrate glint density properly",
-    value: 197,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "ClothAssetSkinweightsValidation",
-    comment: "Introduced skinweight validation to avoid render crashes and disappearing simulation meshes",
-    value: 198,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "VerseRightToLeftHandedness",
-    comment: "Switching verse from right handed to left handed",
-    value: 199,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "AdditionalGameThreadDataSupportInChaosVisualDebugger",
-    comment:
-      "Added additional data required to record and represent particle data from the game thread (Kinematic targets, and SQ rejection reasons)",
-    value: 200,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "UpgradeWidgetBlueprintLegacySequencePlayer",
-    comment: "Upgrade UMG widget blueprints using legacy animation API",
-    value: 201,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "PCGSplineDirectionClockwiseFix",
-    comment:
-      "Changed clockwise detection algorithm for PCGSplineDirection node with the correct one, but add a version to not break previous nodes.",
-    value: 202,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "RectLightFixedEVUnitConversion",
-    comment: "Rect Lights set in EV units had the wrong intensity (older files need a flag set to keep the old look)",
-    value: 203,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "ParticleInflatedBoundsInChaosVisualDebugger",
-    comment: "Add particle bounds to data exported to CVD",
-    value: 204,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "MigrateLandscapeEditLayerProperties",
-    comment: "Migrate properties from FLandscapeLayer to ULandscapeEditLayer",
-    value: 205,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "ThreadContextDataInChaosVisualDebuggerDebugDrawData",
-    comment:
-      "Added more context data to CVD's traced shapes so we can play it back at the solver stage level (not just game thread frames)",
-    value: 206,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "PCGChangedSurfaceSamplerDefaultGridCreationMode",
-    comment: "Changed default grid mode in surface sampler to a version that's more intuitive and less error-prone",
-    value: 207,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "MediaPlateOverlayTechniqueRemoval",
-    comment: "Media plate overlay composite technique replacement with holdout composite",
-    value: 208,
-    firstAppearance: "5.7.0",
-  }),
-  new VersionDetails({
-    name: "PerParticleFlagToAllowPartialIslandSleepInConnectedIsland",
-    comment: "Added particle flag to allow/disallow partial island sleeping in the island the particle is in",
-    value: 209,
-    firstAppearance: "5.7.0",
-  }),
-  new VersionDetails({
-    name: "MaterialFunctionBlendTopBottomInputEnum",
-    comment: "Material Function Blend Deserialize Top/Bottom input nodes with clearer enum marker.",
-    value: 210,
-    firstAppearance: "5.7.0",
-  }),
-  new VersionDetails({
-    name: "MorphTargetCookedCPUDataCompressed",
-    comment:
-      "Cooked CPU-side morph target points are now stored internally in the same compressed format as the GPU morph data.",
-    value: 211,
-    firstAppearance: "5.7.0",
-  }),
-  new VersionDetails({
-    name: "AnimNextVariableReferences",
-    comment: "AnimNext variables converted to references",
-    value: 212,
-    firstAppearance: "5.7.0",
-  }),
-  new VersionDetails({
-    name: "LensComponentDefaultToDistortionSVE",
-    comment:
-      "The default distortion rendering mode used by the Lens Component is now the Lens Distortion Scene View Extension",
-    value: 213,
-    firstAppearance: "5.7.0",
-  }),
-  new VersionDetails({
-    name: "ChangeDefaultAlphaBlendType",
-    comment: "Animation default blend option changed from Linear to HermiteCubic (aka SmoothStep, ease in / ease out)",
-    value: 214,
-    firstAppearance: "5.7.0",
-  }),
-  new VersionDetails({
-    name: "PerParticleIterationCountMovedToDynamicMisc",
-    comment:
-      "Moved Position/Velocity/Projection Iteration Counts from FChaosVDFRigidParticleControlFlags to FChaosVDParticleDynamicMisc",
-    value: 215,
-    firstAppearance: "5.7.0",
-  }),
-  new VersionDetails({
-    name: "AddedMissingSerializationForPropertiesInDynamicMisc",
-    comment:
-      "Added missing custom serialization for some properties in the ParticleDynamicMisc structure used by the Chaos Visual Debugger",
-    value: 216,
-    firstAppearance: "5.7.0",
-  }),
-  new VersionDetails({
-    name: "PCGDeprecateWorldPartitionGenerationSources",
-    comment: "Change default value for deprecated bEnableWorldPartitionGenerationSources",
-    value: 217,
-    firstAppearance: "5.7.0",
-  }),
-  new VersionDetails({
-    name: "CompositeActorSceneCaptureRefactor",
-    comment: "Refactored the composite (plugin) actor scene capture management.",
-    value: 218,
-    firstAppearance: "5.7.0",
-  }),
-  new VersionDetails({
-    name: "HLODLayerEditorOnlyObject",
-    comment: "Moved HLOD Layer properties to an editor only optional object",
-    value: 219,
-    firstAppearance: "5.7.0",
-  }),
-  new VersionDetails({
-    name: "DeduplicatedDebugNameSerializationInCVD",
-    comment: "Deduplicated particle debug names serialization in the Chaos Visual Debugger",
-    value: 220,
-    firstAppearance: "5.7.0",
-  }),
-  new VersionDetails({
-    name: "SpecializeBloomIntensity",
-    comment: "Add BloomGaussianIntensity and BloomConvolutionIntensity",
-    value: 221,
-    firstAppearance: "5.7.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionActorComponentDesc",
-    comment: "Add support for world partition actor component descriptors",
-    value: 222,
-    firstAppearance: "5.7.0",
-  }),
-  new VersionDetails({
-    name: "MigrateLandscapeNonEditLayerToEditLayer",
-    comment: "Migrate Non-Edit layer landscapes to use the edit layer (ULandscapeEditLayer) system",
-    value: 223,
-    firstAppearance: "5.7.0",
-  }),
-  new VersionDetails({
-    name: "DynamicMeshAttributesMorphTargets",
-    comment: "FDynamicMeshAttributeSet has Morph Targets.",
-    value: 224,
-    firstAppearance: "5.7.0",
-  }),
-  new VersionDetails({
-    name: "LandscapeAdvancedWeightBlending",
-    comment: "Introduce landscape advanced weight blending",
-    value: 225,
-    firstAppearance: "5.7.0",
-  }),
-];
+export const FFortniteMainBranchObjectVersionDetails = new LazyVersionDetails({
+  releases: [
+    "4.20.0",
+    "4.21.0",
+    "4.22.0",
+    "4.23.0",
+    "4.24.0",
+    "4.26.0",
+    "4.27.0",
+    "5.0.0",
+    "5.1.0",
+    "5.2.0",
+    "5.3.0",
+    "5.4.0",
+    "5.5.0",
+    "5.6.0",
+    "5.7.0",
+  ],
+  names: [
+    "BeforeCustomVersionWasAdded",
+    "WorldCompositionTile3DOffset",
+    "MaterialInstanceSerializeOptimization_ShaderFName",
+    "CullDistanceRefactor_RemovedDefaultDistance",
+    "CullDistanceRefactor_NeverCullHLODsByDefault",
+    "CullDistanceRefactor_NeverCullALODActorsByDefault",
+    "SaveGeneratedMorphTargetByEngine",
+    "ConvertReductionSettingOptions",
+    "StaticParameterTerrainLayerWeightBlendType",
+    "FixUpNoneNameAnimationCurves",
+    "EnsureActiveBoneIndicesToContainParents",
+    "SerializeInstancedStaticMeshRenderData",
+    "CachedMaterialQualityNodeUsage",
+    "FontOutlineDropShadowFixup",
+    "NewSkeletalMeshImporterWorkflow",
+    "NewLandscapeMaterialPerLOD",
+    "RemoveUnnecessaryTracksFromPose",
+    "FoliageLazyObjPtrToSoftObjPtr",
+    "REVERTED_StoreTimelineNamesInTemplate",
+    "AddBakePoseOverrideForSkeletalMeshReductionSetting",
+    "StoreTimelineNamesInTemplate",
+    "WidgetStopDuplicatingAnimations",
+    "AllowSkeletalMeshToReduceTheBaseLOD",
+    "ShrinkCurveTableSize",
+    "WidgetAnimationDefaultToSelfFail",
+    "FortHUDElementNowRequiresTag",
+    "FortMappedCookedAnimation",
+    "SupportVirtualBoneInRetargeting",
+    "FixUpWaterMetadata",
+    "MoveWaterMetadataToActor",
+    "ReplaceLakeCollision",
+    "AnimLayerGuidConformation",
+    "MakeOceanCollisionTransient",
+    "FFieldPathOwnerSerialization",
+    "FixUpUnderwaterPostProcessMaterial",
+    "SupportMultipleWaterBodiesPerExclusionVolume",
+    "RigVMByteCodeDeterminism",
+    "LandscapePhysicalMaterialRenderData",
+    "FixupRuntimeVirtualTextureVolume",
+    "FixUpRiverCollisionComponents",
+    "FixDuplicateRiverSplineMeshCollisionComponents",
+    "ContainsStableActorGUIDs",
+    "LevelsetSerializationSupportForBodySetup",
+    "ChaosSolverPropertiesMoved",
+    "GameFeatureData_MovedComponentListAndCheats",
+    "ChaosClothAddfictitiousforces",
+    "ChaosConvexVariableStructureDataAndVerticesArray",
+    "RemoveLandscapeWaterInfo",
+    "ChaosClothAddWeightedValue",
+    "ChaosClothAddTetherStiffnessWeightMap",
+    "ChaosClothFixLODTransitionMaps",
+    "ChaosClothAddTetherScaleAndDragLiftWeightMaps",
+    "ChaosClothAddMaterialWeightMaps",
+    "SerializeFloatChannelShowCurve",
+    "LandscapeGrassSingleArray",
+    "AddedSubSequenceEntryWarpCounter",
+    "WaterBodyComponentRefactor",
+    "BPGCCookedEditorTags",
+    "TerrainLayerWeightsAreNotParameters",
+    "GravityOverrideDefinedInWorldSpace",
+    "AnimDynamicsEditableChainParameters",
+    "WaterZonesRefactor",
+    "ChaosClothFasterDamping",
+    "MigratedFunctionHandlersToDefaults",
+    "ChaosInertiaConvertedToVec3",
+    "MigratedEventDefinitionToDefaults",
+    "LevelInstanceActorGuidSerialize",
+    "SingleFrameAndKeyAnimModel",
+    "RemappedEvaluateWorldPositionOffsetInRayTracing",
+    "WaterBodyComponentCollisionSettingsRefactor",
+    "WidgetInheritedNamedSlots",
+    "WaterHLODSupportAdded",
+    "PoseWatchMigrateSkeletonDrawParametersToPoseElement",
+    "WaterExclusionVolumeExcludeAllDefault",
+    "WaterNontessellatedLODSupportAdded",
+    "HierarchicalSimplificationMethodEnumAdded",
+    "WorldPartitionStreamingCellsNamingShortened",
+    "WorldPartitionActorDescSerializeContentBundleGuid",
+    "WorldPartitionActorDescSerializeActorIsRuntimeOnly",
+    "NaniteMaterialOverride",
+    "WorldPartitionHLODActorDescSerializeStats",
+    "WorldPartitionStreamingSourceComponentTargetDeprecation",
+    "FixedLocalizationGatherForExternalActorPackage",
+    "WorldPartitionHLODActorUseSourceCellGuid",
+    "ChaosGeometryCollectionInternalFacesAttribute",
+    "DynamicCastNodesUsePureStateEnum",
+    "WorldPartitionActorFilter",
+    "AudioAttenuationNonSpatializedRadiusBlend",
+    "WorldPartitionActorClassDescSerialize",
+    "WorldPartitionFActorContainerIDu64ToGuid",
+    "WorldPartitionPrivateDataLayers",
+    "ChaosImplicitObjectUnionBVHRefactor",
+    "LevelInstanceActorDescDeltaSerializeFilter",
+    "FixNaniteLandscapeMeshDDCKey",
+    "ChaosGeometryCollectionConnectionEdgeGroup",
+    "WaterBodyStaticMeshComponents",
+    "WorldPartitionActorDescSerializeInvalidBounds",
+    "NavigationLinkID32To64",
+    "WorldPartitionActorDescSerializeEditorOnlyReferences",
+    "WorldPartitionActorDescSerializeSoftObjectPathSupport",
+    "WorldPartitionClasDescGuidTransient",
+    "WorldPartitionActorDescIsMainWorldOnly",
+    "WorldPartitionActorFilterStringAssetPath",
+    "PackedLevelActorDesc",
+    "WorldPartitionRuntimeSpatialHashCVarOverrides",
+    "WorldPartitionHLODSourceActorsRefactor",
+    "WaterBodyStaticMeshRename",
+    "GeometryCollectionConvertVertexColorToSRGB",
+    "WaterOwningZonePointerFixup",
+    "WaterBodyStaticMeshDuplicateTransient",
+    "MVVMConvertPropertyPathToSkeletalClass",
+    "WaterBodyStaticMeshFixup",
+    "AnimGraphNodeBindingExtensions",
+    "RigVMSaveDebugMapInGraphFunctionData",
+    "FixMissingAnimGraphNodeBindingExtensions",
+    "ISMComponentEditableWhenInheritedSkipSerialization",
+    "LandscapeSupportPerComponentGrassTypes",
+    "WorldPartitionDataLayersLogicOperatorAdded",
+    "MovieSceneSortedBindings",
+    "RemoveAnimCurveCompressionCodecInstanceGuid",
+    "WorldPartitionHLODActorDescSerializeSourceHLODLayer",
+    "WorldPartitionHLODActorDescSerializeEditorBounds",
+    "LocalExposureDefaultChangeFrom1_Reverted",
+    "AddDataLayerInstanceExternalPackage",
+    "MVVMPropertyPathSelf",
+    "AddDataflowObjectSerialization",
+    "AnimNotifyAddRateScale",
+    "FixedTangentTransformForNonuniformBuildScale",
+    "AnimNodeRootDefaultGroupChange",
+    "AnimNextMoveGraphsToEntries",
+    "AnimationSequenceCompressedDataRemoveDebugData",
+    "OrthographicCameraDefaultSettings",
+    "LandscapeAddedHLODSettings",
+    "MeshDescriptionForSkeletalMesh",
+    "SkeletalHalfEdgeData",
+    "AnimNextCombineGraphContexts",
+    "AnimNextCombineParameterBlocksAndGraphs",
+    "AnimNextMoveWorkspaces",
+    "LevelInstancePropertyOverrides",
+    "VolumetricLightMapGridDescSupport",
+    "IntroduceLandscapeEditLayerClass",
+    "AnimNextWorkspaceEntryConversion",
+    "DataflowAnyTypeSupport",
+    "PhysicsAssetUseManifoldFlags",
+    "SimAndQueryDataSupportInChaosVisualDebugger",
+    "ChaosClothAssetUSDImportNodeAddAssetDependencies",
+    "LumenRayLightingModeOverrideEnum",
+    "PCGPartitionActorDesc",
+    "LandscapeTargetLayersInLandscapeActor",
+    "DataflowTemplatedTypeFix",
+    "LevelInstanceStaticLightingSupport",
+    "PCGGridDescriptor",
+    "AnimNextGraphAccessSpecifiers",
+    "MaterialPixelDepthOffsetMode",
+    "DataflowHideablePins",
+    "ClothAssetSkeletalMeshMultiSectionImport",
+    "WorldPartitionActorDescSerializeEditorBounds",
+    "FixupLandscapeTargetLayersInLandscapeActor",
+    "MorphTargetCustomImport",
+    "ChaosClothAllowZeroBucklingStiffness",
+    "LevelSequenceUpgradeDynamicBindings_NoOp",
+    "GameFeatureDataActionAddToFrontendDefaultToUnload",
+    "LevelSequenceUpgradeDynamicBindings",
+    "ChaosStoreKinematicTargetRotationAsSinglePrecision",
+    "PCGApplyOnActorNodeMoveTargetActorEdgeToInput",
+    "TimelinePlayingStateTrackerDeprecation",
+    "MeshPaintTextureUsesEditorOnly",
+    "LandscapeBodyInstanceAsSharedProperty",
+    "AnimNextModuleRefactor",
+    "SubsurfaceProfileGuid",
+    "SolverIterationsDataSupportInChaosVisualDebugger",
+    "MaterialInputUsesLinearColor",
+    "FunctionalTestCanRunInEditorWorld",
+    "VisualLoggerSupportDisplayName",
+    "GyroscopicTorquesSupportInChaosVisualDebugger",
+    "AddManagedArrayCollectionPropertySerialization",
+    "LandscapeTexturePatchUsesTextureAssetResolution",
+    "WorldPartitionActorDescSerializeRelativeTransform",
+    "SceneGraphEntitiesPrivateByDefault",
+    "DebugColorForPhysicalMaterials",
+    "AddedPreprocessedFontGeometry",
+    "DynamicMeshSerializeSculptLayers",
+    "SpatialHashRuntimeGridInfoSpriteFixup",
+    "AnimSequenceRawDataOnlyFlagRemoval",
+    "ResetLevelInstanceHLODRelevancy",
+    "SceneCaptureDefaultSettings",
+    "AddClothAssetBase",
+    "PCGInlineConstantDefaultValues",
+    "AddMaterialSubstrateSubsurfaceType",
+    "AddedRuntimeVirtualTextureUseStreamingMipsInEditorMode",
+    "MediaPlateHoldoutComponentRemoval",
+    "PCGLandscapeCacheDefaultSerializationChanged",
+    "SoftObjectPathUtf8SubPaths",
+    "SoftObjectPathTrailingNULsMaintained",
+    "WaterBodyPhysicalMaterialPropertyRemoval",
+    "PCGAttributeSetToPointAlwaysConverts",
+    "MeshMaterialSlotOverlayMaterialAdded",
+    "ConvertGlintDensity",
+    "ClothAssetSkinweightsValidation",
+    "VerseRightToLeftHandedness",
+    "AdditionalGameThreadDataSupportInChaosVisualDebugger",
+    "UpgradeWidgetBlueprintLegacySequencePlayer",
+    "PCGSplineDirectionClockwiseFix",
+    "RectLightFixedEVUnitConversion",
+    "ParticleInflatedBoundsInChaosVisualDebugger",
+    "MigrateLandscapeEditLayerProperties",
+    "ThreadContextDataInChaosVisualDebuggerDebugDrawData",
+    "PCGChangedSurfaceSamplerDefaultGridCreationMode",
+    "MediaPlateOverlayTechniqueRemoval",
+    "PerParticleFlagToAllowPartialIslandSleepInConnectedIsland",
+    "MaterialFunctionBlendTopBottomInputEnum",
+    "MorphTargetCookedCPUDataCompressed",
+    "AnimNextVariableReferences",
+    "LensComponentDefaultToDistortionSVE",
+    "ChangeDefaultAlphaBlendType",
+    "PerParticleIterationCountMovedToDynamicMisc",
+    "AddedMissingSerializationForPropertiesInDynamicMisc",
+    "PCGDeprecateWorldPartitionGenerationSources",
+    "CompositeActorSceneCaptureRefactor",
+    "HLODLayerEditorOnlyObject",
+    "DeduplicatedDebugNameSerializationInCVD",
+    "SpecializeBloomIntensity",
+    "WorldPartitionActorComponentDesc",
+    "MigrateLandscapeNonEditLayerToEditLayer",
+    "DynamicMeshAttributesMorphTargets",
+    "LandscapeAdvancedWeightBlending",
+  ],
+  values: [
+    0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31,
+    32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60,
+    61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89,
+    90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114,
+    115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137,
+    138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160,
+    161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183,
+    184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206,
+    207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222, 223, 224, 225,
+  ],
+  comments: [
+    "Before any version changes were made",
+    "World composition tile offset changed from 2d to 3d",
+    "Minor material serialization optimization",
+    "Refactored cull distances to account for HLOD, explicit override and globals in priority",
+    "Support to remove morphtarget generated by bRemapMorphtarget",
+    "Convert reduction setting options",
+    "Serialize the type of blending used for landscape layer weight static params",
+    "Fix up None Named animation curve names,",
+    "Ensure ActiveBoneIndices to have parents even not skinned for old assets",
+    "Serialize the instanced static mesh render data, to avoid building it at runtime",
+    "Cache material quality node usage",
+    "Font outlines no longer apply to drop shadows for new objects but we maintain the opposite way for backwards compat",
+    "New skeletal mesh import workflow (Geometry only or animation only re-import )",
+    "Migrate data from previous data structure to new one to support materials per LOD on the Landscape",
+    "New Pose Asset data type",
+    "Migrate Foliage TLazyObjectPtr to TSoftObjectPtr",
+    "This code tied to this version was reverted and redone at a later date",
+    "Added BakePoseOverride for LOD setting",
+    "TimelineTemplates store their derived names instead of dynamically generating",
+    "Avoid duplicating widget animations to save space.",
+    "Allow reducing of the base LOD, we need to store some imported model data so we can reduce again from the same data.",
+    "Curve Table size reduction",
+    "Widgets upgraded with WidgetStopDuplicatingAnimations, may not correctly default-to-self for the widget parameter.",
+    "HUDWidgets now require an element tag",
+    "Animation saved as bulk data when cooked",
+    "Support Virtual Bone in Retarget Manager",
+    "Fixup bad defaults in water metadata",
+    "Move the location of water metadata",
+    "Replaced lake collision component",
+    "Anim layer node names are now conformed by Guid",
+    "Ocean collision component has become dynamic",
+    "FFieldPath will serialize the owner struct reference and only a short path to its property",
+    "Simplified WaterBody post process material handling",
+    "A single water exclusion volume can now exclude N water bodies",
+    "Serialize rigvm operators one by one instead of the full byte code array to ensure determinism",
+    "Serialize the physical materials generated by the render material",
+    "RuntimeVirtualTextureVolume fix transforms",
+    "Retrieve water body collision components that were lost in cooked builds",
+    "Fix duplicate spline mesh components on rivers",
+    "Indicates level has stable actor guids",
+    "Levelset Serialization support for BodySetup.",
+    "Moving Chaos solver properties to allow them to exist in the project physics settings",
+    "Moving some UFortGameFeatureData properties and behaviors into the UGameFeatureAction pattern",
+    "Add centrifugal forces for cloth",
+    "(Merged from //UE4/Main)",
+    "Remove the WaterVelocityHeightTexture dependency on MPC_Landscape and LandscapeWaterIndo",
+    "Added the weighted value property type to store the cloths weight maps' low/high ranges",
+    "Added the Long Range Attachment stiffness weight map",
+    "Fix corrupted LOD transition maps",
+    "Enable a few more weight maps to better art direct the cloth simulation",
+    "Enable material (edge, bending, and area stiffness) weight maps",
+    "Added bShowCurve for movie scene float channel serialization",
+    "Minimize slack waste by using a single array for grass data",
+    "Add loop counters to sequencer's compiled sub-sequence data",
+    "Water plugin is now component-based rather than actor based",
+    "Cooked BPGC storing editor-only asset tags",
+    "Terrain layer weights are no longer considered material parameters",
+    "true for nodes predating this change.",
+    "Anim Dynamics Node Physics parameters for each body in a chain are now stored in an array and can be edited.",
+    "Decoupled the generation of the water texture from the Water Brush and the landscape",
+    "Add faster damping calculations to the cloth simulation and rename previous Damping parameter to LocalDamping.",
+    "Migrated function handlers to the CDO/archetype data",
+    "Storing inertia tensor as vec3 instead of matrix.",
+    "Migrated event definitions to the CDO/archetype data",
+    "Serialize LevelInstanceActorGuid on new ILevelInstanceInterface implementation",
+    "Single-frame/key AnimDataModel patch-up",
+    "Remapped bEvaluateWorldPositionOffset to bEvaluateWorldPositionOffsetInRayTracing",
+    "Water body collision settings are now those of the base UPrimitiveComponent, rather than duplicated in UWaterBodyComponent",
+    "if a widget exposes its named slot to everyone (even if it has content) which by default they wont any longer.",
+    "Added water HLOD material",
+    "Moved parameters affecting Skeleton pose rendering from the PoseWatch class to the PoseWatchPoseElement class.",
+    'Reset default value for Water exclusion volumes to make them more intuitive and support the "it just works" philosophy.',
+    "Added water non-tessellated LOD",
+    "Added FHierarchicalSimplification::SimplificationMethod",
+    "Changed how world partition streaming cells are named",
+    "Serialize ContentBundleGuid in WorldPartitionActorDesc",
+    "Serialize IsActorRuntimeOnly in WorldPartitionActorDesc",
+    "Add Nanite Material Override option to materials and material instances.",
+    "Serialize HLOD stats in HLODActorDesc",
+    "WorldPartitionStreamingSourceComponent property deprecation",
+    "Fixed localization gathering for external actor packages",
+    "Change HLODActors to RuntimeCells mapping to use a GUID instead of the cell name",
+    "Add an attribute to geometry collection to track internal faces, rather than relying on material ID numbering",
+    "Dynamic cast nodes use an enumerated pure node state to include a value for the default setting",
+    "Add FWorldPartitionActorFilter to FLevelInstanceActorDesc/FDataLayerInstanceDesc",
+    "Change the non-spatialized radius to blend to a pure 2D spatialized sound vs omnidirectional",
+    "Serialize actor class descriptors",
+    "FActorContainerID is now an FGuid instead of a uint64",
+    "FDataLayerInstanceDesc support for private data layers",
+    "Reduce size and improve behaviour of Chaos::FImplicitObjectUnion",
+    "FLevelInstanceActorDesc DeltaSerialize Filter",
+    "Fix the Nanite landscape mesh non-deterministic DDC keys",
+    "Change how connection graphs are stored on Geometry Collections to an edge-array representation",
+    "Moved the water info mesh data and static water body meshes into new static mesh components for water bodies.",
+    "Serialize invalid bounds in world partition actor descriptors",
+    "Upgrade Navigation Links to use 64 bits for the ID",
+    "Serialize editor only references in world partition actor descriptors",
+    "Add support for soft object paths in actor descriptors",
+    "Don't serialize class descriptor GUIDs",
+    "Serialize ActorDesc bIsMainWorldOnly",
+    "FWorldPartitionActorFilter go back to FString serialize of AssetPaths to avoid FArchiveReplaceOrClearExternalReferences clearing CDO references on BP Compile",
+    "Add FPackedLevelActorDesc for APackedLevelActor and support for APackedLevelActor Filters",
+    "Add customizable values for several UWorldPartitionRuntimeSpatialHash cvars",
+    "WorldPartition HLOD now contains a source actors object",
+    "Geometry Collection now by-default converts vertex colors to sRGB when creating render data",
+    "Water bodies before this version need to update their water zone on load since they won't have been serialized yet.",
+    "Set flags on water static meshes to duplicate transient to avoid underlying static mesh duplication issue",
+    "Update paths to use the SkeletalClass",
+    "Fixup all flags/outering on static meshes on water bodies by rebuilding them completely",
+    "Binding extensions for anim graph nodes",
+    "Function data stores a map from work to debug operands",
+    "Fix missing binding extensions for some anim graph nodes",
+    "EditableWhenInherited: Skip custom serialization on non Archetypes",
+    "GrassTypes are now per-component, rather than per-landscape proxy :",
+    "World partition actor data layers activation logic operator support defaults for old maps",
+    "Started sorting Possessables, Spawnables, and MovieSceneBindings for better search performance.",
+    "Remove the UAnimCurveCompressionCodec::InstanceGuid which causes cook determinism issues",
+    "Serialize the source HLOD Layer for HLOD actor descriptors.",
+    "Serialize custom editor bounds for HLOD actor descriptors.",
+    "Changed default Local Exposure Contrast from 1.0 to 0.8 (reverted)",
+    "Added support of external packaging of Data Layer Instances",
+    "Update paths to keep a flag if they are the widget BP",
+    "Enabled ObjectPtr property serialization for Dataflow nodes",
+    "Add anim notify rate scaling, defaults to on for new content, off for old content",
+    "Fix tangents for non-uniform build scales, and add a flag to optionally match the previous (incorrect) tangents",
+    "AnimNode Layers will now start in a Shared Group, instead of being each one on a different group at runtime",
+    "Move AnimNext graphs to sub-entries of assets",
+    "Removed debug information containing compressed data author, time etc. from animation DDC data as it introduces indeterminism",
+    "Changes to Orthographic Camera default settings",
+    "Added settings to Landscape HLODs",
+    "Skeletal Mesh uses Mesh Description to store mesh bulk data.",
+    "Skeletal Mesh optionally cooks half edge data per lod",
+    "Combine graph contexts for AnimNext graphs",
+    "Combine parameter blocks and graphs",
+    "Move workspaces to a separate plugin",
+    "Level Instance Property overrides",
+    "Added FVolumetricLightMapGridDesc in MapBuildData",
+    "Introduce new structure for customizing the landscape edit layer behavior",
+    "Change workspaces to store asset references as external objects",
+    "Add support for anytype in dataflow",
+    "Adding a new flag in RBAN Solver Setting to be able to use manifolds",
+    "Added support for to record sim and query data of Shape Instance data in CVD",
+    "Add the imported asset dependencies to the Cloth Asset USD Import node",
+    "Changed HitLighting to HitLightingForReflections, and HitLighting now means hit lighting for entire Lumen",
+    "PCGPartitionActorDesc",
+    "Target layers are now defined in the Landscape actor and not continuously synced from the assigned material.",
+    "Fix to get full name of templated type ( Tarray > TArray<Float> for example )",
+    "Changes for LevelInstance support in StaticLighting",
+    "PCGGridDescriptor",
+    "AnimNext graphs now have public/private state",
+    "Added a more stable pixel depth offset mode.",
+    "Added hideable pins to dataflow",
+    "Added multiple section import to the cloth asset skeletal mesh import node",
+    "Serialize EditorBounds in WorldPartitionActorDesc",
+    "Fixup for the data that has been damaged by LandscapeTargetLayersInLandscapeActor (loss of landscape layer info object assignments)",
+    "Allow custom import of morph target",
+    "Fix chaos cloth buckling stiffness parameter bug",
+    "LevelSequenceUpgradeDynamicBindings was removed but was intended for this position. Putting this here to make sure versioning of subsequent assets remains the same",
+    "AddToFrontend GFA now defaults to unload plugin on exit frontend",
+    "Upgraded movie scene 'dynamic bindings' to use the new Custom Bindings system",
+    "Changed the precision for the stored rotation on kinematic targets to match the precision used in particles",
+    "PCG changes around the ApplyOnActor node, where we collapsed the TargetActor to the input pin.",
+    "PlayingStateTracker type to improve replication reliability",
+    "Enable SkipOnlyEditorOnly style cooking of UStaticMeshComponent::MeshPaintTexture",
+    "Fixup and synchronize some landscape properties that have moved to the property sharing/overriding system :",
+    "Multiple changes to AnimNext modules, variables etc.",
+    "Subsurface profile now has a guid to be able to select one of many in a Substrate material.",
+    "Added support for to record the new solver iteration settings in CVD",
+    "Updated FColorMaterialInput to use FLinearColor instead of FColor",
+    "Updated editor only AFunctionalTest running logic to run tests editor world if the actors don't support PIE",
+    "Added support for display name in the Visual Logger",
+    "Added support for the GyroscopicTorque flag in CVD",
+    "Added managed array property serialization",
+    "Landscape texture patches in Texture Asset source mode now use proper resolution when calculating transform",
+    "Added support for relative transform in WorldPartitionActorDesc",
+    "Make sure scene graph entities are not public by default",
+    "Added debug color for physical materials",
+    "Added PreprocessedFontGeometry to FFontFaceData",
+    "Added Dynamic Mesh Sculpt Layer serialization",
+    "Fix reachable garbage object warnings from some legacy ASpatialHashRuntimeGridInfo actors",
+    "Removed UAnimSequence::bUseRawDataOnly flag alongside compression refactor",
+    "HLOD relevancy of Level Instances was previously ignored, now taken into account. Reset to the default behavior.",
+    "Updated default scene capture post-processing settings to reflect the underlying implementation overrides",
+    "Add Cloth Asset Base class serialization",
+    "Add inline constant default values to the PCG graph nodes.",
+    "Add MaterialSubstrateSubsurfaceType type to UMaterialExpressionSubstrateSlabBSDF for replacing bUseSSSDifffusion",
+    "Added option to visualize runtime virtual textures' streamed mips only in PIE",
+    "Media plate holdout composite components have been replaced by a checkbox",
+    'Changed PCG landscape cache default from "serialize at cook" to "never serialize"',
+    "FSoftObjectPath::SubPathString changed to FUtf8String",
+    "FSoftObjectPath::SubPathString could be saved with trailing NULs and need truncating",
+    "Water body components no longer need to maintain their own PhysicalMaterial property since they are primitive components. After this version, leverage that one instead.",
+    "PCG fixed attribute set -> point conversion passing through empty point data as-is and violating output pin type.",
+    "Add per material slot overlay material data",
+    "Convert Sustrate glint density properly",
+    "Introduced skinweight validation to avoid render crashes and disappearing simulation meshes",
+    "Switching verse from right handed to left handed",
+    "Added additional data required to record and represent particle data from the game thread (Kinematic targets, and SQ rejection reasons)",
+    "Upgrade UMG widget blueprints using legacy animation API",
+    "Changed clockwise detection algorithm for PCGSplineDirection node with the correct one, but add a version to not break previous nodes.",
+    "Rect Lights set in EV units had the wrong intensity (older files need a flag set to keep the old look)",
+    "Add particle bounds to data exported to CVD",
+    "Migrate properties from FLandscapeLayer to ULandscapeEditLayer",
+    "Added more context data to CVD's traced shapes so we can play it back at the solver stage level (not just game thread frames)",
+    "Changed default grid mode in surface sampler to a version that's more intuitive and less error-prone",
+    "Media plate overlay composite technique replacement with holdout composite",
+    "Added particle flag to allow/disallow partial island sleeping in the island the particle is in",
+    "Material Function Blend Deserialize Top/Bottom input nodes with clearer enum marker.",
+    "Cooked CPU-side morph target points are now stored internally in the same compressed format as the GPU morph data.",
+    "AnimNext variables converted to references",
+    "The default distortion rendering mode used by the Lens Component is now the Lens Distortion Scene View Extension",
+    "Animation default blend option changed from Linear to HermiteCubic (aka SmoothStep, ease in / ease out)",
+    "Moved Position/Velocity/Projection Iteration Counts from FChaosVDFRigidParticleControlFlags to FChaosVDParticleDynamicMisc",
+    "Added missing custom serialization for some properties in the ParticleDynamicMisc structure used by the Chaos Visual Debugger",
+    "Change default value for deprecated bEnableWorldPartitionGenerationSources",
+    "Refactored the composite (plugin) actor scene capture management.",
+    "Moved HLOD Layer properties to an editor only optional object",
+    "Deduplicated particle debug names serialization in the Chaos Visual Debugger",
+    "Add BloomGaussianIntensity and BloomConvolutionIntensity",
+    "Add support for world partition actor component descriptors",
+    "Migrate Non-Edit layer landscapes to use the edit layer (ULandscapeEditLayer) system",
+    "FDynamicMeshAttributeSet has Morph Targets.",
+    "Introduce landscape advanced weight blending",
+  ],
+  commentIndexes: [
+    0, 1, 2, 3, -1, -1, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29,
+    30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58,
+    59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87,
+    88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, -1, 104, 105, 106, 107, 108, 109, 110, 111, 112,
+    113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135,
+    136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158,
+    159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181,
+    182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204,
+    205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222,
+  ],
+  firstAppearances: [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 3, 3, 4, 4, 4, 4, 5, 5, 5, 5, 5, 5, 5,
+    5, 5, 5, 5, 5, 6, 6, 6, 6, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 9, 9, 9, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10,
+    10, 10, 10, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 12, 12, 12,
+    12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12,
+    12, 12, 12, 12, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13,
+    13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14,
+    14,
+  ],
+  lastAppearances: [
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+  ],
+});
 
 export const FFortniteMainBranchObjectVersionGuid = new CustomVersionGuid<FFortniteMainBranchObjectVersion>({
   name: "FFortniteMainBranchObjectVersion",
   guid: FGuid.fromComponents(0x601d1886, 0xac644f84, 0xaa16d3de, 0x0deac7d6),
   details: FFortniteMainBranchObjectVersionDetails,
 });
+
+export default FFortniteMainBranchObjectVersionGuid;
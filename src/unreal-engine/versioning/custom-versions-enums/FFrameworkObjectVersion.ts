@@ -3,7 +3,7 @@
 // noinspection JSUnusedGlobalSymbols
 //
 
-import { VersionDetails, CustomVersionGuid } from "../CustomVersionGuid";
+import { LazyVersionDetails, CustomVersionGuid } from "../CustomVersionGuid";
 import { FGuid } from "../../modules/CoreUObject/structs/Guid";
 
 export enum FFrameworkObjectVersion {
@@ -123,241 +123,122 @@ export enum FFrameworkObjectVersion {
   LatestVersion = StoringUCSSerializationIndex,
 }
 
-export const FFrameworkObjectVersionDetails: VersionDetails[] = [
-  new VersionDetails({
-    name: "BeforeCustomVersionWasAdded",
-    comment: "Before any version changes were made",
-    value: 0,
-    firstAppearance: "4.12.0",
-  }),
-  new VersionDetails({
-    name: "UseBodySetupCollisionProfile",
-    comment: "BodySetup's default instance collision profile is used by default when creating a new instance.",
-    value: 1,
-    firstAppearance: "4.12.0",
-  }),
-  new VersionDetails({
-    name: "AnimBlueprintSubgraphFix",
-    comment: "missing graphs that appear read only when edited",
-    value: 2,
-    firstAppearance: "4.12.0",
-  }),
-  new VersionDetails({
-    name: "MeshSocketScaleUtilization",
-    comment: "Static and skeletal mesh sockets now use the specified scale",
-    value: 3,
-    firstAppearance: "4.12.0",
-  }),
-  new VersionDetails({
-    name: "ExplicitAttachmentRules",
-    comment: "Attachment rules are now explicit in how they affect location, rotation and scale",
-    value: 4,
-    firstAppearance: "4.12.0",
-  }),
-  new VersionDetails({
-    name: "MoveCompressedAnimDataToTheDDC",
-    comment: "Moved compressed anim data from uasset to the DDC",
-    value: 5,
-    firstAppearance: "4.12.0",
-  }),
-  new VersionDetails({
-    name: "FixNonTransactionalPins",
-    comment: "which causes issues with undo. Restore the flag at this version",
-    value: 6,
-    firstAppearance: "4.12.0",
-  }),
-  new VersionDetails({
-    name: "SmartNameRefactor",
-    comment: "Create new struct for SmartName, and use that for CurveName",
-    value: 7,
-    firstAppearance: "4.13.0",
-  }),
-  new VersionDetails({
-    name: "AddSourceReferenceSkeletonToRig",
-    comment: "Add Reference Skeleton to Rig",
-    value: 8,
-    firstAppearance: "4.13.0",
-  }),
-  new VersionDetails({
-    name: "ConstraintInstanceBehaviorParameters",
-    comment: "Refactor ConstraintInstance so that we have an easy way to swap behavior paramters",
-    value: 9,
-    firstAppearance: "4.13.0",
-  }),
-  new VersionDetails({
-    name: "PoseAssetSupportPerBoneMask",
-    comment: "Pose Asset support mask per bone",
-    value: 10,
-    firstAppearance: "4.13.0",
-  }),
-  new VersionDetails({
-    name: "PhysAssetUseSkeletalBodySetup",
-    comment: "Physics Assets now use SkeletalBodySetup instead of BodySetup",
-    value: 11,
-    firstAppearance: "4.13.0",
-  }),
-  new VersionDetails({
-    name: "RemoveSoundWaveCompressionName",
-    comment: "Remove SoundWave CompressionName",
-    value: 12,
-    firstAppearance: "4.13.0",
-  }),
-  new VersionDetails({
-    name: "AddInternalClothingGraphicalSkinning",
-    comment: "Switched render data for clothing over to unreal data, reskinned to the simulation mesh",
-    value: 13,
-    firstAppearance: "4.14.0",
-  }),
-  new VersionDetails({
-    name: "WheelOffsetIsFromWheel",
-    comment: "Wheel force offset is now applied at the wheel instead of vehicle COM",
-    value: 14,
-    firstAppearance: "4.14.0",
-  }),
-  new VersionDetails({
-    name: "MoveCurveTypesToSkeleton",
-    comment: "major flag - i.e. material types - moves to skeleton and handle in one place",
-    value: 15,
-    firstAppearance: "4.14.0",
-  }),
-  new VersionDetails({
-    name: "CacheDestructibleOverlaps",
-    comment: "Cache destructible overlaps on save",
-    value: 16,
-    firstAppearance: "4.14.0",
-  }),
-  new VersionDetails({
-    name: "GeometryCacheMissingMaterials",
-    comment: "Added serialization of materials applied to geometry cache objects",
-    value: 17,
-    firstAppearance: "4.14.0",
-  }),
-  new VersionDetails({
-    name: "LODsUseResolutionIndependentScreenSize",
-    comment: "Switch static & skeletal meshes to calculate LODs based on resolution-independent screen size",
-    value: 18,
-    firstAppearance: "4.15.0",
-  }),
-  new VersionDetails({
-    name: "BlendSpacePostLoadSnapToGrid",
-    comment: "Blend space post load verification",
-    value: 19,
-    firstAppearance: "4.15.0",
-  }),
-  new VersionDetails({
-    name: "SupportBlendSpaceRateScale",
-    comment: "Addition of rate scales to blend space samples",
-    value: 20,
-    firstAppearance: "4.15.0",
-  }),
-  new VersionDetails({
-    name: "LODHysteresisUseResolutionIndependentScreenSize",
-    comment: "LOD hysteresis also needs conversion from the LODsUseResolutionIndependentScreenSize version",
-    value: 21,
-    firstAppearance: "4.15.0",
-  }),
-  new VersionDetails({
-    name: "ChangeAudioComponentOverrideSubtitlePriorityDefault",
-    comment: "AudioComponent override subtitle priority default change",
-    value: 22,
-    firstAppearance: "4.15.0",
-  }),
-  new VersionDetails({
-    name: "HardSoundReferences",
-    comment: "Serialize hard references to sound files when possible",
-    value: 23,
-    firstAppearance: "4.16.0",
-  }),
-  new VersionDetails({
-    name: "EnforceConstInAnimBlueprintFunctionGraphs",
-    comment: "Enforce const correctness in Animation Blueprint function graphs",
-    value: 24,
-    firstAppearance: "4.17.0",
-  }),
-  new VersionDetails({
-    name: "InputKeySelectorTextStyle",
-    comment: "Upgrade the InputKeySelector to use a text style",
-    value: 25,
-    firstAppearance: "4.17.0",
-  }),
-  new VersionDetails({
-    name: "EdGraphPinContainerType",
-    comment: "Represent a pins container type as an enum not 3 independent booleans",
-    value: 26,
-    firstAppearance: "4.17.0",
-  }),
-  new VersionDetails({
-    name: "ChangeAssetPinsToString",
-    comment: "Switch asset pins to store as string instead of hard object reference",
-    value: 27,
-    firstAppearance: "4.17.0",
-  }),
-  new VersionDetails({
-    name: "LocalVariablesBlueprintVisible",
-    comment: "Fix Local Variables so that the properties are correctly flagged as blueprint visible",
-    value: 28,
-    firstAppearance: "4.17.0",
-  }),
-  new VersionDetails({
-    name: "RemoveUField_Next",
-    comment: "in order to allow us to do all UFunction loading in a single pass (after classes and CDOs are created):",
-    value: 29,
-    firstAppearance: "4.18.0",
-  }),
-  new VersionDetails({
-    name: "UserDefinedStructsBlueprintVisible",
-    comment: "Fix User Defined structs so that all members are correct flagged blueprint visible",
-    value: 30,
-    firstAppearance: "4.18.0",
-  }),
-  new VersionDetails({
-    name: "PinsStoreFName",
-    comment: "FMaterialInput and FEdGraphPin store their name as FName instead of FString",
-    value: 31,
-    firstAppearance: "4.19.0",
-  }),
-  new VersionDetails({
-    name: "UserDefinedStructsStoreDefaultInstance",
-    comment: "User defined structs store their default instance, which is used for initializing instances",
-    value: 32,
-    firstAppearance: "4.19.0",
-  }),
-  new VersionDetails({
-    name: "FunctionTerminatorNodesUseMemberReference",
-    comment: "Function terminator nodes serialize an FMemberReference rather than a name/class pair",
-    value: 33,
-    firstAppearance: "4.19.0",
-  }),
-  new VersionDetails({
-    name: "EditableEventsUseConstRefParameters",
-    comment: "Custom event and non-native interface event implementations add 'const' to reference parameters",
-    value: 34,
-    firstAppearance: "4.20.0",
-  }),
-  new VersionDetails({
-    name: "BlueprintGeneratedClassIsAlwaysAuthoritative",
-    comment:
-      "No longer serialize the legacy flag that indicates this state, as it is now implied since we don't serialize the skeleton CDO",
-    value: 35,
-    firstAppearance: "4.22.0",
-  }),
-  new VersionDetails({
-    name: "EnforceBlueprintFunctionVisibility",
-    comment:
-      "Enforce visibility of blueprint functions - e.g. raise an error if calling a private function from another blueprint:",
-    value: 36,
-    firstAppearance: "4.24.0",
-  }),
-  new VersionDetails({
-    name: "StoringUCSSerializationIndex",
-    comment: "ActorComponents now store their serialization index",
-    value: 37,
-    firstAppearance: "4.25.0",
-  }),
-];
+export const FFrameworkObjectVersionDetails = new LazyVersionDetails({
+  releases: [
+    "4.12.0",
+    "4.13.0",
+    "4.14.0",
+    "4.15.0",
+    "4.16.0",
+    "4.17.0",
+    "4.18.0",
+    "4.19.0",
+    "4.20.0",
+    "4.22.0",
+    "4.24.0",
+    "4.25.0",
+  ],
+  names: [
+    "BeforeCustomVersionWasAdded",
+    "UseBodySetupCollisionProfile",
+    "AnimBlueprintSubgraphFix",
+    "MeshSocketScaleUtilization",
+    "ExplicitAttachmentRules",
+    "MoveCompressedAnimDataToTheDDC",
+    "FixNonTransactionalPins",
+    "SmartNameRefactor",
+    "AddSourceReferenceSkeletonToRig",
+    "ConstraintInstanceBehaviorParameters",
+    "PoseAssetSupportPerBoneMask",
+    "PhysAssetUseSkeletalBodySetup",
+    "RemoveSoundWaveCompressionName",
+    "AddInternalClothingGraphicalSkinning",
+    "WheelOffsetIsFromWheel",
+    "MoveCurveTypesToSkeleton",
+    "CacheDestructibleOverlaps",
+    "GeometryCacheMissingMaterials",
+    "LODsUseResolutionIndependentScreenSize",
+    "BlendSpacePostLoadSnapToGrid",
+    "SupportBlendSpaceRateScale",
+    "LODHysteresisUseResolutionIndependentScreenSize",
+    "ChangeAudioComponentOverrideSubtitlePriorityDefault",
+    "HardSoundReferences",
+    "EnforceConstInAnimBlueprintFunctionGraphs",
+    "InputKeySelectorTextStyle",
+    "EdGraphPinContainerType",
+    "ChangeAssetPinsToString",
+    "LocalVariablesBlueprintVisible",
+    "RemoveUField_Next",
+    "UserDefinedStructsBlueprintVisible",
+    "PinsStoreFName",
+    "UserDefinedStructsStoreDefaultInstance",
+    "FunctionTerminatorNodesUseMemberReference",
+    "EditableEventsUseConstRefParameters",
+    "BlueprintGeneratedClassIsAlwaysAuthoritative",
+    "EnforceBlueprintFunctionVisibility",
+    "StoringUCSSerializationIndex",
+  ],
+  values: [
+    0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31,
+    32, 33, 34, 35, 36, 37,
+  ],
+  comments: [
+    "Before any version changes were made",
+    "BodySetup's default instance collision profile is used by default when creating a new instance.",
+    "missing graphs that appear read only when edited",
+    "Static and skeletal mesh sockets now use the specified scale",
+    "Attachment rules are now explicit in how they affect location, rotation and scale",
+    "Moved compressed anim data from uasset to the DDC",
+    "which causes issues with undo. Restore the flag at this version",
+    "Create new struct for SmartName, and use that for CurveName",
+    "Add Reference Skeleton to Rig",
+    "Refactor ConstraintInstance so that we have an easy way to swap behavior paramters",
+    "Pose Asset support mask per bone",
+    "Physics Assets now use SkeletalBodySetup instead of BodySetup",
+    "Remove SoundWave CompressionName",
+    "Switched render data for clothing over to unreal data, reskinned to the simulation mesh",
+    "Wheel force offset is now applied at the wheel instead of vehicle COM",
+    "major flag - i.e. material types - moves to skeleton and handle in one place",
+    "Cache destructible overlaps on save",
+    "Added serialization of materials applied to geometry cache objects",
+    "Switch static & skeletal meshes to calculate LODs based on resolution-independent screen size",
+    "Blend space post load verification",
+    "Addition of rate scales to blend space samples",
+    "LOD hysteresis also needs conversion from the LODsUseResolutionIndependentScreenSize version",
+    "AudioComponent override subtitle priority default change",
+    "Serialize hard references to sound files when possible",
+    "Enforce const correctness in Animation Blueprint function graphs",
+    "Upgrade the InputKeySelector to use a text style",
+    "Represent a pins container type as an enum not 3 independent booleans",
+    "Switch asset pins to store as string instead of hard object reference",
+    "Fix Local Variables so that the properties are correctly flagged as blueprint visible",
+    "in order to allow us to do all UFunction loading in a single pass (after classes and CDOs are created):",
+    "Fix User Defined structs so that all members are correct flagged blueprint visible",
+    "FMaterialInput and FEdGraphPin store their name as FName instead of FString",
+    "User defined structs store their default instance, which is used for initializing instances",
+    "Function terminator nodes serialize an FMemberReference rather than a name/class pair",
+    "Custom event and non-native interface event implementations add 'const' to reference parameters",
+    "No longer serialize the legacy flag that indicates this state, as it is now implied since we don't serialize the skeleton CDO",
+    "Enforce visibility of blueprint functions - e.g. raise an error if calling a private function from another blueprint:",
+    "ActorComponents now store their serialization index",
+  ],
+  commentIndexes: [
+    0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31,
+    32, 33, 34, 35, 36, 37,
+  ],
+  firstAppearances: [
+    0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 4, 5, 5, 5, 5, 5, 6, 6, 7, 7, 7, 8, 9, 10, 11,
+  ],
+  lastAppearances: [
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1,
+  ],
+});
 
 export const FFrameworkObjectVersionGuid = new CustomVersionGuid<FFrameworkObjectVersion>({
   name: "FFrameworkObjectVersion",
   guid: FGuid.fromComponents(0xcffc743f, 0x43b04480, 0x939114df, 0x171d2073),
   details: FFrameworkObjectVersionDetails,
 });
+
+export default FFrameworkObjectVersionGuid;
@@ -3,7 +3,7 @@
 // noinspection JSUnusedGlobalSymbols
 //
 
-import { VersionDetails, CustomVersionGuid } from "../CustomVersionGuid";
+import { LazyVersionDetails, CustomVersionGuid } from "../CustomVersionGuid";
 import { FGuid } from "../../modules/CoreUObject/structs/Guid";
 
 export enum FUE5MainStreamObjectVersion {
@@ -273,751 +273,285 @@ export enum FUE5MainStreamObjectVersion {
   LatestVersion = RuntimeVirtualTextureMaterialValidation,
 }
 
-export const FUE5MainStreamObjectVersionDetails: VersionDetails[] = [
-  new VersionDetails({
-    name: "BeforeCustomVersionWasAdded",
-    comment: "Before any version changes were made",
-    value: 0,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "GeometryCollectionNaniteData",
-    comment: "Nanite data added to Chaos geometry collections",
-    value: 1,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "GeometryCollectionNaniteDDC",
-    comment: "Nanite Geometry Collection data moved to DDC",
-    value: 2,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "RemovingSourceAnimationData",
-    comment: "Removing SourceAnimationData, animation layering is now applied during compression",
-    value: 3,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "MeshDescriptionNewFormat",
-    comment: "This is the correct versioning for MeshDescription changes which were added to ReleaseObjectVersion.",
-    value: 4,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "PartitionActorDescSerializeGridGuid",
-    comment: "Serialize GridGuid in PartitionActorDesc",
-    value: 5,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "ExternalActorsMapDataPackageFlag",
-    comment: "Set PKG_ContainsMapData on external actor packages",
-    value: 6,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "AnimationAddedBlendProfileModes",
-    comment:
-      "Added a new configurable BlendProfileMode that the user can setup to control the behavior of blend profiles.",
-    value: 7,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionActorDescSerializeDataLayers",
-    comment: "Serialize DataLayers in WorldPartitionActorDesc",
-    value: 8,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "RenamingAnimationNumFrames",
-    comment: "Renaming UAnimSequence::NumFrames to NumberOfKeys, as that what is actually contains.",
-    value: 9,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionHLODActorDescSerializeHLODLayer",
-    comment: "Serialize HLODLayer in WorldPartition HLODActorDesc",
-    value: 10,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "GeometryCollectionNaniteCooked",
-    comment: "Fixed Nanite Geometry Collection cooked data",
-    value: 11,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "AddedCookedBoolFontFaceAssets",
-    comment: "Added bCooked to UFontFace assets",
-    value: 12,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionHLODActorDescSerializeCellHash",
-    comment: "Serialize CellHash in WorldPartition HLODActorDesc",
-    value: 13,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "GeometryCollectionNaniteTransient",
-    comment:
-      "Nanite data is now transient in Geometry Collection similar to how RenderData is transient in StaticMesh.",
-    value: 14,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "AddedLandscapeSplineActorDesc",
-    comment: "Added FLandscapeSplineActorDesc",
-    value: 15,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "AddCollisionConstraintFlag",
-    comment: "Added support for per-object collision constraint flag. [Chaos]",
-    value: 16,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "MantleDbSerialize",
-    comment: "Initial Mantle Serialize Version",
-    value: 17,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "AnimSyncGroupsExplicitSyncMethod",
-    comment: "Animation sync groups explicitly specify sync method",
-    value: 18,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "FLandscapeActorDescFixupGridIndices",
-    comment: "Fixup FLandscapeActorDesc Grid indices",
-    value: 19,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "FoliageTypeIncludeInHLOD",
-    comment: "FoliageType with HLOD support",
-    value: 20,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "IntroducingAnimationDataModel",
-    comment: "Introducing UAnimDataModel sub-object for UAnimSequenceBase containing all animation source data",
-    value: 21,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionActorDescSerializeActorLabel",
-    comment: "Serialize ActorLabel in WorldPartitionActorDesc",
-    value: 22,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionActorDescSerializeArchivePersistent",
-    comment: "Fix WorldPartitionActorDesc serialization archive not persistent",
-    value: 23,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "FixForceExternalActorLevelReferenceDuplicates",
-    comment: "Fix potentially duplicated actors when using ForceExternalActorLevelReference",
-    value: 24,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "SerializeMeshDescriptionBase",
-    comment: "Make UMeshDescriptionBase serializable",
-    value: 25,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "ConvexUsesVerticesArray",
-    comment: "Chaos FConvex uses array of FVec3s for vertices instead of particles",
-    value: 26,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionActorDescSerializeHLODInfo",
-    comment: "Serialize HLOD info in WorldPartitionActorDesc",
-    value: 27,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "AddDisabledFlag",
-    comment: "Expose particle Disabled flag to the game thread",
-    value: 28,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "MoveCustomAttributesToDataModel",
-    comment: "Moving animation custom attributes from AnimationSequence to UAnimDataModel",
-    value: 29,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "BlendSpaceRuntimeTriangulation",
-    comment: "Use of triangulation at runtime in BlendSpace",
-    value: 30,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "BlendSpaceSmoothingImprovements",
-    comment: "Fix to the Cubic smoothing, plus introduction of new smoothing types",
-    value: 31,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "RemovingTessellationParameters",
-    comment: "Removing Tessellation parameters from Materials",
-    value: 32,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "SparseClassDataStructSerialization",
-    comment: "Sparse class data serializes its associated structure to allow for BP types to be used",
-    value: 33,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "PackedLevelInstanceBoundsFix",
-    comment: "PackedLevelInstance bounds fix",
-    value: 34,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "AnimNodeConstantDataRefactorPhase0",
-    comment: "Initial set of anim nodes converted to use constants held in sparse class data",
-    value: 35,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "MaterialSavedCachedData",
-    comment: "Explicitly serialized bSavedCachedExpressionData for Material(Instance)",
-    value: 36,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "RemoveDecalBlendMode",
-    comment: "Remove explicit decal blend mode",
-    value: 37,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "DirLightsAreAtmosphereLightsByDefault",
-    comment: "Made directional lights be atmosphere lights by default",
-    value: 38,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionStreamingCellsNamingShortened",
-    comment: "Changed how world partition streaming cells are named",
-    value: 39,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionActorDescGetStreamingBounds",
-    comment: "Changed how actor descriptors compute their bounds",
-    value: 40,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "MeshDescriptionVirtualization",
-    comment: "Switch FMeshDescriptionBulkData to use virtualized bulkdata",
-    value: 41,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "TextureSourceVirtualization",
-    comment: "Switch FTextureSource to use virtualized bulkdata",
-    value: 42,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "RigVMCopyOpStoreNumBytes",
-    comment: "RigVM to store more information alongside the Copy Operator",
-    value: 43,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "MaterialTranslucencyPass",
-    comment: "Expanded separate translucency into multiple passes",
-    value: 44,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "GeometryCollectionUserDefinedCollisionShapes",
-    comment: "Chaos FGeometryCollectionObject user defined collision shapes support",
-    value: 45,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "RemovedAtmosphericFog",
-    comment: "Removed the AtmosphericFog component with conversion to SkyAtmosphere component",
-    value: 46,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "SkyAtmosphereAffectsHeightFogWithBetterDefault",
-    comment:
-      "The SkyAtmosphere now light up the heightfog by default, and by default the height fog has a black color.",
-    value: 47,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "BlendSpaceSampleOrdering",
-    comment: "Ordering of samples in BlendSpace",
-    value: 48,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "GeometryCollectionCacheRemovesMassToLocal",
-    comment: "No longer bake MassToLocal transform into recorded transform data in GeometryCollection caching",
-    value: 49,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "EdGraphPinSourceIndex",
-    comment: "UEdGraphPin serializes SourceIndex",
-    value: 50,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "VirtualizedBulkDataHaveUniqueGuids",
-    comment: "Change texture bulkdatas to have unique guids",
-    value: 51,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "RigVMMemoryStorageObject",
-    comment: "Introduce RigVM Memory Class Object",
-    value: 52,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "RayTracedShadowsType",
-    comment: "Ray tracing shadows have three states now (Disabled, Use Project Settings, Enabled)",
-    value: 53,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "SkelMeshSectionVisibleInRayTracingFlagAdded",
-    comment: "Add bVisibleInRayTracing flag to Skeletal Mesh Sections",
-    value: 54,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "AnimGraphNodeTaggingAdded",
-    comment: "Add generic tagging of all anim graph nodes in anim blueprints",
-    value: 55,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "DynamicMeshCompactedSerialization",
-    comment: "Add custom version to FDynamicMesh3",
-    value: 56,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "ConvertReductionBaseSkeletalMeshBulkDataToInlineReductionCacheData",
-    comment: "Remove the inline reduction bulkdata and replace it by a simple vertex and triangle count cache",
-    value: 57,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "SkeletalMeshLODModelMeshInfo",
-    comment: "Added some new MeshInfo to the FSkeletalMeshLODModel class.",
-    value: 58,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "TextureDoScaleMipsForAlphaCoverage",
-    comment: "Add Texture DoScaleMipsForAlphaCoverage",
-    value: 59,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "VolumetricCloudReflectionSampleCountDefaultUpdate",
-    comment:
-      "Fixed default value of volumetric cloud to be exact match with main view, more expenssive but we let user choosing how to lower the quality.",
-    value: 60,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "UseTriangleMeshBVH",
-    comment: "Use special BVH for TriangleMesh, instead of the AABBTree",
-    value: 61,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "DynamicMeshAttributesWeightMapsAndNames",
-    comment: "FDynamicMeshAttributeSet has Weight Maps. TDynamicAttributeBase serializes its name.",
-    value: 62,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "FKControlNamingScheme",
-    comment: "Switching FK control naming scheme to incorporate _CURVE for curve controls",
-    value: 63,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "RichCurveKeyInvalidTangentMode",
-    comment:
-      "Fix-up for FRichCurveKey::TangentWeightMode, which were found to contain invalid value w.r.t the enum-type",
-    value: 64,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "ForceUpdateAnimationAssetCurveTangents",
-    comment:
-      "Enforcing new automatic tangent behaviour, enforcing auto-tangents for Key0 and KeyN to be flat, for Animation Assets.",
-    value: 65,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "SoundWaveVirtualizationUpdate",
-    comment: "SoundWave Update to use EditorBuildData for it's RawData",
-    value: 66,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "MaterialFeatureLevelNodeFixForSM6",
-    comment: "Fix material feature level nodes to account for new SM6 input pin.",
-    value: 67,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "GeometryCollectionPerChildDamageThreshold",
-    comment: "Fix material feature level nodes to account for new SM6 input pin.",
-    value: 68,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "AddRigidParticleControlFlags",
-    comment: "Move some Chaos flags into a bitfield",
-    value: 69,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "LiveLinkComponentPickerPerController",
-    comment: "Allow each LiveLink controller to specify its own component to control",
-    value: 70,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "RemoveTriangleMeshBVHFaces",
-    comment: "Remove Faces in Triangle Mesh BVH",
-    value: 71,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "LensComponentNodalOffset",
-    comment: "Moving all nodal offset handling to Lens Component",
-    value: 72,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "FixGpuAlwaysRunningUpdateScriptNoneInterpolated",
-    comment: "GPU none interpolated spawning no longer calls the update script",
-    value: 73,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionSerializeStreamingPolicyOnCook",
-    comment: "World partition streaming policy serialization only for cooked builds",
-    value: 74,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionActorDescRemoveBoundsRelevantSerialization",
-    comment: "Remove serialization of bounds relevant from WorldPartitionActorDesc",
-    value: 75,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "AnimationDataModelInterface_BackedOut",
-    comment: "will be unable to be loaded",
-    value: 76,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "LandscapeSplineActorDescDeprecation",
-    comment: "Deprecate LandscapeSplineActorDesc",
-    value: 77,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "BackoutAnimationDataModelInterface",
-    comment: "Revert the IAnimationDataModel changes. Animation assets",
-    value: 78,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "MobileStationaryLocalLights",
-    comment: "Made stationary local and skylights behave similar to SM5",
-    value: 79,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "ManagedArrayCollectionAlwaysSerializeValue",
-    comment: "Made ManagedArrayCollection::FValueType::Value always serialize when FValueType is",
-    value: 80,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "LensComponentDistortion",
-    comment: "Moving all distortion handling to Lens Component",
-    value: 81,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "ImgMediaPathResolutionWithEngineOrProjectTokens",
-    comment: "Updated image media source path resolution logic",
-    value: 82,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "AddLowResolutionHeightField",
-    comment: "Add low resolution data in Height Field",
-    value: 83,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "DecreaseLowResolutionHeightField",
-    comment: "Low resolution data in Height Field will store one height for (6x6) 36 cells",
-    value: 84,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "GeometryCollectionDamagePropagationData",
-    comment: "Add damage propagation settings to geometry collections",
-    value: 85,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "VehicleFrictionForcePositionChange",
-    comment: "Wheel friction forces are now applied at tire contact point",
-    value: 86,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "AddSetMeshDeformerFlag",
-    comment: "Add flag to override MeshDeformer on a SkinnedMeshComponent.",
-    value: 87,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "WorldPartitionActorDescActorAndClassPaths",
-    comment: "Replace FNames for class/actor paths with FSoftObjectPath",
-    value: 88,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "ReintroduceAnimationDataModelInterface",
-    comment: "Reintroducing AnimationDataModelInterface_BackedOut changes",
-    value: 89,
-    firstAppearance: "5.2.0",
-  }),
-  new VersionDetails({
-    name: "IncreasedSkinWeightPrecision",
-    comment: "Support 16-bit skin weights on SkeletalMesh",
-    value: 90,
-    firstAppearance: "5.2.0",
-  }),
-  new VersionDetails({
-    name: "MaterialHasIsUsedWithVolumetricCloudFlag",
-    comment: "bIsUsedWithVolumetricCloud flag auto conversion",
-    value: 91,
-    firstAppearance: "5.2.0",
-  }),
-  new VersionDetails({
-    name: "UpdateHairDescriptionBulkData",
-    comment: "bIsUsedWithVolumetricCloud flag auto conversion",
-    value: 92,
-    firstAppearance: "5.2.0",
-  }),
-  new VersionDetails({
-    name: "SpawnActorFromClassTransformScaleMethod",
-    comment: "Added TransformScaleMethod pin to SpawnActorFromClass node",
-    value: 93,
-    firstAppearance: "5.2.0",
-  }),
-  new VersionDetails({
-    name: "RigVMLazyEvaluation",
-    comment: "Added support for the RigVM to run branches lazily",
-    value: 94,
-    firstAppearance: "5.2.0",
-  }),
-  new VersionDetails({
-    name: "PoseAssetRawDataGUIDUpdate",
-    comment: "Adding additional object version to defer out-of-date pose asset warning until next resaves",
-    value: 95,
-    firstAppearance: "5.2.0",
-  }),
-  new VersionDetails({
-    name: "RigVMSaveFunctionAccessInModel",
-    comment: "Store function information (and compilation data) in blueprint generated class",
-    value: 96,
-    firstAppearance: "5.2.0",
-  }),
-  new VersionDetails({
-    name: "RigVMSerializeExecuteContextStruct",
-    comment: "Store the RigVM execute context struct the VM uses in the archive",
-    value: 97,
-    firstAppearance: "5.2.0",
-  }),
-  new VersionDetails({
-    name: "VisualLoggerTimeStampAsDouble",
-    comment: "Store the Visual Logger timestamp as a double",
-    value: 98,
-    firstAppearance: "5.2.0",
-  }),
-  new VersionDetails({
-    name: "MaterialInstanceBasePropertyOverridesThinSurface",
-    comment: "Add ThinSurface instance override support",
-    value: 99,
-    firstAppearance: "5.2.0",
-  }),
-  new VersionDetails({
-    name: "MaterialRefractionModeNone",
-    comment: "Add refraction mode None, converted from legacy when the refraction pin is not plugged.",
-    value: 100,
-    firstAppearance: "5.2.0",
-  }),
-  new VersionDetails({
-    name: "RigVMSaveSerializedGraphInGraphFunctionData",
-    comment: "Store serialized graph function in the function data",
-    value: 101,
-    firstAppearance: "5.2.0",
-  }),
-  new VersionDetails({
-    name: "PerPlatformAnimSequenceTargetFrameRate",
-    comment: "Animation Sequence now stores its frame-rate on a per-platform basis",
-    value: 102,
-    firstAppearance: "5.2.0",
-  }),
-  new VersionDetails({
-    name: "NiagaraGrid2DDefaultUnnamedAttributesZero",
-    comment: "New default for number of attributes on 2d grids",
-    value: 103,
-    firstAppearance: "5.2.0",
-  }),
-  new VersionDetails({
-    name: "RigVMGeneratedClass",
-    comment: "RigVM generated class refactor",
-    value: 104,
-    firstAppearance: "5.2.0",
-  }),
-  new VersionDetails({
-    name: "NullPinSubCategoryObjectFix",
-    comment: "In certain cases, Blueprint pins with a PC_Object category would serialize a null PinSubCategoryObject",
-    value: 105,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "AccessSpecifiersForCustomEvents",
-    comment: "Allow custom event nodes to use access specifiers",
-    value: 106,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "GroomAssetWidthOverride",
-    comment: "Explicit override of Groom's hair width",
-    value: 107,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "AnimationRemoveSmartNames",
-    comment: "Smart names removed from animation systems",
-    value: 108,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "NiagaraSpriteRendererFacingAlignmentAutoDefault",
-    comment: "Change the default for facing & alignment to be automatic",
-    value: 109,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "GroomAssetRemoveInAssetSerialization",
-    comment: "Change the default for facing & alignment to be automatic",
-    value: 110,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "IncreaseMaterialAttributesInputMask",
-    comment: "Changed the material property connected bitmasks from 32bit to 64bit",
-    value: 111,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "NiagaraSimStageNumIterationsBindings",
-    comment: "Combines proprties into a new binding so users can select constant or binding",
-    value: 112,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "SkeletalVertexAttributes",
-    comment: "Skeletal vertex attributes",
-    value: 113,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "RigVMExternalExecuteContextStruct",
-    comment: "Store the RigVM execute context struct the VM uses in the archive",
-    value: 114,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "DataflowSeparateInputOutputSerialization",
-    comment: "serialization inputs and outputs as two different sections",
-    value: 115,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "ClothCollectionTetherInitialization",
-    comment: "Cloth collection tether initialization",
-    value: 116,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "OpenColorIOAssetCacheSerialization",
-    comment:
-      "OpenColorIO transforms now serialize their generated texture(s) and shader code normally into the uasset.",
-    value: 117,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "ClothCollectionSingleLodSchema",
-    comment: "Cloth collection single lod schema",
-    value: 118,
-    firstAppearance: "5.3.0",
-  }),
-  new VersionDetails({
-    name: "VisualLoggerAddedSeparateWorldTime",
-    comment:
-      "Visual Logger format now includes a WorldTimeStamp in addition to TimeStamp for easier debugging between multiple instances.",
-    value: 119,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "SkinnedMeshInstanceDataSerializationV2",
-    comment: "Added support for InstanceDataManagerSerialization and changed format for the instances to FTransform3f",
-    value: 120,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "RuntimeVirtualTextureMaterialValidation",
-    comment: "Added new material compilation validation for runtime virtual textures",
-    value: 121,
-    firstAppearance: "5.6.0",
-  }),
-];
+export const FUE5MainStreamObjectVersionDetails = new LazyVersionDetails({
+  releases: ["5.0.0", "5.1.0", "5.2.0", "5.3.0", "5.4.0", "5.6.0"],
+  names: [
+    "BeforeCustomVersionWasAdded",
+    "GeometryCollectionNaniteData",
+    "GeometryCollectionNaniteDDC",
+    "RemovingSourceAnimationData",
+    "MeshDescriptionNewFormat",
+    "PartitionActorDescSerializeGridGuid",
+    "ExternalActorsMapDataPackageFlag",
+    "AnimationAddedBlendProfileModes",
+    "WorldPartitionActorDescSerializeDataLayers",
+    "RenamingAnimationNumFrames",
+    "WorldPartitionHLODActorDescSerializeHLODLayer",
+    "GeometryCollectionNaniteCooked",
+    "AddedCookedBoolFontFaceAssets",
+    "WorldPartitionHLODActorDescSerializeCellHash",
+    "GeometryCollectionNaniteTransient",
+    "AddedLandscapeSplineActorDesc",
+    "AddCollisionConstraintFlag",
+    "MantleDbSerialize",
+    "AnimSyncGroupsExplicitSyncMethod",
+    "FLandscapeActorDescFixupGridIndices",
+    "FoliageTypeIncludeInHLOD",
+    "IntroducingAnimationDataModel",
+    "WorldPartitionActorDescSerializeActorLabel",
+    "WorldPartitionActorDescSerializeArchivePersistent",
+    "FixForceExternalActorLevelReferenceDuplicates",
+    "SerializeMeshDescriptionBase",
+    "ConvexUsesVerticesArray",
+    "WorldPartitionActorDescSerializeHLODInfo",
+    "AddDisabledFlag",
+    "MoveCustomAttributesToDataModel",
+    "BlendSpaceRuntimeTriangulation",
+    "BlendSpaceSmoothingImprovements",
+    "RemovingTessellationParameters",
+    "SparseClassDataStructSerialization",
+    "PackedLevelInstanceBoundsFix",
+    "AnimNodeConstantDataRefactorPhase0",
+    "MaterialSavedCachedData",
+    "RemoveDecalBlendMode",
+    "DirLightsAreAtmosphereLightsByDefault",
+    "WorldPartitionStreamingCellsNamingShortened",
+    "WorldPartitionActorDescGetStreamingBounds",
+    "MeshDescriptionVirtualization",
+    "TextureSourceVirtualization",
+    "RigVMCopyOpStoreNumBytes",
+    "MaterialTranslucencyPass",
+    "GeometryCollectionUserDefinedCollisionShapes",
+    "RemovedAtmosphericFog",
+    "SkyAtmosphereAffectsHeightFogWithBetterDefault",
+    "BlendSpaceSampleOrdering",
+    "GeometryCollectionCacheRemovesMassToLocal",
+    "EdGraphPinSourceIndex",
+    "VirtualizedBulkDataHaveUniqueGuids",
+    "RigVMMemoryStorageObject",
+    "RayTracedShadowsType",
+    "SkelMeshSectionVisibleInRayTracingFlagAdded",
+    "AnimGraphNodeTaggingAdded",
+    "DynamicMeshCompactedSerialization",
+    "ConvertReductionBaseSkeletalMeshBulkDataToInlineReductionCacheData",
+    "SkeletalMeshLODModelMeshInfo",
+    "TextureDoScaleMipsForAlphaCoverage",
+    "VolumetricCloudReflectionSampleCountDefaultUpdate",
+    "UseTriangleMeshBVH",
+    "DynamicMeshAttributesWeightMapsAndNames",
+    "FKControlNamingScheme",
+    "RichCurveKeyInvalidTangentMode",
+    "ForceUpdateAnimationAssetCurveTangents",
+    "SoundWaveVirtualizationUpdate",
+    "MaterialFeatureLevelNodeFixForSM6",
+    "GeometryCollectionPerChildDamageThreshold",
+    "AddRigidParticleControlFlags",
+    "LiveLinkComponentPickerPerController",
+    "RemoveTriangleMeshBVHFaces",
+    "LensComponentNodalOffset",
+    "FixGpuAlwaysRunningUpdateScriptNoneInterpolated",
+    "WorldPartitionSerializeStreamingPolicyOnCook",
+    "WorldPartitionActorDescRemoveBoundsRelevantSerialization",
+    "AnimationDataModelInterface_BackedOut",
+    "LandscapeSplineActorDescDeprecation",
+    "BackoutAnimationDataModelInterface",
+    "MobileStationaryLocalLights",
+    "ManagedArrayCollectionAlwaysSerializeValue",
+    "LensComponentDistortion",
+    "ImgMediaPathResolutionWithEngineOrProjectTokens",
+    "AddLowResolutionHeightField",
+    "DecreaseLowResolutionHeightField",
+    "GeometryCollectionDamagePropagationData",
+    "VehicleFrictionForcePositionChange",
+    "AddSetMeshDeformerFlag",
+    "WorldPartitionActorDescActorAndClassPaths",
+    "ReintroduceAnimationDataModelInterface",
+    "IncreasedSkinWeightPrecision",
+    "MaterialHasIsUsedWithVolumetricCloudFlag",
+    "UpdateHairDescriptionBulkData",
+    "SpawnActorFromClassTransformScaleMethod",
+    "RigVMLazyEvaluation",
+    "PoseAssetRawDataGUIDUpdate",
+    "RigVMSaveFunctionAccessInModel",
+    "RigVMSerializeExecuteContextStruct",
+    "VisualLoggerTimeStampAsDouble",
+    "MaterialInstanceBasePropertyOverridesThinSurface",
+    "MaterialRefractionModeNone",
+    "RigVMSaveSerializedGraphInGraphFunctionData",
+    "PerPlatformAnimSequenceTargetFrameRate",
+    "NiagaraGrid2DDefaultUnnamedAttributesZero",
+    "RigVMGeneratedClass",
+    "NullPinSubCategoryObjectFix",
+    "AccessSpecifiersForCustomEvents",
+    "GroomAssetWidthOverride",
+    "AnimationRemoveSmartNames",
+    "NiagaraSpriteRendererFacingAlignmentAutoDefault",
+    "GroomAssetRemoveInAssetSerialization",
+    "IncreaseMaterialAttributesInputMask",
+    "NiagaraSimStageNumIterationsBindings",
+    "SkeletalVertexAttributes",
+    "RigVMExternalExecuteContextStruct",
+    "DataflowSeparateInputOutputSerialization",
+    "ClothCollectionTetherInitialization",
+    "OpenColorIOAssetCacheSerialization",
+    "ClothCollectionSingleLodSchema",
+    "VisualLoggerAddedSeparateWorldTime",
+    "SkinnedMeshInstanceDataSerializationV2",
+    "RuntimeVirtualTextureMaterialValidation",
+  ],
+  values: [
+    0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31,
+    32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60,
+    61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89,
+    90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114,
+    115, 116, 117, 118, 119, 120, 121,
+  ],
+  comments: [
+    "Before any version changes were made",
+    "Nanite data added to Chaos geometry collections",
+    "Nanite Geometry Collection data moved to DDC",
+    "Removing SourceAnimationData, animation layering is now applied during compression",
+    "This is the correct versioning for MeshDescription changes which were added to ReleaseObjectVersion.",
+    "Serialize GridGuid in PartitionActorDesc",
+    "Set PKG_ContainsMapData on external actor packages",
+    "Added a new configurable BlendProfileMode that the user can setup to control the behavior of blend profiles.",
+    "Serialize DataLayers in WorldPartitionActorDesc",
+    "Renaming UAnimSequence::NumFrames to NumberOfKeys, as that what is actually contains.",
+    "Serialize HLODLayer in WorldPartition HLODActorDesc",
+    "Fixed Nanite Geometry Collection cooked data",
+    "Added bCooked to UFontFace assets",
+    "Serialize CellHash in WorldPartition HLODActorDesc",
+    "Nanite data is now transient in Geometry Collection similar to how RenderData is transient in StaticMesh.",
+    "Added FLandscapeSplineActorDesc",
+    "Added support for per-object collision constraint flag. [Chaos]",
+    "Initial Mantle Serialize Version",
+    "Animation sync groups explicitly specify sync method",
+    "Fixup FLandscapeActorDesc Grid indices",
+    "FoliageType with HLOD support",
+    "Introducing UAnimDataModel sub-object for UAnimSequenceBase containing all animation source data",
+    "Serialize ActorLabel in WorldPartitionActorDesc",
+    "Fix WorldPartitionActorDesc serialization archive not persistent",
+    "Fix potentially duplicated actors when using ForceExternalActorLevelReference",
+    "Make UMeshDescriptionBase serializable",
+    "Chaos FConvex uses array of FVec3s for vertices instead of particles",
+    "Serialize HLOD info in WorldPartitionActorDesc",
+    "Expose particle Disabled flag to the game thread",
+    "Moving animation custom attributes from AnimationSequence to UAnimDataModel",
+    "Use of triangulation at runtime in BlendSpace",
+    "Fix to the Cubic smoothing, plus introduction of new smoothing types",
+    "Removing Tessellation parameters from Materials",
+    "Sparse class data serializes its associated structure to allow for BP types to be used",
+    "PackedLevelInstance bounds fix",
+    "Initial set of anim nodes converted to use constants held in sparse class data",
+    "Explicitly serialized bSavedCachedExpressionData for Material(Instance)",
+    "Remove explicit decal blend mode",
+    "Made directional lights be atmosphere lights by default",
+    "Changed how world partition streaming cells are named",
+    "Changed how actor descriptors compute their bounds",
+    "Switch FMeshDescriptionBulkData to use virtualized bulkdata",
+    "Switch FTextureSource to use virtualized bulkdata",
+    "RigVM to store more information alongside the Copy Operator",
+    "Expanded separate translucency into multiple passes",
+    "Chaos FGeometryCollectionObject user defined collision shapes support",
+    "Removed the AtmosphericFog component with conversion to SkyAtmosphere component",
+    "The SkyAtmosphere now light up the heightfog by default, and by default the height fog has a black color.",
+    "Ordering of samples in BlendSpace",
+    "No longer bake MassToLocal transform into recorded transform data in GeometryCollection caching",
+    "UEdGraphPin serializes SourceIndex",
+    "Change texture bulkdatas to have unique guids",
+    "Introduce RigVM Memory Class Object",
+    "Ray tracing shadows have three states now (Disabled, Use Project Settings, Enabled)",
+    "Add bVisibleInRayTracing flag to Skeletal Mesh Sections",
+    "Add generic tagging of all anim graph nodes in anim blueprints",
+    "Add custom version to FDynamicMesh3",
+    "Remove the inline reduction bulkdata and replace it by a simple vertex and triangle count cache",
+    "Added some new MeshInfo to the FSkeletalMeshLODModel class.",
+    "Add Texture DoScaleMipsForAlphaCoverage",
+    "Fixed default value of volumetric cloud to be exact match with main view, more expenssive but we let user choosing how to lower the quality.",
+    "Use special BVH for TriangleMesh, instead of the AABBTree",
+    "FDynamicMeshAttributeSet has Weight Maps. TDynamicAttributeBase serializes its name.",
+    "Switching FK control naming scheme to incorporate _CURVE for curve controls",
+    "Fix-up for FRichCurveKey::TangentWeightMode, which were found to contain invalid value w.r.t the enum-type",
+    "Enforcing new automatic tangent behaviour, enforcing auto-tangents for Key0 and KeyN to be flat, for Animation Assets.",
+    "SoundWave Update to use EditorBuildData for it's RawData",
+    "Fix material feature level nodes to account for new SM6 input pin.",
+    "Move some Chaos flags into a bitfield",
+    "Allow each LiveLink controller to specify its own component to control",
+    "Remove Faces in Triangle Mesh BVH",
+    "Moving all nodal offset handling to Lens Component",
+    "GPU none interpolated spawning no longer calls the update script",
+    "World partition streaming policy serialization only for cooked builds",
+    "Remove serialization of bounds relevant from WorldPartitionActorDesc",
+    "will be unable to be loaded",
+    "Deprecate LandscapeSplineActorDesc",
+    "Revert the IAnimationDataModel changes. Animation assets",
+    "Made stationary local and skylights behave similar to SM5",
+    "Made ManagedArrayCollection::FValueType::Value always serialize when FValueType is",
+    "Moving all distortion handling to Lens Component",
+    "Updated image media source path resolution logic",
+    "Add low resolution data in Height Field",
+    "Low resolution data in Height Field will store one height for (6x6) 36 cells",
+    "Add damage propagation settings to geometry collections",
+    "Wheel friction forces are now applied at tire contact point",
+    "Add flag to override MeshDeformer on a SkinnedMeshComponent.",
+    "Replace FNames for class/actor paths with FSoftObjectPath",
+    "Reintroducing AnimationDataModelInterface_BackedOut changes",
+    "Support 16-bit skin weights on SkeletalMesh",
+    "bIsUsedWithVolumetricCloud flag auto conversion",
+    "Added TransformScaleMethod pin to SpawnActorFromClass node",
+    "Added support for the RigVM to run branches lazily",
+    "Adding additional object version to defer out-of-date pose asset warning until next resaves",
+    "Store function information (and compilation data) in blueprint generated class",
+    "Store the RigVM execute context struct the VM uses in the archive",
+    "Store the Visual Logger timestamp as a double",
+    "Add ThinSurface instance override support",
+    "Add refraction mode None, converted from legacy when the refraction pin is not plugged.",
+    "Store serialized graph function in the function data",
+    "Animation Sequence now stores its frame-rate on a per-platform basis",
+    "New default for number of attributes on 2d grids",
+    "RigVM generated class refactor",
+    "In certain cases, Blueprint pins with a PC_Object category would serialize a null PinSubCategoryObject",
+    "Allow custom event nodes to use access specifiers",
+    "Explicit override of Groom's hair width",
+    "Smart names removed from animation systems",
+    "Change the default for facing & alignment to be automatic",
+    "Changed the material property connected bitmasks from 32bit to 64bit",
+    "Combines proprties into a new binding so users can select constant or binding",
+    "Skeletal vertex attributes",
+    "serialization inputs and outputs as two different sections",
+    "Cloth collection tether initialization",
+    "OpenColorIO transforms now serialize their generated texture(s) and shader code normally into the uasset.",
+    "Cloth collection single lod schema",
+    "Visual Logger format now includes a WorldTimeStamp in addition to TimeStamp for easier debugging between multiple instances.",
+    "Added support for InstanceDataManagerSerialization and changed format for the instances to FTransform3f",
+    "Added new material compilation validation for runtime virtual textures",
+  ],
+  commentIndexes: [
+    0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31,
+    32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60,
+    61, 62, 63, 64, 65, 66, 67, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88,
+    89, 90, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 107, 108, 109, 110, 95, 111,
+    112, 113, 114, 115, 116, 117,
+  ],
+  firstAppearances: [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+    3, 3, 4, 5, 5,
+  ],
+  lastAppearances: [
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1,
+  ],
+});
 
 export const FUE5MainStreamObjectVersionGuid = new CustomVersionGuid<FUE5MainStreamObjectVersion>({
   name: "FUE5MainStreamObjectVersion",
   guid: FGuid.fromComponents(0x697dd581, 0xe64f41ab, 0xaa4a51ec, 0xbeb7b628),
   details: FUE5MainStreamObjectVersionDetails,
 });
+
+export default FUE5MainStreamObjectVersionGuid;
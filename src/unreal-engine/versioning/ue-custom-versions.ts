@@ -3,21 +3,49 @@
 // noinspection JSUnusedGlobalSymbols
 //
 
-import { FAnimObjectVersionGuid } from "./custom-versions-enums/FAnimObjectVersion";
-import { FAnimPhysObjectVersionGuid } from "./custom-versions-enums/FAnimPhysObjectVersion";
-import { FEditorObjectVersionGuid } from "./custom-versions-enums/FEditorObjectVersion";
-import { FEnterpriseObjectVersionGuid } from "./custom-versions-enums/FEnterpriseObjectVersion";
-import { FFortniteMainBranchObjectVersionGuid } from "./custom-versions-enums/FFortniteMainBranchObjectVersion";
-import { FFrameworkObjectVersionGuid } from "./custom-versions-enums/FFrameworkObjectVersion";
-import { FUE5MainStreamObjectVersionGuid } from "./custom-versions-enums/FUE5MainStreamObjectVersion";
-import type { CustomVersionGuid } from "./CustomVersionGuid";
+import { CustomVersionIndex } from "./CustomVersionGuid";
 
-export const allCustomVersions: ReadonlyArray<CustomVersionGuid> = [
-  FAnimObjectVersionGuid,
-  FAnimPhysObjectVersionGuid,
-  FEditorObjectVersionGuid,
-  FEnterpriseObjectVersionGuid,
-  FFortniteMainBranchObjectVersionGuid,
-  FFrameworkObjectVersionGuid,
-  FUE5MainStreamObjectVersionGuid,
-];
+export const customVersionIndex = new CustomVersionIndex([
+  {
+    guid: [0xaf43a65d, 0x7fd34947, 0x98733e8e, 0xd9c1bb05],
+    name: "FAnimObjectVersion",
+    latestVersion: 15,
+    load: () => import("./custom-versions-enums/FAnimObjectVersion"),
+  },
+  {
+    guid: [0x29e575dd, 0xe0a34627, 0x9d10d276, 0x232cdcea],
+    name: "FAnimPhysObjectVersion",
+    latestVersion: 17,
+    load: () => import("./custom-versions-enums/FAnimPhysObjectVersion"),
+  },
+  {
+    guid: [0xe4b068ed, 0xf49442e9, 0xa231da0b, 0x2e46bb41],
+    name: "FEditorObjectVersion",
+    latestVersion: 40,
+    load: () => import("./custom-versions-enums/FEditorObjectVersion"),
+  },
+  {
+    guid: [0x9dffbcd6, 0x494f0158, 0xe2211282, 0x3c92a888],
+    name: "FEnterpriseObjectVersion",
+    latestVersion: 11,
+    load: () => import("./custom-versions-enums/FEnterpriseObjectVersion"),
+  },
+  {
+    guid: [0x601d1886, 0xac644f84, 0xaa16d3de, 0x0deac7d6],
+    name: "FFortniteMainBranchObjectVersion",
+    latestVersion: 225,
+    load: () => import("./custom-versions-enums/FFortniteMainBranchObjectVersion"),
+  },
+  {
+    guid: [0xcffc743f, 0x43b04480, 0x939114df, 0x171d2073],
+    name: "FFrameworkObjectVersion",
+    latestVersion: 37,
+    load: () => import("./custom-versions-enums/FFrameworkObjectVersion"),
+  },
+  {
+    guid: [0x697dd581, 0xe64f41ab, 0xaa4a51ec, 0xbeb7b628],
+    name: "FUE5MainStreamObjectVersion",
+    latestVersion: 121,
+    load: () => import("./custom-versions-enums/FUE5MainStreamObjectVersion"),
+  },
+]);
@@ -3,2743 +3,975 @@
 // noinspection JSUnusedGlobalSymbols
 //
 
-import { VersionDetails } from "./CustomVersionGuid";
+import { LazyVersionDetails } from "./CustomVersionGuid";
 
-export const versionsDetails: VersionDetails[] = [
-  new VersionDetails({
-    name: "VER_UE4_ADD_PINTYPE_ARRAY",
-    comment: "Added array support to blueprints",
-    value: 108,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVE_REDUNDANT_KEY",
-    comment: "Remove redundant key from raw animation data",
-    value: 109,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SUPPORT_LARGE_SHADERS",
-    comment: "Changing from WORDs to UINTs in the shader cache serialization, needs a new version",
-    value: 110,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FUNCTIONS_IN_SHADERMAPID",
-    comment: "Added material functions to FMaterialShaderMapId",
-    value: 111,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ASSET_REGISTRY_TAGS",
-    comment:
-      "Added asset registry tags to the package summary so the editor can learn more about the assets in the package without loading it",
-    value: 112,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_DONTSORTCATEGORIES_REMOVED",
-    comment: "Removed DontSortCategories option to classes",
-    value: 113,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_TILED_NAVMESH",
-    comment: "Added Tiled navmesh generation and redone navmesh serialization",
-    value: 114,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVED_OLD_NAVMESH",
-    comment: "Removed old pylon-based navigation mesh system",
-    value: 115,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ANIMNOTIFY_NAMECHANGE",
-    comment: "AnimNotify name change",
-    value: 116,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CONSOLIDATE_HEADER_PARSER_ONLY_PROPERTIES",
-    comment: "Removed/consolidated some properties used only in the header parser that should never be serialized",
-    value: 117,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_STOPPED_SERIALIZING_COMPONENTNAMETODEFAULTOBJECTMAP",
-    comment: "Made ComponentNameToDefaultObjectMap non-serialized",
-    value: 118,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_RESET_MODIFYFREQUENCY_STATICLIGHTS",
-    comment: "Reset ModifyFrequency on static lights",
-    value: 119,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADD_SOUNDNODEWAVE_GUID",
-    comment: "Add a GUID to SoundNodeWave",
-    value: 120,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADD_SOUNDNODEWAVE_TO_DDC",
-    comment: "Add audio to DDC",
-    value: 121,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_MATERIAL_BLEND_OVERRIDE",
-    comment: "- Fix for Material Blend Mode override",
-    value: 122,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADD_COOKED_TO_SOUND_NODE_WAVE",
-    comment: "Ability to save cooked audio",
-    value: 123,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_TEXTURE_DERIVED_DATA2",
-    comment: "Update the derived data key for textures.",
-    value: 124,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADD_COOKED_TO_TEXTURE2D",
-    comment: "Textures can now be cooked into packages",
-    value: 125,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADD_COOKED_TO_BODY_SETUP",
-    comment: "Ability to save cooked PhysX meshes",
-    value: 126,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADD_KISMETNETWORKGRAPHS",
-    comment: "Blueprint saved before this may need Event Graph change to Local/Server Graph",
-    value: 127,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_MATERIAL_QUALITY_LEVEL_SWITCH",
-    comment: "- Added material quality level switches",
-    value: 128,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_DEBUG_MATERIALSHADER_UNIFORM_EXPRESSIONS",
-    comment: "- Debugging material shader uniform expression sets.",
-    value: 129,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVED_STRIP_DATA",
-    comment: "Removed StripData",
-    value: 130,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FLAG_SCS_TRANSACTIONAL",
-    comment: "Setting RF_Transactional object flag on blueprint's SimpleConstructionScript",
-    value: 131,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_NX_DESTRUCTIBLE_ASSET_CHUNK_BOUNDS_FIX",
-    comment: "- Fixing chunk bounding boxes in imported NxDestructibleAssets.",
-    value: 132,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_STATIC_MESH_SOCKETS",
-    comment: "Add support for StaticMesh sockets",
-    value: 133,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVE_EXTRA_SKELMESH_VERTEX_INFLUENCES",
-    comment: "- Removed extra skelmesh vert weights",
-    value: 134,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_UCURVE_USING_RICHCURVES",
-    comment: "- Change UCurve objects to use FRichCurve",
-    value: 135,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_INLINE_SHADERS",
-    comment: "Add support for inline shaders",
-    value: 136,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADDITIVE_TYPE_CHANGE",
-    comment: "Change additive types to include mesh rotation only to be baked",
-    value: 137,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_READD_COOKER",
-    comment: "Readd cooker versioning to package",
-    value: 138,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADDED_SCRIPT_SERIALIZATION_FOR_BLUEPRINT_GENERATED_CLASSES",
-    comment: "Serialize class properties",
-    value: 139,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_VARIABLE_BITFIELD_SIZE",
-    comment: "Variable UBoolProperty size.",
-    value: 140,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FIX_REQUIRED_BONES",
-    comment: "Fix skeletons which only list active bones in their required bones list.",
-    value: 141,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_COOKED_PACKAGE_VERSION_IS_PACKAGE_VERSION",
-    comment: "Switched 'cooked package' version to simply be the package version itself.",
-    value: 142,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_TEXTURE_SOURCE_ART_REFACTOR",
-    comment: "Refactor how texture source art is stored to better isolate editor-only data.",
-    value: 143,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADDED_EXTRA_MESH_OPTIMIZATION_SETTINGS",
-    comment:
-      "Add additional settings to static and skeletal mesh optimization struct (FStaticMeshOptimizationSettings and FSkeletalMeshOptimizationSettings)",
-    value: 144,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_DESTRUCTIBLE_MESH_BODYSETUP_HOLDS_PHYSICAL_MATERIAL",
-    comment: "Add BodySetup to DestructibleMesh, use it to store the destructible physical material.",
-    value: 145,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVE_USEQUENCE",
-    comment: "Remove USequence class and references",
-    value: 146,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADD_PINTYPE_BYREF",
-    comment: "Added by-ref parameters to blueprints",
-    value: 147,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_PUBLIC_BLUEPRINT_VARS_READONLY",
-    comment: "Change to make public blueprint variables 'read only'",
-    value: 148,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_VISIBILITY_FLAG_CHANGES",
-    comment: "change HiddenGame, DrawInGame, DrawInEditor to bVisible, and bHiddenInGame",
-    value: 149,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVE_COMPONENT_ENABLED_FLAG",
-    comment: "change Light/Fog/Blur bEnable to use bVisible",
-    value: 150,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CONFORM_COMPONENT_ACTIVATE_FLAG",
-    comment: "change Particle/Audio/Thrust/RadialForce bEnable/bAutoPlay to use bAutoActivate",
-    value: 151,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADD_SKELMESH_MESHTOIMPORTVERTEXMAP",
-    comment: "make the 'mesh to import vertex map' in skelmesh always loaded so it can be used by vertex anim",
-    value: 152,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVE_UE3_864_SERIALIZATION",
-    comment: "remove serialization for properties added with UE3 version 864 serialization",
-    value: 153,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SH_LIGHTMAPS",
-    comment: "Spherical harmonic lightmaps",
-    value: 154,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVED_PERSHADER_DDC",
-    comment: "Removed per-shader DDC entries",
-    value: 155,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CORE_SPLIT",
-    comment: "Core split into Core and CoreUObject",
-    value: 156,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVED_FMATERIAL_COMPILE_OUTPUTS",
-    comment: "Removed some compile outputs being stored in FMaterial",
-    value: 157,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_PHYSICAL_MATERIAL_MODEL",
-    comment: "New physical material model",
-    value: 158,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADDED_MATERIALSHADERMAP_USAGE",
-    comment: "Added a usage to FMaterialShaderMapId",
-    value: 159,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_BLUEPRINT_PROPERTYFLAGS_SIZE_CHANGE",
-    comment: "Covert blueprint PropertyFlags from int32 to uint64",
-    value: 160,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CONSOLIDATE_SKINNEDMESH_UPDATE_FLAGS",
-    comment: "Consolidate UpdateSkelWhenNotRendered and TickAnimationWhenNotRendered to enum",
-    value: 161,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVE_INTERNAL_ARCHETYPE",
-    comment: "Remove Internal Archetype",
-    value: 162,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVE_ARCHETYPE_INDEX_FROM_LINKER_TABLES",
-    comment: "Remove Internal Archetype",
-    value: 163,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_VARK2NODE_NULL_VARSRCCLASS_ON_SELF",
-    comment: "Made change to UK2Node_Variable so that VariableSourceClass is NULL if bSelfContext is TRUE",
-    value: 164,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVED_SPECULAR_BOOST",
-    comment: "Removed SpecularBoost",
-    value: 165,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADD_KISMETVISIBLE",
-    comment: "Add CPF_BlueprintVisible flag",
-    value: 166,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_MOVE_DISTRIBUITONS_TO_POSTINITPROPS",
-    comment: "UDistribution* objects moved to PostInitProperties.",
-    value: 167,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SHADOW_ONLY_INDEX_BUFFERS",
-    comment: "Add optimized shadow-only index buffers to static meshes.",
-    value: 168,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CHANGED_VOLUME_SAMPLE_FORMAT",
-    comment: "Changed indirect lighting volume sample format",
-    value: 169,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CHANGE_BENABLECOLLISION_TO_COLLISIONENABLED",
-    value: 170,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CHANGED_IRRELEVANT_LIGHT_GUIDS",
-    comment: "Changed irrelevant light guids",
-    value: 171,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_RENAME_DISABLEALLRIGIDBODIES",
-    value: 172,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SOUND_NODE_ATTENUATION_SETTINGS_CHANGE",
-    comment: "Unified SoundNodeAttenuation settings with other attenuation settings",
-    value: 173,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADD_EDGRAPHNODE_GUID",
-    comment: "Add a NodeGuid to EdGraphNode, upping version to generate for existing nodes",
-    value: 174,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FIX_INTERPDATA_OUTERS",
-    comment: "Fix the outer of InterpData objects",
-    value: 175,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_BLUEPRINT_NATIVE_SERIALIZATION",
-    comment: "Natively serialize blueprint core classes",
-    value: 176,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SOUND_NODE_INHERIT_FROM_ED_GRAPH_NODE",
-    comment: "Inherit SoundNode from EdGraphNOde",
-    value: 177,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_UNIFY_AMBIENT_SOUND_ACTORS",
-    comment: "Unify ambient sound actor classes in to single ambient actor class",
-    value: 178,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_LIGHTMAP_COMPRESSION",
-    comment: "Lightmap compression",
-    value: 179,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_MORPHTARGET_CURVE_INTEGRATION",
-    comment: "MorphTarget data type integration to curve",
-    value: 180,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CLEAR_STANDALONE_FROM_LEVEL_SCRIPT_BLUEPRINTS",
-    comment: "Fix LevelScriptBlueprints being standalone",
-    value: 181,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_NO_INTERFACE_PROPERTY",
-    comment: "Natively serialize blueprint core classes",
-    value: 182,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CATEGORY_MOVED_TO_METADATA",
-    comment: "Category field moved to metadata.",
-    value: 183,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVE_CTOR_LINK",
-    comment: "We removed the ctor link flag, this just clears this flag on load for future use",
-    value: 184,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVE_SHORT_PACKAGE_NAME_ASSOCIATIONS",
-    comment: "Short to long package name associations removal.",
-    value: 185,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADD_CREATEDBYCONSTRUCTIONSCRIPT",
-    comment: "Add bCreatedByConstructionScript flag to ActorComponent",
-    value: 186,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_NX_DESTRUCTIBLE_ASSET_AUTHORING_LOAD_FIX",
-    comment: "Fix loading of bogus NxDestructibleAssetAuthoring",
-    value: 187,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ANGULAR_CONSTRAINT_OPTIONS",
-    comment: "Added angular constraint options",
-    value: 188,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CHANGE_MATERIAL_EXPRESSION_CONSTANTS_TO_LINEARCOLOR",
-    value: 189,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_PRIMITIVE_BUILT_LIGHTING_FLAG",
-    comment: "Added built lighting flag to primitive component",
-    value: 190,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ATMOSPHERIC_FOG_CACHE_TEXTURE",
-    comment: "Added Counter for atmospheric fog",
-    value: 191,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_PRECOMPUTED_SHADOW_MAPS",
-    comment: "Ressurrected precomputed shadowmaps",
-    value: 192,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_MODULATOR_CONTINUOUS_NO_DISTRIBUTION",
-    comment: "Eliminated use of distribution for USoundNodeModulatorContinuous",
-    value: 193,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_PACKAGE_MAGIC_POSTTAG",
-    comment: "Added a 4-byte magic number at the end of the package for file corruption validation",
-    value: 194,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_TOSS_IRRELEVANT_LIGHTS",
-    comment: "Discard invalid irrelevant lights",
-    value: 195,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVE_NET_INDEX",
-    comment: "Removed NetIndex",
-    value: 196,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_BLUEPRINT_CDO_MIGRATION",
-    comment: "Moved blueprint authoritative data from Skeleton CDO to the Generated CDO",
-    value: 197,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_BULKDATA_AT_LARGE_OFFSETS",
-    comment: "Bulkdata is stored at the end of package files and can be located at offsets > 2GB",
-    value: 198,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_EXPLICIT_STREAMING_TEXTURE_BUILT",
-    comment: "Explicitly track whether streaming texture data has been built",
-    value: 199,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_PRECOMPUTED_SHADOW_MAPS_BSP",
-    comment: "Precomputed shadowmaps on bsp and landscape",
-    value: 200,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_STATIC_MESH_REFACTOR",
-    comment: "Refactor of static mesh build pipeline.",
-    value: 201,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVE_CACHED_STATIC_MESH_STREAMING_FACTORS",
-    comment: "Remove cached static mesh streaming texture factors. They have been moved to derived data.",
-    value: 202,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ATMOSPHERIC_FOG_MATERIAL",
-    comment: "Added Atmospheric fog Material support",
-    value: 203,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FIX_BSP_BRUSH_TYPE",
-    comment: "Fixup BSP brush type",
-    value: 204,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVE_CLIENTDESTROYEDACTORCONTENT",
-    comment: "Removed ClientDestroyedActorContent from UWorld",
-    value: 205,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SOUND_CUE_GRAPH_EDITOR",
-    comment: "Added SoundCueGraph for new SoundCue editor",
-    value: 206,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_STRIP_TRANS_LEVEL_MOVE_BUFFER",
-    comment: "Strip TransLevelMoveBuffers out of Worlds",
-    value: 207,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_DEPRECATED_BNOENCROACHCHECK",
-    comment: "Deprecated PrimitiveComponent.bNoEncroachCheck",
-    value: 208,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_LIGHTS_USE_IES_BRIGHTNESS_DEFAULT_CHANGED",
-    comment: "Light component bUseIESBrightness now defaults to false",
-    value: 209,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_MATERIAL_ATTRIBUTES_MULTIPLEX",
-    comment: "Material attributes multiplex",
-    value: 210,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_TEXTURE_FORMAT_RGBA_SWIZZLE",
-    comment: "Renamed & moved TSF_RGBA8/E8 to TSF_BGRA8/E8",
-    value: 211,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SUMMARY_HAS_BULKDATA_OFFSET",
-    comment: "Package summary stores the offset to the beginning of the area where the bulkdata gets stored */",
-    value: 212,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_DEFAULT_ROOT_COMP_TRANSACTIONAL",
-    comment:
-      "The SimpleConstructionScript now marks the default root component as transactional, and bCreatedByConstructionScript true",
-    value: 213,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_HASHED_MATERIAL_OUTPUT",
-    comment: "Hashed material compile output stored in packages to detect mismatches",
-    value: 214,
-    firstAppearance: "4.0.1",
-    lastAppearance: "4.6.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_BLUEPRINT_VARS_NOT_READ_ONLY",
-    comment: "Removed restriction on blueprint-exposed variables from being read-only",
-    value: 215,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_STATIC_MESH_STORE_NAV_COLLISION",
-    comment: "Added manually serialized element to UStaticMesh (precalculated nav collision)",
-    value: 216,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ATMOSPHERIC_FOG_DECAY_NAME_CHANGE",
-    comment: "Changed property name for atmospheric fog",
-    value: 217,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SCENECOMP_TRANSLATION_TO_LOCATION",
-    comment: "Change many properties/functions from Translation to Location",
-    value: 218,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_MATERIAL_ATTRIBUTES_REORDERING",
-    comment: "Material attributes reordering",
-    value: 219,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_COLLISION_PROFILE_SETTING",
-    comment: "Collision Profile setting has been added, and all components that exists has to be properly upgraded",
-    value: 220,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_BLUEPRINT_SKEL_TEMPORARY_TRANSIENT",
-    comment: "Making the blueprint's skeleton class transient",
-    value: 221,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_BLUEPRINT_SKEL_SERIALIZED_AGAIN",
-    comment: "Making the blueprint's skeleton class serialized again",
-    value: 222,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_BLUEPRINT_SETS_REPLICATION",
-    comment: "Blueprint now controls replication settings again",
-    value: 223,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_WORLD_LEVEL_INFO",
-    comment: "Added level info used by World browser",
-    value: 224,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_AFTER_CAPSULE_HALF_HEIGHT_CHANGE",
-    comment: "Changed capsule height to capsule half-height (afterwards)",
-    value: 225,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADDED_NAMESPACE_AND_KEY_DATA_TO_FTEXT",
-    comment: "Added Namepace, GUID (Key) and Flags to FText",
-    value: 226,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ATTENUATION_SHAPES",
-    comment: "Attenuation shapes",
-    value: 227,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_LIGHTCOMPONENT_USE_IES_TEXTURE_MULTIPLIER_ON_NON_IES_BRIGHTNESS",
-    comment: "Use IES texture multiplier even when IES brightness is not being used",
-    value: 228,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVE_INPUT_COMPONENTS_FROM_BLUEPRINTS",
-    comment: "Removed InputComponent as a blueprint addable component",
-    value: 229,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_VARK2NODE_USE_MEMBERREFSTRUCT",
-    comment: "Use an FMemberReference struct in UK2Node_Variable",
-    value: 230,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REFACTOR_MATERIAL_EXPRESSION_SCENECOLOR_AND_SCENEDEPTH_INPUTS",
-    comment:
-      "Refactored material expression inputs for UMaterialExpressionSceneColor and UMaterialExpressionSceneDepth",
-    value: 231,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SPLINE_MESH_ORIENTATION",
-    comment: "Spline meshes changed from Z forwards to configurable",
-    value: 232,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REVERB_EFFECT_ASSET_TYPE",
-    comment: "Added ReverbEffect asset type",
-    value: 233,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_MAX_TEXCOORD_INCREASED",
-    comment: "changed max texcoords from 4 to 8",
-    value: 234,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SPEEDTREE_STATICMESH",
-    comment: "static meshes changed to support SpeedTrees",
-    value: 235,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_LANDSCAPE_COMPONENT_LAZY_REFERENCES",
-    comment: "Landscape component reference between landscape component and collision component",
-    value: 236,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SWITCH_CALL_NODE_TO_USE_MEMBER_REFERENCE",
-    comment: "Refactored UK2Node_CallFunction to use FMemberReference",
-    value: 237,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADDED_SKELETON_ARCHIVER_REMOVAL",
-    comment: "Added fixup step to remove skeleton class references from blueprint objects",
-    value: 238,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADDED_SKELETON_ARCHIVER_REMOVAL_SECOND_TIME",
-    comment: "See above, take 2.",
-    value: 239,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_BLUEPRINT_SKEL_CLASS_TRANSIENT_AGAIN",
-    comment: "Making the skeleton class on blueprints transient",
-    value: 240,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADD_COOKED_TO_UCLASS",
-    comment: "UClass knows if it's been cooked",
-    value: 241,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_DEPRECATED_STATIC_MESH_THUMBNAIL_PROPERTIES_REMOVED",
-    comment: "Deprecated static mesh thumbnail properties were removed",
-    value: 242,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_COLLECTIONS_IN_SHADERMAPID",
-    comment: "Added collections in material shader map ids",
-    value: 243,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REFACTOR_MOVEMENT_COMPONENT_HIERARCHY",
-    comment: "Renamed some Movement Component properties, added PawnMovementComponent",
-    value: 244,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FIX_TERRAIN_LAYER_SWITCH_ORDER",
-    comment: "Swap UMaterialExpressionTerrainLayerSwitch::LayerUsed/LayerNotUsed the correct way round",
-    value: 245,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ALL_PROPS_TO_CONSTRAINTINSTANCE",
-    comment: "Remove URB_ConstraintSetup",
-    value: 246,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_LOW_QUALITY_DIRECTIONAL_LIGHTMAPS",
-    comment: "Low quality directional lightmaps",
-    value: 247,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADDED_NOISE_EMITTER_COMPONENT",
-    comment: "Added NoiseEmitterComponent and removed related Pawn properties.",
-    value: 248,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADD_TEXT_COMPONENT_VERTICAL_ALIGNMENT",
-    comment: "Add text component vertical alignment",
-    value: 249,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADDED_FBX_ASSET_IMPORT_DATA",
-    comment: "Added AssetImportData for FBX asset types, deprecating SourceFilePath and SourceFileTimestamp",
-    value: 250,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVE_LEVELBODYSETUP",
-    comment: "Remove LevelBodySetup from ULevel",
-    value: 251,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REFACTOR_CHARACTER_CROUCH",
-    comment: "Refactor character crouching",
-    value: 252,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SMALLER_DEBUG_MATERIALSHADER_UNIFORM_EXPRESSIONS",
-    comment: "Trimmed down material shader debug information.",
-    value: 253,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_APEX_CLOTH",
-    comment: "APEX Clothing",
-    value: 254,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SAVE_COLLISIONRESPONSE_PER_CHANNEL",
-    comment: "we should rename to match ECollisionChannel",
-    value: 255,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADDED_LANDSCAPE_SPLINE_EDITOR_MESH",
-    comment: "Added Landscape Spline editor meshes",
-    value: 256,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CHANGED_MATERIAL_REFACTION_TYPE",
-    comment: "Fixup input expressions for reading from refraction material attributes.",
-    value: 257,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REFACTOR_PROJECTILE_MOVEMENT",
-    comment: "Refactor projectile movement, along with some other movement component work.",
-    value: 258,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVE_PHYSICALMATERIALPROPERTY",
-    comment: "Remove PhysicalMaterialProperty and replace with user defined enum",
-    value: 259,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_PURGED_FMATERIAL_COMPILE_OUTPUTS",
-    comment: "Removed all compile outputs from FMaterial",
-    value: 260,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADD_COOKED_TO_LANDSCAPE",
-    comment: "Ability to save cooked PhysX meshes to Landscape",
-    value: 261,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CONSUME_INPUT_PER_BIND",
-    comment: "Change how input component consumption works",
-    value: 262,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SOUND_CLASS_GRAPH_EDITOR",
-    comment: "Added new Graph based SoundClass Editor",
-    value: 263,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FIXUP_TERRAIN_LAYER_NODES",
-    comment: "Fixed terrain layer node guids which was causing artifacts",
-    value: 264,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_RETROFIT_CLAMP_EXPRESSIONS_SWAP",
-    comment: "Added clamp min/max swap check to catch older materials",
-    value: 265,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVE_LIGHT_MOBILITY_CLASSES",
-    comment: "Remove static/movable/stationary light classes",
-    value: 266,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REFACTOR_PHYSICS_BLENDING",
-    comment: "Refactor the way physics blending works to allow partial blending",
-    value: 267,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_WORLD_LEVEL_INFO_UPDATED",
-    comment: "WorldLevelInfo: Added reference to parent level and streaming distance",
-    value: 268,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_STATIC_SKELETAL_MESH_SERIALIZATION_FIX",
-    comment: "Fixed cooking of skeletal/static meshes due to bad serialization logic",
-    value: 269,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVE_STATICMESH_MOBILITY_CLASSES",
-    comment: "Removal of InterpActor and PhysicsActor",
-    value: 270,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REFACTOR_PHYSICS_TRANSFORMS",
-    comment: "Refactor physics transforms",
-    value: 271,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVE_ZERO_TRIANGLE_SECTIONS",
-    comment: "Remove zero triangle sections from static meshes and compact material indices.",
-    value: 272,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CHARACTER_MOVEMENT_DECELERATION",
-    comment: "Add param for deceleration in character movement instead of using acceleration.",
-    value: 273,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CAMERA_ACTOR_USING_CAMERA_COMPONENT",
-    comment: "Made ACameraActor use a UCameraComponent for parameter storage, etc...",
-    value: 274,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CHARACTER_MOVEMENT_DEPRECATE_PITCH_ROLL",
-    comment: "Deprecated some pitch/roll properties in CharacterMovementComponent",
-    value: 275,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REBUILD_TEXTURE_STREAMING_DATA_ON_LOAD",
-    comment: "Rebuild texture streaming data on load for uncooked builds",
-    value: 276,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SUPPORT_32BIT_STATIC_MESH_INDICES",
-    comment: "Add support for 32 bit index buffers for static meshes.",
-    value: 277,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADDED_CHUNKID_TO_ASSETDATA_AND_UPACKAGE",
-    comment: "Added streaming install ChunkID to AssetData and UPackage",
-    value: 278,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CHARACTER_DEFAULT_MOVEMENT_BINDINGS",
-    comment: "Add flag to control whether Character blueprints receive default movement bindings.",
-    value: 279,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_APEX_CLOTH_LOD",
-    comment: "APEX Clothing LOD Info",
-    value: 280,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ATMOSPHERIC_FOG_CACHE_DATA",
-    comment: "Added atmospheric fog texture data to be general",
-    value: 281,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VAR_UE4_ARRAY_PROPERTY_INNER_TAGS",
-    comment: "Arrays serialize their inner's tags",
-    value: 282,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_KEEP_SKEL_MESH_INDEX_DATA",
-    comment: "Skeletal mesh index data is kept in memory in game to support mesh merging.",
-    value: 283,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_BODYSETUP_COLLISION_CONVERSION",
-    comment: "Added compatibility for the body instance collision change",
-    value: 284,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REFLECTION_CAPTURE_COOKING",
-    comment: "Reflection capture cooking",
-    value: 285,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVE_DYNAMIC_VOLUME_CLASSES",
-    comment: "Removal of DynamicTriggerVolume, DynamicBlockingVolume, DynamicPhysicsVolume",
-    value: 286,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_STORE_HASCOOKEDDATA_FOR_BODYSETUP",
-    comment: "Store an additional flag in the BodySetup to indicate whether there is any cooked data to load",
-    value: 287,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REFRACTION_BIAS_TO_REFRACTION_DEPTH_BIAS",
-    comment: "Changed name of RefractionBias to RefractionDepthBias.",
-    value: 288,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVE_SKELETALPHYSICSACTOR",
-    comment: "Removal of SkeletalPhysicsActor",
-    value: 289,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_PC_ROTATION_INPUT_REFACTOR",
-    comment: "PlayerController rotation input refactor",
-    value: 290,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_LANDSCAPE_PLATFORMDATA_COOKING",
-    comment: "Landscape Platform Data cooking",
-    value: 291,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CREATEEXPORTS_CLASS_LINKING_FOR_BLUEPRINTS",
-    comment: "Added call for linking classes in CreateExport to ensure memory is initialized properly",
-    value: 292,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVE_NATIVE_COMPONENTS_FROM_BLUEPRINT_SCS",
-    comment: "Remove native component nodes from the blueprint SimpleConstructionScript",
-    value: 293,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVE_SINGLENODEINSTANCE",
-    comment: "Removal of Single Node Instance",
-    value: 294,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CHARACTER_BRAKING_REFACTOR",
-    comment: "Character movement braking changes",
-    value: 295,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_VOLUME_SAMPLE_LOW_QUALITY_SUPPORT",
-    comment: "Supported low quality lightmaps in volume samples",
-    value: 296,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SPLIT_TOUCH_AND_CLICK_ENABLES",
-    comment: "Split bEnableTouchEvents out from bEnableClickEvents",
-    value: 297,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_HEALTH_DEATH_REFACTOR",
-    comment: "Health/Death refactor",
-    value: 298,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SOUND_NODE_ENVELOPER_CURVE_CHANGE",
-    comment: "Moving USoundNodeEnveloper from UDistributionFloatConstantCurve to FRichCurve",
-    value: 299,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_POINT_LIGHT_SOURCE_RADIUS",
-    comment: "Moved SourceRadius to UPointLightComponent",
-    value: 300,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SCENE_CAPTURE_CAMERA_CHANGE",
-    comment: "Scene capture actors based on camera actors.",
-    value: 301,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_MOVE_SKELETALMESH_SHADOWCASTING",
-    comment: "Moving SkeletalMesh shadow casting flag from LoD details to material",
-    value: 302,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CHANGE_SETARRAY_BYTECODE",
-    comment: "Changing bytecode operators for creating arrays",
-    value: 303,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_MATERIAL_INSTANCE_BASE_PROPERTY_OVERRIDES",
-    comment: "Material Instances overriding base material properties.",
-    value: 304,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_COMBINED_LIGHTMAP_TEXTURES",
-    comment: "Combined top/bottom lightmap textures",
-    value: 305,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_BUMPED_MATERIAL_EXPORT_GUIDS",
-    comment: "Forced material lightmass guids to be regenerated",
-    value: 306,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_BLUEPRINT_INPUT_BINDING_OVERRIDES",
-    comment: "Allow overriding of parent class input bindings",
-    value: 307,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FIXUP_BODYSETUP_INVALID_CONVEX_TRANSFORM",
-    comment: "Fix up convex invalid transform",
-    value: 308,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FIXUP_STIFFNESS_AND_DAMPING_SCALE",
-    comment: "Fix up scale of physics stiffness and damping value",
-    value: 309,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REFERENCE_SKELETON_REFACTOR",
-    comment: "Convert USkeleton and FBoneContrainer to using FReferenceSkeleton.",
-    value: 310,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_K2NODE_REFERENCEGUIDS",
-    comment: "Adding references to variable, function, and macro nodes to be able to update to renamed values",
-    value: 311,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FIXUP_ROOTBONE_PARENT",
-    comment: "Fix up the 0th bone's parent bone index.",
-    value: 312,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_TEXT_RENDER_COMPONENTS_WORLD_SPACE_SIZING",
-    comment: "Allow setting of TextRenderComponents size in world space.",
-    value: 313,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_MATERIAL_INSTANCE_BASE_PROPERTY_OVERRIDES_PHASE_2",
-    comment: "Material Instances overriding base material properties #2.",
-    value: 314,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CLASS_NOTPLACEABLE_ADDED",
-    comment: "CLASS_Placeable becomes CLASS_NotPlaceable",
-    value: 315,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_WORLD_LEVEL_INFO_LOD_LIST",
-    comment: "Added LOD info list to a world tile description",
-    value: 316,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CHARACTER_MOVEMENT_VARIABLE_RENAMING_1",
-    comment: "CharacterMovement variable naming refactor",
-    value: 317,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FSLATESOUND_CONVERSION",
-    comment: "FName properties containing sound names converted to FSlateSound properties",
-    value: 318,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_WORLD_LEVEL_INFO_ZORDER",
-    comment: "Added ZOrder to a world tile description",
-    value: 319,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_PACKAGE_REQUIRES_LOCALIZATION_GATHER_FLAGGING",
-    comment: "Added flagging of localization gather requirement to packages",
-    value: 320,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_BP_ACTOR_VARIABLE_DEFAULT_PREVENTING",
-    comment: "Preventing Blueprint Actor variables from having default values",
-    value: 321,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_TEST_ANIMCOMP_CHANGE",
-    comment: "Preventing Blueprint Actor variables from having default values",
-    value: 322,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_EDITORONLY_BLUEPRINTS",
-    comment: "Class as primary asset, name convention changed",
-    value: 323,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_EDGRAPHPINTYPE_SERIALIZATION",
-    comment: "Custom serialization for FEdGraphPinType",
-    value: 324,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_NO_MIRROR_BRUSH_MODEL_COLLISION",
-    comment: "Stop generating 'mirrored' cooked mesh for Brush and Model components",
-    value: 325,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CHANGED_CHUNKID_TO_BE_AN_ARRAY_OF_CHUNKIDS",
-    comment: "Changed ChunkID to be an array of IDs.",
-    value: 326,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_WORLD_NAMED_AFTER_PACKAGE",
-    comment: 'Worlds have been renamed from "TheWorld" to be named after the package containing them',
-    value: 327,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SKY_LIGHT_COMPONENT",
-    comment: "Added sky light component",
-    value: 328,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_WORLD_LAYER_ENABLE_DISTANCE_STREAMING",
-    comment: "Added Enable distance streaming flag to FWorldTileLayer",
-    value: 329,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVE_ZONES_FROM_MODEL",
-    comment: "Remove visibility/zone information from UModel",
-    value: 330,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FIX_ANIMATIONBASEPOSE_SERIALIZATION",
-    comment: "Fix base pose serialization",
-    value: 331,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SUPPORT_8_BONE_INFLUENCES_SKELETAL_MESHES",
-    comment: "Support for up to 8 skinning influences per vertex on skeletal meshes (on non-gpu vertices)",
-    value: 332,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADD_OVERRIDE_GRAVITY_FLAG",
-    comment: "Add explicit bOverrideGravity to world settings",
-    value: 333,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SUPPORT_GPUSKINNING_8_BONE_INFLUENCES",
-    comment: "Support for up to 8 skinning influences per vertex on skeletal meshes (on gpu vertices)",
-    value: 334,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ANIM_SUPPORT_NONUNIFORM_SCALE_ANIMATION",
-    comment: "Supporting nonuniform scale animation",
-    value: 335,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ENGINE_VERSION_OBJECT",
-    comment: "Engine version is stored as a FEngineVersion object rather than changelist number",
-    value: 336,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_PUBLIC_WORLDS",
-    comment: "World assets now have RF_Public",
-    value: 337,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SKELETON_GUID_SERIALIZATION",
-    comment: "Skeleton Guid",
-    value: 338,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CHARACTER_MOVEMENT_WALKABLE_FLOOR_REFACTOR",
-    comment: "Character movement WalkableFloor refactor",
-    value: 339,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_INVERSE_SQUARED_LIGHTS_DEFAULT",
-    comment: "Lights default to inverse squared",
-    value: 340,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_DISABLED_SCRIPT_LIMIT_BYTECODE",
-    comment: "Disabled SCRIPT_LIMIT_BYTECODE_TO_64KB",
-    value: 341,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_PRIVATE_REMOTE_ROLE",
-    comment: "Made remote role private, exposed bReplicates",
-    value: 342,
-    firstAppearance: "4.0.1",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FOLIAGE_STATIC_MOBILITY",
-    comment: "Fix up old foliage components to have static mobility (superseded by VER_UE4_FOLIAGE_MOVABLE_MOBILITY)",
-    value: 343,
-    firstAppearance: "4.1.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_BUILD_SCALE_VECTOR",
-    comment: "Change BuildScale from a float to a vector",
-    value: 344,
-    firstAppearance: "4.1.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FOLIAGE_COLLISION",
-    comment: "After implementing foliage collision, need to disable collision on old foliage instances",
-    value: 345,
-    firstAppearance: "4.1.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SKY_BENT_NORMAL",
-    comment: "Added sky bent normal to indirect lighting cache",
-    value: 346,
-    firstAppearance: "4.1.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_LANDSCAPE_COLLISION_DATA_COOKING",
-    comment: "Added cooking for landscape collision data",
-    value: 347,
-    firstAppearance: "4.1.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_MORPHTARGET_CPU_TANGENTZDELTA_FORMATCHANGE",
-    comment: "we still convert all to FVector in CPU time whenever any calculation",
-    value: 348,
-    firstAppearance: "4.1.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SOFT_CONSTRAINTS_USE_MASS",
-    comment: "Soft constraint limits will implicitly use the mass of the bodies",
-    value: 349,
-    firstAppearance: "4.1.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REFLECTION_DATA_IN_PACKAGES",
-    comment: "Reflection capture data saved in packages",
-    value: 350,
-    firstAppearance: "4.1.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FOLIAGE_MOVABLE_MOBILITY",
-    comment:
-      "Fix up old foliage components to have movable mobility (superseded by VER_UE4_FOLIAGE_STATIC_LIGHTING_SUPPORT)",
-    value: 351,
-    firstAppearance: "4.1.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_UNDO_BREAK_MATERIALATTRIBUTES_CHANGE",
-    comment: "Undo BreakMaterialAttributes changes as it broke old content",
-    value: 352,
-    firstAppearance: "4.1.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADD_CUSTOMPROFILENAME_CHANGE",
-    comment: "Now Default custom profile name isn't NONE anymore due to copy/paste not working properly with it",
-    value: 353,
-    firstAppearance: "4.2.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FLIP_MATERIAL_COORDS",
-    comment: "Permanently flip and scale material expression coordinates",
-    value: 354,
-    firstAppearance: "4.2.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_MEMBERREFERENCE_IN_PINTYPE",
-    comment: "PinSubCategoryMemberReference added to FEdGraphPinType",
-    value: 355,
-    firstAppearance: "4.2.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_VEHICLES_UNIT_CHANGE",
-    comment: "Vehicles use Nm for Torque instead of cm and RPM instead of rad/s",
-    value: 356,
-    firstAppearance: "4.2.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ANIMATION_REMOVE_NANS",
-    comment: "now importing should detect NaNs, so we should not have NaNs in source data",
-    value: 357,
-    firstAppearance: "4.2.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SKELETON_ASSET_PROPERTY_TYPE_CHANGE",
-    comment: "Change skeleton preview attached assets property type",
-    value: 358,
-    firstAppearance: "4.2.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FIX_BLUEPRINT_VARIABLE_FLAGS",
-    comment: "when they shouldn't",
-    value: 359,
-    firstAppearance: "4.2.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_VEHICLES_UNIT_CHANGE2",
-    comment:
-      "Vehicles use Nm for Torque instead of cm and RPM instead of rad/s part two (missed conversion for some variables",
-    value: 360,
-    firstAppearance: "4.2.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_UCLASS_SERIALIZE_INTERFACES_AFTER_LINKING",
-    comment: "Changed order of interface class serialization",
-    value: 361,
-    firstAppearance: "4.2.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_STATIC_MESH_SCREEN_SIZE_LODS",
-    comment: "Change from LOD distances to display factors",
-    value: 362,
-    firstAppearance: "4.2.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FIX_MATERIAL_COORDS",
-    comment: "Requires test of material coords to ensure they're saved correctly",
-    value: 363,
-    firstAppearance: "4.2.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SPEEDTREE_WIND_V7",
-    comment: "Changed SpeedTree wind presets to v7",
-    value: 364,
-    firstAppearance: "4.3.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_LOAD_FOR_EDITOR_GAME",
-    comment: "NeedsLoadForEditorGame added",
-    value: 365,
-    firstAppearance: "4.3.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SERIALIZE_RICH_CURVE_KEY",
-    comment: "Manual serialization of FRichCurveKey to save space",
-    value: 366,
-    firstAppearance: "4.3.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_MOVE_LANDSCAPE_MICS_AND_TEXTURES_WITHIN_LEVEL",
-    comment:
-      "Change the outer of ULandscapeMaterialInstanceConstants and Landscape-related textures to the level in which they reside",
-    value: 367,
-    firstAppearance: "4.3.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FTEXT_HISTORY",
-    comment: "FTexts have creation history data, removed Key, Namespaces, and SourceString",
-    value: 368,
-    firstAppearance: "4.3.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FIX_MATERIAL_COMMENTS",
-    comment: "Shift comments to the left to contain expressions properly",
-    value: 369,
-    firstAppearance: "4.3.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_STORE_BONE_EXPORT_NAMES",
-    comment:
-      "Bone names stored as FName means that we can't guarantee the correct case on export, now we store a separate string for export purposes only",
-    value: 370,
-    firstAppearance: "4.3.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_MESH_EMITTER_INITIAL_ORIENTATION_DISTRIBUTION",
-    comment: "changed mesh emitter initial orientation to distribution",
-    value: 371,
-    firstAppearance: "4.3.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_DISALLOW_FOLIAGE_ON_BLUEPRINTS",
-    comment: "Foliage on blueprints causes crashes",
-    value: 372,
-    firstAppearance: "4.3.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FIXUP_MOTOR_UNITS",
-    comment: "change motors to use revolutions per second instead of rads/second",
-    value: 373,
-    firstAppearance: "4.3.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_DEPRECATED_MOVEMENTCOMPONENT_MODIFIED_SPEEDS",
-    comment: 'deprecated MovementComponent functions including "ModifiedMaxSpeed" et al',
-    value: 374,
-    firstAppearance: "4.3.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_RENAME_CANBECHARACTERBASE",
-    comment: "rename CanBeCharacterBase",
-    value: 375,
-    firstAppearance: "4.3.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_GAMEPLAY_TAG_CONTAINER_TAG_TYPE_CHANGE",
-    comment:
-      "Change GameplayTagContainers to have FGameplayTags instead of FNames; Required to fix-up native serialization",
-    value: 376,
-    firstAppearance: "4.3.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FOLIAGE_SETTINGS_TYPE",
-    comment:
-      "Change from UInstancedFoliageSettings to UFoliageType, and change the api from being keyed on UStaticMesh* to UFoliageType*",
-    value: 377,
-    firstAppearance: "4.3.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_STATIC_SHADOW_DEPTH_MAPS",
-    comment: "Lights serialize static shadow depth maps",
-    value: 378,
-    firstAppearance: "4.3.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADD_TRANSACTIONAL_TO_DATA_ASSETS",
-    comment: "Add RF_Transactional to data assets, fixing undo problems when editing them",
-    value: 379,
-    firstAppearance: "4.3.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADD_LB_WEIGHTBLEND",
-    comment: "Change LB_AlphaBlend to LB_WeightBlend in ELandscapeLayerBlendType",
-    value: 380,
-    firstAppearance: "4.3.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADD_ROOTCOMPONENT_TO_FOLIAGEACTOR",
-    comment: "Add root component to an foliage actor, all foliage cluster components will be attached to a root",
-    value: 381,
-    firstAppearance: "4.3.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FIX_MATERIAL_PROPERTY_OVERRIDE_SERIALIZE",
-    comment: "FMaterialInstanceBasePropertyOverrides didn't use proper UObject serialize",
-    value: 382,
-    firstAppearance: "4.3.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADD_LINEAR_COLOR_SAMPLER",
-    comment: "Addition of linear color sampler. color sample type is changed to linear sampler if source texture !sRGB",
-    value: 383,
-    firstAppearance: "4.4.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADD_STRING_ASSET_REFERENCES_MAP",
-    comment: "Added StringAssetReferencesMap to support renames of FStringAssetReference properties.",
-    value: 384,
-    firstAppearance: "4.4.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_BLUEPRINT_USE_SCS_ROOTCOMPONENT_SCALE",
-    comment:
-      "Apply scale from SCS RootComponent details in the Blueprint Editor to new actor instances at construction time",
-    value: 385,
-    firstAppearance: "4.4.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_LEVEL_STREAMING_DRAW_COLOR_TYPE_CHANGE",
-    comment: "Changed level streaming to have a linear color since the visualization doesn't gamma correct.",
-    value: 386,
-    firstAppearance: "4.5.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CLEAR_NOTIFY_TRIGGERS",
-    comment: "Cleared end triggers from non-state anim notifies",
-    value: 387,
-    firstAppearance: "4.5.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SKELETON_ADD_SMARTNAMES",
-    comment: "Convert old curve names stored in anim assets into skeleton smartnames",
-    value: 388,
-    firstAppearance: "4.5.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADDED_CURRENCY_CODE_TO_FTEXT",
-    comment: "Added the currency code field to FTextHistory_AsCurrency",
-    value: 389,
-    firstAppearance: "4.5.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ENUM_CLASS_SUPPORT",
-    comment: "Added support for C++11 enum classes",
-    value: 390,
-    firstAppearance: "4.5.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FIXUP_WIDGET_ANIMATION_CLASS",
-    comment: "Fixup widget animation class",
-    value: 391,
-    firstAppearance: "4.5.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SOUND_COMPRESSION_TYPE_ADDED",
-    comment: "USoundWave objects now contain details about compression scheme used.",
-    value: 392,
-    firstAppearance: "4.5.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_AUTO_WELDING",
-    comment: "Bodies will automatically weld when attached",
-    value: 393,
-    firstAppearance: "4.5.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_RENAME_CROUCHMOVESCHARACTERDOWN",
-    comment: "Rename UCharacterMovementComponent::bCrouchMovesCharacterDown",
-    value: 394,
-    firstAppearance: "4.5.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_LIGHTMAP_MESH_BUILD_SETTINGS",
-    comment: "Lightmap parameters in FMeshBuildSettings",
-    value: 395,
-    firstAppearance: "4.5.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_RENAME_SM3_TO_ES3_1",
-    comment: "Rename SM3 to ES3_1 and updates featurelevel material node selector",
-    value: 396,
-    firstAppearance: "4.5.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_DEPRECATE_UMG_STYLE_ASSETS",
-    comment: "Deprecated separate style assets for use in UMG",
-    value: 397,
-    firstAppearance: "4.5.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_POST_DUPLICATE_NODE_GUID",
-    comment: "Duplicating Blueprints will regenerate NodeGuids after this version",
-    value: 398,
-    firstAppearance: "4.5.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_RENAME_CAMERA_COMPONENT_VIEW_ROTATION",
-    comment:
-      "Rename UCameraComponent::bUseControllerViewRotation to bUsePawnViewRotation (and change the default value)",
-    value: 399,
-    firstAppearance: "4.5.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CASE_PRESERVING_FNAME",
-    comment: "Changed FName to be case preserving",
-    value: 400,
-    firstAppearance: "4.5.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_RENAME_CAMERA_COMPONENT_CONTROL_ROTATION",
-    comment: "Rename UCameraComponent::bUsePawnViewRotation to bUsePawnControlRotation",
-    value: 401,
-    firstAppearance: "4.5.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FIX_REFRACTION_INPUT_MASKING",
-    comment: "Fix bad refraction material attribute masks",
-    value: 402,
-    firstAppearance: "4.6.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_GLOBAL_EMITTER_SPAWN_RATE_SCALE",
-    comment: "A global spawn rate for emitters.",
-    value: 403,
-    firstAppearance: "4.6.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CLEAN_DESTRUCTIBLE_SETTINGS",
-    comment: "Cleanup destructible mesh settings",
-    value: 404,
-    firstAppearance: "4.6.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CHARACTER_MOVEMENT_UPPER_IMPACT_BEHAVIOR",
-    comment:
-      "CharacterMovementComponent refactor of AdjustUpperHemisphereImpact and deprecation of some associated vars.",
-    value: 405,
-    firstAppearance: "4.6.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_BP_MATH_VECTOR_EQUALITY_USES_EPSILON",
-    comment:
-      'Changed Blueprint math equality functions for vectors and rotators to operate as a "nearly" equals rather than "exact"',
-    value: 406,
-    firstAppearance: "4.6.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FOLIAGE_STATIC_LIGHTING_SUPPORT",
-    comment: "Static lighting support was re-added to foliage, and mobility was returned to static",
-    value: 407,
-    firstAppearance: "4.6.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SLATE_COMPOSITE_FONTS",
-    comment: "Added composite fonts to Slate font info",
-    value: 408,
-    firstAppearance: "4.6.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVE_SAVEGAMESUMMARY",
-    comment: "Remove UDEPRECATED_SaveGameSummary, required for UWorld::Serialize",
-    value: 409,
-    firstAppearance: "4.6.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVE_SKELETALMESH_COMPONENT_BODYSETUP_SERIALIZATION",
-    comment: "Remove bodyseutp serialization from skeletal mesh component",
-    value: 410,
-    firstAppearance: "4.6.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SLATE_BULK_FONT_DATA",
-    comment: "Made Slate font data use bulk data to store the embedded font data",
-    value: 411,
-    firstAppearance: "4.6.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADD_PROJECTILE_FRICTION_BEHAVIOR",
-    comment: "Add new friction behavior in ProjectileMovementComponent.",
-    value: 412,
-    firstAppearance: "4.6.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_MOVEMENTCOMPONENT_AXIS_SETTINGS",
-    comment: "Add axis settings enum to MovementComponent.",
-    value: 413,
-    firstAppearance: "4.6.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_GRAPH_INTERACTIVE_COMMENTBUBBLES",
-    comment: "Switch to new interactive comments, requires boundry conversion to preserve previous states",
-    value: 414,
-    firstAppearance: "4.7.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_LANDSCAPE_SERIALIZE_PHYSICS_MATERIALS",
-    comment: "Landscape serializes physical materials for collision objects",
-    value: 415,
-    firstAppearance: "4.7.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_RENAME_WIDGET_VISIBILITY",
-    comment: "Rename Visiblity on widgets to Visibility",
-    value: 416,
-    firstAppearance: "4.7.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ANIMATION_ADD_TRACKCURVES",
-    comment: "add track curves for animation",
-    value: 417,
-    firstAppearance: "4.7.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_MONTAGE_BRANCHING_POINT_REMOVAL",
-    comment: "Removed BranchingPoints from AnimMontages and converted them to regular AnimNotifies.",
-    value: 418,
-    firstAppearance: "4.7.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_BLUEPRINT_ENFORCE_CONST_IN_FUNCTION_OVERRIDES",
-    comment: "Enforce const-correctness in Blueprint implementations of native C++ const class methods",
-    value: 419,
-    firstAppearance: "4.7.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADD_PIVOT_TO_WIDGET_COMPONENT",
-    comment: "Added pivot to widget components, need to load old versions as a 0,0 pivot, new default is 0.5,0.5",
-    value: 420,
-    firstAppearance: "4.7.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_PAWN_AUTO_POSSESS_AI",
-    comment:
-      "Added finer control over when AI Pawns are automatically possessed. Also renamed Pawn.AutoPossess to Pawn.AutoPossessPlayer indicate this was a setting for players and not AI.",
-    value: 421,
-    firstAppearance: "4.7.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FTEXT_HISTORY_DATE_TIMEZONE",
-    comment: "Added serialization of timezone to FTextHistory for AsDate operations.",
-    value: 422,
-    firstAppearance: "4.7.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SORT_ACTIVE_BONE_INDICES",
-    comment: "Sort ActiveBoneIndices on lods so that we can avoid doing it at run time",
-    value: 423,
-    firstAppearance: "4.7.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_PERFRAME_MATERIAL_UNIFORM_EXPRESSIONS",
-    comment: "Added per-frame material uniform expressions",
-    value: 424,
-    firstAppearance: "4.7.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_MIKKTSPACE_IS_DEFAULT",
-    comment: "Make MikkTSpace the default tangent space calculation method for static meshes.",
-    value: 425,
-    firstAppearance: "4.7.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_LANDSCAPE_GRASS_COOKING",
-    comment: "Only applies to cooked files, grass cooking support.",
-    value: 426,
-    firstAppearance: "4.7.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FIX_SKEL_VERT_ORIENT_MESH_PARTICLES",
-    comment: "Fixed code for using the bOrientMeshEmitters property.",
-    value: 427,
-    firstAppearance: "4.7.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_LANDSCAPE_STATIC_SECTION_OFFSET",
-    comment: "Do not change landscape section offset on load under world composition",
-    value: 428,
-    firstAppearance: "4.7.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADD_MODIFIERS_RUNTIME_GENERATION",
-    comment: "New options for navigation data runtime generation (static, modifiers only, dynamic)",
-    value: 429,
-    firstAppearance: "4.7.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_MATERIAL_MASKED_BLENDMODE_TIDY",
-    comment: "Tidied up material's handling of masked blend mode.",
-    value: 430,
-    firstAppearance: "4.7.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_MERGED_ADD_MODIFIERS_RUNTIME_GENERATION_TO_4_7_DEPRECATED",
-    comment:
-      "Original version of VER_UE4_MERGED_ADD_MODIFIERS_RUNTIME_GENERATION_TO_4_7; renumbered to prevent blocking promotion in main.",
-    value: 431,
-    firstAppearance: "4.7.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_AFTER_MERGED_ADD_MODIFIERS_RUNTIME_GENERATION_TO_4_7_DEPRECATED",
-    comment:
-      "Original version of VER_UE4_AFTER_MERGED_ADD_MODIFIERS_RUNTIME_GENERATION_TO_4_7; renumbered to prevent blocking promotion in main.",
-    value: 432,
-    firstAppearance: "4.7.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_MERGED_ADD_MODIFIERS_RUNTIME_GENERATION_TO_4_7",
-    comment: "After merging VER_UE4_ADD_MODIFIERS_RUNTIME_GENERATION into 4.7 branch",
-    value: 433,
-    firstAppearance: "4.7.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_AFTER_MERGING_ADD_MODIFIERS_RUNTIME_GENERATION_TO_4_7",
-    comment: "After merging VER_UE4_ADD_MODIFIERS_RUNTIME_GENERATION into 4.7 branch",
-    value: 434,
-    firstAppearance: "4.8.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SERIALIZE_LANDSCAPE_GRASS_DATA",
-    comment: "Landscape grass weightmap data is now generated in the editor and serialized.",
-    value: 435,
-    firstAppearance: "4.8.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_OPTIONALLY_CLEAR_GPU_EMITTERS_ON_INIT",
-    comment: "New property to optionally prevent gpu emitters clearing existing particles on Init().",
-    value: 436,
-    firstAppearance: "4.8.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SERIALIZE_LANDSCAPE_GRASS_DATA_MATERIAL_GUID",
-    comment: "Also store the Material guid with the landscape grass data",
-    value: 437,
-    firstAppearance: "4.8.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_BLUEPRINT_GENERATED_CLASS_COMPONENT_TEMPLATES_PUBLIC",
-    comment: "Make sure that all template components from blueprint generated classes are flagged as public",
-    value: 438,
-    firstAppearance: "4.8.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ACTOR_COMPONENT_CREATION_METHOD",
-    comment:
-      "Split out creation method on ActorComponents to distinguish between native, instance, and simple or user construction script",
-    value: 439,
-    firstAppearance: "4.8.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_K2NODE_EVENT_MEMBER_REFERENCE",
-    comment: "K2Node_Event now uses FMemberReference for handling references",
-    value: 440,
-    firstAppearance: "4.8.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_STRUCT_GUID_IN_PROPERTY_TAG",
-    comment: "FPropertyTag stores GUID of struct",
-    value: 441,
-    firstAppearance: "4.8.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVE_UNUSED_UPOLYS_FROM_UMODEL",
-    comment: "Remove unused UPolys from UModel cooked content",
-    value: 442,
-    firstAppearance: "4.8.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REBUILD_HIERARCHICAL_INSTANCE_TREES",
-    comment:
-      'This doesn\'t do anything except trigger a rebuild on HISMC cluster trees, in this case to get a good "occlusion query" level',
-    value: 443,
-    firstAppearance: "4.8.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_PACKAGE_SUMMARY_HAS_COMPATIBLE_ENGINE_VERSION",
-    comment: "Package summary includes an CompatibleWithEngineVersion field, separately to the version it's saved with",
-    value: 444,
-    firstAppearance: "4.8.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_TRACK_UCS_MODIFIED_PROPERTIES",
-    comment: "Track UCS modified properties on Actor Components",
-    value: 445,
-    firstAppearance: "4.8.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_LANDSCAPE_SPLINE_CROSS_LEVEL_MESHES",
-    comment:
-      "Allowed landscape spline meshes to be stored into landscape streaming levels rather than the spline's level",
-    value: 446,
-    firstAppearance: "4.8.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_DEPRECATE_USER_WIDGET_DESIGN_SIZE",
-    comment: "Deprecate the variables used for sizing in the designer on UUserWidget",
-    value: 447,
-    firstAppearance: "4.8.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADD_EDITOR_VIEWS",
-    comment: "Make the editor views array dynamically sized",
-    value: 448,
-    firstAppearance: "4.8.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FOLIAGE_WITH_ASSET_OR_CLASS",
-    comment: "Updated foliage to work with either FoliageType assets or blueprint classes",
-    value: 449,
-    firstAppearance: "4.8.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_BODYINSTANCE_BINARY_SERIALIZATION",
-    comment: "Allows PhysicsSerializer to serialize shapes and actors for faster load times",
-    value: 450,
-    firstAppearance: "4.8.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SERIALIZE_BLUEPRINT_EVENTGRAPH_FASTCALLS_IN_UFUNCTION",
-    comment: "Added fastcall data serialization directly in UFunction",
-    value: 451,
-    firstAppearance: "4.8.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_INTERPCURVE_SUPPORTS_LOOPING",
-    comment: "Changes to USplineComponent and FInterpCurve",
-    value: 452,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_MATERIAL_INSTANCE_BASE_PROPERTY_OVERRIDES_DITHERED_LOD_TRANSITION",
-    comment: "Material Instances overriding base material LOD transitions",
-    value: 453,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SERIALIZE_LANDSCAPE_ES2_TEXTURES",
-    comment: "Serialize ES2 textures separately rather than overwriting the properties used on other platforms",
-    value: 454,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CONSTRAINT_INSTANCE_MOTOR_FLAGS",
-    comment: "Constraint motor velocity is broken into per-component",
-    value: 455,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SERIALIZE_PINTYPE_CONST",
-    comment: "Serialize bIsConst in FEdGraphPinType",
-    value: 456,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_LIBRARY_CATEGORIES_AS_FTEXT",
-    comment:
-      "Change UMaterialFunction::LibraryCategories to LibraryCategoriesText (old assets were saved before auto-conversion of FArrayProperty was possible)",
-    value: 457,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SKIP_DUPLICATE_EXPORTS_ON_SAVE_PACKAGE",
-    comment: "Check for duplicate exports while saving packages.",
-    value: 458,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SERIALIZE_TEXT_IN_PACKAGES",
-    comment: "Pre-gathering of gatherable, localizable text in packages to optimize text gathering operation times",
-    value: 459,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADD_BLEND_MODE_TO_WIDGET_COMPONENT",
-    comment: "Added pivot to widget components, need to load old versions as a 0,0 pivot, new default is 0.5,0.5",
-    value: 460,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_NEW_LIGHTMASS_PRIMITIVE_SETTING",
-    comment: "Added lightmass primitive setting",
-    value: 461,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REPLACE_SPRING_NOZ_PROPERTY",
-    comment: "Deprecate NoZSpring property on spring nodes to be replaced with TranslateZ property",
-    value: 462,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_TIGHTLY_PACKED_ENUMS",
-    comment: "Keep enums tight and serialize their values as pairs of FName and value. Don't insert dummy values.",
-    value: 463,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ASSET_IMPORT_DATA_AS_JSON",
-    comment: "Changed Asset import data to serialize file meta data as JSON",
-    value: 464,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_TEXTURE_LEGACY_GAMMA",
-    comment: "Legacy gamma support for textures.",
-    value: 465,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADDED_NATIVE_SERIALIZATION_FOR_IMMUTABLE_STRUCTURES",
-    comment:
-      "Added WithSerializer for basic native structures like FVector, FColor etc to improve serialization performance",
-    value: 466,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_DEPRECATE_UMG_STYLE_OVERRIDES",
-    comment: "Deprecated attributes that override the style on UMG widgets",
-    value: 467,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_STATIC_SHADOWMAP_PENUMBRA_SIZE",
-    comment: "Shadowmap penumbra size stored",
-    value: 468,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_NIAGARA_DATA_OBJECT_DEV_UI_FIX",
-    comment: "Fix BC on Niagara effects from the data object and dev UI changes.",
-    value: 469,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FIXED_DEFAULT_ORIENTATION_OF_WIDGET_COMPONENT",
-    comment: "Fixed the default orientation of widget component so it faces down +x",
-    value: 470,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_REMOVED_MATERIAL_USED_WITH_UI_FLAG",
-    comment: "Removed bUsedWithUI flag from UMaterial and replaced it with a new material domain for UI",
-    value: 471,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CHARACTER_MOVEMENT_ADD_BRAKING_FRICTION",
-    comment: "Added braking friction separate from turning friction.",
-    value: 472,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_BSP_UNDO_FIX",
-    comment: "Removed TTransArrays from UModel",
-    value: 473,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_DYNAMIC_PARAMETER_DEFAULT_VALUE",
-    comment: "Added default value to dynamic parameter.",
-    value: 474,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_STATIC_MESH_EXTENDED_BOUNDS",
-    comment: "Added ExtendedBounds to StaticMesh",
-    value: 475,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADDED_NON_LINEAR_TRANSITION_BLENDS",
-    comment: "Added non-linear blending to anim transitions, deprecating old types",
-    value: 476,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_AO_MATERIAL_MASK",
-    comment: "AO Material Mask texture",
-    value: 477,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_NAVIGATION_AGENT_SELECTOR",
-    comment: "Replaced navigation agents selection with single structure",
-    value: 478,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_MESH_PARTICLE_COLLISIONS_CONSIDER_PARTICLE_SIZE",
-    comment: "Mesh particle collisions consider particle size.",
-    value: 479,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_BUILD_MESH_ADJ_BUFFER_FLAG_EXPOSED",
-    comment: "Adjacency buffer building no longer automatically handled based on triangle count, user-controlled",
-    value: 480,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_MAX_ANGULAR_VELOCITY_DEFAULT",
-    comment: "Change the default max angular velocity",
-    value: 481,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_APEX_CLOTH_TESSELLATION",
-    comment: "Build Adjacency index buffer for clothing tessellation",
-    value: 482,
-    firstAppearance: "4.9.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_DECAL_SIZE",
-    comment: "Added DecalSize member, solved backward compatibility",
-    value: 483,
-    firstAppearance: "4.11.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_KEEP_ONLY_PACKAGE_NAMES_IN_STRING_ASSET_REFERENCES_MAP",
-    comment: "Keep only package names in StringAssetReferencesMap",
-    value: 484,
-    firstAppearance: "4.11.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_COOKED_ASSETS_IN_EDITOR_SUPPORT",
-    comment: "Support sound cue not saving out editor only data",
-    value: 485,
-    firstAppearance: "4.11.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_DIALOGUE_WAVE_NAMESPACE_AND_CONTEXT_CHANGES",
-    comment: "Updated dialogue wave localization gathering logic.",
-    value: 486,
-    firstAppearance: "4.11.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_MAKE_ROT_RENAME_AND_REORDER",
-    comment: "Renamed MakeRot MakeRotator and rearranged parameters.",
-    value: 487,
-    firstAppearance: "4.11.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_K2NODE_VAR_REFERENCEGUIDS",
-    comment: "K2Node_Variable will properly have the VariableReference Guid set if available",
-    value: 488,
-    firstAppearance: "4.11.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SOUND_CONCURRENCY_PACKAGE",
-    comment: "Added support for sound concurrency settings structure and overrides",
-    value: 489,
-    firstAppearance: "4.11.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_USERWIDGET_DEFAULT_FOCUSABLE_FALSE",
-    comment: "Changing the default value for focusable user widgets to false",
-    value: 490,
-    firstAppearance: "4.11.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_BLUEPRINT_CUSTOM_EVENT_CONST_INPUT",
-    comment: "Custom event nodes implicitly set 'const' on array and non-array pass-by-reference input params",
-    value: 491,
-    firstAppearance: "4.11.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_USE_LOW_PASS_FILTER_FREQ",
-    comment: "Renamed HighFrequencyGain to LowPassFilterFrequency",
-    value: 492,
-    firstAppearance: "4.11.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_NO_ANIM_BP_CLASS_IN_GAMEPLAY_CODE",
-    comment: "UAnimBlueprintGeneratedClass can be replaced by a dynamic class. Use TSubclassOf<UAnimInstance> instead.",
-    value: 493,
-    firstAppearance: "4.11.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SCS_STORES_ALLNODES_ARRAY",
-    comment:
-      "The SCS keeps a list of all nodes in its hierarchy rather than recursively building it each time it is requested",
-    value: 494,
-    firstAppearance: "4.11.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FBX_IMPORT_DATA_RANGE_ENCAPSULATION",
-    comment: "Moved StartRange and EndRange in UFbxAnimSequenceImportData to use FInt32Interval",
-    value: 495,
-    firstAppearance: "4.11.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CAMERA_COMPONENT_ATTACH_TO_ROOT",
-    comment: "Adding a new root scene component to camera component",
-    value: 496,
-    firstAppearance: "4.11.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_INSTANCED_STEREO_UNIFORM_UPDATE",
-    comment: "Updating custom material expression nodes for instanced stereo implementation",
-    value: 497,
-    firstAppearance: "4.11.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_STREAMABLE_TEXTURE_MIN_MAX_DISTANCE",
-    comment: "Texture streaming min and max distance to handle HLOD",
-    value: 498,
-    firstAppearance: "4.11.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_INJECT_BLUEPRINT_STRUCT_PIN_CONVERSION_NODES",
-    comment: "Fixing up invalid struct-to-struct pin connections by injecting available conversion nodes",
-    value: 499,
-    firstAppearance: "4.12.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_INNER_ARRAY_TAG_INFO",
-    comment: "Saving tag data for Array Property's inner property",
-    value: 500,
-    firstAppearance: "4.12.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FIX_SLOT_NAME_DUPLICATION",
-    comment: "Fixed duplicating slot node names in skeleton due to skeleton preload on compile",
-    value: 501,
-    firstAppearance: "4.12.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_STREAMABLE_TEXTURE_AABB",
-    comment: "Texture streaming using AABBs instead of Spheres",
-    value: 502,
-    firstAppearance: "4.12.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_PROPERTY_GUID_IN_PROPERTY_TAG",
-    comment: "FPropertyTag stores GUID of property",
-    value: 503,
-    firstAppearance: "4.12.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_NAME_HASHES_SERIALIZED",
-    comment: "Name table hashes are calculated and saved out rather than at load time",
-    value: 504,
-    firstAppearance: "4.12.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_INSTANCED_STEREO_UNIFORM_REFACTOR",
-    comment: "Updating custom material expression nodes for instanced stereo implementation refactor",
-    value: 505,
-    firstAppearance: "4.13.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_COMPRESSED_SHADER_RESOURCES",
-    comment: "Added compression to the shader resource for memory savings",
-    value: 506,
-    firstAppearance: "4.14.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_PRELOAD_DEPENDENCIES_IN_COOKED_EXPORTS",
-    comment:
-      "Cooked files contain the dependency graph for the event driven loader (the serialization is largely independent of the use of the new loader)",
-    value: 507,
-    firstAppearance: "4.14.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_TemplateIndex_IN_COOKED_EXPORTS",
-    comment:
-      "Cooked files contain the TemplateIndex used by the event driven loader (the serialization is largely independent of the use of the new loader, i.e. this will be null if cooking for the old loader)",
-    value: 508,
-    firstAppearance: "4.14.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_PROPERTY_TAG_SET_MAP_SUPPORT",
-    comment: "FPropertyTag includes contained type(s) for Set and Map properties:",
-    value: 509,
-    firstAppearance: "4.15.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADDED_SEARCHABLE_NAMES",
-    comment: "Added SearchableNames to the package summary and asset registry",
-    value: 510,
-    firstAppearance: "4.15.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_64BIT_EXPORTMAP_SERIALSIZES",
-    comment:
-      "Increased size of SerialSize and SerialOffset in export map entries to 64 bit, allow support for bigger files",
-    value: 511,
-    firstAppearance: "4.16.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SKYLIGHT_MOBILE_IRRADIANCE_MAP",
-    comment: "Sky light stores IrradianceMap for mobile renderer.",
-    value: 512,
-    firstAppearance: "4.16.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADDED_SWEEP_WHILE_WALKING_FLAG",
-    comment: "Added flag to control sweep behavior while walking in UCharacterMovementComponent.",
-    value: 513,
-    firstAppearance: "4.16.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADDED_SOFT_OBJECT_PATH",
-    comment:
-      "StringAssetReference changed to SoftObjectPath and swapped to serialize as a name+string instead of a string",
-    value: 514,
-    firstAppearance: "4.18.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_POINTLIGHT_SOURCE_ORIENTATION",
-    comment: "Changed the source orientation of point lights to match spot lights (z axis)",
-    value: 515,
-    firstAppearance: "4.19.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADDED_PACKAGE_SUMMARY_LOCALIZATION_ID",
-    comment: "LocalizationId has been added to the package summary (editor-only)",
-    value: 516,
-    firstAppearance: "4.19.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_FIX_WIDE_STRING_CRC",
-    comment: "Fixed case insensitive hashes of wide strings containing character values from 128-255",
-    value: 517,
-    firstAppearance: "4.21.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ADDED_PACKAGE_OWNER",
-    comment: "Added package owner to allow private references",
-    value: 518,
-    firstAppearance: "4.24.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_SKINWEIGHT_PROFILE_DATA_LAYOUT_CHANGES",
-    comment: "Changed the data layout for skin weight profile data",
-    value: 519,
-    firstAppearance: "4.26.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_NON_OUTER_PACKAGE_IMPORT",
-    comment: "Added import that can have package different than their outer",
-    value: 520,
-    firstAppearance: "4.26.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_ASSETREGISTRY_DEPENDENCYFLAGS",
-    comment: "Added DependencyFlags to AssetRegistry",
-    value: 521,
-    firstAppearance: "4.26.0",
-  }),
-  new VersionDetails({
-    name: "VER_UE4_CORRECT_LICENSEE_FLAG",
-    comment: "Fixed corrupt licensee flag in 4.26 assets",
-    value: 522,
-    firstAppearance: "4.26.0",
-  }),
-  new VersionDetails({
-    name: "INITIAL_VERSION",
-    comment:
-      "The original UE5 version, at the time this was added the UE4 version was 522, so UE5 will start from 1000 to show a clear difference",
-    value: 1000,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "NAMES_REFERENCED_FROM_EXPORT_DATA",
-    comment: "Support stripping names that are not referenced from export data",
-    value: 1001,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "PAYLOAD_TOC",
-    comment: "Added a payload table of contents to the package summary",
-    value: 1002,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "OPTIONAL_RESOURCES",
-    comment: "Added data to identify references from and to optional package",
-    value: 1003,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "LARGE_WORLD_COORDINATES",
-    comment: "Large world coordinates converts a number of core types to double components by default.",
-    value: 1004,
-    firstAppearance: "5.0.0",
-  }),
-  new VersionDetails({
-    name: "REMOVE_OBJECT_EXPORT_PACKAGE_GUID",
-    comment: "Remove package GUID from FObjectExport",
-    value: 1005,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "TRACK_OBJECT_EXPORT_IS_INHERITED",
-    comment: "Add IsInherited to the FObjectExport entry",
-    value: 1006,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "FSOFTOBJECTPATH_REMOVE_ASSET_PATH_FNAMES",
-    comment: "Replace FName asset path in FSoftObjectPath with (package name, asset name) pair FTopLevelAssetPath",
-    value: 1007,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "ADD_SOFTOBJECTPATH_LIST",
-    comment: "Add a soft object path list to the package summary for fast remap",
-    value: 1008,
-    firstAppearance: "5.1.0",
-  }),
-  new VersionDetails({
-    name: "DATA_RESOURCES",
-    comment: "Added bulk/data resource table",
-    value: 1009,
-    firstAppearance: "5.2.0",
-  }),
-  new VersionDetails({
-    name: "SCRIPT_SERIALIZATION_OFFSET",
-    comment: "Added script property serialization offset to export table entries for saved, versioned packages",
-    value: 1010,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "PROPERTY_TAG_EXTENSION_AND_OVERRIDABLE_SERIALIZATION",
-    comment: "Support for overridable logic in containers",
-    value: 1011,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "PROPERTY_TAG_COMPLETE_TYPE_NAME",
-    comment: "Added property tag complete type name and serialization type",
-    value: 1012,
-    firstAppearance: "5.4.0",
-  }),
-  new VersionDetails({
-    name: "ASSETREGISTRY_PACKAGEBUILDDEPENDENCIES",
-    comment: "Changed UE::AssetRegistry::WritePackageData to include PackageBuildDependencies",
-    value: 1013,
-    firstAppearance: "5.5.0",
-  }),
-  new VersionDetails({
-    name: "METADATA_SERIALIZATION_OFFSET",
-    comment: "Added meta data serialization offset to for saved, versioned packages",
-    value: 1014,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "VERSE_CELLS",
-    comment: "Added VCells to the object graph",
-    value: 1015,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "PACKAGE_SAVED_HASH",
-    comment: "Changed PackageFileSummary to write FIoHash PackageSavedHash instead of FGuid Guid",
-    value: 1016,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "OS_SUB_OBJECT_SHADOW_SERIALIZATION",
-    comment: "OS shadow serialization of subobjects",
-    value: 1017,
-    firstAppearance: "5.6.0",
-  }),
-  new VersionDetails({
-    name: "IMPORT_TYPE_HIERARCHIES",
-    comment: "Adds a table of hierarchical type information for imports in a package",
-    value: 1018,
-    firstAppearance: "5.7.0",
-  }),
-];
+export const versionsDetails = new LazyVersionDetails({
+  releases: [
+    "4.0.1",
+    "4.1.0",
+    "4.2.0",
+    "4.3.0",
+    "4.4.0",
+    "4.5.0",
+    "4.6.0",
+    "4.6.1",
+    "4.7.0",
+    "4.8.0",
+    "4.9.0",
+    "4.11.0",
+    "4.12.0",
+    "4.13.0",
+    "4.14.0",
+    "4.15.0",
+    "4.16.0",
+    "4.18.0",
+    "4.19.0",
+    "4.21.0",
+    "4.24.0",
+    "4.26.0",
+    "5.0.0",
+    "5.1.0",
+    "5.2.0",
+    "5.4.0",
+    "5.5.0",
+    "5.6.0",
+    "5.7.0",
+  ],
+  names: [
+    "VER_UE4_ADD_PINTYPE_ARRAY",
+    "VER_UE4_REMOVE_REDUNDANT_KEY",
+    "VER_UE4_SUPPORT_LARGE_SHADERS",
+    "VER_UE4_FUNCTIONS_IN_SHADERMAPID",
+    "VER_UE4_ASSET_REGISTRY_TAGS",
+    "VER_UE4_DONTSORTCATEGORIES_REMOVED",
+    "VER_UE4_TILED_NAVMESH",
+    "VER_UE4_REMOVED_OLD_NAVMESH",
+    "VER_UE4_ANIMNOTIFY_NAMECHANGE",
+    "VER_UE4_CONSOLIDATE_HEADER_PARSER_ONLY_PROPERTIES",
+    "VER_UE4_STOPPED_SERIALIZING_COMPONENTNAMETODEFAULTOBJECTMAP",
+    "VER_UE4_RESET_MODIFYFREQUENCY_STATICLIGHTS",
+    "VER_UE4_ADD_SOUNDNODEWAVE_GUID",
+    "VER_UE4_ADD_SOUNDNODEWAVE_TO_DDC",
+    "VER_UE4_MATERIAL_BLEND_OVERRIDE",
+    "VER_UE4_ADD_COOKED_TO_SOUND_NODE_WAVE",
+    "VER_UE4_TEXTURE_DERIVED_DATA2",
+    "VER_UE4_ADD_COOKED_TO_TEXTURE2D",
+    "VER_UE4_ADD_COOKED_TO_BODY_SETUP",
+    "VER_UE4_ADD_KISMETNETWORKGRAPHS",
+    "VER_UE4_MATERIAL_QUALITY_LEVEL_SWITCH",
+    "VER_DEBUG_MATERIALSHADER_UNIFORM_EXPRESSIONS",
+    "VER_UE4_REMOVED_STRIP_DATA",
+    "VER_UE4_FLAG_SCS_TRANSACTIONAL",
+    "VER_UE4_NX_DESTRUCTIBLE_ASSET_CHUNK_BOUNDS_FIX",
+    "VER_UE4_STATIC_MESH_SOCKETS",
+    "VER_UE4_REMOVE_EXTRA_SKELMESH_VERTEX_INFLUENCES",
+    "VER_UE4_UCURVE_USING_RICHCURVES",
+    "VER_UE4_INLINE_SHADERS",
+    "VER_UE4_ADDITIVE_TYPE_CHANGE",
+    "VER_UE4_READD_COOKER",
+    "VER_UE4_ADDED_SCRIPT_SERIALIZATION_FOR_BLUEPRINT_GENERATED_CLASSES",
+    "VER_UE4_VARIABLE_BITFIELD_SIZE",
+    "VER_UE4_FIX_REQUIRED_BONES",
+    "VER_UE4_COOKED_PACKAGE_VERSION_IS_PACKAGE_VERSION",
+    "VER_UE4_TEXTURE_SOURCE_ART_REFACTOR",
+    "VER_UE4_ADDED_EXTRA_MESH_OPTIMIZATION_SETTINGS",
+    "VER_UE4_DESTRUCTIBLE_MESH_BODYSETUP_HOLDS_PHYSICAL_MATERIAL",
+    "VER_UE4_REMOVE_USEQUENCE",
+    "VER_UE4_ADD_PINTYPE_BYREF",
+    "VER_UE4_PUBLIC_BLUEPRINT_VARS_READONLY",
+    "VER_UE4_VISIBILITY_FLAG_CHANGES",
+    "VER_UE4_REMOVE_COMPONENT_ENABLED_FLAG",
+    "VER_UE4_CONFORM_COMPONENT_ACTIVATE_FLAG",
+    "VER_UE4_ADD_SKELMESH_MESHTOIMPORTVERTEXMAP",
+    "VER_UE4_REMOVE_UE3_864_SERIALIZATION",
+    "VER_UE4_SH_LIGHTMAPS",
+    "VER_UE4_REMOVED_PERSHADER_DDC",
+    "VER_UE4_CORE_SPLIT",
+    "VER_UE4_REMOVED_FMATERIAL_COMPILE_OUTPUTS",
+    "VER_UE4_PHYSICAL_MATERIAL_MODEL",
+    "VER_UE4_ADDED_MATERIALSHADERMAP_USAGE",
+    "VER_UE4_BLUEPRINT_PROPERTYFLAGS_SIZE_CHANGE",
+    "VER_UE4_CONSOLIDATE_SKINNEDMESH_UPDATE_FLAGS",
+    "VER_UE4_REMOVE_INTERNAL_ARCHETYPE",
+    "VER_UE4_REMOVE_ARCHETYPE_INDEX_FROM_LINKER_TABLES",
+    "VER_UE4_VARK2NODE_NULL_VARSRCCLASS_ON_SELF",
+    "VER_UE4_REMOVED_SPECULAR_BOOST",
+    "VER_UE4_ADD_KISMETVISIBLE",
+    "VER_UE4_MOVE_DISTRIBUITONS_TO_POSTINITPROPS",
+    "VER_UE4_SHADOW_ONLY_INDEX_BUFFERS",
+    "VER_UE4_CHANGED_VOLUME_SAMPLE_FORMAT",
+    "VER_UE4_CHANGE_BENABLECOLLISION_TO_COLLISIONENABLED",
+    "VER_UE4_CHANGED_IRRELEVANT_LIGHT_GUIDS",
+    "VER_UE4_RENAME_DISABLEALLRIGIDBODIES",
+    "VER_UE4_SOUND_NODE_ATTENUATION_SETTINGS_CHANGE",
+    "VER_UE4_ADD_EDGRAPHNODE_GUID",
+    "VER_UE4_FIX_INTERPDATA_OUTERS",
+    "VER_UE4_BLUEPRINT_NATIVE_SERIALIZATION",
+    "VER_UE4_SOUND_NODE_INHERIT_FROM_ED_GRAPH_NODE",
+    "VER_UE4_UNIFY_AMBIENT_SOUND_ACTORS",
+    "VER_UE4_LIGHTMAP_COMPRESSION",
+    "VER_UE4_MORPHTARGET_CURVE_INTEGRATION",
+    "VER_UE4_CLEAR_STANDALONE_FROM_LEVEL_SCRIPT_BLUEPRINTS",
+    "VER_UE4_NO_INTERFACE_PROPERTY",
+    "VER_UE4_CATEGORY_MOVED_TO_METADATA",
+    "VER_UE4_REMOVE_CTOR_LINK",
+    "VER_UE4_REMOVE_SHORT_PACKAGE_NAME_ASSOCIATIONS",
+    "VER_UE4_ADD_CREATEDBYCONSTRUCTIONSCRIPT",
+    "VER_UE4_NX_DESTRUCTIBLE_ASSET_AUTHORING_LOAD_FIX",
+    "VER_UE4_ANGULAR_CONSTRAINT_OPTIONS",
+    "VER_UE4_CHANGE_MATERIAL_EXPRESSION_CONSTANTS_TO_LINEARCOLOR",
+    "VER_UE4_PRIMITIVE_BUILT_LIGHTING_FLAG",
+    "VER_UE4_ATMOSPHERIC_FOG_CACHE_TEXTURE",
+    "VER_UE4_PRECOMPUTED_SHADOW_MAPS",
+    "VER_UE4_MODULATOR_CONTINUOUS_NO_DISTRIBUTION",
+    "VER_UE4_PACKAGE_MAGIC_POSTTAG",
+    "VER_UE4_TOSS_IRRELEVANT_LIGHTS",
+    "VER_UE4_REMOVE_NET_INDEX",
+    "VER_UE4_BLUEPRINT_CDO_MIGRATION",
+    "VER_UE4_BULKDATA_AT_LARGE_OFFSETS",
+    "VER_UE4_EXPLICIT_STREAMING_TEXTURE_BUILT",
+    "VER_UE4_PRECOMPUTED_SHADOW_MAPS_BSP",
+    "VER_UE4_STATIC_MESH_REFACTOR",
+    "VER_UE4_REMOVE_CACHED_STATIC_MESH_STREAMING_FACTORS",
+    "VER_UE4_ATMOSPHERIC_FOG_MATERIAL",
+    "VER_UE4_FIX_BSP_BRUSH_TYPE",
+    "VER_UE4_REMOVE_CLIENTDESTROYEDACTORCONTENT",
+    "VER_UE4_SOUND_CUE_GRAPH_EDITOR",
+    "VER_UE4_STRIP_TRANS_LEVEL_MOVE_BUFFER",
+    "VER_UE4_DEPRECATED_BNOENCROACHCHECK",
+    "VER_UE4_LIGHTS_USE_IES_BRIGHTNESS_DEFAULT_CHANGED",
+    "VER_UE4_MATERIAL_ATTRIBUTES_MULTIPLEX",
+    "VER_UE4_TEXTURE_FORMAT_RGBA_SWIZZLE",
+    "VER_UE4_SUMMARY_HAS_BULKDATA_OFFSET",
+    "VER_UE4_DEFAULT_ROOT_COMP_TRANSACTIONAL",
+    "VER_UE4_HASHED_MATERIAL_OUTPUT",
+    "VER_UE4_BLUEPRINT_VARS_NOT_READ_ONLY",
+    "VER_UE4_STATIC_MESH_STORE_NAV_COLLISION",
+    "VER_UE4_ATMOSPHERIC_FOG_DECAY_NAME_CHANGE",
+    "VER_UE4_SCENECOMP_TRANSLATION_TO_LOCATION",
+    "VER_UE4_MATERIAL_ATTRIBUTES_REORDERING",
+    "VER_UE4_COLLISION_PROFILE_SETTING",
+    "VER_UE4_BLUEPRINT_SKEL_TEMPORARY_TRANSIENT",
+    "VER_UE4_BLUEPRINT_SKEL_SERIALIZED_AGAIN",
+    "VER_UE4_BLUEPRINT_SETS_REPLICATION",
+    "VER_UE4_WORLD_LEVEL_INFO",
+    "VER_UE4_AFTER_CAPSULE_HALF_HEIGHT_CHANGE",
+    "VER_UE4_ADDED_NAMESPACE_AND_KEY_DATA_TO_FTEXT",
+    "VER_UE4_ATTENUATION_SHAPES",
+    "VER_UE4_LIGHTCOMPONENT_USE_IES_TEXTURE_MULTIPLIER_ON_NON_IES_BRIGHTNESS",
+    "VER_UE4_REMOVE_INPUT_COMPONENTS_FROM_BLUEPRINTS",
+    "VER_UE4_VARK2NODE_USE_MEMBERREFSTRUCT",
+    "VER_UE4_REFACTOR_MATERIAL_EXPRESSION_SCENECOLOR_AND_SCENEDEPTH_INPUTS",
+    "VER_UE4_SPLINE_MESH_ORIENTATION",
+    "VER_UE4_REVERB_EFFECT_ASSET_TYPE",
+    "VER_UE4_MAX_TEXCOORD_INCREASED",
+    "VER_UE4_SPEEDTREE_STATICMESH",
+    "VER_UE4_LANDSCAPE_COMPONENT_LAZY_REFERENCES",
+    "VER_UE4_SWITCH_CALL_NODE_TO_USE_MEMBER_REFERENCE",
+    "VER_UE4_ADDED_SKELETON_ARCHIVER_REMOVAL",
+    "VER_UE4_ADDED_SKELETON_ARCHIVER_REMOVAL_SECOND_TIME",
+    "VER_UE4_BLUEPRINT_SKEL_CLASS_TRANSIENT_AGAIN",
+    "VER_UE4_ADD_COOKED_TO_UCLASS",
+    "VER_UE4_DEPRECATED_STATIC_MESH_THUMBNAIL_PROPERTIES_REMOVED",
+    "VER_UE4_COLLECTIONS_IN_SHADERMAPID",
+    "VER_UE4_REFACTOR_MOVEMENT_COMPONENT_HIERARCHY",
+    "VER_UE4_FIX_TERRAIN_LAYER_SWITCH_ORDER",
+    "VER_UE4_ALL_PROPS_TO_CONSTRAINTINSTANCE",
+    "VER_UE4_LOW_QUALITY_DIRECTIONAL_LIGHTMAPS",
+    "VER_UE4_ADDED_NOISE_EMITTER_COMPONENT",
+    "VER_UE4_ADD_TEXT_COMPONENT_VERTICAL_ALIGNMENT",
+    "VER_UE4_ADDED_FBX_ASSET_IMPORT_DATA",
+    "VER_UE4_REMOVE_LEVELBODYSETUP",
+    "VER_UE4_REFACTOR_CHARACTER_CROUCH",
+    "VER_UE4_SMALLER_DEBUG_MATERIALSHADER_UNIFORM_EXPRESSIONS",
+    "VER_UE4_APEX_CLOTH",
+    "VER_UE4_SAVE_COLLISIONRESPONSE_PER_CHANNEL",
+    "VER_UE4_ADDED_LANDSCAPE_SPLINE_EDITOR_MESH",
+    "VER_UE4_CHANGED_MATERIAL_REFACTION_TYPE",
+    "VER_UE4_REFACTOR_PROJECTILE_MOVEMENT",
+    "VER_UE4_REMOVE_PHYSICALMATERIALPROPERTY",
+    "VER_UE4_PURGED_FMATERIAL_COMPILE_OUTPUTS",
+    "VER_UE4_ADD_COOKED_TO_LANDSCAPE",
+    "VER_UE4_CONSUME_INPUT_PER_BIND",
+    "VER_UE4_SOUND_CLASS_GRAPH_EDITOR",
+    "VER_UE4_FIXUP_TERRAIN_LAYER_NODES",
+    "VER_UE4_RETROFIT_CLAMP_EXPRESSIONS_SWAP",
+    "VER_UE4_REMOVE_LIGHT_MOBILITY_CLASSES",
+    "VER_UE4_REFACTOR_PHYSICS_BLENDING",
+    "VER_UE4_WORLD_LEVEL_INFO_UPDATED",
+    "VER_UE4_STATIC_SKELETAL_MESH_SERIALIZATION_FIX",
+    "VER_UE4_REMOVE_STATICMESH_MOBILITY_CLASSES",
+    "VER_UE4_REFACTOR_PHYSICS_TRANSFORMS",
+    "VER_UE4_REMOVE_ZERO_TRIANGLE_SECTIONS",
+    "VER_UE4_CHARACTER_MOVEMENT_DECELERATION",
+    "VER_UE4_CAMERA_ACTOR_USING_CAMERA_COMPONENT",
+    "VER_UE4_CHARACTER_MOVEMENT_DEPRECATE_PITCH_ROLL",
+    "VER_UE4_REBUILD_TEXTURE_STREAMING_DATA_ON_LOAD",
+    "VER_UE4_SUPPORT_32BIT_STATIC_MESH_INDICES",
+    "VER_UE4_ADDED_CHUNKID_TO_ASSETDATA_AND_UPACKAGE",
+    "VER_UE4_CHARACTER_DEFAULT_MOVEMENT_BINDINGS",
+    "VER_UE4_APEX_CLOTH_LOD",
+    "VER_UE4_ATMOSPHERIC_FOG_CACHE_DATA",
+    "VAR_UE4_ARRAY_PROPERTY_INNER_TAGS",
+    "VER_UE4_KEEP_SKEL_MESH_INDEX_DATA",
+    "VER_UE4_BODYSETUP_COLLISION_CONVERSION",
+    "VER_UE4_REFLECTION_CAPTURE_COOKING",
+    "VER_UE4_REMOVE_DYNAMIC_VOLUME_CLASSES",
+    "VER_UE4_STORE_HASCOOKEDDATA_FOR_BODYSETUP",
+    "VER_UE4_REFRACTION_BIAS_TO_REFRACTION_DEPTH_BIAS",
+    "VER_UE4_REMOVE_SKELETALPHYSICSACTOR",
+    "VER_UE4_PC_ROTATION_INPUT_REFACTOR",
+    "VER_UE4_LANDSCAPE_PLATFORMDATA_COOKING",
+    "VER_UE4_CREATEEXPORTS_CLASS_LINKING_FOR_BLUEPRINTS",
+    "VER_UE4_REMOVE_NATIVE_COMPONENTS_FROM_BLUEPRINT_SCS",
+    "VER_UE4_REMOVE_SINGLENODEINSTANCE",
+    "VER_UE4_CHARACTER_BRAKING_REFACTOR",
+    "VER_UE4_VOLUME_SAMPLE_LOW_QUALITY_SUPPORT",
+    "VER_UE4_SPLIT_TOUCH_AND_CLICK_ENABLES",
+    "VER_UE4_HEALTH_DEATH_REFACTOR",
+    "VER_UE4_SOUND_NODE_ENVELOPER_CURVE_CHANGE",
+    "VER_UE4_POINT_LIGHT_SOURCE_RADIUS",
+    "VER_UE4_SCENE_CAPTURE_CAMERA_CHANGE",
+    "VER_UE4_MOVE_SKELETALMESH_SHADOWCASTING",
+    "VER_UE4_CHANGE_SETARRAY_BYTECODE",
+    "VER_UE4_MATERIAL_INSTANCE_BASE_PROPERTY_OVERRIDES",
+    "VER_UE4_COMBINED_LIGHTMAP_TEXTURES",
+    "VER_UE4_BUMPED_MATERIAL_EXPORT_GUIDS",
+    "VER_UE4_BLUEPRINT_INPUT_BINDING_OVERRIDES",
+    "VER_UE4_FIXUP_BODYSETUP_INVALID_CONVEX_TRANSFORM",
+    "VER_UE4_FIXUP_STIFFNESS_AND_DAMPING_SCALE",
+    "VER_UE4_REFERENCE_SKELETON_REFACTOR",
+    "VER_UE4_K2NODE_REFERENCEGUIDS",
+    "VER_UE4_FIXUP_ROOTBONE_PARENT",
+    "VER_UE4_TEXT_RENDER_COMPONENTS_WORLD_SPACE_SIZING",
+    "VER_UE4_MATERIAL_INSTANCE_BASE_PROPERTY_OVERRIDES_PHASE_2",
+    "VER_UE4_CLASS_NOTPLACEABLE_ADDED",
+    "VER_UE4_WORLD_LEVEL_INFO_LOD_LIST",
+    "VER_UE4_CHARACTER_MOVEMENT_VARIABLE_RENAMING_1",
+    "VER_UE4_FSLATESOUND_CONVERSION",
+    "VER_UE4_WORLD_LEVEL_INFO_ZORDER",
+    "VER_UE4_PACKAGE_REQUIRES_LOCALIZATION_GATHER_FLAGGING",
+    "VER_UE4_BP_ACTOR_VARIABLE_DEFAULT_PREVENTING",
+    "VER_UE4_TEST_ANIMCOMP_CHANGE",
+    "VER_UE4_EDITORONLY_BLUEPRINTS",
+    "VER_UE4_EDGRAPHPINTYPE_SERIALIZATION",
+    "VER_UE4_NO_MIRROR_BRUSH_MODEL_COLLISION",
+    "VER_UE4_CHANGED_CHUNKID_TO_BE_AN_ARRAY_OF_CHUNKIDS",
+    "VER_UE4_WORLD_NAMED_AFTER_PACKAGE",
+    "VER_UE4_SKY_LIGHT_COMPONENT",
+    "VER_UE4_WORLD_LAYER_ENABLE_DISTANCE_STREAMING",
+    "VER_UE4_REMOVE_ZONES_FROM_MODEL",
+    "VER_UE4_FIX_ANIMATIONBASEPOSE_SERIALIZATION",
+    "VER_UE4_SUPPORT_8_BONE_INFLUENCES_SKELETAL_MESHES",
+    "VER_UE4_ADD_OVERRIDE_GRAVITY_FLAG",
+    "VER_UE4_SUPPORT_GPUSKINNING_8_BONE_INFLUENCES",
+    "VER_UE4_ANIM_SUPPORT_NONUNIFORM_SCALE_ANIMATION",
+    "VER_UE4_ENGINE_VERSION_OBJECT",
+    "VER_UE4_PUBLIC_WORLDS",
+    "VER_UE4_SKELETON_GUID_SERIALIZATION",
+    "VER_UE4_CHARACTER_MOVEMENT_WALKABLE_FLOOR_REFACTOR",
+    "VER_UE4_INVERSE_SQUARED_LIGHTS_DEFAULT",
+    "VER_UE4_DISABLED_SCRIPT_LIMIT_BYTECODE",
+    "VER_UE4_PRIVATE_REMOTE_ROLE",
+    "VER_UE4_FOLIAGE_STATIC_MOBILITY",
+    "VER_UE4_BUILD_SCALE_VECTOR",
+    "VER_UE4_FOLIAGE_COLLISION",
+    "VER_UE4_SKY_BENT_NORMAL",
+    "VER_UE4_LANDSCAPE_COLLISION_DATA_COOKING",
+    "VER_UE4_MORPHTARGET_CPU_TANGENTZDELTA_FORMATCHANGE",
+    "VER_UE4_SOFT_CONSTRAINTS_USE_MASS",
+    "VER_UE4_REFLECTION_DATA_IN_PACKAGES",
+    "VER_UE4_FOLIAGE_MOVABLE_MOBILITY",
+    "VER_UE4_UNDO_BREAK_MATERIALATTRIBUTES_CHANGE",
+    "VER_UE4_ADD_CUSTOMPROFILENAME_CHANGE",
+    "VER_UE4_FLIP_MATERIAL_COORDS",
+    "VER_UE4_MEMBERREFERENCE_IN_PINTYPE",
+    "VER_UE4_VEHICLES_UNIT_CHANGE",
+    "VER_UE4_ANIMATION_REMOVE_NANS",
+    "VER_UE4_SKELETON_ASSET_PROPERTY_TYPE_CHANGE",
+    "VER_UE4_FIX_BLUEPRINT_VARIABLE_FLAGS",
+    "VER_UE4_VEHICLES_UNIT_CHANGE2",
+    "VER_UE4_UCLASS_SERIALIZE_INTERFACES_AFTER_LINKING",
+    "VER_UE4_STATIC_MESH_SCREEN_SIZE_LODS",
+    "VER_UE4_FIX_MATERIAL_COORDS",
+    "VER_UE4_SPEEDTREE_WIND_V7",
+    "VER_UE4_LOAD_FOR_EDITOR_GAME",
+    "VER_UE4_SERIALIZE_RICH_CURVE_KEY",
+    "VER_UE4_MOVE_LANDSCAPE_MICS_AND_TEXTURES_WITHIN_LEVEL",
+    "VER_UE4_FTEXT_HISTORY",
+    "VER_UE4_FIX_MATERIAL_COMMENTS",
+    "VER_UE4_STORE_BONE_EXPORT_NAMES",
+    "VER_UE4_MESH_EMITTER_INITIAL_ORIENTATION_DISTRIBUTION",
+    "VER_UE4_DISALLOW_FOLIAGE_ON_BLUEPRINTS",
+    "VER_UE4_FIXUP_MOTOR_UNITS",
+    "VER_UE4_DEPRECATED_MOVEMENTCOMPONENT_MODIFIED_SPEEDS",
+    "VER_UE4_RENAME_CANBECHARACTERBASE",
+    "VER_UE4_GAMEPLAY_TAG_CONTAINER_TAG_TYPE_CHANGE",
+    "VER_UE4_FOLIAGE_SETTINGS_TYPE",
+    "VER_UE4_STATIC_SHADOW_DEPTH_MAPS",
+    "VER_UE4_ADD_TRANSACTIONAL_TO_DATA_ASSETS",
+    "VER_UE4_ADD_LB_WEIGHTBLEND",
+    "VER_UE4_ADD_ROOTCOMPONENT_TO_FOLIAGEACTOR",
+    "VER_UE4_FIX_MATERIAL_PROPERTY_OVERRIDE_SERIALIZE",
+    "VER_UE4_ADD_LINEAR_COLOR_SAMPLER",
+    "VER_UE4_ADD_STRING_ASSET_REFERENCES_MAP",
+    "VER_UE4_BLUEPRINT_USE_SCS_ROOTCOMPONENT_SCALE",
+    "VER_UE4_LEVEL_STREAMING_DRAW_COLOR_TYPE_CHANGE",
+    "VER_UE4_CLEAR_NOTIFY_TRIGGERS",
+    "VER_UE4_SKELETON_ADD_SMARTNAMES",
+    "VER_UE4_ADDED_CURRENCY_CODE_TO_FTEXT",
+    "VER_UE4_ENUM_CLASS_SUPPORT",
+    "VER_UE4_FIXUP_WIDGET_ANIMATION_CLASS",
+    "VER_UE4_SOUND_COMPRESSION_TYPE_ADDED",
+    "VER_UE4_AUTO_WELDING",
+    "VER_UE4_RENAME_CROUCHMOVESCHARACTERDOWN",
+    "VER_UE4_LIGHTMAP_MESH_BUILD_SETTINGS",
+    "VER_UE4_RENAME_SM3_TO_ES3_1",
+    "VER_UE4_DEPRECATE_UMG_STYLE_ASSETS",
+    "VER_UE4_POST_DUPLICATE_NODE_GUID",
+    "VER_UE4_RENAME_CAMERA_COMPONENT_VIEW_ROTATION",
+    "VER_UE4_CASE_PRESERVING_FNAME",
+    "VER_UE4_RENAME_CAMERA_COMPONENT_CONTROL_ROTATION",
+    "VER_UE4_FIX_REFRACTION_INPUT_MASKING",
+    "VER_UE4_GLOBAL_EMITTER_SPAWN_RATE_SCALE",
+    "VER_UE4_CLEAN_DESTRUCTIBLE_SETTINGS",
+    "VER_UE4_CHARACTER_MOVEMENT_UPPER_IMPACT_BEHAVIOR",
+    "VER_UE4_BP_MATH_VECTOR_EQUALITY_USES_EPSILON",
+    "VER_UE4_FOLIAGE_STATIC_LIGHTING_SUPPORT",
+    "VER_UE4_SLATE_COMPOSITE_FONTS",
+    "VER_UE4_REMOVE_SAVEGAMESUMMARY",
+    "VER_UE4_REMOVE_SKELETALMESH_COMPONENT_BODYSETUP_SERIALIZATION",
+    "VER_UE4_SLATE_BULK_FONT_DATA",
+    "VER_UE4_ADD_PROJECTILE_FRICTION_BEHAVIOR",
+    "VER_UE4_MOVEMENTCOMPONENT_AXIS_SETTINGS",
+    "VER_UE4_GRAPH_INTERACTIVE_COMMENTBUBBLES",
+    "VER_UE4_LANDSCAPE_SERIALIZE_PHYSICS_MATERIALS",
+    "VER_UE4_RENAME_WIDGET_VISIBILITY",
+    "VER_UE4_ANIMATION_ADD_TRACKCURVES",
+    "VER_UE4_MONTAGE_BRANCHING_POINT_REMOVAL",
+    "VER_UE4_BLUEPRINT_ENFORCE_CONST_IN_FUNCTION_OVERRIDES",
+    "VER_UE4_ADD_PIVOT_TO_WIDGET_COMPONENT",
+    "VER_UE4_PAWN_AUTO_POSSESS_AI",
+    "VER_UE4_FTEXT_HISTORY_DATE_TIMEZONE",
+    "VER_UE4_SORT_ACTIVE_BONE_INDICES",
+    "VER_UE4_PERFRAME_MATERIAL_UNIFORM_EXPRESSIONS",
+    "VER_UE4_MIKKTSPACE_IS_DEFAULT",
+    "VER_UE4_LANDSCAPE_GRASS_COOKING",
+    "VER_UE4_FIX_SKEL_VERT_ORIENT_MESH_PARTICLES",
+    "VER_UE4_LANDSCAPE_STATIC_SECTION_OFFSET",
+    "VER_UE4_ADD_MODIFIERS_RUNTIME_GENERATION",
+    "VER_UE4_MATERIAL_MASKED_BLENDMODE_TIDY",
+    "VER_UE4_MERGED_ADD_MODIFIERS_RUNTIME_GENERATION_TO_4_7_DEPRECATED",
+    "VER_UE4_AFTER_MERGED_ADD_MODIFIERS_RUNTIME_GENERATION_TO_4_7_DEPRECATED",
+    "VER_UE4_MERGED_ADD_MODIFIERS_RUNTIME_GENERATION_TO_4_7",
+    "VER_UE4_AFTER_MERGING_ADD_MODIFIERS_RUNTIME_GENERATION_TO_4_7",
+    "VER_UE4_SERIALIZE_LANDSCAPE_GRASS_DATA",
+    "VER_UE4_OPTIONALLY_CLEAR_GPU_EMITTERS_ON_INIT",
+    "VER_UE4_SERIALIZE_LANDSCAPE_GRASS_DATA_MATERIAL_GUID",
+    "VER_UE4_BLUEPRINT_GENERATED_CLASS_COMPONENT_TEMPLATES_PUBLIC",
+    "VER_UE4_ACTOR_COMPONENT_CREATION_METHOD",
+    "VER_UE4_K2NODE_EVENT_MEMBER_REFERENCE",
+    "VER_UE4_STRUCT_GUID_IN_PROPERTY_TAG",
+    "VER_UE4_REMOVE_UNUSED_UPOLYS_FROM_UMODEL",
+    "VER_UE4_REBUILD_HIERARCHICAL_INSTANCE_TREES",
+    "VER_UE4_PACKAGE_SUMMARY_HAS_COMPATIBLE_ENGINE_VERSION",
+    "VER_UE4_TRACK_UCS_MODIFIED_PROPERTIES",
+    "VER_UE4_LANDSCAPE_SPLINE_CROSS_LEVEL_MESHES",
+    "VER_UE4_DEPRECATE_USER_WIDGET_DESIGN_SIZE",
+    "VER_UE4_ADD_EDITOR_VIEWS",
+    "VER_UE4_FOLIAGE_WITH_ASSET_OR_CLASS",
+    "VER_UE4_BODYINSTANCE_BINARY_SERIALIZATION",
+    "VER_UE4_SERIALIZE_BLUEPRINT_EVENTGRAPH_FASTCALLS_IN_UFUNCTION",
+    "VER_UE4_INTERPCURVE_SUPPORTS_LOOPING",
+    "VER_UE4_MATERIAL_INSTANCE_BASE_PROPERTY_OVERRIDES_DITHERED_LOD_TRANSITION",
+    "VER_UE4_SERIALIZE_LANDSCAPE_ES2_TEXTURES",
+    "VER_UE4_CONSTRAINT_INSTANCE_MOTOR_FLAGS",
+    "VER_UE4_SERIALIZE_PINTYPE_CONST",
+    "VER_UE4_LIBRARY_CATEGORIES_AS_FTEXT",
+    "VER_UE4_SKIP_DUPLICATE_EXPORTS_ON_SAVE_PACKAGE",
+    "VER_UE4_SERIALIZE_TEXT_IN_PACKAGES",
+    "VER_UE4_ADD_BLEND_MODE_TO_WIDGET_COMPONENT",
+    "VER_UE4_NEW_LIGHTMASS_PRIMITIVE_SETTING",
+    "VER_UE4_REPLACE_SPRING_NOZ_PROPERTY",
+    "VER_UE4_TIGHTLY_PACKED_ENUMS",
+    "VER_UE4_ASSET_IMPORT_DATA_AS_JSON",
+    "VER_UE4_TEXTURE_LEGACY_GAMMA",
+    "VER_UE4_ADDED_NATIVE_SERIALIZATION_FOR_IMMUTABLE_STRUCTURES",
+    "VER_UE4_DEPRECATE_UMG_STYLE_OVERRIDES",
+    "VER_UE4_STATIC_SHADOWMAP_PENUMBRA_SIZE",
+    "VER_UE4_NIAGARA_DATA_OBJECT_DEV_UI_FIX",
+    "VER_UE4_FIXED_DEFAULT_ORIENTATION_OF_WIDGET_COMPONENT",
+    "VER_UE4_REMOVED_MATERIAL_USED_WITH_UI_FLAG",
+    "VER_UE4_CHARACTER_MOVEMENT_ADD_BRAKING_FRICTION",
+    "VER_UE4_BSP_UNDO_FIX",
+    "VER_UE4_DYNAMIC_PARAMETER_DEFAULT_VALUE",
+    "VER_UE4_STATIC_MESH_EXTENDED_BOUNDS",
+    "VER_UE4_ADDED_NON_LINEAR_TRANSITION_BLENDS",
+    "VER_UE4_AO_MATERIAL_MASK",
+    "VER_UE4_NAVIGATION_AGENT_SELECTOR",
+    "VER_UE4_MESH_PARTICLE_COLLISIONS_CONSIDER_PARTICLE_SIZE",
+    "VER_UE4_BUILD_MESH_ADJ_BUFFER_FLAG_EXPOSED",
+    "VER_UE4_MAX_ANGULAR_VELOCITY_DEFAULT",
+    "VER_UE4_APEX_CLOTH_TESSELLATION",
+    "VER_UE4_DECAL_SIZE",
+    "VER_UE4_KEEP_ONLY_PACKAGE_NAMES_IN_STRING_ASSET_REFERENCES_MAP",
+    "VER_UE4_COOKED_ASSETS_IN_EDITOR_SUPPORT",
+    "VER_UE4_DIALOGUE_WAVE_NAMESPACE_AND_CONTEXT_CHANGES",
+    "VER_UE4_MAKE_ROT_RENAME_AND_REORDER",
+    "VER_UE4_K2NODE_VAR_REFERENCEGUIDS",
+    "VER_UE4_SOUND_CONCURRENCY_PACKAGE",
+    "VER_UE4_USERWIDGET_DEFAULT_FOCUSABLE_FALSE",
+    "VER_UE4_BLUEPRINT_CUSTOM_EVENT_CONST_INPUT",
+    "VER_UE4_USE_LOW_PASS_FILTER_FREQ",
+    "VER_UE4_NO_ANIM_BP_CLASS_IN_GAMEPLAY_CODE",
+    "VER_UE4_SCS_STORES_ALLNODES_ARRAY",
+    "VER_UE4_FBX_IMPORT_DATA_RANGE_ENCAPSULATION",
+    "VER_UE4_CAMERA_COMPONENT_ATTACH_TO_ROOT",
+    "VER_UE4_INSTANCED_STEREO_UNIFORM_UPDATE",
+    "VER_UE4_STREAMABLE_TEXTURE_MIN_MAX_DISTANCE",
+    "VER_UE4_INJECT_BLUEPRINT_STRUCT_PIN_CONVERSION_NODES",
+    "VER_UE4_INNER_ARRAY_TAG_INFO",
+    "VER_UE4_FIX_SLOT_NAME_DUPLICATION",
+    "VER_UE4_STREAMABLE_TEXTURE_AABB",
+    "VER_UE4_PROPERTY_GUID_IN_PROPERTY_TAG",
+    "VER_UE4_NAME_HASHES_SERIALIZED",
+    "VER_UE4_INSTANCED_STEREO_UNIFORM_REFACTOR",
+    "VER_UE4_COMPRESSED_SHADER_RESOURCES",
+    "VER_UE4_PRELOAD_DEPENDENCIES_IN_COOKED_EXPORTS",
+    "VER_UE4_TemplateIndex_IN_COOKED_EXPORTS",
+    "VER_UE4_PROPERTY_TAG_SET_MAP_SUPPORT",
+    "VER_UE4_ADDED_SEARCHABLE_NAMES",
+    "VER_UE4_64BIT_EXPORTMAP_SERIALSIZES",
+    "VER_UE4_SKYLIGHT_MOBILE_IRRADIANCE_MAP",
+    "VER_UE4_ADDED_SWEEP_WHILE_WALKING_FLAG",
+    "VER_UE4_ADDED_SOFT_OBJECT_PATH",
+    "VER_UE4_POINTLIGHT_SOURCE_ORIENTATION",
+    "VER_UE4_ADDED_PACKAGE_SUMMARY_LOCALIZATION_ID",
+    "VER_UE4_FIX_WIDE_STRING_CRC",
+    "VER_UE4_ADDED_PACKAGE_OWNER",
+    "VER_UE4_SKINWEIGHT_PROFILE_DATA_LAYOUT_CHANGES",
+    "VER_UE4_NON_OUTER_PACKAGE_IMPORT",
+    "VER_UE4_ASSETREGISTRY_DEPENDENCYFLAGS",
+    "VER_UE4_CORRECT_LICENSEE_FLAG",
+    "INITIAL_VERSION",
+    "NAMES_REFERENCED_FROM_EXPORT_DATA",
+    "PAYLOAD_TOC",
+    "OPTIONAL_RESOURCES",
+    "LARGE_WORLD_COORDINATES",
+    "REMOVE_OBJECT_EXPORT_PACKAGE_GUID",
+    "TRACK_OBJECT_EXPORT_IS_INHERITED",
+    "FSOFTOBJECTPATH_REMOVE_ASSET_PATH_FNAMES",
+    "ADD_SOFTOBJECTPATH_LIST",
+    "DATA_RESOURCES",
+    "SCRIPT_SERIALIZATION_OFFSET",
+    "PROPERTY_TAG_EXTENSION_AND_OVERRIDABLE_SERIALIZATION",
+    "PROPERTY_TAG_COMPLETE_TYPE_NAME",
+    "ASSETREGISTRY_PACKAGEBUILDDEPENDENCIES",
+    "METADATA_SERIALIZATION_OFFSET",
+    "VERSE_CELLS",
+    "PACKAGE_SAVED_HASH",
+    "OS_SUB_OBJECT_SHADOW_SERIALIZATION",
+    "IMPORT_TYPE_HIERARCHIES",
+  ],
+  values: [
+    108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130,
+    131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153,
+    154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176,
+    177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199,
+    200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222,
+    223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245,
+    246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259, 260, 261, 262, 263, 264, 265, 266, 267, 268,
+    269, 270, 271, 272, 273, 274, 275, 276, 277, 278, 279, 280, 281, 282, 283, 284, 285, 286, 287, 288, 289, 290, 291,
+    292, 293, 294, 295, 296, 297, 298, 299, 300, 301, 302, 303, 304, 305, 306, 307, 308, 309, 310, 311, 312, 313, 314,
+    315, 316, 317, 318, 319, 320, 321, 322, 323, 324, 325, 326, 327, 328, 329, 330, 331, 332, 333, 334, 335, 336, 337,
+    338, 339, 340, 341, 342, 343, 344, 345, 346, 347, 348, 349, 350, 351, 352, 353, 354, 355, 356, 357, 358, 359, 360,
+    361, 362, 363, 364, 365, 366, 367, 368, 369, 370, 371, 372, 373, 374, 375, 376, 377, 378, 379, 380, 381, 382, 383,
+    384, 385, 386, 387, 388, 389, 390, 391, 392, 393, 394, 395, 396, 397, 398, 399, 400, 401, 402, 403, 404, 405, 406,
+    407, 408, 409, 410, 411, 412, 413, 414, 415, 416, 417, 418, 419, 420, 421, 422, 423, 424, 425, 426, 427, 428, 429,
+    430, 431, 432, 433, 434, 435, 436, 437, 438, 439, 440, 441, 442, 443, 444, 445, 446, 447, 448, 449, 450, 451, 452,
+    453, 454, 455, 456, 457, 458, 459, 460, 461, 462, 463, 464, 465, 466, 467, 468, 469, 470, 471, 472, 473, 474, 475,
+    476, 477, 478, 479, 480, 481, 482, 483, 484, 485, 486, 487, 488, 489, 490, 491, 492, 493, 494, 495, 496, 497, 498,
+    499, 500, 501, 502, 503, 504, 505, 506, 507, 508, 509, 510, 511, 512, 513, 514, 515, 516, 517, 518, 519, 520, 521,
+    522, 1000, 1001, 1002, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017,
+    1018,
+  ],
+  comments: [
+    "Added array support to blueprints",
+    "Remove redundant key from raw animation data",
+    "Changing from WORDs to UINTs in the shader cache serialization, needs a new version",
+    "Added material functions to FMaterialShaderMapId",
+    "Added asset registry tags to the package summary so the editor can learn more about the assets in the package without loading it",
+    "Removed DontSortCategories option to classes",
+    "Added Tiled navmesh generation and redone navmesh serialization",
+    "Removed old pylon-based navigation mesh system",
+    "AnimNotify name change",
+    "Removed/consolidated some properties used only in the header parser that should never be serialized",
+    "Made ComponentNameToDefaultObjectMap non-serialized",
+    "Reset ModifyFrequency on static lights",
+    "Add a GUID to SoundNodeWave",
+    "Add audio to DDC",
+    "- Fix for Material Blend Mode override",
+    "Ability to save cooked audio",
+    "Update the derived data key for textures.",
+    "Textures can now be cooked into packages",
+    "Ability to save cooked PhysX meshes",
+    "Blueprint saved before this may need Event Graph change to Local/Server Graph",
+    "- Added material quality level switches",
+    "- Debugging material shader uniform expression sets.",
+    "Removed StripData",
+    "Setting RF_Transactional object flag on blueprint's SimpleConstructionScript",
+    "- Fixing chunk bounding boxes in imported NxDestructibleAssets.",
+    "Add support for StaticMesh sockets",
+    "- Removed extra skelmesh vert weights",
+    "- Change UCurve objects to use FRichCurve",
+    "Add support for inline shaders",
+    "Change additive types to include mesh rotation only to be baked",
+    "Readd cooker versioning to package",
+    "Serialize class properties",
+    "Variable UBoolProperty size.",
+    "Fix skeletons which only list active bones in their required bones list.",
+    "Switched 'cooked package' version to simply be the package version itself.",
+    "Refactor how texture source art is stored to better isolate editor-only data.",
+    "Add additional settings to static and skeletal mesh optimization struct (FStaticMeshOptimizationSettings and FSkeletalMeshOptimizationSettings)",
+    "Add BodySetup to DestructibleMesh, use it to store the destructible physical material.",
+    "Remove USequence class and references",
+    "Added by-ref parameters to blueprints",
+    "Change to make public blueprint variables 'read only'",
+    "change HiddenGame, DrawInGame, DrawInEditor to bVisible, and bHiddenInGame",
+    "change Light/Fog/Blur bEnable to use bVisible",
+    "change Particle/Audio/Thrust/RadialForce bEnable/bAutoPlay to use bAutoActivate",
+    "make the 'mesh to import vertex map' in skelmesh always loaded so it can be used by vertex anim",
+    "remove serialization for properties added with UE3 version 864 serialization",
+    "Spherical harmonic lightmaps",
+    "Removed per-shader DDC entries",
+    "Core split into Core and CoreUObject",
+    "Removed some compile outputs being stored in FMaterial",
+    "New physical material model",
+    "Added a usage to FMaterialShaderMapId",
+    "Covert blueprint PropertyFlags from int32 to uint64",
+    "Consolidate UpdateSkelWhenNotRendered and TickAnimationWhenNotRendered to enum",
+    "Remove Internal Archetype",
+    "Made change to UK2Node_Variable so that VariableSourceClass is NULL if bSelfContext is TRUE",
+    "Removed SpecularBoost",
+    "Add CPF_BlueprintVisible flag",
+    "UDistribution* objects moved to PostInitProperties.",
+    "Add optimized shadow-only index buffers to static meshes.",
+    "Changed indirect lighting volume sample format",
+    "Changed irrelevant light guids",
+    "Unified SoundNodeAttenuation settings with other attenuation settings",
+    "Add a NodeGuid to EdGraphNode, upping version to generate for existing nodes",
+    "Fix the outer of InterpData objects",
+    "Natively serialize blueprint core classes",
+    "Inherit SoundNode from EdGraphNOde",
+    "Unify ambient sound actor classes in to single ambient actor class",
+    "Lightmap compression",
+    "MorphTarget data type integration to curve",
+    "Fix LevelScriptBlueprints being standalone",
+    "Category field moved to metadata.",
+    "We removed the ctor link flag, this just clears this flag on load for future use",
+    "Short to long package name associations removal.",
+    "Add bCreatedByConstructionScript flag to ActorComponent",
+    "Fix loading of bogus NxDestructibleAssetAuthoring",
+    "Added angular constraint options",
+    "Added built lighting flag to primitive component",
+    "Added Counter for atmospheric fog",
+    "Ressurrected precomputed shadowmaps",
+    "Eliminated use of distribution for USoundNodeModulatorContinuous",
+    "Added a 4-byte magic number at the end of the package for file corruption validation",
+    "Discard invalid irrelevant lights",
+    "Removed NetIndex",
+    "Moved blueprint authoritative data from Skeleton CDO to the Generated CDO",
+    "Bulkdata is stored at the end of package files and can be located at offsets > 2GB",
+    "Explicitly track whether streaming texture data has been built",
+    "Precomputed shadowmaps on bsp and landscape",
+    "Refactor of static mesh build pipeline.",
+    "Remove cached static mesh streaming texture factors. They have been moved to derived data.",
+    "Added Atmospheric fog Material support",
+    "Fixup BSP brush type",
+    "Removed ClientDestroyedActorContent from UWorld",
+    "Added SoundCueGraph for new SoundCue editor",
+    "Strip TransLevelMoveBuffers out of Worlds",
+    "Deprecated PrimitiveComponent.bNoEncroachCheck",
+    "Light component bUseIESBrightness now defaults to false",
+    "Material attributes multiplex",
+    "Renamed & moved TSF_RGBA8/E8 to TSF_BGRA8/E8",
+    "Package summary stores the offset to the beginning of the area where the bulkdata gets stored */",
+    "The SimpleConstructionScript now marks the default root component as transactional, and bCreatedByConstructionScript true",
+    "Hashed material compile output stored in packages to detect mismatches",
+    "Removed restriction on blueprint-exposed variables from being read-only",
+    "Added manually serialized element to UStaticMesh (precalculated nav collision)",
+    "Changed property name for atmospheric fog",
+    "Change many properties/functions from Translation to Location",
+    "Material attributes reordering",
+    "Collision Profile setting has been added, and all components that exists has to be properly upgraded",
+    "Making the blueprint's skeleton class transient",
+    "Making the blueprint's skeleton class serialized again",
+    "Blueprint now controls replication settings again",
+    "Added level info used by World browser",
+    "Changed capsule height to capsule half-height (afterwards)",
+    "Added Namepace, GUID (Key) and Flags to FText",
+    "Attenuation shapes",
+    "Use IES texture multiplier even when IES brightness is not being used",
+    "Removed InputComponent as a blueprint addable component",
+    "Use an FMemberReference struct in UK2Node_Variable",
+    "Refactored material expression inputs for UMaterialExpressionSceneColor and UMaterialExpressionSceneDepth",
+    "Spline meshes changed from Z forwards to configurable",
+    "Added ReverbEffect asset type",
+    "changed max texcoords from 4 to 8",
+    "static meshes changed to support SpeedTrees",
+    "Landscape component reference between landscape component and collision component",
+    "Refactored UK2Node_CallFunction to use FMemberReference",
+    "Added fixup step to remove skeleton class references from blueprint objects",
+    "See above, take 2.",
+    "Making the skeleton class on blueprints transient",
+    "UClass knows if it's been cooked",
+    "Deprecated static mesh thumbnail properties were removed",
+    "Added collections in material shader map ids",
+    "Renamed some Movement Component properties, added PawnMovementComponent",
+    "Swap UMaterialExpressionTerrainLayerSwitch::LayerUsed/LayerNotUsed the correct way round",
+    "Remove URB_ConstraintSetup",
+    "Low quality directional lightmaps",
+    "Added NoiseEmitterComponent and removed related Pawn properties.",
+    "Add text component vertical alignment",
+    "Added AssetImportData for FBX asset types, deprecating SourceFilePath and SourceFileTimestamp",
+    "Remove LevelBodySetup from ULevel",
+    "Refactor character crouching",
+    "Trimmed down material shader debug information.",
+    "APEX Clothing",
+    "we should rename to match ECollisionChannel",
+    "Added Landscape Spline editor meshes",
+    "Fixup input expressions for reading from refraction material attributes.",
+    "Refactor projectile movement, along with some other movement component work.",
+    "Remove PhysicalMaterialProperty and replace with user defined enum",
+    "Removed all compile outputs from FMaterial",
+    "Ability to save cooked PhysX meshes to Landscape",
+    "Change how input component consumption works",
+    "Added new Graph based SoundClass Editor",
+    "Fixed terrain layer node guids which was causing artifacts",
+    "Added clamp min/max swap check to catch older materials",
+    "Remove static/movable/stationary light classes",
+    "Refactor the way physics blending works to allow partial blending",
+    "WorldLevelInfo: Added reference to parent level and streaming distance",
+    "Fixed cooking of skeletal/static meshes due to bad serialization logic",
+    "Removal of InterpActor and PhysicsActor",
+    "Refactor physics transforms",
+    "Remove zero triangle sections from static meshes and compact material indices.",
+    "Add param for deceleration in character movement instead of using acceleration.",
+    "Made ACameraActor use a UCameraComponent for parameter storage, etc...",
+    "Deprecated some pitch/roll properties in CharacterMovementComponent",
+    "Rebuild texture streaming data on load for uncooked builds",
+    "Add support for 32 bit index buffers for static meshes.",
+    "Added streaming install ChunkID to AssetData and UPackage",
+    "Add flag to control whether Character blueprints receive default movement bindings.",
+    "APEX Clothing LOD Info",
+    "Added atmospheric fog texture data to be general",
+    "Arrays serialize their inner's tags",
+    "Skeletal mesh index data is kept in memory in game to support mesh merging.",
+    "Added compatibility for the body instance collision change",
+    "Reflection capture cooking",
+    "Removal of DynamicTriggerVolume, DynamicBlockingVolume, DynamicPhysicsVolume",
+    "Store an additional flag in the BodySetup to indicate whether there is any cooked data to load",
+    "Changed name of RefractionBias to RefractionDepthBias.",
+    "Removal of SkeletalPhysicsActor",
+    "PlayerController rotation input refactor",
+    "Landscape Platform Data cooking",
+    "Added call for linking classes in CreateExport to ensure memory is initialized properly",
+    "Remove native component nodes from the blueprint SimpleConstructionScript",
+    "Removal of Single Node Instance",
+    "Character movement braking changes",
+    "Supported low quality lightmaps in volume samples",
+    "Split bEnableTouchEvents out from bEnableClickEvents",
+    "Health/Death refactor",
+    "Moving USoundNodeEnveloper from UDistributionFloatConstantCurve to FRichCurve",
+    "Moved SourceRadius to UPointLightComponent",
+    "Scene capture actors based on camera actors.",
+    "Moving SkeletalMesh shadow casting flag from LoD details to material",
+    "Changing bytecode operators for creating arrays",
+    "Material Instances overriding base material properties.",
+    "Combined top/bottom lightmap textures",
+    "Forced material lightmass guids to be regenerated",
+    "Allow overriding of parent class input bindings",
+    "Fix up convex invalid transform",
+    "Fix up scale of physics stiffness and damping value",
+    "Convert USkeleton and FBoneContrainer to using FReferenceSkeleton.",
+    "Adding references to variable, function, and macro nodes to be able to update to renamed values",
+    "Fix up the 0th bone's parent bone index.",
+    "Allow setting of TextRenderComponents size in world space.",
+    "Material Instances overriding base material properties #2.",
+    "CLASS_Placeable becomes CLASS_NotPlaceable",
+    "Added LOD info list to a world tile description",
+    "CharacterMovement variable naming refactor",
+    "FName properties containing sound names converted to FSlateSound properties",
+    "Added ZOrder to a world tile description",
+    "Added flagging of localization gather requirement to packages",
+    "Preventing Blueprint Actor variables from having default values",
+    "Class as primary asset, name convention changed",
+    "Custom serialization for FEdGraphPinType",
+    "Stop generating 'mirrored' cooked mesh for Brush and Model components",
+    "Changed ChunkID to be an array of IDs.",
+    'Worlds have been renamed from "TheWorld" to be named after the package containing them',
+    "Added sky light component",
+    "Added Enable distance streaming flag to FWorldTileLayer",
+    "Remove visibility/zone information from UModel",
+    "Fix base pose serialization",
+    "Support for up to 8 skinning influences per vertex on skeletal meshes (on non-gpu vertices)",
+    "Add explicit bOverrideGravity to world settings",
+    "Support for up to 8 skinning influences per vertex on skeletal meshes (on gpu vertices)",
+    "Supporting nonuniform scale animation",
+    "Engine version is stored as a FEngineVersion object rather than changelist number",
+    "World assets now have RF_Public",
+    "Skeleton Guid",
+    "Character movement WalkableFloor refactor",
+    "Lights default to inverse squared",
+    "Disabled SCRIPT_LIMIT_BYTECODE_TO_64KB",
+    "Made remote role private, exposed bReplicates",
+    "Fix up old foliage components to have static mobility (superseded by VER_UE4_FOLIAGE_MOVABLE_MOBILITY)",
+    "Change BuildScale from a float to a vector",
+    "After implementing foliage collision, need to disable collision on old foliage instances",
+    "Added sky bent normal to indirect lighting cache",
+    "Added cooking for landscape collision data",
+    "we still convert all to FVector in CPU time whenever any calculation",
+    "Soft constraint limits will implicitly use the mass of the bodies",
+    "Reflection capture data saved in packages",
+    "Fix up old foliage components to have movable mobility (superseded by VER_UE4_FOLIAGE_STATIC_LIGHTING_SUPPORT)",
+    "Undo BreakMaterialAttributes changes as it broke old content",
+    "Now Default custom profile name isn't NONE anymore due to copy/paste not working properly with it",
+    "Permanently flip and scale material expression coordinates",
+    "PinSubCategoryMemberReference added to FEdGraphPinType",
+    "Vehicles use Nm for Torque instead of cm and RPM instead of rad/s",
+    "now importing should detect NaNs, so we should not have NaNs in source data",
+    "Change skeleton preview attached assets property type",
+    "when they shouldn't",
+    "Vehicles use Nm for Torque instead of cm and RPM instead of rad/s part two (missed conversion for some variables",
+    "Changed order of interface class serialization",
+    "Change from LOD distances to display factors",
+    "Requires test of material coords to ensure they're saved correctly",
+    "Changed SpeedTree wind presets to v7",
+    "NeedsLoadForEditorGame added",
+    "Manual serialization of FRichCurveKey to save space",
+    "Change the outer of ULandscapeMaterialInstanceConstants and Landscape-related textures to the level in which they reside",
+    "FTexts have creation history data, removed Key, Namespaces, and SourceString",
+    "Shift comments to the left to contain expressions properly",
+    "Bone names stored as FName means that we can't guarantee the correct case on export, now we store a separate string for export purposes only",
+    "changed mesh emitter initial orientation to distribution",
+    "Foliage on blueprints causes crashes",
+    "change motors to use revolutions per second instead of rads/second",
+    'deprecated MovementComponent functions including "ModifiedMaxSpeed" et al',
+    "rename CanBeCharacterBase",
+    "Change GameplayTagContainers to have FGameplayTags instead of FNames; Required to fix-up native serialization",
+    "Change from UInstancedFoliageSettings to UFoliageType, and change the api from being keyed on UStaticMesh* to UFoliageType*",
+    "Lights serialize static shadow depth maps",
+    "Add RF_Transactional to data assets, fixing undo problems when editing them",
+    "Change LB_AlphaBlend to LB_WeightBlend in ELandscapeLayerBlendType",
+    "Add root component to an foliage actor, all foliage cluster components will be attached to a root",
+    "FMaterialInstanceBasePropertyOverrides didn't use proper UObject serialize",
+    "Addition of linear color sampler. color sample type is changed to linear sampler if source texture !sRGB",
+    "Added StringAssetReferencesMap to support renames of FStringAssetReference properties.",
+    "Apply scale from SCS RootComponent details in the Blueprint Editor to new actor instances at construction time",
+    "Changed level streaming to have a linear color since the visualization doesn't gamma correct.",
+    "Cleared end triggers from non-state anim notifies",
+    "Convert old curve names stored in anim assets into skeleton smartnames",
+    "Added the currency code field to FTextHistory_AsCurrency",
+    "Added support for C++11 enum classes",
+    "Fixup widget animation class",
+    "USoundWave objects now contain details about compression scheme used.",
+    "Bodies will automatically weld when attached",
+    "Rename UCharacterMovementComponent::bCrouchMovesCharacterDown",
+    "Lightmap parameters in FMeshBuildSettings",
+    "Rename SM3 to ES3_1 and updates featurelevel material node selector",
+    "Deprecated separate style assets for use in UMG",
+    "Duplicating Blueprints will regenerate NodeGuids after this version",
+    "Rename UCameraComponent::bUseControllerViewRotation to bUsePawnViewRotation (and change the default value)",
+    "Changed FName to be case preserving",
+    "Rename UCameraComponent::bUsePawnViewRotation to bUsePawnControlRotation",
+    "Fix bad refraction material attribute masks",
+    "A global spawn rate for emitters.",
+    "Cleanup destructible mesh settings",
+    "CharacterMovementComponent refactor of AdjustUpperHemisphereImpact and deprecation of some associated vars.",
+    'Changed Blueprint math equality functions for vectors and rotators to operate as a "nearly" equals rather than "exact"',
+    "Static lighting support was re-added to foliage, and mobility was returned to static",
+    "Added composite fonts to Slate font info",
+    "Remove UDEPRECATED_SaveGameSummary, required for UWorld::Serialize",
+    "Remove bodyseutp serialization from skeletal mesh component",
+    "Made Slate font data use bulk data to store the embedded font data",
+    "Add new friction behavior in ProjectileMovementComponent.",
+    "Add axis settings enum to MovementComponent.",
+    "Switch to new interactive comments, requires boundry conversion to preserve previous states",
+    "Landscape serializes physical materials for collision objects",
+    "Rename Visiblity on widgets to Visibility",
+    "add track curves for animation",
+    "Removed BranchingPoints from AnimMontages and converted them to regular AnimNotifies.",
+    "Enforce const-correctness in Blueprint implementations of native C++ const class methods",
+    "Added pivot to widget components, need to load old versions as a 0,0 pivot, new default is 0.5,0.5",
+    "Added finer control over when AI Pawns are automatically possessed. Also renamed Pawn.AutoPossess to Pawn.AutoPossessPlayer indicate this was a setting for players and not AI.",
+    "Added serialization of timezone to FTextHistory for AsDate operations.",
+    "Sort ActiveBoneIndices on lods so that we can avoid doing it at run time",
+    "Added per-frame material uniform expressions",
+    "Make MikkTSpace the default tangent space calculation method for static meshes.",
+    "Only applies to cooked files, grass cooking support.",
+    "Fixed code for using the bOrientMeshEmitters property.",
+    "Do not change landscape section offset on load under world composition",
+    "New options for navigation data runtime generation (static, modifiers only, dynamic)",
+    "Tidied up material's handling of masked blend mode.",
+    "Original version of VER_UE4_MERGED_ADD_MODIFIERS_RUNTIME_GENERATION_TO_4_7; renumbered to prevent blocking promotion in main.",
+    "Original version of VER_UE4_AFTER_MERGED_ADD_MODIFIERS_RUNTIME_GENERATION_TO_4_7; renumbered to prevent blocking promotion in main.",
+    "After merging VER_UE4_ADD_MODIFIERS_RUNTIME_GENERATION into 4.7 branch",
+    "Landscape grass weightmap data is now generated in the editor and serialized.",
+    "New property to optionally prevent gpu emitters clearing existing particles on Init().",
+    "Also store the Material guid with the landscape grass data",
+    "Make sure that all template components from blueprint generated classes are flagged as public",
+    "Split out creation method on ActorComponents to distinguish between native, instance, and simple or user construction script",
+    "K2Node_Event now uses FMemberReference for handling references",
+    "FPropertyTag stores GUID of struct",
+    "Remove unused UPolys from UModel cooked content",
+    'This doesn\'t do anything except trigger a rebuild on HISMC cluster trees, in this case to get a good "occlusion query" level',
+    "Package summary includes an CompatibleWithEngineVersion field, separately to the version it's saved with",
+    "Track UCS modified properties on Actor Components",
+    "Allowed landscape spline meshes to be stored into landscape streaming levels rather than the spline's level",
+    "Deprecate the variables used for sizing in the designer on UUserWidget",
+    "Make the editor views array dynamically sized",
+    "Updated foliage to work with either FoliageType assets or blueprint classes",
+    "Allows PhysicsSerializer to serialize shapes and actors for faster load times",
+    "Added fastcall data serialization directly in UFunction",
+    "Changes to USplineComponent and FInterpCurve",
+    "Material Instances overriding base material LOD transitions",
+    "Serialize ES2 textures separately rather than overwriting the properties used on other platforms",
+    "Constraint motor velocity is broken into per-component",
+    "Serialize bIsConst in FEdGraphPinType",
+    "Change UMaterialFunction::LibraryCategories to LibraryCategoriesText (old assets were saved before auto-conversion of FArrayProperty was possible)",
+    "Check for duplicate exports while saving packages.",
+    "Pre-gathering of gatherable, localizable text in packages to optimize text gathering operation times",
+    "Added lightmass primitive setting",
+    "Deprecate NoZSpring property on spring nodes to be replaced with TranslateZ property",
+    "Keep enums tight and serialize their values as pairs of FName and value. Don't insert dummy values.",
+    "Changed Asset import data to serialize file meta data as JSON",
+    "Legacy gamma support for textures.",
+    "Added WithSerializer for basic native structures like FVector, FColor etc to improve serialization performance",
+    "Deprecated attributes that override the style on UMG widgets",
+    "Shadowmap penumbra size stored",
+    "Fix BC on Niagara effects from the data object and dev UI changes.",
+    "Fixed the default orientation of widget component so it faces down +x",
+    "Removed bUsedWithUI flag from UMaterial and replaced it with a new material domain for UI",
+    "Added braking friction separate from turning friction.",
+    "Removed TTransArrays from UModel",
+    "Added default value to dynamic parameter.",
+    "Added ExtendedBounds to StaticMesh",
+    "Added non-linear blending to anim transitions, deprecating old types",
+    "AO Material Mask texture",
+    "Replaced navigation agents selection with single structure",
+    "Mesh particle collisions consider particle size.",
+    "Adjacency buffer building no longer automatically handled based on triangle count, user-controlled",
+    "Change the default max angular velocity",
+    "Build Adjacency index buffer for clothing tessellation",
+    "Added DecalSize member, solved backward compatibility",
+    "Keep only package names in StringAssetReferencesMap",
+    "Support sound cue not saving out editor only data",
+    "Updated dialogue wave localization gathering logic.",
+    "Renamed MakeRot MakeRotator and rearranged parameters.",
+    "K2Node_Variable will properly have the VariableReference Guid set if available",
+    "Added support for sound concurrency settings structure and overrides",
+    "Changing the default value for focusable user widgets to false",
+    "Custom event nodes implicitly set 'const' on array and non-array pass-by-reference input params",
+    "Renamed HighFrequencyGain to LowPassFilterFrequency",
+    "UAnimBlueprintGeneratedClass can be replaced by a dynamic class. Use TSubclassOf<UAnimInstance> instead.",
+    "The SCS keeps a list of all nodes in its hierarchy rather than recursively building it each time it is requested",
+    "Moved StartRange and EndRange in UFbxAnimSequenceImportData to use FInt32Interval",
+    "Adding a new root scene component to camera component",
+    "Updating custom material expression nodes for instanced stereo implementation",
+    "Texture streaming min and max distance to handle HLOD",
+    "Fixing up invalid struct-to-struct pin connections by injecting available conversion nodes",
+    "Saving tag data for Array Property's inner property",
+    "Fixed duplicating slot node names in skeleton due to skeleton preload on compile",
+    "Texture streaming using AABBs instead of Spheres",
+    "FPropertyTag stores GUID of property",
+    "Name table hashes are calculated and saved out rather than at load time",
+    "Updating custom material expression nodes for instanced stereo implementation refactor",
+    "Added compression to the shader resource for memory savings",
+    "Cooked files contain the dependency graph for the event driven loader (the serialization is largely independent of the use of the new loader)",
+    "Cooked files contain the TemplateIndex used by the event driven loader (the serialization is largely independent of the use of the new loader, i.e. this will be null if cooking for the old loader)",
+    "FPropertyTag includes contained type(s) for Set and Map properties:",
+    "Added SearchableNames to the package summary and asset registry",
+    "Increased size of SerialSize and SerialOffset in export map entries to 64 bit, allow support for bigger files",
+    "Sky light stores IrradianceMap for mobile renderer.",
+    "Added flag to control sweep behavior while walking in UCharacterMovementComponent.",
+    "StringAssetReference changed to SoftObjectPath and swapped to serialize as a name+string instead of a string",
+    "Changed the source orientation of point lights to match spot lights (z axis)",
+    "LocalizationId has been added to the package summary (editor-only)",
+    "Fixed case insensitive hashes of wide strings containing character values from 128-255",
+    "Added package owner to allow private references",
+    "Changed the data layout for skin weight profile data",
+    "Added import that can have package different than their outer",
+    "Added DependencyFlags to AssetRegistry",
+    "Fixed corrupt licensee flag in 4.26 assets",
+    "The original UE5 version, at the time this was added the UE4 version was 522, so UE5 will start from 1000 to show a clear difference",
+    "Support stripping names that are not referenced from export data",
+    "Added a payload table of contents to the package summary",
+    "Added data to identify references from and to optional package",
+    "Large world coordinates converts a number of core types to double components by default.",
+    "Remove package GUID from FObjectExport",
+    "Add IsInherited to the FObjectExport entry",
+    "Replace FName asset path in FSoftObjectPath with (package name, asset name) pair FTopLevelAssetPath",
+    "Add a soft object path list to the package summary for fast remap",
+    "Added bulk/data resource table",
+    "Added script property serialization offset to export table entries for saved, versioned packages",
+    "Support for overridable logic in containers",
+    "Added property tag complete type name and serialization type",
+    "Changed UE::AssetRegistry::WritePackageData to include PackageBuildDependencies",
+    "Added meta data serialization offset to for saved, versioned packages",
+    "Added VCells to the object graph",
+    "Changed PackageFileSummary to write FIoHash PackageSavedHash instead of FGuid Guid",
+    "OS shadow serialization of subobjects",
+    "Adds a table of hierarchical type information for imports in a package",
+  ],
+  commentIndexes: [
+    0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31,
+    32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 54, 55, 56, 57, 58, 59,
+    60, -1, 61, -1, 62, 63, 64, 65, 66, 67, 68, 69, 70, 65, 71, 72, 73, 74, 75, 76, -1, 77, 78, 79, 80, 81, 82, 83, 84,
+    85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110,
+    111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133,
+    134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156,
+    157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179,
+    180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202,
+    203, 204, 205, 206, 207, 208, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222, 223, 224,
+    225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247,
+    248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259, 260, 261, 262, 263, 264, 265, 266, 267, 268, 269, 270,
+    271, 272, 273, 274, 275, 276, 277, 278, 279, 280, 281, 282, 283, 284, 285, 286, 287, 288, 289, 290, 291, 292, 293,
+    294, 295, 296, 297, 298, 299, 300, 301, 302, 303, 304, 305, 306, 307, 308, 309, 310, 311, 312, 313, 314, 315, 316,
+    317, 318, 319, 319, 320, 321, 322, 323, 324, 325, 326, 327, 328, 329, 330, 331, 332, 333, 334, 335, 336, 337, 338,
+    339, 340, 341, 342, 343, 344, 306, 345, 346, 347, 348, 349, 350, 351, 352, 353, 354, 355, 356, 357, 358, 359, 360,
+    361, 362, 363, 364, 365, 366, 367, 368, 369, 370, 371, 372, 373, 374, 375, 376, 377, 378, 379, 380, 381, 382, 383,
+    384, 385, 386, 387, 388, 389, 390, 391, 392, 393, 394, 395, 396, 397, 398, 399, 400, 401, 402, 403, 404, 405, 406,
+    407, 408, 409, 410, 411, 412, 413, 414, 415, 416, 417, 418, 419, 420, 421, 422, 423, 424, 425,
+  ],
+  firstAppearances: [
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+    3, 3, 4, 4, 4, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 10, 10, 10, 10, 10,
+    10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 11, 11, 11,
+    11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 11, 12, 12, 12, 12, 12, 12, 13, 14, 14, 14, 15, 15, 16, 16, 16, 17,
+    18, 18, 19, 20, 21, 21, 21, 21, 22, 22, 22, 22, 22, 23, 23, 23, 23, 24, 25, 25, 25, 26, 27, 27, 27, 27, 28,
+  ],
+  lastAppearances: [
+    7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7,
+    7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7,
+    7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1,
+  ],
+});